@@ -27,26 +27,30 @@ Network Collector - Утилита для сбора данных с сетев
 __version__ = "2.0.0"
 __author__ = "Network Automation Team"
 
-# Основные классы для импорта
-from .core.device import Device
-from .core.connection import ConnectionManager
-from .core.credentials import CredentialsManager
+from .core.lazy import lazy_exports
 
-# Коллекторы данных
-from .collectors.mac import MACCollector
-from .collectors.lldp import LLDPCollector
-from .collectors.interfaces import InterfaceCollector
-
-# Парсеры
-from .parsers.textfsm_parser import TextFSMParser
-
-# Экспортеры
-from .exporters.excel import ExcelExporter
-from .exporters.csv_exporter import CSVExporter
-from .exporters.json_exporter import JSONExporter
+# Классы загружаются при первом обращении: CLI (python -m network_collector)
+# не платит за импорт scrapli/openpyxl/pynetbox там, где они не нужны
+_EXPORTS = {
+    # Основные классы
+    "Device": ".core.device",
+    "ConnectionManager": ".core.connection",
+    "CredentialsManager": ".core.credentials",
+    # Коллекторы данных
+    "MACCollector": ".collectors.mac",
+    "LLDPCollector": ".collectors.lldp",
+    "InterfaceCollector": ".collectors.interfaces",
+    # Парсеры
+    "TextFSMParser": ".parsers.textfsm_parser",
+    # Экспортеры
+    "ExcelExporter": ".exporters.excel",
+    "CSVExporter": ".exporters.csv_exporter",
+    "JSONExporter": ".exporters.json_exporter",
+    # NetBox
+    "NetBoxClient": ".netbox.client",
+}
 
-# NetBox
-from .netbox.client import NetBoxClient
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     # Версия
@@ -22,6 +22,11 @@ except ImportError:
     # python-certifi-win32 не установлен, используем стандартный certifi
     pass
 
+# --import-profile: замер импортов до загрузки CLI
+from .core.import_profile import install_if_requested
+
+install_if_requested()
+
 from .cli import main
 
 if __name__ == "__main__":
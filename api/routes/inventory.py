@@ -5,6 +5,7 @@ from fastapi import APIRouter, Request
 from ..schemas import InventoryRequest, InventoryResponse, Credentials
 from .auth import get_credentials_from_headers
 from ..services.collector_service import CollectorService
+from ..services.streaming import ndjson_response, wants_ndjson
 
 router = APIRouter()
 
@@ -23,8 +24,12 @@ async def collect_inventory(
 
     Credentials передаются в headers: X-SSH-Username, X-SSH-Password
 
+    С Accept: application/x-ndjson строки отдаются потоком по мере сбора.
+
     Возвращает: модули, SFP, PSU с PID и serial.
     """
     credentials = get_credentials_from_headers(request)
     service = CollectorService(credentials)
+    if wants_ndjson(request):
+        return ndjson_response(service.stream_rows("inventory", body))
     return await service.collect_inventory(body)
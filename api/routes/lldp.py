@@ -5,6 +5,7 @@ from fastapi import APIRouter, Request
 from ..schemas import LLDPRequest, LLDPResponse, Credentials
 from .auth import get_credentials_from_headers
 from ..services.collector_service import CollectorService
+from ..services.streaming import ndjson_response, wants_ndjson
 
 router = APIRouter()
 
@@ -23,6 +24,8 @@ async def collect_lldp(
 
     Credentials передаются в headers: X-SSH-Username, X-SSH-Password
 
+    С Accept: application/x-ndjson строки отдаются потоком по мере сбора.
+
     Протоколы:
     - lldp: Только LLDP
     - cdp: Только CDP (Cisco)
@@ -30,4 +33,6 @@ async def collect_lldp(
     """
     credentials = get_credentials_from_headers(request)
     service = CollectorService(credentials)
+    if wants_ndjson(request):
+        return ndjson_response(service.stream_rows("lldp", body))
     return await service.collect_lldp(body)
@@ -5,6 +5,7 @@ from fastapi import APIRouter, Request
 from ..schemas import MACRequest, MACResponse, Credentials
 from .auth import get_credentials_from_headers
 from ..services.collector_service import CollectorService
+from ..services.streaming import ndjson_response, wants_ndjson
 
 router = APIRouter()
 
@@ -23,10 +24,14 @@ async def collect_mac(
 
     Credentials передаются в headers: X-SSH-Username, X-SSH-Password
 
+    С Accept: application/x-ndjson строки отдаются потоком по мере сбора.
+
     Опции:
     - exclude_vlans: Исключить определённые VLAN
     - exclude_interfaces: Исключить интерфейсы по regex
     """
     credentials = get_credentials_from_headers(request)
     service = CollectorService(credentials)
+    if wants_ndjson(request):
+        return ndjson_response(service.stream_rows("mac", body))
     return await service.collect_mac(body)
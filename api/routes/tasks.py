@@ -4,13 +4,16 @@ Tasks API - получение статуса и прогресса задач.
 Endpoints:
 - GET /api/tasks - список всех задач
 - GET /api/tasks/{task_id} - статус конкретной задачи
+- GET /api/tasks/{task_id}/results - данные результата (страницы, фильтр, NDJSON)
 """
 
-from typing import List, Optional
-from fastapi import APIRouter, HTTPException
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, HTTPException, Query
 from pydantic import BaseModel
 
 from ..services.task_manager import task_manager, TaskStatus
+from ..services.result_store import result_store
+from ..services.streaming import ndjson_response
 
 router = APIRouter(prefix="/api/tasks", tags=["tasks"])
 
@@ -48,6 +51,15 @@ class TaskResponse(BaseModel):
     completed_at: Optional[str] = None
 
 
+class TaskResultsResponse(BaseModel):
+    """Страница результата задачи."""
+    task_id: str
+    items: List[Dict[str, Any]]
+    total: int
+    offset: int
+    limit: int
+
+
 class TaskListResponse(BaseModel):
     """Список задач."""
     tasks: List[TaskResponse]
@@ -93,6 +105,46 @@ async def get_task(task_id: str):
     return TaskResponse(**task.to_dict())
 
 
+@router.get("/{task_id}/results", response_model=TaskResultsResponse)
+async def get_task_results(
+    task_id: str,
+    offset: int = Query(0, ge=0),
+    limit: int = Query(100, ge=1, le=10000),
+    hostname: Optional[str] = None,
+    format: str = Query("json", pattern="^(json|ndjson)$"),
+):
+    """
+    Получить данные результата задачи.
+
+    Args:
+        task_id: ID задачи
+        offset: Смещение (для json)
+        limit: Размер страницы (для json)
+        hostname: Только записи указанного устройства
+        format: json — страница, ndjson — весь результат потоком
+
+    Returns:
+        TaskResultsResponse или поток application/x-ndjson
+
+    Raises:
+        404: Задача или результат не найдены
+        410: Результат удалён по ограничению объёма
+    """
+    if not result_store.exists(task_id):
+        task = task_manager.get_task(task_id)
+        if task and task.result and task.result.get("data_ref"):
+            raise HTTPException(status_code=410, detail=f"Results of task {task_id} expired")
+        raise HTTPException(status_code=404, detail=f"Results of task {task_id} not found")
+
+    if format == "ndjson":
+        return ndjson_response(result_store.iter_lines(task_id, hostname))
+
+    items, total = result_store.read_page(task_id, offset, limit, hostname)
+    return TaskResultsResponse(
+        task_id=task_id, items=items, total=total, offset=offset, limit=limit,
+    )
+
+
 @router.delete("/{task_id}")
 async def cancel_task(task_id: str):
     """
@@ -34,6 +34,7 @@ class DevicesRequest(BaseModel):
         False,
         description="Async mode: вернуть task_id сразу, сбор в фоне. Клиент поллит /api/tasks/{id}"
     )
+    refresh: bool = Field(False, description="Опросить устройства заново, не используя кэш выводов команд")
 
     model_config = ConfigDict(
         json_schema_extra={
@@ -79,6 +80,7 @@ class MACRequest(BaseModel):
     exclude_vlans: Optional[List[int]] = Field(None, description="Исключить VLAN")
     exclude_interfaces: Optional[List[str]] = Field(None, description="Исключить интерфейсы (regex)")
     async_mode: bool = Field(False, description="Async mode: вернуть task_id сразу")
+    refresh: bool = Field(False, description="Опросить устройства заново, не используя кэш выводов команд")
 
 
 class MACEntry(BaseModel):
@@ -113,6 +115,7 @@ class LLDPRequest(BaseModel):
     protocol: Protocol = Field(Protocol.BOTH, description="lldp, cdp или both")
     format: ExportFormat = Field(ExportFormat.JSON)
     async_mode: bool = Field(False, description="Async mode: вернуть task_id сразу")
+    refresh: bool = Field(False, description="Опросить устройства заново, не используя кэш выводов команд")
 
 
 class LLDPNeighborInfo(BaseModel):
@@ -149,6 +152,7 @@ class InterfacesRequest(BaseModel):
     devices: Optional[List[str]] = None
     format: ExportFormat = Field(ExportFormat.JSON)
     async_mode: bool = Field(False, description="Async mode: вернуть task_id сразу")
+    refresh: bool = Field(False, description="Опросить устройства заново, не используя кэш выводов команд")
 
 
 class InterfaceInfo(BaseModel):
@@ -187,6 +191,7 @@ class InventoryRequest(BaseModel):
     devices: Optional[List[str]] = None
     format: ExportFormat = Field(ExportFormat.JSON)
     async_mode: bool = Field(False, description="Async mode: вернуть task_id сразу")
+    refresh: bool = Field(False, description="Опросить устройства заново, не используя кэш выводов команд")
 
 
 class InventoryItem(BaseModel):
@@ -275,6 +280,7 @@ class SyncRequest(BaseModel):
     dry_run: bool = Field(True, description="Только показать изменения")
     show_diff: bool = Field(True, description="Показать diff")
     async_mode: bool = Field(True, description="Async mode: вернуть task_id сразу, sync в фоне")
+    refresh: bool = Field(False, description="Опросить устройства заново, не используя кэш выводов команд")
 
 
 class DiffEntry(BaseModel):
@@ -8,10 +8,12 @@ import asyncio
 import logging
 import time
 import threading
-from typing import List, Optional, Callable, Any
+from typing import Iterator, List, Optional, Callable, Any
 from concurrent.futures import ThreadPoolExecutor
 
 from .task_manager import task_manager, TaskStatus
+from .result_store import result_store
+from .streaming import dumps_error_line, dumps_line
 
 logger = logging.getLogger(__name__)
 
@@ -46,6 +48,7 @@ from network_collector.collectors import (
     InventoryCollector,
     ConfigBackupCollector,
 )
+from network_collector.core.command_cache import get_command_cache
 from network_collector.core.device import Device
 from network_collector.config import config
 from . import history_service
@@ -71,6 +74,14 @@ class CollectorService:
         from .common import get_devices_for_operation
         return get_devices_for_operation(device_list)
 
+    @staticmethod
+    def _cache_options(request: Any) -> dict:
+        """Кэш выводов команд для коллектора (request.refresh — опросить заново)."""
+        return {
+            "command_cache": get_command_cache(),
+            "refresh_cache": getattr(request, "refresh", False),
+        }
+
     async def _run_in_executor(self, func, *args):
         """Запускает синхронную функцию в executor."""
         loop = asyncio.get_event_loop()
@@ -98,7 +109,7 @@ class CollectorService:
             start_time = time.time()
             try:
                 results = collect_func()
-                processed = process_results(results)
+                processed = self._spill_results(task_id, process_results(results))
 
                 duration_ms = int((time.time() - start_time) * 1000)
                 history_service.add_entry(
@@ -128,6 +139,26 @@ class CollectorService:
         thread = threading.Thread(target=_background_worker, daemon=True)
         thread.start()
 
+    def _spill_results(self, task_id: str, processed: dict) -> dict:
+        """
+        Переносит строки результата (processed["data"]) на диск.
+
+        В task.result остаётся ссылка data_ref, данные отдаёт
+        GET /api/tasks/{id}/results.
+        """
+        rows = processed.get("data")
+        if not isinstance(rows, list):
+            return processed
+        try:
+            data_ref = result_store.save(task_id, rows)
+        except OSError as e:
+            logger.warning(f"Результат задачи {task_id} оставлен в памяти: {e}")
+            return processed
+        spilled = {k: v for k, v in processed.items() if k != "data"}
+        spilled.setdefault("total", len(rows))
+        spilled["data_ref"] = data_ref
+        return spilled
+
     def _format_collector_error(self, error: Exception, devices: List[Device]) -> str:
         """Форматирует ошибку коллектора в понятное сообщение."""
         error_str = str(error)
@@ -175,7 +206,11 @@ class CollectorService:
             task_manager.update_item(task.id, current=current, name=host, total=total)
 
         def _collect():
-            collector = DeviceCollector(credentials=self.credentials, max_workers=self._max_workers)
+            collector = DeviceCollector(
+                credentials=self.credentials,
+                max_workers=self._max_workers,
+                **self._cache_options(request),
+            )
             return collector.collect_dicts(devices, progress_callback=_progress_callback)
 
         # Async mode: возвращаем task_id сразу, сбор в фоне
@@ -270,7 +305,11 @@ class CollectorService:
             task_manager.update_item(task.id, current=current, name=host, total=total)
 
         def _collect():
-            collector = MACCollector(credentials=self.credentials, max_workers=self._max_workers)
+            collector = MACCollector(
+                credentials=self.credentials,
+                max_workers=self._max_workers,
+                **self._cache_options(request),
+            )
             return collector.collect_dicts(devices, progress_callback=_progress_callback)
 
         # Async mode: возвращаем task_id сразу
@@ -363,6 +402,7 @@ class CollectorService:
                 protocol=request.protocol.value,
                 credentials=self.credentials,
                 max_workers=self._max_workers,
+                **self._cache_options(request),
             )
             return collector.collect_dicts(devices, progress_callback=_progress_callback)
 
@@ -453,7 +493,11 @@ class CollectorService:
             task_manager.update_item(task.id, current=current, name=host, total=total)
 
         def _collect():
-            collector = InterfaceCollector(credentials=self.credentials, max_workers=self._max_workers)
+            collector = InterfaceCollector(
+                credentials=self.credentials,
+                max_workers=self._max_workers,
+                **self._cache_options(request),
+            )
             return collector.collect_dicts(devices, progress_callback=_progress_callback)
 
         # Async mode
@@ -533,7 +577,11 @@ class CollectorService:
             task_manager.update_item(task.id, current=current, name=host, total=total)
 
         def _collect():
-            collector = InventoryCollector(credentials=self.credentials, max_workers=self._max_workers)
+            collector = InventoryCollector(
+                credentials=self.credentials,
+                max_workers=self._max_workers,
+                **self._cache_options(request),
+            )
             return collector.collect_dicts(devices, progress_callback=_progress_callback)
 
         # Async mode
@@ -575,6 +623,102 @@ class CollectorService:
             task_manager.fail_task(task.id, str(e))
             return InventoryResponse(success=False, items=[], total=0, errors=[str(e)], task_id=task.id)
 
+    # =========================================================================
+    # Streaming (NDJSON)
+    # =========================================================================
+
+    def _make_collector(self, operation: str, request: Any):
+        """Коллектор для потокового сбора по имени операции."""
+        if operation == "lldp":
+            return LLDPCollector(
+                protocol=request.protocol.value,
+                credentials=self.credentials,
+                max_workers=self._max_workers,
+                **self._cache_options(request),
+            )
+        collector_class = {
+            "mac": MACCollector,
+            "interfaces": InterfaceCollector,
+            "inventory": InventoryCollector,
+        }[operation]
+        return collector_class(
+            credentials=self.credentials,
+            max_workers=self._max_workers,
+            **self._cache_options(request),
+        )
+
+    def stream_rows(self, operation: str, request: Any) -> Iterator[bytes]:
+        """
+        Потоковый сбор: строки NDJSON по мере опроса устройств.
+
+        Строки не проходят через Pydantic-модели ответа и не копятся
+        в памяти — каждое устройство сериализуется и отдаётся сразу.
+        Задача и запись истории создаются как в обычном режиме.
+
+        Args:
+            operation: mac, lldp, interfaces, inventory
+            request: Запрос эндпоинта (devices, protocol для lldp)
+
+        Ошибка (нет устройств, сбой коллектора) приходит последней строкой
+        {"success": false, "errors": [...]} — статус 200 уже отправлен.
+
+        Yields:
+            bytes: Строка NDJSON на запись
+        """
+        devices = self._get_devices(request.devices)
+        if not devices:
+            logger.warning(f"Потоковый сбор {operation}: нет устройств")
+            yield dumps_error_line("No devices to collect from")
+            return
+
+        start_time = time.time()
+        task = task_manager.create_task(
+            task_type=f"collect_{operation}",
+            total_steps=1,
+            total_items=len(devices),
+        )
+        task_manager.start_task(task.id, f"Потоковый сбор {operation} с {len(devices)} устройств")
+
+        def _progress_callback(current: int, total: int, host: str, success: bool):
+            task_manager.update_item(task.id, current=current, name=host, total=total)
+
+        total = 0
+        try:
+            collector = self._make_collector(operation, request)
+            for rows in collector.iter_collect(devices, progress_callback=_progress_callback):
+                total += len(rows)
+                yield b"".join(dumps_line(row) for row in rows)
+        except GeneratorExit:
+            # Клиент закрыл соединение — оставшиеся опросы отменены
+            task_manager.fail_task(task.id, "Клиент прервал потоковый ответ")
+            raise
+        except Exception as e:
+            error_msg = self._format_collector_error(e, devices)
+            logger.error(f"Ошибка потокового сбора {operation}: {error_msg}")
+            history_service.add_entry(
+                operation=operation,
+                status="error",
+                devices=[d.host for d in devices],
+                duration_ms=int((time.time() - start_time) * 1000),
+                error=error_msg,
+            )
+            task_manager.fail_task(task.id, error_msg)
+            yield dumps_error_line(error_msg)
+            return
+
+        history_service.add_entry(
+            operation=operation,
+            status="success",
+            devices=[d.host for d in devices],
+            stats={"total": total},
+            duration_ms=int((time.time() - start_time) * 1000),
+        )
+        task_manager.complete_task(
+            task.id,
+            result={"total": total},
+            message=f"Передано {total} записей",
+        )
+
     # =========================================================================
     # Backup
     # =========================================================================
@@ -0,0 +1,157 @@
+"""
+Хранилище результатов фоновых задач на диске.
+
+Результат async-сбора (тысячи MAC/интерфейсов) не держится в памяти
+в Task: строки пишутся в сжатый NDJSON (одна запись на строку) по ключу
+task_id, а в task.result остаётся только ссылка (data_ref):
+
+    {"total": 5000, "data_ref": {"rows": 5000, "bytes": 81234,
+                                 "url": "/api/tasks/ab12cd34/results"}}
+
+Данные отдаёт GET /api/tasks/{id}/results постранично (offset/limit),
+с фильтром по hostname или потоком NDJSON.
+
+Объём ограничен в байтах (MAX_BYTES): при превышении удаляются самые
+старые результаты.
+"""
+
+import gzip
+import json
+import logging
+import threading
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Каталог результатов
+RESULTS_DIR = Path(__file__).parent.parent.parent / "data" / "task_results"
+MAX_BYTES = 200 * 1024 * 1024  # 200 MB на все результаты
+
+SUFFIX = ".ndjson.gz"
+
+
+class TaskResultStore:
+    """
+    Сжатые результаты задач на диске с ограничением по объёму.
+
+    Attributes:
+        root: Каталог с файлами {task_id}.ndjson.gz
+        max_bytes: Предел суммарного размера файлов
+    """
+
+    def __init__(self, root: Path = RESULTS_DIR, max_bytes: int = MAX_BYTES):
+        self.root = Path(root)
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+
+    def _path(self, task_id: str) -> Path:
+        return self.root / f"{task_id}{SUFFIX}"
+
+    def exists(self, task_id: str) -> bool:
+        """Есть ли результат задачи на диске."""
+        return self._path(task_id).exists()
+
+    def save(self, task_id: str, rows: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Записывает строки результата.
+
+        Args:
+            task_id: ID задачи
+            rows: Записи результата
+
+        Returns:
+            Dict: Ссылка на результат {rows, bytes, url}
+        """
+        self.root.mkdir(parents=True, exist_ok=True)
+        path = self._path(task_id)
+        tmp = path.with_suffix(".tmp")
+        with gzip.open(tmp, "wt", encoding="utf-8", compresslevel=6) as f:
+            for row in rows:
+                f.write(json.dumps(row, ensure_ascii=False, default=str))
+                f.write("\n")
+        tmp.replace(path)
+
+        size = path.stat().st_size
+        with self._lock:
+            self._enforce_limit(keep=path)
+        logger.debug(f"Результат задачи {task_id}: {len(rows)} записей, {size} байт")
+        return {
+            "rows": len(rows),
+            "bytes": size,
+            "url": f"/api/tasks/{task_id}/results",
+        }
+
+    def iter_lines(self, task_id: str, hostname: Optional[str] = None) -> Iterator[str]:
+        """
+        Строки NDJSON без разбора JSON (для потоковой отдачи).
+
+        Args:
+            task_id: ID задачи
+            hostname: Только записи этого устройства
+
+        Raises:
+            FileNotFoundError: Результата нет (не было или удалён по объёму)
+        """
+        with gzip.open(self._path(task_id), "rt", encoding="utf-8") as f:
+            for line in f:
+                if hostname and not _match_hostname(line, hostname):
+                    continue
+                yield line
+
+    def read_page(
+        self,
+        task_id: str,
+        offset: int = 0,
+        limit: int = 100,
+        hostname: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Страница результата.
+
+        Разбирается только JSON строк, попавших в страницу.
+
+        Returns:
+            (записи страницы, всего записей с учётом фильтра)
+        """
+        items = []
+        total = 0
+        for line in self.iter_lines(task_id, hostname):
+            if offset <= total < offset + limit:
+                items.append(json.loads(line))
+            total += 1
+        return items, total
+
+    def delete(self, task_id: str) -> None:
+        """Удаляет результат задачи."""
+        self._path(task_id).unlink(missing_ok=True)
+
+    def total_bytes(self) -> int:
+        """Суммарный размер результатов."""
+        return sum(p.stat().st_size for p in self.root.glob(f"*{SUFFIX}"))
+
+    def _enforce_limit(self, keep: Optional[Path] = None) -> None:
+        """Удаляет самые старые файлы, пока объём больше max_bytes."""
+        files = [(p, p.stat()) for p in self.root.glob(f"*{SUFFIX}")]
+        total = sum(st.st_size for _, st in files)
+        files.sort(key=lambda x: x[1].st_mtime)
+        for path, st in files:
+            if total <= self.max_bytes:
+                break
+            if path == keep:
+                continue
+            path.unlink(missing_ok=True)
+            total -= st.st_size
+            logger.debug(f"Результат {path.name} удалён: превышен лимит {self.max_bytes} байт")
+
+
+def _match_hostname(line: str, hostname: str) -> bool:
+    """Фильтр по hostname: дешёвая проверка подстроки, затем разбор JSON."""
+    if hostname.lower() not in line.lower():
+        return False
+    row = json.loads(line)
+    return str(row.get("hostname", "")).lower() == hostname.lower()
+
+
+# Глобальный экземпляр
+result_store = TaskResultStore()
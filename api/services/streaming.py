@@ -0,0 +1,47 @@
+"""
+Потоковые ответы NDJSON для эндпоинтов сбора.
+
+Обычный ответ (MACResponse и т.п.) строит Pydantic-модель на каждую
+строку и сериализует всё одним телом — на сотнях тысяч записей это
+дольше самого сбора. С заголовком Accept: application/x-ndjson строки
+пишутся в ответ по мере опроса устройств, по одной JSON-записи на строку,
+без Pydantic-валидации:
+
+    curl -H "Accept: application/x-ndjson" -X POST .../api/mac/collect
+
+Ошибка сбора (в том числе пустой список устройств) передаётся последней
+строкой {"success": false, "errors": [...]}: статус 200 к этому моменту
+уже отправлен, поэтому клиент проверяет поле success.
+
+Сериализация через orjson (если установлен), иначе стандартный json
+(core/jsonutil.py).
+"""
+
+from typing import Any, Dict, Iterable
+
+from fastapi import Request
+from fastapi.responses import StreamingResponse
+
+from network_collector.core.jsonutil import dumps
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+
+def dumps_line(row: Dict[str, Any]) -> bytes:
+    """Строка NDJSON (с переводом строки) для одной записи."""
+    return dumps(row, newline=True)
+
+
+def dumps_error_line(message: str) -> bytes:
+    """Строка NDJSON с ошибкой сбора (формат errors как в обычных ответах)."""
+    return dumps_line({"success": False, "errors": [message]})
+
+
+def wants_ndjson(request: Request) -> bool:
+    """Клиент запросил потоковый ответ (Accept: application/x-ndjson)."""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def ndjson_response(lines: Iterable[bytes]) -> StreamingResponse:
+    """StreamingResponse из итератора строк NDJSON."""
+    return StreamingResponse(lines, media_type=NDJSON_MEDIA_TYPE)
@@ -24,6 +24,7 @@ from ..schemas import (
     DiffEntry,
 )
 
+from network_collector.core.command_cache import get_command_cache
 from network_collector.core.device import Device
 from network_collector.netbox.client import NetBoxClient
 from network_collector.netbox.sync import NetBoxSync
@@ -159,6 +160,15 @@ class SyncService:
         )
         sync = NetBoxSync(client, dry_run=request.dry_run)
 
+        # Общие параметры коллекторов: повторный сбор интерфейсов для IP/VLAN
+        # берёт выводы из кэша команд (если он включён)
+        collector_options = {
+            "credentials": self.credentials,
+            "max_workers": self._max_workers,
+            "command_cache": get_command_cache(),
+            "refresh_cache": request.refresh,
+        }
+
         diff_entries: List[DiffEntry] = []
         stats = {
             "devices": SyncStats(),
@@ -174,7 +184,7 @@ class SyncService:
         if request.sync_all or request.create_devices or request.update_devices:
             update_step("Devices")
             try:
-                collector = DeviceCollector(credentials=self.credentials, max_workers=self._max_workers)
+                collector = DeviceCollector(**collector_options)
                 device_data = collector.collect_dicts(devices)
 
                 result = sync.sync_devices_from_inventory(
@@ -205,7 +215,7 @@ class SyncService:
         if request.sync_all or request.interfaces or request.cleanup_interfaces:
             update_step("Interfaces")
             try:
-                collector = InterfaceCollector(credentials=self.credentials, max_workers=self._max_workers)
+                collector = InterfaceCollector(**collector_options)
                 interface_data = collector.collect_dicts(devices)
 
                 # Group by device
@@ -257,7 +267,7 @@ class SyncService:
             update_step("IP Addresses")
             try:
                 # IP адреса извлекаются из интерфейсов
-                collector = InterfaceCollector(credentials=self.credentials, max_workers=self._max_workers)
+                collector = InterfaceCollector(**collector_options)
                 interface_data = collector.collect_dicts(devices)
 
                 by_device = {}
@@ -320,7 +330,7 @@ class SyncService:
         if request.sync_all or request.vlans:
             update_step("VLANs")
             try:
-                collector = InterfaceCollector(credentials=self.credentials, max_workers=self._max_workers)
+                collector = InterfaceCollector(**collector_options)
                 interface_data = collector.collect_dicts(devices)
 
                 by_device = {}
@@ -362,7 +372,7 @@ class SyncService:
         if request.sync_all or request.inventory or request.cleanup_inventory:
             update_step("Inventory")
             try:
-                collector = InventoryCollector(credentials=self.credentials, max_workers=self._max_workers)
+                collector = InventoryCollector(**collector_options)
                 inventory_data = collector.collect_dicts(devices)
 
                 # Group by device
@@ -411,11 +421,7 @@ class SyncService:
             try:
                 # Используем protocol из запроса
                 protocol = request.protocol.value if hasattr(request.protocol, 'value') else str(request.protocol)
-                collector = LLDPCollector(
-                    protocol=protocol,
-                    credentials=self.credentials,
-                    max_workers=self._max_workers,
-                )
+                collector = LLDPCollector(protocol=protocol, **collector_options)
                 lldp_data = collector.collect_dicts(devices)
 
                 # sync_cables_from_lldp поддерживает cleanup параметр
@@ -19,8 +19,10 @@ CLI модуль network_collector.
 """
 
 import argparse
+import importlib
 import logging
 from pathlib import Path
+from typing import Callable, Optional
 
 from .utils import (
     load_devices,
@@ -29,22 +31,62 @@ from .utils import (
     prepare_collection,
 )
 
-from .commands import (
-    cmd_devices,
-    cmd_mac,
-    cmd_lldp,
-    cmd_interfaces,
-    cmd_inventory,
-    cmd_sync_netbox,
-    cmd_backup,
-    cmd_run,
-    cmd_match_mac,
-    cmd_push_descriptions,
-    cmd_push_config,
-    cmd_validate_fields,
-    cmd_pipeline,
-    _print_sync_summary,
-)
+from ..core.lazy import lazy_exports
+
+# Обработчики подкоманд: {команда: (модуль cli.commands, функция)}
+# Модуль импортируется только для запущенной команды
+COMMAND_HANDLERS = {
+    "devices": ("collect", "cmd_devices"),
+    "mac": ("collect", "cmd_mac"),
+    "lldp": ("collect", "cmd_lldp"),
+    "interfaces": ("collect", "cmd_interfaces"),
+    "inventory": ("collect", "cmd_inventory"),
+    "run": ("backup", "cmd_run"),
+    "match-mac": ("match", "cmd_match_mac"),
+    "push-descriptions": ("push", "cmd_push_descriptions"),
+    "push-config": ("push", "cmd_push_config"),
+    "sync-netbox": ("sync", "cmd_sync_netbox"),
+    "backup": ("backup", "cmd_backup"),
+    "validate-fields": ("validate", "cmd_validate_fields"),
+    "pipeline": ("pipeline", "cmd_pipeline"),
+}
+
+# cmd_* по-прежнему импортируются из network_collector.cli (лениво)
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "cmd_devices": ".commands",
+    "cmd_mac": ".commands",
+    "cmd_lldp": ".commands",
+    "cmd_interfaces": ".commands",
+    "cmd_inventory": ".commands",
+    "cmd_sync_netbox": ".commands",
+    "cmd_backup": ".commands",
+    "cmd_run": ".commands",
+    "cmd_match_mac": ".commands",
+    "cmd_push_descriptions": ".commands",
+    "cmd_push_config": ".commands",
+    "cmd_validate_fields": ".commands",
+    "cmd_pipeline": ".commands",
+    "_print_sync_summary": ".commands",
+})
+
+
+def get_command_handler(command: Optional[str]) -> Optional[Callable]:
+    """
+    Возвращает обработчик подкоманды, импортируя только его модуль.
+
+    Args:
+        command: Имя подкоманды (devices, mac, pipeline, ...)
+
+    Returns:
+        Callable(args, ctx) или None для неизвестной команды
+    """
+    entry = COMMAND_HANDLERS.get(command)
+    if entry is None:
+        return None
+    module_name, func_name = entry
+    module = importlib.import_module(f".commands.{module_name}", __name__)
+    return getattr(module, func_name)
+
 
 logger = logging.getLogger(__name__)
 
@@ -95,6 +137,11 @@ def setup_parser() -> argparse.ArgumentParser:
         default="ssh2",
         help="SSH транспорт для Scrapli (default: ssh2)",
     )
+    parser.add_argument(
+        "--import-profile",
+        action="store_true",
+        help="Показать время импорта модулей после выполнения команды",
+    )
     parser.add_argument(
         "-c",
         "--config",
@@ -110,7 +157,7 @@ def setup_parser() -> argparse.ArgumentParser:
     devices_parser.add_argument(
         "--format",
         "-f",
-        choices=["excel", "csv", "json", "raw", "parsed"],
+        choices=["excel", "csv", "json", "raw", "parsed", "parquet", "feather"],
         default="csv",
         help="Формат вывода",
     )
@@ -140,7 +187,7 @@ def setup_parser() -> argparse.ArgumentParser:
     mac_parser.add_argument(
         "--format",
         "-f",
-        choices=["excel", "csv", "json", "raw", "parsed"],
+        choices=["excel", "csv", "json", "raw", "parsed", "parquet", "feather"],
         default="excel",
         help="Формат вывода",
     )
@@ -193,13 +240,20 @@ def setup_parser() -> argparse.ArgumentParser:
         action="store_true",
         help="Собирать sticky MAC из port-security (offline устройства)",
     )
+    mac_parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Процессов для парсинга (0 — в потоках сбора, по умолчанию из config.yaml)",
+    )
 
     # === LLDP ===
     lldp_parser = subparsers.add_parser("lldp", help="Сбор LLDP/CDP соседей")
     lldp_parser.add_argument(
         "--format",
         "-f",
-        choices=["excel", "csv", "json", "raw", "parsed"],
+        choices=["excel", "csv", "json", "raw", "parsed", "parquet", "feather"],
         default="excel",
         help="Формат вывода",
     )
@@ -226,7 +280,7 @@ def setup_parser() -> argparse.ArgumentParser:
     intf_parser.add_argument(
         "--format",
         "-f",
-        choices=["excel", "csv", "json", "raw", "parsed"],
+        choices=["excel", "csv", "json", "raw", "parsed", "parquet", "feather"],
         default="excel",
         help="Формат вывода",
     )
@@ -239,6 +293,13 @@ def setup_parser() -> argparse.ArgumentParser:
         "--fields",
         help="Поля для вывода (через запятую)",
     )
+    intf_parser.add_argument(
+        "--parse-workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Процессов для парсинга (0 — в потоках сбора, по умолчанию из config.yaml)",
+    )
 
     # === Inventory ===
     inv_parser = subparsers.add_parser(
@@ -247,7 +308,7 @@ def setup_parser() -> argparse.ArgumentParser:
     inv_parser.add_argument(
         "--format",
         "-f",
-        choices=["excel", "csv", "json", "raw", "parsed"],
+        choices=["excel", "csv", "json", "raw", "parsed", "parquet", "feather"],
         default="json",
         help="Формат вывода",
     )
@@ -274,7 +335,7 @@ def setup_parser() -> argparse.ArgumentParser:
     run_parser.add_argument(
         "--format",
         "-f",
-        choices=["excel", "csv", "json", "raw", "parsed"],
+        choices=["excel", "csv", "json", "raw", "parsed", "parquet", "feather"],
         default="json",
         help="Формат вывода",
     )
@@ -317,6 +378,10 @@ def setup_parser() -> argparse.ArgumentParser:
         default="matched_data.xlsx",
         help="Файл для сохранения результатов",
     )
+    match_parser.add_argument(
+        "--cache-dir",
+        help="Папка кэша нормализованных справочников (повторный запуск без чтения Excel)",
+    )
 
     # === Push descriptions (применение описаний) ===
     push_parser = subparsers.add_parser(
@@ -718,42 +783,20 @@ def main() -> None:
         backup_count=getattr(log_cfg, "backup_count", 5) if log_cfg else 5,
         when=getattr(log_cfg, "when", "midnight") if log_cfg else "midnight",
         interval=getattr(log_cfg, "interval", 1) if log_cfg else 1,
+        queue=getattr(log_cfg, "queue", False) if log_cfg else False,
+        queue_size=getattr(log_cfg, "queue_size", 10000) if log_cfg else 10000,
     )
 
     setup_logging_from_config(log_config)
 
     logger.info(f"Run started (command={args.command}, dry_run={dry_run})")
 
-    # Выбор команды
-    if args.command == "devices":
-        cmd_devices(args, ctx)
-    elif args.command == "mac":
-        cmd_mac(args, ctx)
-    elif args.command == "lldp":
-        cmd_lldp(args, ctx)
-    elif args.command == "interfaces":
-        cmd_interfaces(args, ctx)
-    elif args.command == "inventory":
-        cmd_inventory(args, ctx)
-    elif args.command == "run":
-        cmd_run(args, ctx)
-    elif args.command == "match-mac":
-        cmd_match_mac(args, ctx)
-    elif args.command == "push-descriptions":
-        cmd_push_descriptions(args, ctx)
-    elif args.command == "push-config":
-        cmd_push_config(args, ctx)
-    elif args.command == "sync-netbox":
-        cmd_sync_netbox(args, ctx)
-    elif args.command == "backup":
-        cmd_backup(args, ctx)
-    elif args.command == "validate-fields":
-        cmd_validate_fields(args, ctx)
-    elif args.command == "pipeline":
-        cmd_pipeline(args, ctx)
-    else:
+    # Выбор команды (модуль обработчика импортируется здесь)
+    handler = get_command_handler(args.command)
+    if handler is None:
         parser.print_help()
         return
+    handler(args, ctx)
 
     # Логируем завершение
     logger.info(f"Run completed: {ctx.run_id} (elapsed={ctx.elapsed_human})")
@@ -765,6 +808,9 @@ __all__ = [
     "get_exporter",
     "get_credentials",
     "prepare_collection",
+    # Dispatch
+    "COMMAND_HANDLERS",
+    "get_command_handler",
     # Commands
     "cmd_devices",
     "cmd_mac",
@@ -11,19 +11,28 @@ CLI команды.
 - pipeline.py: pipeline (list, show, run, validate, create, delete)
 """
 
-from .collect import (
-    cmd_devices,
-    cmd_mac,
-    cmd_lldp,
-    cmd_interfaces,
-    cmd_inventory,
-)
-from .sync import cmd_sync_netbox, _print_sync_summary
-from .backup import cmd_backup, cmd_run
-from .match import cmd_match_mac
-from .push import cmd_push_descriptions, cmd_push_config
-from .validate import cmd_validate_fields
-from .pipeline import cmd_pipeline
+from ...core.lazy import lazy_exports
+
+# Модуль команды импортируется при первом обращении к обработчику:
+# `pipeline list` не загружает коллекторы, NetBox и configurator
+_EXPORTS = {
+    "cmd_devices": ".collect",
+    "cmd_mac": ".collect",
+    "cmd_lldp": ".collect",
+    "cmd_interfaces": ".collect",
+    "cmd_inventory": ".collect",
+    "cmd_sync_netbox": ".sync",
+    "_print_sync_summary": ".sync",
+    "cmd_backup": ".backup",
+    "cmd_run": ".backup",
+    "cmd_match_mac": ".match",
+    "cmd_push_descriptions": ".push",
+    "cmd_push_config": ".push",
+    "cmd_validate_fields": ".validate",
+    "cmd_pipeline": ".pipeline",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     "cmd_devices",
@@ -7,7 +7,7 @@
 import logging
 from typing import Optional
 
-from ..utils import prepare_collection, get_exporter
+from ..utils import prepare_collection, get_exporter, get_parse_workers
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +50,7 @@ def cmd_devices(args, ctx=None) -> None:
 
     data = apply_fields_config(data, "devices")
 
-    exporter = get_exporter(args.format, args.output, args.delimiter)
+    exporter = get_exporter(args.format, args.output, args.delimiter, data_type="devices")
     file_path = exporter.export(data, "device_inventory")
 
     if file_path:
@@ -106,6 +106,7 @@ def cmd_mac(args, ctx=None) -> None:
         collect_trunk_ports=collect_trunk,
         collect_port_security=collect_port_security,
         transport=args.transport,
+        parse_workers=get_parse_workers(args),
     )
 
     # --format parsed: пропускаем нормализацию
@@ -129,27 +130,18 @@ def cmd_mac(args, ctx=None) -> None:
             from ...configurator import DescriptionMatcher
             matcher = DescriptionMatcher()
             matcher.load_hosts_file(args.match_file)
-            matched = matcher.match_mac_data(data)
-            data = []
-            for entry in matched:
-                row = {
-                    "hostname": entry.hostname,
-                    "device_ip": entry.device_ip,
-                    "interface": entry.interface,
-                    "mac": entry.mac,
-                    "vlan": entry.vlan,
-                    "description": entry.current_description,
-                    "host_name": entry.host_name,
-                    "matched": "Yes" if entry.matched else "No",
-                }
-                data.append(row)
+            import pandas as pd
+            matched = matcher.match_mac_frame(pd.DataFrame.from_records(data))
+            matched = matched.rename(columns={"current_description": "description"})
+            matched["matched"] = matched["matched"].map({True: "Yes", False: "No"})
+            data = matched.to_dict("records")
             logger.info(f"Данные обогащены из {args.match_file}")
         except Exception as e:
             logger.warning(f"Ошибка сопоставления: {e}")
 
     data = apply_fields_config(data, "mac")
 
-    exporter = get_exporter(args.format, args.output, args.delimiter)
+    exporter = get_exporter(args.format, args.output, args.delimiter, data_type="mac")
 
     per_device = getattr(args, "per_device", False) or app_config.output.per_device
 
@@ -205,7 +197,7 @@ def cmd_lldp(args, ctx=None) -> None:
 
     data = apply_fields_config(data, "lldp")
 
-    exporter = get_exporter(args.format, args.output, args.delimiter)
+    exporter = get_exporter(args.format, args.output, args.delimiter, data_type="lldp")
     report_name = f"{args.protocol}_neighbors"
     file_path = exporter.export(data, report_name)
 
@@ -226,6 +218,7 @@ def cmd_interfaces(args, ctx=None) -> None:
         credentials=credentials,
         ntc_fields=fields,
         transport=args.transport,
+        parse_workers=get_parse_workers(args),
     )
 
     # --format parsed: пропускаем нормализацию
@@ -245,7 +238,7 @@ def cmd_interfaces(args, ctx=None) -> None:
 
     data = apply_fields_config(data, "interfaces")
 
-    exporter = get_exporter(args.format, args.output, args.delimiter)
+    exporter = get_exporter(args.format, args.output, args.delimiter, data_type="interfaces")
     file_path = exporter.export(data, "interfaces")
 
     if file_path:
@@ -284,7 +277,7 @@ def cmd_inventory(args, ctx=None) -> None:
 
     data = apply_fields_config(data, "inventory")
 
-    exporter = get_exporter(args.format, args.output, args.delimiter)
+    exporter = get_exporter(args.format, args.output, args.delimiter, data_type="inventory")
     file_path = exporter.export(data, "inventory")
 
     if file_path:
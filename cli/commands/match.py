@@ -28,11 +28,10 @@ def cmd_match_mac(args, ctx=None) -> None:
         reverse_map.get(col.lower(), col.lower())
         for col in mac_df.columns
     ]
-    mac_data = mac_df.to_dict("records")
-    logger.info(f"Загружено {len(mac_data)} записей MAC")
+    logger.info(f"Загружено {len(mac_df)} записей MAC")
 
     # Создаём матчер
-    matcher = DescriptionMatcher()
+    matcher = DescriptionMatcher(cache_dir=getattr(args, "cache_dir", None))
 
     # Загружаем справочник хостов
     if args.hosts_folder:
@@ -50,8 +49,9 @@ def cmd_match_mac(args, ctx=None) -> None:
 
     # Сопоставляем (указываем имена полей из MAC файла)
     # Колонки преобразованы через reverse_map в оригинальные имена полей модели
-    matched = matcher.match_mac_data(
-        mac_data,
+    # DataFrame сопоставляется целиком (merge), без построчных объектов
+    matcher.match_mac_frame(
+        mac_df,
         mac_field="mac",           # Оригинальное имя поля в модели MACEntry
         hostname_field="hostname", # Оригинальное имя поля в модели MACEntry
         interface_field="interface",  # Оригинальное имя поля в модели MACEntry
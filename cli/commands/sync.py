@@ -324,6 +324,9 @@ def cmd_sync_netbox(args, ctx=None) -> None:
     # === СВОДКА В КОНЦЕ ===
     _print_changes_details(all_details, args)
     _print_sync_summary(summary, all_details, args)
+    session = getattr(client, "http_session", None)
+    if session is not None:
+        logger.info(session.stats_summary())
 
 
 def _print_changes_details(all_details: dict, args) -> None:
@@ -7,7 +7,7 @@
 import sys
 import logging
 from pathlib import Path
-from typing import List, Tuple
+from typing import List, Optional, Tuple
 
 from ..core.constants.platforms import DEFAULT_PLATFORM
 
@@ -110,21 +110,41 @@ def load_devices(devices_file: str) -> List:
     return devices
 
 
-def get_exporter(format_type: str, output_folder: str, delimiter: str = ","):
+def get_exporter(
+    format_type: str,
+    output_folder: str,
+    delimiter: str = ",",
+    data_type: Optional[str] = None,
+):
     """
     Возвращает экспортер по типу формата.
 
     Args:
-        format_type: Тип формата (excel, csv, json, raw)
+        format_type: Тип формата (excel, csv, json, raw, parquet, feather)
         output_folder: Папка для вывода
         delimiter: Разделитель для CSV
+        data_type: Тип данных fields.yaml (порядок колонок для parquet/feather)
 
     Returns:
         BaseExporter: Экспортер
+
+    Raises:
+        SystemExit: Для parquet/feather без pyarrow
     """
     from ..exporters import CSVExporter, JSONExporter, ExcelExporter, RawExporter
 
-    if format_type == "csv":
+    if format_type in ("parquet", "feather"):
+        from ..exporters import ParquetExporter, FeatherExporter
+
+        exporter_cls = ParquetExporter if format_type == "parquet" else FeatherExporter
+        try:
+            return exporter_cls(output_folder=output_folder, data_type=data_type)
+        except ImportError:
+            logger.error(
+                f"Для экспорта в {format_type} установите pyarrow: pip install pyarrow"
+            )
+            sys.exit(1)
+    elif format_type == "csv":
         return CSVExporter(output_folder=output_folder, delimiter=delimiter)
     elif format_type == "json":
         return JSONExporter(output_folder=output_folder)
@@ -160,3 +180,21 @@ def prepare_collection(args) -> Tuple[List, object]:
     devices = load_devices(args.devices)
     credentials = get_credentials()
     return devices, credentials
+
+
+def get_parse_workers(args) -> int:
+    """
+    Число процессов для парсинга: --parse-workers или parser.parse_workers.
+
+    Args:
+        args: Аргументы командной строки
+
+    Returns:
+        int: Процессов для парсинга (0 — парсинг в потоках сбора)
+    """
+    value = getattr(args, "parse_workers", None)
+    if value is None:
+        from ..config import config as app_config
+
+        value = app_config.parser.get("parse_workers", 0) if app_config.parser else 0
+    return max(0, int(value or 0))
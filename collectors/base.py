@@ -14,6 +14,14 @@
             # Парсинг вывода
             return parsed_data
 
+Шардированный сбор (parse_workers > 0):
+    # Потоки только ходят на устройства, парсинг — в пуле процессов
+    collector = MACCollector(max_workers=20, parse_workers=4)
+    data = collector.collect_dicts(devices)
+
+    Коллектор с разделением _fetch_outputs / _process_outputs (без
+    переопределения _collect_from_device) поддерживает режим автоматически.
+
 Поддержка типизированных моделей:
     # Collectors возвращают List[Dict] для обратной совместимости
     data = collector.collect_dicts(devices)
@@ -27,8 +35,11 @@
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Optional, Type, TypeVar, Callable
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import List, Dict, Any, Iterator, Optional, Tuple, Type, TypeVar, Callable
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed
+import logging
+import logging.handlers
+import multiprocessing
 
 # TypeVar для типизированных моделей
 T = TypeVar("T")
@@ -37,7 +48,9 @@ T = TypeVar("T")
 ProgressCallback = Callable[[int, int, str, bool], None]
 
 from ..core.device import Device, DeviceStatus
+from ..core.command_cache import CommandOutputCache
 from ..core.connection import ConnectionManager, get_ntc_platform
+from ..core.constants.commands import get_structured_command, supports_batch
 from ..core.credentials import Credentials
 from ..core.context import RunContext, get_current_context
 from ..core.exceptions import (
@@ -48,10 +61,136 @@ from ..core.exceptions import (
     format_error_for_log,
 )
 from ..core.logging import get_logger
-from ..parsers.textfsm_parser import NTCParser, NTC_AVAILABLE
+from ..parsers.textfsm_parser import (
+    NTCParser,
+    NTC_AVAILABLE,
+    get_template_cache,
+    load_template_cache,
+)
+from ..parsers.structured_parser import is_structured_output, parse_structured
 
 logger = get_logger(__name__)
 
+# Компактная пачка строк: (наборы ключей, [(индекс набора, значения)])
+RowBatch = Tuple[List[Tuple[str, ...]], List[Tuple[int, tuple]]]
+
+# Копия коллектора в процессе-парсере (создаётся initializer'ом пула)
+_worker_collector: Optional["BaseCollector"] = None
+
+
+class _WorkerLogBuffer(logging.handlers.QueueHandler):
+    """
+    Копит записи лога процесса-парсера.
+
+    Под spawn у процесса нет handlers родителя: записи возвращаются
+    вместе с результатом и выводятся в родителе (_emit_worker_logs).
+    prepare() QueueHandler'а делает записи сериализуемыми (pickle).
+    """
+
+    def __init__(self):
+        super().__init__(None)
+        self.records: List[logging.LogRecord] = []
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        self.records.append(record)
+
+    def drain(self) -> List[logging.LogRecord]:
+        """Забирает накопленные записи."""
+        records, self.records = self.records, []
+        return records
+
+
+_worker_log = _WorkerLogBuffer()
+
+
+def pack_rows(rows: List[Dict[str, Any]]) -> RowBatch:
+    """
+    Упаковывает строки в компактную пачку для передачи между процессами.
+
+    Ключи каждого набора передаются один раз, строки — кортежами значений.
+    Порядок строк и ключей сохраняется.
+
+    Args:
+        rows: Строки (словари)
+
+    Returns:
+        RowBatch: (наборы ключей, [(индекс набора, значения)])
+    """
+    shapes: List[Tuple[str, ...]] = []
+    shape_index: Dict[Tuple[str, ...], int] = {}
+    packed = []
+    for row in rows:
+        keys = tuple(row)
+        idx = shape_index.get(keys)
+        if idx is None:
+            idx = shape_index[keys] = len(shapes)
+            shapes.append(keys)
+        packed.append((idx, tuple(row.values())))
+    return shapes, packed
+
+
+def unpack_rows(batch: RowBatch) -> List[Dict[str, Any]]:
+    """Восстанавливает строки из пачки pack_rows()."""
+    shapes, packed = batch
+    return [dict(zip(shapes[idx], values)) for idx, values in packed]
+
+
+def _init_parse_worker(
+    collector_cls: Type["BaseCollector"],
+    options: Dict[str, Any],
+    skip_normalize: bool,
+    template_cache: Dict[str, str],
+    log_level: int = logging.WARNING,
+) -> None:
+    """
+    Initializer процесса-парсера: шаблоны, лог и копия коллектора без учётных данных.
+
+    Args:
+        collector_cls: Класс коллектора
+        options: Аргументы конструктора (_parse_pool_options)
+        skip_normalize: Флаг --format parsed
+        template_cache: Тексты кастомных шаблонов из родительского процесса
+        log_level: Уровень лога родительского процесса
+    """
+    global _worker_collector
+    root_logger = logging.getLogger()
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+    root_logger.addHandler(_worker_log)
+    root_logger.setLevel(log_level)
+    load_template_cache(template_cache)
+    _worker_collector = collector_cls(**options)
+    _worker_collector._skip_normalize = skip_normalize
+
+
+def _parse_in_worker(
+    device: Device,
+    hostname: str,
+    outputs: Dict[str, str],
+) -> Tuple[RowBatch, List[logging.LogRecord]]:
+    """
+    Парсит и нормализует выводы одного устройства в процессе-парсере.
+
+    Returns:
+        (пачка строк, записи лога за время разбора)
+    """
+    _worker_log.drain()
+    try:
+        rows = _worker_collector._process_outputs(outputs, device, hostname)
+    except Exception as e:
+        # Исключение уходит в родителя без записей лога — логируем их в нём
+        e.worker_logs = _worker_log.drain()
+        raise
+    return pack_rows(rows), _worker_log.drain()
+
+
+def _emit_worker_logs(records: List[logging.LogRecord]) -> None:
+    """Выводит записи лога процесса-парсера через handlers родителя."""
+    for record in records:
+        target = logging.getLogger(record.name)
+        if target.isEnabledFor(record.levelno):
+            target.handle(record)
+
 
 class BaseCollector(ABC):
     """
@@ -64,6 +203,7 @@ class BaseCollector(ABC):
         credentials: Учётные данные для подключения
         use_ntc: Использовать NTC Templates для парсинга
         max_workers: Максимум параллельных подключений
+        parse_workers: Процессов для парсинга (0 — парсинг в потоках сбора)
         model_class: Класс модели для типизированного вывода
 
     Example:
@@ -86,6 +226,9 @@ class BaseCollector(ABC):
     # {device_type: command}
     platform_commands: Dict[str, str] = {}
 
+    # Ключ JSON-команд в STRUCTURED_COMMANDS (interfaces, mac, lldp, inventory)
+    structured_key: str = ""
+
     # Класс модели для типизированного вывода (переопределяется в наследниках)
     # Должен иметь метод from_dict(data: Dict) -> Model
     model_class: Optional[Type[T]] = None
@@ -102,6 +245,10 @@ class BaseCollector(ABC):
         max_retries: int = 2,
         retry_delay: int = 5,
         context: Optional[RunContext] = None,
+        parse_workers: int = 0,
+        command_cache: Optional[CommandOutputCache] = None,
+        refresh_cache: bool = False,
+        structured_output: Optional[bool] = None,
     ):
         """
         Инициализация коллектора.
@@ -117,6 +264,13 @@ class BaseCollector(ABC):
             max_retries: Максимум повторных попыток при ошибке подключения
             retry_delay: Задержка между попытками (секунды)
             context: Контекст выполнения (если None — использует глобальный)
+            parse_workers: Процессов для парсинга и нормализации. При > 0
+                потоки только выполняют команды, а разбор выводов идёт
+                в ProcessPoolExecutor (для больших MAC-таблиц и show interfaces)
+            command_cache: Кэш выводов команд между сборами (None — без кэша)
+            refresh_cache: Опросить устройства, не читая кэш
+            structured_output: JSON-вывод вместо TextFSM на платформах из
+                STRUCTURED_COMMANDS (None — parser.structured_output из config.yaml)
         """
         self.credentials = credentials
         # Контекст: явный или глобальный
@@ -124,6 +278,14 @@ class BaseCollector(ABC):
         self.use_ntc = use_ntc and NTC_AVAILABLE
         self.ntc_fields = ntc_fields
         self.max_workers = max_workers
+        self.parse_workers = max(0, parse_workers or 0)
+        if structured_output is None:
+            from ..config import config as app_config
+
+            structured_output = bool(
+                app_config.parser and app_config.parser.get("structured_output", False)
+            )
+        self.structured_output = structured_output
 
         # Менеджер подключений с retry логикой
         self._conn_manager = ConnectionManager(
@@ -132,6 +294,8 @@ class BaseCollector(ABC):
             transport=transport,
             max_retries=max_retries,
             retry_delay=retry_delay,
+            command_cache=command_cache,
+            refresh_cache=refresh_cache,
         )
 
         # NTC парсер
@@ -207,7 +371,11 @@ class BaseCollector(ABC):
         all_data = []
         total = len(devices)
 
-        if parallel and len(devices) > 1:
+        if self.parse_workers and self._supports_parse_pool():
+            all_data = self._collect_sharded(
+                devices, progress_callback, max_workers=self.max_workers if parallel else 1
+            )
+        elif parallel and len(devices) > 1:
             all_data = self._collect_parallel(devices, progress_callback)
         else:
             for idx, device in enumerate(devices):
@@ -236,26 +404,31 @@ class BaseCollector(ABC):
             )
         return [self.model_class.from_dict(row) for row in data]
 
-    def _collect_parallel(
+    def iter_collect(
         self,
         devices: List[Device],
         progress_callback: Optional[ProgressCallback] = None,
-    ) -> List[Dict[str, Any]]:
+    ) -> Iterator[List[Dict[str, Any]]]:
         """
-        Параллельный сбор данных.
+        Параллельный сбор с выдачей данных по мере готовности устройств.
+
+        Строки одного устройства отдаются сразу после его опроса, поэтому
+        потребитель (потоковый API, запись в файл) не держит в памяти
+        весь результат. При досрочной остановке генератора ещё не
+        начатые опросы отменяются.
 
         Args:
             devices: Список устройств
             progress_callback: Callback для отслеживания прогресса
 
-        Returns:
-            List[Dict]: Собранные данные
+        Yields:
+            List[Dict]: Данные одного устройства
         """
-        all_data = []
         total = len(devices)
         completed_count = 0
 
-        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+        executor = ThreadPoolExecutor(max_workers=self.max_workers)
+        try:
             futures = {
                 executor.submit(self._collect_from_device, device): device
                 for device in devices
@@ -264,11 +437,9 @@ class BaseCollector(ABC):
             for future in as_completed(futures):
                 device = futures[future]
                 completed_count += 1
-                success = False
+                data = []
                 try:
                     data = future.result()
-                    all_data.extend(data)
-                    success = len(data) > 0
                 except CollectorError as e:
                     # Наши типизированные ошибки — логируем с деталями
                     logger.error(f"{self._log_prefix()}Ошибка сбора с {device.host}: {format_error_for_log(e)}")
@@ -278,14 +449,39 @@ class BaseCollector(ABC):
 
                 # Вызываем callback после каждого устройства
                 if progress_callback:
-                    progress_callback(completed_count, total, device.host, success)
+                    progress_callback(completed_count, total, device.host, len(data) > 0)
+                if data:
+                    yield data
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
 
+    def _collect_parallel(
+        self,
+        devices: List[Device],
+        progress_callback: Optional[ProgressCallback] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Параллельный сбор данных.
+
+        Args:
+            devices: Список устройств
+            progress_callback: Callback для отслеживания прогресса
+
+        Returns:
+            List[Dict]: Собранные данные
+        """
+        all_data = []
+        for data in self.iter_collect(devices, progress_callback):
+            all_data.extend(data)
         return all_data
 
     def _collect_from_device(self, device: Device) -> List[Dict[str, Any]]:
         """
         Собирает данные с одного устройства.
 
+        Выполняет команды (_fetch_outputs) и разбирает выводы
+        (_process_outputs) в одном потоке.
+
         Args:
             device: Устройство
 
@@ -300,16 +496,219 @@ class BaseCollector(ABC):
         try:
             with self._conn_manager.connect(device, self.credentials) as conn:
                 hostname = self._init_device_connection(conn, device)
+                outputs = self._fetch_outputs(conn, device)
+                return self._process_outputs(outputs, device, hostname)
 
-                response = conn.send_command(command)
-                data = self._parse_output(response.result, device)
+        except Exception as e:
+            return self._handle_collection_error(e, device)
 
-                self._add_metadata_to_rows(data, hostname, device.host)
-                logger.info(f"{hostname}: собрано {len(data)} записей")
-                return data
+    def _fetch_outputs(self, conn, device: Device) -> Dict[str, str]:
+        """
+        Выполняет команды на устройстве и возвращает сырые выводы (только I/O).
+
+        Args:
+            conn: Активное соединение
+            device: Устройство
+
+        Returns:
+            Dict: {ключ: вывод команды}
+        """
+        return {"main": self._send_main_command(conn, device)}
+
+    def _send_batch(
+        self,
+        conn,
+        device: Device,
+        commands: Dict[str, str],
+    ) -> Dict[str, str]:
+        """
+        Выполняет команды пакетом (send_commands), если платформа позволяет.
+
+        Первая команда — основная: её ошибка прерывает сбор. Ошибка
+        остальных (вторичных) не прерывает сбор — их вывод просто
+        отсутствует в результате. По одной повторяются только команды
+        без ответа: пакет оборвался (stop_on_failed, CachedConnection)
+        или бросил исключение — scrapli тогда не отдаёт частичный
+        результат, и повторяются все. Ответ с failed не повторяется:
+        send_command вернул бы тот же вывод ошибки.
+
+        Args:
+            conn: Активное соединение
+            device: Устройство
+            commands: {ключ: команда}, основная команда первой
 
+        Returns:
+            Dict: {ключ: вывод команды}
+        """
+        keys = list(commands)
+        outputs: Dict[str, str] = {}
+        if len(keys) > 1 and supports_batch(device.platform):
+            try:
+                responses = conn.send_commands([commands[key] for key in keys])
+                for key, response in zip(keys, responses):
+                    outputs[key] = response.result
+            except Exception as e:
+                logger.debug(f"{device.host}: ошибка пакета команд ({e}), выполняем по одной")
+            if outputs and len(outputs) < len(keys):
+                logger.debug(
+                    f"{device.host}: пакет вернул {len(outputs)} ответов "
+                    f"из {len(keys)}, остальные выполняем по одной"
+                )
+
+        main = keys[0]
+        if main not in outputs:
+            outputs[main] = conn.send_command(commands[main]).result
+        for key in keys[1:]:
+            if key in outputs:
+                continue
+            try:
+                outputs[key] = conn.send_command(commands[key]).result
+            except Exception as e:
+                logger.warning(f"{device.host}: ошибка получения {key} info: {e}")
+        return {key: outputs[key] for key in keys if key in outputs}
+
+    def _process_outputs(
+        self,
+        outputs: Dict[str, str],
+        device: Device,
+        hostname: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        Парсит и нормализует выводы команд (без подключения к устройству).
+
+        В шардированном режиме вызывается в процессе-парсере, поэтому
+        не должен обращаться к соединению и изменять состояние коллектора.
+
+        Args:
+            outputs: Результат _fetch_outputs
+            device: Устройство
+            hostname: Hostname устройства
+
+        Returns:
+            List[Dict]: Данные с устройства
+        """
+        data = self._parse_output(outputs["main"], device)
+        self._add_metadata_to_rows(data, hostname, device.host)
+        logger.info(f"{hostname}: собрано {len(data)} записей")
+        return data
+
+    def _supports_parse_pool(self) -> bool:
+        """Коллектор использует разделение fetch/process (не свой _collect_from_device)."""
+        return type(self)._collect_from_device is BaseCollector._collect_from_device
+
+    def _parse_pool_options(self) -> Dict[str, Any]:
+        """
+        Аргументы конструктора для копии коллектора в процессе-парсере.
+
+        Наследники добавляют свои параметры парсинга и нормализации.
+        Учётные данные в процессы не передаются.
+        """
+        return {
+            "use_ntc": self.use_ntc,
+            "ntc_fields": self.ntc_fields,
+            "structured_output": self.structured_output,
+        }
+
+    def _fetch_device(self, device: Device) -> Optional[Tuple[str, Dict[str, str]]]:
+        """
+        I/O-стадия шардированного сбора: подключение и выполнение команд.
+
+        Args:
+            device: Устройство
+
+        Returns:
+            (hostname, outputs) или None при ошибке / отсутствии команды
+        """
+        if not self._get_command(device):
+            logger.warning(f"Нет команды для {device.platform}")
+            return None
+
+        try:
+            with self._conn_manager.connect(device, self.credentials) as conn:
+                hostname = self._init_device_connection(conn, device)
+                return hostname, self._fetch_outputs(conn, device)
         except Exception as e:
-            return self._handle_collection_error(e, device)
+            self._handle_collection_error(e, device)
+            return None
+
+    def _collect_sharded(
+        self,
+        devices: List[Device],
+        progress_callback: Optional[ProgressCallback] = None,
+        max_workers: Optional[int] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Сбор в две стадии: потоки выполняют команды, процессы парсят.
+
+        Выводы устройства отправляются в пул процессов сразу после
+        получения, поэтому разбор идёт параллельно с опросом остальных
+        устройств. Процессы запускаются через spawn (безопасно при
+        работающих потоках) и получают уже загруженные шаблоны.
+
+        Args:
+            devices: Список устройств
+            progress_callback: Callback для отслеживания прогресса
+            max_workers: Потоков для I/O (по умолчанию self.max_workers)
+
+        Returns:
+            List[Dict]: Собранные данные
+        """
+        all_data = []
+        total = len(devices)
+        completed_count = 0
+
+        def report(device: Device, success: bool) -> None:
+            nonlocal completed_count
+            completed_count += 1
+            if progress_callback:
+                progress_callback(completed_count, total, device.host, success)
+
+        parse_pool = ProcessPoolExecutor(
+            max_workers=self.parse_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_parse_worker,
+            initargs=(
+                type(self),
+                self._parse_pool_options(),
+                self._skip_normalize,
+                get_template_cache(),
+                logging.getLogger().getEffectiveLevel(),
+            ),
+        )
+
+        with parse_pool, ThreadPoolExecutor(max_workers=max_workers or self.max_workers) as io_pool:
+            fetch_futures = {
+                io_pool.submit(self._fetch_device, device): device
+                for device in devices
+            }
+            parse_futures = {}
+
+            for future in as_completed(fetch_futures):
+                device = fetch_futures[future]
+                fetched = future.result()
+                if fetched is None:
+                    report(device, False)
+                    continue
+                hostname, outputs = fetched
+                worker_device = Device(host=device.host, platform=device.platform)
+                parse_futures[
+                    parse_pool.submit(_parse_in_worker, worker_device, hostname, outputs)
+                ] = device
+
+            for future in as_completed(parse_futures):
+                device = parse_futures[future]
+                data = []
+                try:
+                    batch, records = future.result()
+                    _emit_worker_logs(records)
+                    data = unpack_rows(batch)
+                    all_data.extend(data)
+                except Exception as e:
+                    _emit_worker_logs(getattr(e, "worker_logs", []))
+                    self._handle_collection_error(e, device)
+                report(device, len(data) > 0)
+
+        return all_data
 
     def _get_command(self, device: Device) -> str:
         """
@@ -328,6 +727,52 @@ class BaseCollector(ABC):
         # Иначе используем общую команду
         return self.command
 
+    def _structured_command(self, device: Device) -> str:
+        """JSON-команда для устройства или "" (выключено / платформа не поддерживает)."""
+        if not self.structured_output or not self.structured_key:
+            return ""
+        return get_structured_command(self.structured_key, device.platform)
+
+    def _main_command(self, device: Device) -> str:
+        """Основная команда: JSON-вариант, если доступен, иначе текстовая."""
+        return self._structured_command(device) or self._get_command(device)
+
+    def _text_fallback(self, conn, device: Device, output: str) -> str:
+        """
+        Повторяет текстовую команду, если JSON-команда не вернула JSON.
+
+        Args:
+            conn: Активное соединение
+            device: Устройство
+            output: Вывод основной команды (_main_command)
+
+        Returns:
+            str: JSON-вывод или вывод текстовой команды
+        """
+        structured = self._structured_command(device)
+        if not structured or is_structured_output(output):
+            return output
+        logger.warning(
+            f"{device.host}: '{structured}' не вернула JSON, используем текстовую команду"
+        )
+        return conn.send_command(self._get_command(device)).result
+
+    def _send_main_command(self, conn, device: Device) -> str:
+        """Выполняет основную команду (JSON, если доступна) и возвращает вывод."""
+        output = conn.send_command(self._main_command(device)).result
+        return self._text_fallback(conn, device, output)
+
+    def _parse_structured(self, output: str, device: Device) -> Optional[List[Dict[str, Any]]]:
+        """
+        Сырые строки из JSON-вывода (без TextFSM).
+
+        Returns:
+            List[Dict] или None, если вывод не JSON — тогда разбирается как текст
+        """
+        if not self._structured_command(device):
+            return None
+        return parse_structured(output, device.platform, self.structured_key)
+
     def _init_device_connection(self, conn, device: Device) -> str:
         """
         Инициализирует подключение: hostname, metadata, status.
@@ -27,6 +27,7 @@ ProgressCallback = Callable[[int, int, str, bool], None]
 from ..parsers.textfsm_parser import NTCParser
 
 from ..core.device import Device
+from ..core.command_cache import CommandOutputCache
 from ..core.connection import ConnectionManager
 from ..core.credentials import Credentials
 from ..core.constants import normalize_device_model, slugify
@@ -99,6 +100,8 @@ class DeviceCollector:
         transport: str = "ssh2",
         max_retries: int = 2,
         retry_delay: int = 5,
+        command_cache: Optional[CommandOutputCache] = None,
+        refresh_cache: bool = False,
     ):
         """
         Инициализация коллектора устройств.
@@ -113,6 +116,8 @@ class DeviceCollector:
             transport: Тип транспорта (ssh2, paramiko, system)
             max_retries: Максимум повторных попыток при ошибке подключения
             retry_delay: Задержка между попытками (секунды)
+            command_cache: Кэш выводов команд между сборами (None — без кэша)
+            refresh_cache: Опросить устройства, не читая кэш
         """
         self.credentials = credentials
         self.max_workers = max_workers
@@ -128,6 +133,8 @@ class DeviceCollector:
             transport=transport,
             max_retries=max_retries,
             retry_delay=retry_delay,
+            command_cache=command_cache,
+            refresh_cache=refresh_cache,
         )
 
         self._parser = NTCParser()
@@ -32,6 +32,7 @@ from ..core.domain.interface import InterfaceNormalizer
 from ..core.constants import COLLECTOR_COMMANDS
 from ..core.constants.commands import SECONDARY_COMMANDS
 from ..core.constants.interfaces import get_interface_aliases, normalize_interface_full
+from ..parsers.regex_fallback import parse_lag_membership, parse_switchport_modes
 
 logger = get_logger(__name__)
 
@@ -60,6 +61,7 @@ class InterfaceCollector(BaseCollector):
 
     # Команды для разных платформ (из централизованного хранилища)
     platform_commands = COLLECTOR_COMMANDS.get("interfaces", {})
+    structured_key = "interfaces"
 
     # Вторичные команды (из централизованного хранилища commands.py)
     error_commands = SECONDARY_COMMANDS.get("interface_errors", {})
@@ -116,6 +118,11 @@ class InterfaceCollector(BaseCollector):
         Returns:
             List[Dict]: Сырые данные интерфейсов
         """
+        # JSON-вывод (structured_output) — без TextFSM
+        data = self._parse_structured(output, device)
+        if data is not None:
+            return data
+
         # Пробуем TextFSM
         if self.use_ntc:
             data = self._parse_with_textfsm(output, device)
@@ -199,125 +206,150 @@ class InterfaceCollector(BaseCollector):
     
     # Нормализация перенесена в Domain Layer: core/domain/interface.py (InterfaceNormalizer)
 
-    def _collect_from_device(self, device: Device) -> List[Dict[str, Any]]:
+    def _parse_pool_options(self) -> Dict[str, Any]:
+        """Параметры сбора интерфейсов для процесса-парсера."""
+        options = super()._parse_pool_options()
+        options.update(
+            include_errors=self.include_errors,
+            collect_lag_info=self.collect_lag_info,
+            collect_switchport=self.collect_switchport,
+            collect_media_type=self.collect_media_type,
+        )
+        return options
+
+    def _fetch_outputs(self, conn, device: Device) -> Dict[str, str]:
+        """
+        Выполняет show interfaces и вторичные команды (только I/O).
+
+        Команды отправляются одним пакетом (см. BATCH_PLATFORMS в
+        commands.py). Ошибка вторичной команды не прерывает сбор — её
+        вывод просто отсутствует в результате.
+
+        Args:
+            conn: Активное соединение
+            device: Устройство
+
+        Returns:
+            Dict: {"main", "lag", "switchport", "media_type"}
+        """
+        commands = {"main": self._main_command(device)}
+
+        # --format parsed: только основная команда
+        if not self._skip_normalize:
+            secondary = (
+                ("lag", self.collect_lag_info, self.lag_commands),
+                ("switchport", self.collect_switchport, self.switchport_commands),
+                ("media_type", self.collect_media_type, self.media_type_commands),
+            )
+            for key, enabled, platform_commands in secondary:
+                cmd = platform_commands.get(device.platform) if enabled else None
+                if enabled and not cmd:
+                    logger.debug(f"Нет команды {key} для платформы {device.platform}")
+                if cmd:
+                    commands[key] = cmd
+
+        outputs = self._send_batch(conn, device, commands)
+        outputs["main"] = self._text_fallback(conn, device, outputs["main"])
+        return outputs
+
+    def _process_outputs(
+        self,
+        outputs: Dict[str, str],
+        device: Device,
+        hostname: str,
+    ) -> List[Dict[str, Any]]:
         """
-        Собирает данные с одного устройства.
+        Парсит и нормализует интерфейсы устройства.
 
         Архитектура:
         1. Collector: парсинг (TextFSM/regex) → сырые данные
         2. Domain (InterfaceNormalizer): нормализация и обогащение
 
         Args:
+            outputs: Результат _fetch_outputs
             device: Устройство
+            hostname: Hostname устройства
 
         Returns:
             List[Dict]: Нормализованные данные с устройства
         """
-        command = self._get_command(device)
-        if not command:
-            logger.warning(f"Нет команды для {device.platform}")
-            return []
-
-        try:
-            with self._conn_manager.connect(device, self.credentials) as conn:
-                hostname = self._init_device_connection(conn, device)
-
-                # 1. Парсим основную команду show interfaces (СЫРЫЕ данные)
-                response = conn.send_command(command)
-                raw_data = self._parse_output(response.result, device)
-
-                # --format parsed: сырые данные TextFSM, без нормализации
-                if self._skip_normalize:
-                    self._add_metadata_to_rows(raw_data, hostname, device.host)
-                    logger.info(f"{hostname}: собрано {len(raw_data)} интерфейсов (parsed, без нормализации)")
-                    return raw_data
-
-                # 2. Domain Layer: нормализация через InterfaceNormalizer
-                data = self._normalizer.normalize_dicts(
-                    raw_data, hostname=hostname, device_ip=device.host
-                )
+        # 1. Парсим основную команду show interfaces (СЫРЫЕ данные)
+        raw_data = self._parse_output(outputs["main"], device)
+
+        # --format parsed: сырые данные TextFSM, без нормализации
+        if self._skip_normalize:
+            self._add_metadata_to_rows(raw_data, hostname, device.host)
+            logger.info(f"{hostname}: собрано {len(raw_data)} интерфейсов (parsed, без нормализации)")
+            return raw_data
+
+        # 2. Domain Layer: нормализация через InterfaceNormalizer
+        data = self._normalizer.normalize_dicts(
+            raw_data, hostname=hostname, device_ip=device.host
+        )
 
-                # 3. Собираем дополнительные данные для обогащения
-                lag_membership = {}
-                if self.collect_lag_info:
-                    lag_cmd = self.lag_commands.get(device.platform)
-                    if lag_cmd:
-                        try:
-                            lag_response = conn.send_command(lag_cmd)
-                            # Диспетч парсера LAG по платформе (data-driven)
-                            parser_name = self.LAG_PARSERS.get(device.platform)
-                            if parser_name:
-                                lag_membership = getattr(self, parser_name)(
-                                    lag_response.result,
-                                )
-                            else:
-                                lag_membership = self._parse_lag_membership(
-                                    lag_response.result,
-                                    device.platform,
-                                    lag_cmd,
-                                )
-                        except Exception as e:
-                            logger.debug(f"Ошибка получения LAG info: {e}")
-
-                switchport_modes = {}
-                if self.collect_switchport:
-                    sw_cmd = self.switchport_commands.get(device.platform)
-                    logger.debug(f"{hostname}: collect_switchport={self.collect_switchport}, platform={device.platform}, sw_cmd={sw_cmd}")
-                    if sw_cmd:
-                        try:
-                            sw_response = conn.send_command(sw_cmd)
-                            switchport_modes = self._parse_switchport_modes(
-                                sw_response.result,
-                                device.platform,
-                                sw_cmd,
-                            )
-                            logger.debug(f"{hostname}: switchport_modes содержит {len(switchport_modes)} записей")
-                            if switchport_modes:
-                                # Показываем первые 3 для отладки
-                                sample = list(switchport_modes.items())[:3]
-                                logger.debug(f"{hostname}: пример switchport_modes: {sample}")
-                        except Exception as e:
-                            logger.warning(f"{hostname}: ошибка получения switchport info: {e}")
-                    else:
-                        logger.debug(f"{hostname}: нет команды switchport для платформы {device.platform}")
-
-                media_types = {}
-                if self.collect_media_type:
-                    mt_cmd = self.media_type_commands.get(device.platform)
-                    logger.debug(f"{hostname}: collect_media_type={self.collect_media_type}, platform={device.platform}, mt_cmd={mt_cmd}")
-                    if mt_cmd:
-                        try:
-                            mt_response = conn.send_command(mt_cmd)
-                            logger.debug(f"{hostname}: transceiver output length={len(mt_response.result)}")
-                            media_types = self._parse_media_types(
-                                mt_response.result,
-                                device.platform,
-                                mt_cmd,
-                            )
-                            logger.debug(f"{hostname}: media_types содержит {len(media_types)} записей")
-                            if media_types:
-                                sample = list(media_types.items())[:3]
-                                logger.debug(f"{hostname}: пример media_types: {sample}")
-                        except Exception as e:
-                            logger.warning(f"{hostname}: ошибка получения media_type: {e}")
-
-                # 4. Domain Layer: обогащение данных
-                if lag_membership:
-                    data = self._normalizer.enrich_with_lag(data, lag_membership)
+        # 3. Разбираем дополнительные данные для обогащения
+        lag_membership = {}
+        if "lag" in outputs:
+            try:
+                # Диспетч парсера LAG по платформе (data-driven)
+                parser_name = self.LAG_PARSERS.get(device.platform)
+                if parser_name:
+                    lag_membership = getattr(self, parser_name)(outputs["lag"])
+                else:
+                    lag_membership = self._parse_lag_membership(
+                        outputs["lag"],
+                        device.platform,
+                        self.lag_commands[device.platform],
+                    )
+            except Exception as e:
+                logger.debug(f"Ошибка получения LAG info: {e}")
 
+        switchport_modes = {}
+        if "switchport" in outputs:
+            try:
+                switchport_modes = self._parse_switchport_modes(
+                    outputs["switchport"],
+                    device.platform,
+                    self.switchport_commands[device.platform],
+                )
+                logger.debug(f"{hostname}: switchport_modes содержит {len(switchport_modes)} записей")
                 if switchport_modes:
-                    data = self._normalizer.enrich_with_switchport(
-                        data, switchport_modes, lag_membership
-                    )
+                    # Показываем первые 3 для отладки
+                    sample = list(switchport_modes.items())[:3]
+                    logger.debug(f"{hostname}: пример switchport_modes: {sample}")
+            except Exception as e:
+                logger.warning(f"{hostname}: ошибка получения switchport info: {e}")
 
+        media_types = {}
+        if "media_type" in outputs:
+            try:
+                logger.debug(f"{hostname}: transceiver output length={len(outputs['media_type'])}")
+                media_types = self._parse_media_types(
+                    outputs["media_type"],
+                    device.platform,
+                    self.media_type_commands[device.platform],
+                )
+                logger.debug(f"{hostname}: media_types содержит {len(media_types)} записей")
                 if media_types:
-                    data = self._normalizer.enrich_with_media_type(data, media_types)
+                    sample = list(media_types.items())[:3]
+                    logger.debug(f"{hostname}: пример media_types: {sample}")
+            except Exception as e:
+                logger.warning(f"{hostname}: ошибка получения media_type: {e}")
 
-                logger.info(f"{hostname}: собрано {len(data)} интерфейсов")
-                return data
+        # 4. Domain Layer: обогащение данных
+        if lag_membership:
+            data = self._normalizer.enrich_with_lag(data, lag_membership)
 
-        except Exception as e:
-            return self._handle_collection_error(e, device)
+        if switchport_modes:
+            data = self._normalizer.enrich_with_switchport(
+                data, switchport_modes, lag_membership
+            )
+
+        if media_types:
+            data = self._normalizer.enrich_with_media_type(data, media_types)
+
+        logger.info(f"{hostname}: собрано {len(data)} интерфейсов")
+        return data
 
     def _parse_lag_membership(
         self,
@@ -459,24 +491,8 @@ class InterfaceCollector(BaseCollector):
         """
         membership = {}
 
-        # Ищем строки с Port-channel и member портами
-        # Po1(SU)  LACP  Gi0/1(P) Gi0/2(P)
-        pattern = re.compile(
-            r"(Po\d+)\([^)]*\)\s+"  # Po1(SU)
-            r"(?:LACP|PAgP|ON|-)\s+"  # Protocol
-            r"(.+)$",  # Member ports
-            re.MULTILINE
-        )
-
-        for match in pattern.finditer(output):
-            lag_name = match.group(1)  # Po1
-            members_str = match.group(2)
-
-            # Парсим member порты: Gi0/1(P) Twe1/0/27(P) Hu1/0/51(P) Eth1/1(P)
-            member_pattern = re.compile(r"([A-Za-z]+[\d/]+)\([^)]*\)")
-            for member_match in member_pattern.finditer(members_str):
-                member = member_match.group(1)
-                self._add_lag_member_aliases(membership, member, lag_name)
+        for member, lag_name in parse_lag_membership(output):
+            self._add_lag_member_aliases(membership, member, lag_name)
 
         return membership
 
@@ -541,54 +557,7 @@ class InterfaceCollector(BaseCollector):
         Returns:
             Dict: {interface: {mode, native_vlan, access_vlan}}
         """
-        modes = {}
-        current_interface = None
-        current_data = {}
-
-        for line in output.splitlines():
-            line = line.strip()
-
-            # Новый интерфейс
-            if line.startswith("Name:"):
-                if current_interface and current_data:
-                    modes[current_interface] = current_data
-                current_interface = line.split(":", 1)[1].strip()
-                current_data = {"mode": "", "native_vlan": "", "access_vlan": ""}
-                continue
-
-            if current_interface:
-                # Administrative Mode: trunk / access / dynamic
-                if "Administrative Mode:" in line:
-                    mode = line.split(":", 1)[1].strip().lower()
-                    if "access" in mode:
-                        current_data["mode"] = "access"
-                    elif "trunk" in mode or "dynamic" in mode:
-                        # По умолчанию tagged-all, если не указаны конкретные VLAN
-                        current_data["mode"] = "tagged-all"
-
-                # Trunking VLANs Enabled: ALL / 1,10,20
-                elif "Trunking VLANs Enabled:" in line:
-                    vlans = line.split(":", 1)[1].strip().lower()
-                    if vlans != "all" and vlans and current_data.get("mode") in ("tagged-all", "tagged"):
-                        # Есть конкретные VLAN - это tagged, не tagged-all
-                        current_data["mode"] = "tagged"
-
-                # Access Mode VLAN: 1
-                elif "Access Mode VLAN:" in line:
-                    parts = line.split(":", 1)[1].strip().split()
-                    if parts:
-                        current_data["access_vlan"] = parts[0]
-
-                # Trunking Native Mode VLAN: 1
-                elif "Native Mode VLAN:" in line:
-                    parts = line.split(":", 1)[1].strip().split()
-                    if parts:
-                        current_data["native_vlan"] = parts[0]
-
-        # Последний интерфейс
-        if current_interface and current_data:
-            modes[current_interface] = current_data
-
+        modes = parse_switchport_modes(output)
         return modes
 
     def _parse_media_types(
@@ -55,6 +55,7 @@ class InventoryCollector(BaseCollector):
 
     # Команды для разных платформ (из централизованного хранилища)
     platform_commands = COLLECTOR_COMMANDS.get("inventory", {})
+    structured_key = "inventory"
 
     # Команды для трансиверов (из централизованного хранилища commands.py)
     transceiver_commands = SECONDARY_COMMANDS.get("transceiver", {})
@@ -93,6 +94,11 @@ class InventoryCollector(BaseCollector):
         Returns:
             List[Dict]: Сырые данные компонентов
         """
+        # JSON-вывод (structured_output) — без TextFSM
+        data = self._parse_structured(output, device)
+        if data is not None:
+            return data
+
         # Пробуем NTC Templates
         if self.use_ntc:
             data = self._parse_with_textfsm(output, device)
@@ -164,8 +170,7 @@ class InventoryCollector(BaseCollector):
                 # 1. Парсим сырые данные show inventory (если команда есть)
                 raw_data = []
                 if command:
-                    response = conn.send_command(command)
-                    raw_data = self._parse_output(response.result, device)
+                    raw_data = self._parse_output(self._send_main_command(conn, device), device)
 
                 # --format parsed: сырые данные TextFSM, без нормализации
                 if self._skip_normalize:
@@ -39,6 +39,7 @@ from ..core.exceptions import (
 from ..core.constants import COLLECTOR_COMMANDS, normalize_interface_short
 from ..core.constants.commands import SECONDARY_COMMANDS
 from ..core.domain.lldp import LLDPNormalizer
+from ..parsers.regex_fallback import parse_cdp_detail, parse_lldp_detail
 
 logger = get_logger(__name__)
 
@@ -65,6 +66,7 @@ class LLDPCollector(BaseCollector):
 
     # Команды для LLDP (detail) - из централизованного хранилища
     lldp_commands = COLLECTOR_COMMANDS.get("lldp", {})
+    structured_key = "lldp"
 
     # Команды для LLDP summary (из централизованного хранилища commands.py)
     lldp_summary_commands = SECONDARY_COMMANDS.get("lldp_summary", {})
@@ -97,6 +99,12 @@ class LLDPCollector(BaseCollector):
         else:
             self.platform_commands = self.lldp_commands
 
+    def _structured_command(self, device: Device) -> str:
+        """JSON-команда только для LLDP: CDP на NX-OS/EOS отдаётся текстом."""
+        if self.protocol == "cdp":
+            return ""
+        return super()._structured_command(device)
+
     def _collect_from_device(self, device: Device) -> List[Dict[str, Any]]:
         """
         Собирает LLDP/CDP данные с устройства.
@@ -137,8 +145,7 @@ class LLDPCollector(BaseCollector):
                         logger.info(f"{hostname}: собрано {len(all_raw)} записей (parsed, без нормализации)")
                         return all_raw
                     else:
-                        response = conn.send_command(command)
-                        raw_data = self._parse_output(response.result, device)
+                        raw_data = self._parse_output(self._send_main_command(conn, device), device)
                         self._add_metadata_to_rows(raw_data, hostname, device.host)
                         logger.info(f"{hostname}: собрано {len(raw_data)} записей (parsed, без нормализации)")
                         return raw_data
@@ -148,8 +155,7 @@ class LLDPCollector(BaseCollector):
                     raw_data = self._collect_both_protocols(conn, device, hostname)
                 else:
                     # Один протокол - парсим сырые данные
-                    response = conn.send_command(command)
-                    raw_data = self._parse_output(response.result, device)
+                    raw_data = self._parse_output(self._send_main_command(conn, device), device)
                     # Нормализация через Domain Layer
                     raw_data = self._normalizer.normalize_dicts(
                         raw_data,
@@ -205,9 +211,9 @@ class LLDPCollector(BaseCollector):
         # Собираем и нормализуем LLDP detail
         lldp_command = self.lldp_commands.get(device.platform)
         if lldp_command:
-            response = conn.send_command(lldp_command)
+            output = self._send_main_command(conn, device)
             # Передаём команду явно для правильного TextFSM шаблона
-            raw_lldp = self._parse_output(response.result, device, command=lldp_command, protocol="lldp")
+            raw_lldp = self._parse_output(output, device, command=lldp_command, protocol="lldp")
             lldp_data = self._normalizer.normalize_dicts(
                 raw_lldp, protocol="lldp", hostname=hostname, device_ip=device.host
             )
@@ -383,6 +389,12 @@ class LLDPCollector(BaseCollector):
         """
         proto = protocol or self.protocol
 
+        # JSON-вывод LLDP (structured_output) — без TextFSM
+        if proto != "cdp":
+            data = self._parse_structured(output, device)
+            if data is not None:
+                return data
+
         # Пробуем TextFSM с явной командой
         if self.use_ntc:
             data = self._parse_with_textfsm(output, device, command=command)
@@ -409,87 +421,9 @@ class LLDPCollector(BaseCollector):
         Returns:
             List[Dict]: Соседи
         """
-        neighbors = []
-
-        # Паттерны для Cisco IOS LLDP
-        local_intf_pattern = re.compile(r"Local Intf:\s*(\S+)")
-        chassis_id_pattern = re.compile(r"Chassis id:\s*(\S+)")
-        port_id_pattern = re.compile(r"Port id:\s*(.+?)(?:\n|$)")
-        port_desc_pattern = re.compile(r"Port Description:\s*(.+?)(?:\n|$)")
-        system_name_pattern = re.compile(r"System Name:\s*(.+?)(?:\n|$)")
-        system_desc_pattern = re.compile(r"System Description:\s*\n(.+?)(?:\n\n|\nTime)", re.DOTALL)
-        mgmt_ip_pattern = re.compile(r"IP:\s*(\d+\.\d+\.\d+\.\d+)")
-
-        # Определяем формат вывода
-        has_local_intf = "Local Intf:" in output
-
-        if has_local_intf:
-            # Формат с "Local Intf:" - разбиваем по нему
-            blocks = re.split(r"(?=Local Intf:)", output)
-        else:
-            # Формат без "Local Intf:" - разбиваем по разделителю блоков
-            blocks = re.split(r"-{20,}", output)
-
-        for block in blocks:
-            if not block.strip():
-                continue
-            # Пропускаем блоки без данных соседа
-            if "Chassis id:" not in block:
-                continue
-
-            neighbor = {}
-
-            # Локальный интерфейс (может отсутствовать в старом формате)
-            match = local_intf_pattern.search(block)
-            if match:
-                neighbor["local_interface"] = match.group(1)
-
-            # Chassis ID (обычно MAC)
-            match = chassis_id_pattern.search(block)
-            if match:
-                neighbor["chassis_id"] = match.group(1)
-
-            # Port ID (remote port)
-            match = port_id_pattern.search(block)
-            if match:
-                port_id = match.group(1).strip()
-                # Port ID может быть числом, MAC или именем интерфейса
-                neighbor["port_id"] = port_id
-
-            # Port Description (может содержать имя интерфейса)
-            match = port_desc_pattern.search(block)
-            if match:
-                port_desc = match.group(1).strip()
-                if port_desc and port_desc != "- not advertised":
-                    neighbor["port_description"] = port_desc
-
-            # System Name (remote hostname)
-            match = system_name_pattern.search(block)
-            if match:
-                sys_name = match.group(1).strip()
-                if sys_name and sys_name != "- not advertised":
-                    neighbor["remote_hostname"] = sys_name
-
-            # System Description
-            match = system_desc_pattern.search(block)
-            if match:
-                sys_desc = match.group(1).strip()
-                if sys_desc:
-                    neighbor["remote_description"] = sys_desc
-
-            # Management IP
-            match = mgmt_ip_pattern.search(block)
-            if match:
-                neighbor["remote_ip"] = match.group(1)
-
-            # remote_port определяется в Domain Layer (LLDPNormalizer)
-            # Здесь оставляем сырые port_id и port_description
-
-            # Добавляем только если есть хоть какие-то данные о соседе
-            if neighbor.get("chassis_id") or neighbor.get("remote_hostname"):
-                neighbors.append(neighbor)
-
-        return neighbors
+        # remote_port определяется в Domain Layer (LLDPNormalizer)
+        # Здесь оставляем сырые port_id и port_description
+        return parse_lldp_detail(output)
 
     def _parse_cdp_regex(self, output: str) -> List[Dict[str, Any]]:
         """
@@ -501,52 +435,6 @@ class LLDPCollector(BaseCollector):
         Returns:
             List[Dict]: Соседи
         """
-        neighbors = []
-
-        # Паттерны для CDP
-        device_id_pattern = re.compile(r"Device ID:\s*(\S+)")
-        local_intf_pattern = re.compile(r"Interface:\s*(\S+),")
-        remote_intf_pattern = re.compile(r"Port ID.*?:\s*(\S+)")
-        platform_pattern = re.compile(r"Platform:\s*(.+?),")
-        ip_pattern = re.compile(r"IP address:\s*(\S+)")
-
-        # Разбиваем по "Device ID:"
-        blocks = re.split(r"(?=Device ID:)", output)
-
-        for block in blocks:
-            if not block.strip():
-                continue
-
-            neighbor = {}
-
-            # Device ID (hostname)
-            match = device_id_pattern.search(block)
-            if match:
-                neighbor["remote_hostname"] = match.group(1)
-
-            # Локальный интерфейс
-            match = local_intf_pattern.search(block)
-            if match:
-                neighbor["local_interface"] = match.group(1)
-
-            # Удалённый интерфейс
-            match = remote_intf_pattern.search(block)
-            if match:
-                neighbor["remote_port"] = match.group(1)
-
-            # Платформа
-            match = platform_pattern.search(block)
-            if match:
-                neighbor["remote_platform"] = match.group(1).strip()
-
-            # IP адрес
-            match = ip_pattern.search(block)
-            if match:
-                neighbor["remote_ip"] = match.group(1)
-
-            if neighbor.get("local_interface"):
-                neighbors.append(neighbor)
-
-        return neighbors
+        return parse_cdp_detail(output)
 
     # Нормализация перенесена в Domain Layer: core/domain/lldp.py → LLDPNormalizer
@@ -17,7 +17,6 @@
     collector = MACCollector(mac_format="cisco")
 """
 
-import re
 from typing import List, Dict, Any, Optional, Set, Tuple
 
 from ntc_templates.parse import parse_output
@@ -43,6 +42,11 @@ from ..core.exceptions import (
     format_error_for_log,
 )
 from ..parsers.textfsm_parser import TextFSMParser
+from ..parsers.regex_fallback import (
+    parse_interface_status,
+    parse_mac_table,
+    parse_trunk_ports,
+)
 from ..config import config as app_config
 
 logger = get_logger(__name__)
@@ -75,6 +79,7 @@ class MACCollector(BaseCollector):
 
     # Команды для разных платформ (из централизованного хранилища)
     platform_commands = COLLECTOR_COMMANDS.get("mac", {})
+    structured_key = "mac"
 
     def __init__(
         self,
@@ -120,108 +125,134 @@ class MACCollector(BaseCollector):
             exclude_vlans=self.exclude_vlans,
         )
 
-        # Кэш для хранения статуса интерфейсов текущего устройства
-        self._current_interface_status: Dict[str, str] = {}
-
         # Парсер для кастомных шаблонов
         self._textfsm_parser = TextFSMParser()
 
-    def _collect_from_device(self, device: Device) -> List[Dict[str, Any]]:
+    def _parse_pool_options(self) -> Dict[str, Any]:
+        """Параметры нормализации MAC для процесса-парсера."""
+        options = super()._parse_pool_options()
+        options.update(
+            mac_format=self.mac_format,
+            normalize_interfaces=self.normalize_interfaces,
+            exclude_interfaces=self.exclude_interfaces,
+            exclude_vlans=self.exclude_vlans,
+            collect_descriptions=self.collect_descriptions,
+            collect_trunk_ports=self.collect_trunk_ports,
+            collect_port_security=self.collect_port_security,
+        )
+        return options
+
+    def _fetch_outputs(self, conn, device: Device) -> Dict[str, str]:
         """
-        Собирает MAC-адреса с одного устройства.
+        Выполняет MAC-таблицу и дополнительные команды (только I/O).
+
+        Args:
+            conn: Активное подключение
+            device: Устройство
+
+        Returns:
+            Dict: {"mac", "status", "descriptions", "trunk", "running_config"}
+        """
+        outputs = {"mac": self._send_main_command(conn, device)}
+
+        # --format parsed: только MAC-таблица, без доп. команд и нормализации
+        if self._skip_normalize:
+            return outputs
 
-        Переопределяем базовый метод для дополнительных команд.
+        # Статус интерфейсов для определения online/offline
+        # "show interfaces status" - компактный вывод, быстрый парсинг
+        outputs["status"] = conn.send_command("show interfaces status").result
+
+        if self.collect_descriptions:
+            outputs["descriptions"] = conn.send_command("show interfaces description").result
+
+        # Trunk порты для фильтрации
+        if not self.collect_trunk_ports:
+            outputs["trunk"] = conn.send_command("show interfaces trunk").result
+
+        # Sticky MAC из port-security (show running-config)
+        if self.collect_port_security and self._get_port_security_template(device.platform):
+            try:
+                outputs["running_config"] = conn.send_command("show running-config").result
+            except Exception as e:
+                logger.warning(f"Ошибка сбора sticky MAC: {e}")
+
+        return outputs
+
+    def _process_outputs(
+        self,
+        outputs: Dict[str, str],
+        device: Device,
+        hostname: str,
+    ) -> List[Dict[str, Any]]:
+        """
+        Парсит и нормализует MAC-таблицу устройства.
 
         Args:
+            outputs: Результат _fetch_outputs
             device: Устройство
+            hostname: Hostname устройства
 
         Returns:
-            List[Dict]: Данные с устройства
+            List[Dict]: MAC-записи устройства
         """
-        command = self._get_command(device)
         ntc_platform = get_ntc_platform(device.platform)
 
-        if not command:
-            logger.warning(f"Нет команды для {device.platform}")
-            return []
+        # --format parsed: сырые данные без нормализации
+        if self._skip_normalize:
+            raw_data = self._parse_raw(outputs["mac"], device)
+            self._add_metadata_to_rows(raw_data, hostname, device.host)
+            logger.info(f"{hostname}: собрано {len(raw_data)} MAC-адресов (parsed, без нормализации)")
+            return raw_data
 
-        try:
-            with self._conn_manager.connect(device, self.credentials) as conn:
-                hostname = self._init_device_connection(conn, device)
-
-                # Получаем MAC-таблицу
-                mac_response = conn.send_command(command)
-                mac_output = mac_response.result
-
-                # --format parsed: только MAC-таблица, без доп. команд и нормализации
-                if self._skip_normalize:
-                    raw_data = self._parse_raw(mac_output, device)
-                    self._add_metadata_to_rows(raw_data, hostname, device.host)
-                    logger.info(f"{hostname}: собрано {len(raw_data)} MAC-адресов (parsed, без нормализации)")
-                    return raw_data
-
-                # Получаем статус интерфейсов для определения online/offline
-                # Используем "show interfaces status" - компактный вывод, быстрый парсинг
-                status_response = conn.send_command("show interfaces status")
-                interface_status = self._parse_interface_status(
-                    status_response.result, ntc_platform
-                )
-
-                # Получаем описания интерфейсов если нужно
-                descriptions = {}
-                if self.collect_descriptions:
-                    desc_response = conn.send_command("show interfaces description")
-                    descriptions = self._parse_interface_descriptions(
-                        desc_response.result, ntc_platform
-                    )
-
-                # Получаем trunk порты для фильтрации
-                trunk_interfaces: Set[str] = set()
-                if not self.collect_trunk_ports:
-                    trunk_response = conn.send_command("show interfaces trunk")
-                    trunk_interfaces = self._parse_trunk_interfaces(trunk_response.result)
-
-                # Сохраняем статус интерфейсов для использования в _parse_output
-                self._current_interface_status = interface_status
-
-                # Парсим MAC-таблицу (сырые данные)
-                raw_data = self._parse_raw(mac_output, device)
-
-                # Domain Layer: нормализация через MACNormalizer
-                data = self._normalizer.normalize_dicts(
-                    raw_data,
-                    interface_status=interface_status,
-                    hostname=hostname,
-                    device_ip=device.host,
-                )
-
-                # Собираем sticky MAC из port-security (show running-config)
-                if self.collect_port_security:
-                    sticky_macs = self._collect_sticky_macs(conn, device, interface_status)
-                    # Domain Layer: объединение через MACNormalizer
-                    data = self._normalizer.merge_sticky_macs(
-                        data, sticky_macs, hostname=hostname, device_ip=device.host
-                    )
-                    logger.debug(f"{hostname}: добавлено {len(sticky_macs)} sticky MACs")
-
-                # Добавляем описание интерфейса
-                if self.collect_descriptions:
-                    for row in data:
-                        iface = row.get("interface", "")
-                        row["description"] = descriptions.get(iface, "")
-
-                # Domain Layer: фильтрация trunk портов через MACNormalizer
-                if not self.collect_trunk_ports:
-                    data = self._normalizer.filter_trunk_ports(data, trunk_interfaces)
-
-                # Domain Layer: финальная дедупликация
-                data = self._normalizer.deduplicate(data)
-
-                logger.info(f"{hostname}: собрано {len(data)} MAC-адресов")
-                return data
+        interface_status = self._parse_interface_status(outputs["status"], ntc_platform)
 
-        except Exception as e:
-            return self._handle_collection_error(e, device)
+        descriptions = {}
+        if self.collect_descriptions:
+            descriptions = self._parse_interface_descriptions(
+                outputs["descriptions"], ntc_platform
+            )
+
+        trunk_interfaces: Set[str] = set()
+        if not self.collect_trunk_ports:
+            trunk_interfaces = self._parse_trunk_interfaces(outputs["trunk"])
+
+        # Парсим MAC-таблицу (сырые данные)
+        raw_data = self._parse_raw(outputs["mac"], device)
+
+        # Domain Layer: нормализация через MACNormalizer
+        data = self._normalizer.normalize_dicts(
+            raw_data,
+            interface_status=interface_status,
+            hostname=hostname,
+            device_ip=device.host,
+        )
+
+        if self.collect_port_security:
+            sticky_macs = self._parse_sticky_macs(
+                outputs.get("running_config", ""), device, interface_status
+            )
+            # Domain Layer: объединение через MACNormalizer
+            data = self._normalizer.merge_sticky_macs(
+                data, sticky_macs, hostname=hostname, device_ip=device.host
+            )
+            logger.debug(f"{hostname}: добавлено {len(sticky_macs)} sticky MACs")
+
+        # Добавляем описание интерфейса
+        if self.collect_descriptions:
+            for row in data:
+                iface = row.get("interface", "")
+                row["description"] = descriptions.get(iface, "")
+
+        # Domain Layer: фильтрация trunk портов через MACNormalizer
+        if not self.collect_trunk_ports:
+            data = self._normalizer.filter_trunk_ports(data, trunk_interfaces)
+
+        # Domain Layer: финальная дедупликация
+        data = self._normalizer.deduplicate(data)
+
+        logger.info(f"{hostname}: собрано {len(data)} MAC-адресов")
+        return data
 
     def _parse_raw(
         self,
@@ -241,6 +272,11 @@ class MACCollector(BaseCollector):
         Returns:
             List[Dict]: Сырые данные от парсера
         """
+        # JSON-вывод (structured_output) — без TextFSM
+        data = self._parse_structured(output, device)
+        if data is not None:
+            return data
+
         # Пробуем NTC Templates
         if self.use_ntc:
             data = self._parse_with_ntc(output, device)
@@ -267,30 +303,7 @@ class MACCollector(BaseCollector):
         Returns:
             List[Dict]: Сырые данные
         """
-        data = []
-
-        # Универсальный regex для MAC-таблицы
-        # Формат: VLAN  MAC  TYPE  INTERFACE
-        pattern = re.compile(
-            r"^\s*(\d+)\s+"  # VLAN
-            r"([0-9a-fA-F.:]+)\s+"  # MAC
-            r"(\w+)\s+"  # TYPE (DYNAMIC, STATIC, etc.)
-            r"(\S+)",  # INTERFACE
-            re.MULTILINE,
-        )
-
-        for match in pattern.finditer(output):
-            vlan, mac, mac_type, interface = match.groups()
-
-            data.append(
-                {
-                    "vlan": vlan,
-                    "mac": mac,
-                    "type": mac_type.lower(),
-                    "interface": interface,
-                }
-            )
-
+        data = parse_mac_table(output)
         return data  # Сырые данные, нормализация в Domain Layer
 
     def _parse_output(
@@ -301,7 +314,7 @@ class MACCollector(BaseCollector):
         """
         Парсит вывод команды (реализация абстрактного метода).
 
-        Примечание: MACCollector переопределяет _collect_from_device целиком,
+        Примечание: MACCollector разбирает выводы в _process_outputs,
         поэтому этот метод не вызывается напрямую. Реализован для совместимости
         с абстрактным классом BaseCollector.
 
@@ -394,20 +407,7 @@ class MACCollector(BaseCollector):
             Dict: {interface: status}
         """
         status_map = {}
-
-        # Regex для парсинга строки show interfaces status
-        # Port может быть Gi0/1, Fa0/1, Te0/1, Et0/1 и т.д.
-        # Status: connected, notconnect, disabled, err-disabled, etc.
-        pattern = re.compile(
-            r"^((?:Gi|Fa|Te|Et|Po|Vl)\S+)\s+"  # Port (Gi0/1, Fa0/1, etc.)
-            r"(?:\S.*?)?\s+"  # Name (optional, может быть пустым)
-            r"(connected|notconnect|disabled|err-disabled|inactive|suspended)\s+",  # Status
-            re.MULTILINE | re.IGNORECASE
-        )
-
-        for match in pattern.finditer(output):
-            iface = match.group(1)
-            status = match.group(2).lower()
+        for iface, status in parse_interface_status(output):
             self._add_interface_status(status_map, iface, status)
 
         return status_map
@@ -462,48 +462,34 @@ class MACCollector(BaseCollector):
             Set: Множество trunk интерфейсов
         """
         trunk_interfaces = set()
-        in_port_section = False
-
-        for line in output.splitlines():
-            line = line.strip()
-
-            if not line:
-                continue
-
-            # Начало секции с портами
-            if line.startswith("Port") and "Mode" in line:
-                in_port_section = True
-                continue
-
-            # Другая секция - выходим
-            if "Vlans allowed" in line or "Vlans in spanning" in line:
-                break
-
-            # Парсим trunk порт
-            if in_port_section:
-                parts = line.split()
-                if parts:
-                    iface = parts[0]
-                    if re.match(r"^(Gi|Fa|Te|Eth|Po)", iface, re.IGNORECASE):
-                        # Добавляем все возможные варианты написания
-                        trunk_interfaces.update(get_interface_aliases(iface))
+        for iface in parse_trunk_ports(output):
+            # Добавляем все возможные варианты написания
+            trunk_interfaces.update(get_interface_aliases(iface))
 
         return trunk_interfaces
 
-    def _collect_sticky_macs(
+    def _get_port_security_template(self, platform: str) -> Optional[Tuple[str, str]]:
+        """Ключ шаблона port-security для платформы (cisco_ios как fallback)."""
+        for template_key in ((platform, "port-security"), ("cisco_ios", "port-security")):
+            if template_key in CUSTOM_TEXTFSM_TEMPLATES:
+                return template_key
+        logger.debug(f"Нет шаблона port-security для {platform}")
+        return None
+
+    def _parse_sticky_macs(
         self,
-        conn,
+        output: str,
         device: Device,
         interface_status: Dict[str, str],
     ) -> List[Dict[str, Any]]:
         """
-        Собирает sticky MAC из port-security (show running-config).
+        Парсит sticky MAC из port-security в выводе show running-config.
 
         Парсит конфигурацию интерфейсов для извлечения sticky MAC-адресов.
         Используется для обнаружения offline устройств.
 
         Args:
-            conn: Активное подключение
+            output: Вывод show running-config
             device: Устройство
             interface_status: Статус интерфейсов {interface: status}
 
@@ -513,20 +499,10 @@ class MACCollector(BaseCollector):
         sticky_macs = []
         platform = device.platform
 
-        # Проверяем есть ли шаблон для этой платформы
-        template_key = (platform, "port-security")
-        if template_key not in CUSTOM_TEXTFSM_TEMPLATES:
-            # Пробуем cisco_ios как fallback
-            template_key = ("cisco_ios", "port-security")
-            if template_key not in CUSTOM_TEXTFSM_TEMPLATES:
-                logger.debug(f"Нет шаблона port-security для {platform}")
-                return []
+        if not output:
+            return []
 
         try:
-            # Получаем show running-config
-            response = conn.send_command("show running-config")
-            output = response.result
-
             # Парсим через кастомный шаблон
             parsed = self._textfsm_parser.parse(output, platform, "port-security")
 
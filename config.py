@@ -12,6 +12,7 @@
 
 import os
 import logging
+import importlib.util
 from typing import Any, Optional
 
 from .core.constants.utils import DEFAULT_EXCLUDE_INTERFACES
@@ -31,12 +32,9 @@ except ImportError:
     pass
 
 # Pydantic валидация (опциональна)
-PYDANTIC_AVAILABLE = False
-try:
-    from .core.config_schema import validate_config, AppConfig
-    PYDANTIC_AVAILABLE = True
-except ImportError:
-    pass
+# Схема импортируется только в validate()/get_validated(): pydantic
+# заметно замедляет старт CLI, а большинству команд валидация не нужна
+PYDANTIC_AVAILABLE = importlib.util.find_spec("pydantic") is not None
 
 # Путь к файлу конфигурации
 CONFIG_FILE = os.path.join(os.path.dirname(__file__), "config.yaml")
@@ -115,15 +113,31 @@ class Config:
             "parser": {
                 "use_ntc_templates": True,
                 "custom_templates_path": None,
+                "parse_workers": 0,
+                "structured_output": False,
             },
             "netbox": {
                 "url": os.getenv("NETBOX_URL", "http://localhost:8000/"),
                 "token": os.getenv("NETBOX_TOKEN", ""),
                 "verify_ssl": True,
                 "timeout": 30,
+                "pool_size": 0,
+                "keep_alive": True,
+                "page_size": None,
+                "object_cache": "",
+                "read_backend": "rest",
                 "create_missing": True,
                 "update_existing": True,
             },
+            "command_cache": {
+                "enabled": False,
+                "default_ttl": 300,
+                "max_bytes": 64 * 1024 * 1024,  # 64 MB
+                "ttl": {
+                    "show mac address-table": 60,
+                    "show running-config": 0,
+                },
+            },
             "mac": {
                 "collect_descriptions": True,
                 "collect_trunk_ports": False,
@@ -143,6 +157,8 @@ class Config:
                 "backup_count": 5,
                 "when": "midnight",
                 "interval": 1,
+                "queue": False,
+                "queue_size": 10000,
             },
             "debug": False,
             "devices_file": "devices_ips.py",
@@ -232,6 +248,8 @@ class Config:
         if not PYDANTIC_AVAILABLE:
             raise ImportError("Pydantic не установлен. Установите: pip install pydantic")
 
+        from .core.config_schema import validate_config
+
         validate_config(self._data)
         return True
 
@@ -248,6 +266,8 @@ class Config:
         if not PYDANTIC_AVAILABLE:
             raise ImportError("Pydantic не установлен")
 
+        from .core.config_schema import validate_config
+
         return validate_config(self._data)
 
 
@@ -22,6 +22,7 @@
     results = pusher.push_descriptions(devices, commands, dry_run=True)
 """
 
+import hashlib
 import logging
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Set
@@ -61,6 +62,45 @@ def normalize_mac(mac: str) -> str:
     return normalize_mac_raw(str(mac))
 
 
+def normalize_mac_series(macs: "pd.Series") -> "pd.Series":
+    """
+    Векторная нормализация MAC-адресов (аналог normalize_mac для колонки).
+
+    Работает строковыми операциями pandas без Python-цикла по строкам.
+    Невалидные значения и NaN превращаются в "".
+
+    Args:
+        macs: Колонка с MAC-адресами в любом формате
+
+    Returns:
+        pd.Series: Нормализованные MAC (12 символов, нижний регистр) или ""
+    """
+    clean = (
+        macs.astype("string")
+        .str.strip()
+        .str.lower()
+        .str.replace(r"[:\-. ]", "", regex=True)
+    )
+    clean = clean.where(clean.str.len() == 12, "")
+    return clean.fillna("").astype(object)
+
+
+# Колонки результата сопоставления (порядок полей MatchedEntry)
+MATCHED_COLUMNS = [
+    "hostname",
+    "device_ip",
+    "interface",
+    "mac",
+    "vlan",
+    "host_name",
+    "current_description",
+    "matched",
+]
+
+# Версия формата кэша справочника (менять при изменении структуры)
+_REFERENCE_CACHE_VERSION = 1
+
+
 @dataclass
 class MatchedEntry:
     """Запись сопоставления MAC с хостом."""
@@ -81,9 +121,14 @@ class DescriptionMatcher:
     Загружает справочные данные о хостах (имена ПК, пользователи)
     и сопоставляет их с MAC-адресами, собранными с коммутаторов.
 
+    Справочник и результат хранятся как DataFrame, сопоставление
+    выполняется через merge по нормализованному MAC. Словарь
+    reference_data и список matched_data строятся лениво при обращении.
+
     Attributes:
         reference_data: {normalized_mac: {name: ..., user: ..., ...}}
         matched_data: Список сопоставленных записей
+        cache_dir: Папка кэша нормализованных справочников (None = без кэша)
 
     Example:
         matcher = DescriptionMatcher()
@@ -101,23 +146,62 @@ class DescriptionMatcher:
         commands = matcher.generate_description_commands()
     """
 
-    def __init__(self):
-        """Инициализация матчера."""
+    def __init__(self, cache_dir: Optional[str] = None):
+        """
+        Инициализация матчера.
+
+        Args:
+            cache_dir: Папка для кэша нормализованных справочников.
+                Кэш привязан к mtime/размеру исходного файла, повторная
+                загрузка того же файла пропускает чтение Excel.
+        """
         if not PANDAS_AVAILABLE:
             raise ImportError(
                 "pandas не установлен. Установите: pip install pandas openpyxl"
             )
 
-        # Справочные данные: {normalized_mac: {field: value}}
-        self.reference_data: Dict[str, Dict[str, Any]] = {}
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+
+        # Справочник: колонки mac, name, _source_file + дополнительные
+        self._reference_df = pd.DataFrame(columns=["mac", "name", "_source_file"])
+        self._reference_data: Optional[Dict[str, Dict[str, Any]]] = None
 
-        # Сопоставленные данные
-        self.matched_data: List[MatchedEntry] = []
+        # Результат сопоставления (колонки MATCHED_COLUMNS)
+        self._matched_df = pd.DataFrame(columns=MATCHED_COLUMNS)
+        self._matched_data: Optional[List[MatchedEntry]] = None
 
         # Статистика
         self._loaded_files: List[str] = []
         self._total_matched = 0
 
+    @property
+    def reference_data(self) -> Dict[str, Dict[str, Any]]:
+        """Справочник в виде {normalized_mac: {field: value}} (строится лениво)."""
+        if self._reference_data is None:
+            data: Dict[str, Dict[str, Any]] = {}
+            for record in self._reference_df.to_dict("records"):
+                mac = record.pop("mac")
+                data[mac] = {k: v for k, v in record.items() if not pd.isna(v)}
+            self._reference_data = data
+        return self._reference_data
+
+    @property
+    def matched_data(self) -> List[MatchedEntry]:
+        """Результат сопоставления в виде MatchedEntry (строится лениво)."""
+        if self._matched_data is None:
+            self._matched_data = [
+                MatchedEntry(*row)
+                for row in self._matched_df[MATCHED_COLUMNS].itertuples(
+                    index=False, name=None
+                )
+            ]
+        return self._matched_data
+
+    @property
+    def matched_frame(self) -> "pd.DataFrame":
+        """Результат сопоставления в виде DataFrame (колонки MATCHED_COLUMNS)."""
+        return self._matched_df
+
     def load_hosts_file(
         self,
         file_path: str,
@@ -143,13 +227,52 @@ class DescriptionMatcher:
         if not path.exists():
             raise FileNotFoundError(f"Файл не найден: {file_path}")
 
+        cache_key = "|".join([
+            str(path.resolve()),
+            str(sheet_name or ""),
+            mac_column,
+            name_column,
+            ",".join(additional_columns or []),
+        ])
+        frame = self._read_reference_cache(path, cache_key)
+        if frame is None:
+            frame = self._build_reference_frame(
+                path, mac_column, name_column, additional_columns, sheet_name,
+            )
+            self._write_reference_cache(path, cache_key, frame)
+
+        count = len(frame)
+        self._merge_reference(frame)
+
+        self._loaded_files.append(str(path))
+        logger.info(f"Загружено {count} хостов из {path.name}")
+
+        return count
+
+    def _build_reference_frame(
+        self,
+        path: Path,
+        mac_column: str,
+        name_column: str,
+        additional_columns: Optional[List[str]],
+        sheet_name: Optional[str],
+    ) -> "pd.DataFrame":
+        """
+        Читает Excel и строит нормализованный справочник.
+
+        Одна строка результата = один MAC. Ячейки с несколькими MAC
+        (разделители: \\n, ;, ,) разворачиваются в несколько строк.
+
+        Returns:
+            pd.DataFrame: Колонки mac, name, _source_file + дополнительные
+        """
         try:
             if sheet_name:
                 df = pd.read_excel(path, sheet_name=sheet_name)
             else:
                 df = pd.read_excel(path)
         except Exception as e:
-            logger.error(f"Ошибка чтения файла {file_path}: {e}")
+            logger.error(f"Ошибка чтения файла {path}: {e}")
             raise
 
         # Ищем колонку с MAC
@@ -169,46 +292,106 @@ class DescriptionMatcher:
         if additional_columns:
             for col in additional_columns:
                 found = self._find_column(df, col)
-                if found:
+                if found and found not in extra_cols:
                     extra_cols.append(found)
 
-        # Загружаем данные
-        count = 0
-        for _, row in df.iterrows():
-            raw_mac = row[mac_col]
-            if pd.isna(raw_mac):
-                continue
-
-            # Разбиваем ячейку с несколькими MAC (разделители: \n, ;, ,)
-            mac_list = str(raw_mac).replace(';', '\n').replace(',', '\n').split('\n')
-            mac_list = [normalize_mac(m) for m in mac_list if normalize_mac(m)]
-
-            if not mac_list:
-                continue
-
-            data = {"_source_file": path.name}
+        frame = pd.DataFrame(index=df.index)
+        frame["mac"] = df[mac_col]
 
-            # Имя хоста
-            if name_col and pd.notna(row[name_col]):
-                data["name"] = str(row[name_col]).strip()
-            else:
-                data["name"] = ""
+        # Имя хоста: без имени запись не нужна (нечего ставить в description)
+        if name_col:
+            frame["name"] = df[name_col].astype("string").str.strip().fillna("")
+        else:
+            frame["name"] = ""
 
-            # Дополнительные колонки
-            for col in extra_cols:
-                if pd.notna(row[col]):
-                    data[col] = str(row[col]).strip()
+        # Дополнительные колонки (NaN сохраняется — пропускается в reference_data)
+        for col in extra_cols:
+            frame[col] = df[col].astype("string").str.strip().astype(object)
+            frame[col] = frame[col].where(df[col].notna(), None)
 
-            # Добавляем каждый MAC из ячейки
-            if data.get("name"):  # Только если есть имя
-                for mac in mac_list:
-                    self.reference_data[mac] = data
-                    count += 1
+        frame = frame[df[mac_col].notna() & (frame["name"] != "")]
 
-        self._loaded_files.append(str(path))
-        logger.info(f"Загружено {count} хостов из {path.name}")
+        # Разбиваем ячейку с несколькими MAC и нормализуем векторно
+        frame["mac"] = (
+            frame["mac"].astype("string")
+            .str.replace(";", "\n", regex=False)
+            .str.replace(",", "\n", regex=False)
+            .str.split("\n")
+        )
+        frame = frame.explode("mac")
+        frame["mac"] = normalize_mac_series(frame["mac"])
+        frame = frame[frame["mac"] != ""]
+
+        frame["name"] = frame["name"].astype(object)
+        frame["_source_file"] = path.name
+        return frame[["mac", "name", "_source_file", *extra_cols]].reset_index(drop=True)
+
+    def _merge_reference(self, frame: "pd.DataFrame") -> None:
+        """Добавляет записи в справочник (последняя запись по MAC побеждает)."""
+        if self._reference_df.empty:
+            combined = frame
+        else:
+            combined = pd.concat([self._reference_df, frame], ignore_index=True)
+        self._reference_df = combined.drop_duplicates(
+            subset="mac", keep="last"
+        ).reset_index(drop=True)
+        self._reference_data = None
+
+    def _cache_path(self, cache_key: str) -> Optional[Path]:
+        """Путь к файлу кэша для справочника (None если кэш выключен)."""
+        if not self.cache_dir:
+            return None
+        digest = hashlib.sha1(cache_key.encode("utf-8")).hexdigest()
+        return self.cache_dir / f"hosts_{digest}.pkl"
+
+    def _read_reference_cache(
+        self, path: Path, cache_key: str,
+    ) -> Optional["pd.DataFrame"]:
+        """Возвращает справочник из кэша, если исходный файл не менялся."""
+        cache_path = self._cache_path(cache_key)
+        if not cache_path or not cache_path.exists():
+            return None
 
-        return count
+        try:
+            cached = pd.read_pickle(cache_path)
+        except Exception as e:
+            logger.debug(f"Кэш {cache_path} не прочитан: {e}")
+            return None
+
+        stat = path.stat()
+        if (
+            not isinstance(cached, dict)
+            or cached.get("version") != _REFERENCE_CACHE_VERSION
+            or cached.get("mtime_ns") != stat.st_mtime_ns
+            or cached.get("size") != stat.st_size
+        ):
+            return None
+
+        logger.debug(f"Справочник {path.name} загружен из кэша")
+        return cached["frame"]
+
+    def _write_reference_cache(
+        self, path: Path, cache_key: str, frame: "pd.DataFrame",
+    ) -> None:
+        """Сохраняет нормализованный справочник в кэш."""
+        cache_path = self._cache_path(cache_key)
+        if not cache_path:
+            return
+
+        stat = path.stat()
+        try:
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            pd.to_pickle(
+                {
+                    "version": _REFERENCE_CACHE_VERSION,
+                    "mtime_ns": stat.st_mtime_ns,
+                    "size": stat.st_size,
+                    "frame": frame,
+                },
+                cache_path,
+            )
+        except OSError as e:
+            logger.warning(f"Не удалось сохранить кэш справочника: {e}")
 
     def load_hosts_folder(
         self,
@@ -270,36 +453,93 @@ class DescriptionMatcher:
         Returns:
             List[MatchedEntry]: Сопоставленные записи
         """
-        self.matched_data = []
-        self._total_matched = 0
+        self._match(
+            pd.DataFrame.from_records(list(mac_data)),
+            mac_field=mac_field,
+            hostname_field=hostname_field,
+            interface_field=interface_field,
+            vlan_field=vlan_field,
+            description_field=description_field,
+        )
+        return self.matched_data
 
-        for row in mac_data:
-            mac = row.get(mac_field, "")
-            normalized_mac = normalize_mac(mac)
-
-            entry = MatchedEntry(
-                hostname=row.get(hostname_field, ""),
-                device_ip=row.get("device_ip", ""),
-                interface=row.get(interface_field, ""),
-                mac=mac,
-                vlan=str(row.get(vlan_field, "")),
-                current_description=row.get(description_field, ""),
-            )
+    def match_mac_frame(
+        self,
+        mac_df: "pd.DataFrame",
+        mac_field: str = "mac",
+        hostname_field: str = "hostname",
+        interface_field: str = "interface",
+        vlan_field: str = "vlan",
+        description_field: str = "description",
+    ) -> "pd.DataFrame":
+        """
+        Сопоставляет DataFrame с MAC со справочником хостов.
 
-            # Ищем в справочнике
-            if normalized_mac in self.reference_data:
-                ref = self.reference_data[normalized_mac]
-                entry.host_name = ref.get("name", "")
-                entry.matched = True
-                self._total_matched += 1
+        В отличие от match_mac_data не создаёт MatchedEntry на каждую
+        строку — подходит для больших таблиц (сотни тысяч строк).
 
-            self.matched_data.append(entry)
+        Args:
+            mac_df: DataFrame с данными MAC
+            mac_field: Колонка с MAC-адресом
+            hostname_field: Колонка с hostname устройства
+            interface_field: Колонка с интерфейсом
+            vlan_field: Колонка с VLAN
+            description_field: Колонка с текущим описанием
 
-        logger.info(
-            f"Сопоставлено {self._total_matched} из {len(self.matched_data)} записей"
+        Returns:
+            pd.DataFrame: Результат (колонки MATCHED_COLUMNS)
+        """
+        self._match(
+            mac_df,
+            mac_field=mac_field,
+            hostname_field=hostname_field,
+            interface_field=interface_field,
+            vlan_field=vlan_field,
+            description_field=description_field,
         )
+        return self._matched_df
 
-        return self.matched_data
+    def _match(
+        self,
+        mac_df: "pd.DataFrame",
+        mac_field: str,
+        hostname_field: str,
+        interface_field: str,
+        vlan_field: str,
+        description_field: str,
+    ) -> None:
+        """Векторное сопоставление: merge по нормализованному MAC."""
+        def text(column: str) -> "pd.Series":
+            if column not in mac_df.columns:
+                return pd.Series("", index=mac_df.index, dtype=object)
+            values = mac_df[column]
+            return values.astype(str).where(values.notna(), "").astype(object)
+
+        result = pd.DataFrame({
+            "hostname": text(hostname_field),
+            "device_ip": text("device_ip"),
+            "interface": text(interface_field),
+            "mac": text(mac_field),
+            "vlan": text(vlan_field),
+            "current_description": text(description_field),
+        })
+        result["_mac_key"] = normalize_mac_series(result["mac"])
+
+        reference = self._reference_df[["mac", "name"]].rename(
+            columns={"mac": "_mac_key", "name": "host_name"}
+        )
+        # how="left" сохраняет порядок строк; справочник уникален по MAC
+        result = result.merge(reference, on="_mac_key", how="left")
+        result["matched"] = result["host_name"].notna() & (result["_mac_key"] != "")
+        result["host_name"] = result["host_name"].where(result["matched"], "")
+
+        self._matched_df = result[MATCHED_COLUMNS]
+        self._matched_data = None
+        self._total_matched = int(result["matched"].sum())
+
+        logger.info(
+            f"Сопоставлено {self._total_matched} из {len(self._matched_df)} записей"
+        )
 
     def save_matched(
         self,
@@ -316,26 +556,23 @@ class DescriptionMatcher:
         Returns:
             str: Путь к сохранённому файлу
         """
-        if not self.matched_data:
+        if self._matched_df.empty:
             raise ValueError("Нет данных для сохранения. Сначала вызовите match_mac_data()")
 
-        data = []
-        for entry in self.matched_data:
-            if not include_unmatched and not entry.matched:
-                continue
-
-            data.append({
-                "Device": entry.hostname,
-                "IP": entry.device_ip,
-                "Interface": entry.interface,
-                "MAC": entry.mac,
-                "VLAN": entry.vlan,
-                "Current_Description": entry.current_description,
-                "Host_Name": entry.host_name,
-                "Matched": "Yes" if entry.matched else "No",
-            })
-
-        df = pd.DataFrame(data)
+        matched = self._matched_df
+        if not include_unmatched:
+            matched = matched[matched["matched"]]
+
+        df = pd.DataFrame({
+            "Device": matched["hostname"],
+            "IP": matched["device_ip"],
+            "Interface": matched["interface"],
+            "MAC": matched["mac"],
+            "VLAN": matched["vlan"],
+            "Current_Description": matched["current_description"],
+            "Host_Name": matched["host_name"],
+            "Matched": matched["matched"].map({True: "Yes", False: "No"}),
+        })
         df.to_excel(output_file, index=False)
 
         logger.info(f"Результаты сохранены: {output_file}")
@@ -358,25 +595,23 @@ class DescriptionMatcher:
         """
         commands: Dict[str, List[str]] = {}
 
-        for entry in self.matched_data:
-            # Пропускаем несопоставленные
-            if not entry.matched or not entry.host_name:
-                continue
-
-            # Проверяем нужно ли обновлять
-            if only_empty and entry.current_description:
-                continue
+        # Пропускаем несопоставленные
+        matched = self._matched_df
+        selected = matched["matched"] & (matched["host_name"] != "")
 
-            if not overwrite and entry.current_description:
-                continue
+        # Проверяем нужно ли обновлять
+        has_description = matched["current_description"] != ""
+        if only_empty or not overwrite:
+            selected &= ~has_description
 
+        rows = matched.loc[selected, ["hostname", "interface", "host_name"]]
+        for hostname, interface, host_name in rows.itertuples(index=False, name=None):
             # Добавляем команды для устройства
-            hostname = entry.hostname
             if hostname not in commands:
                 commands[hostname] = []
 
-            commands[hostname].append(f"interface {entry.interface}")
-            commands[hostname].append(f"description {entry.host_name}")
+            commands[hostname].append(f"interface {interface}")
+            commands[hostname].append(f"description {host_name}")
 
         logger.info(
             f"Сгенерировано команд для {len(commands)} устройств"
@@ -391,20 +626,21 @@ class DescriptionMatcher:
         Returns:
             Dict: Статистика
         """
+        total = len(self._matched_df)
         return {
-            "reference_hosts": len(self.reference_data),
+            "reference_hosts": len(self._reference_df),
             "loaded_files": self._loaded_files,
-            "total_mac_entries": len(self.matched_data),
+            "total_mac_entries": total,
             "matched": self._total_matched,
-            "unmatched": len(self.matched_data) - self._total_matched,
-            "match_rate": f"{(self._total_matched / len(self.matched_data) * 100):.1f}%"
-            if self.matched_data else "0%",
+            "unmatched": total - self._total_matched,
+            "match_rate": f"{(self._total_matched / total * 100):.1f}%"
+            if total else "0%",
         }
 
     def _find_column(self, df: pd.DataFrame, column_name: str) -> Optional[str]:
         """Находит колонку с учётом регистра."""
         for col in df.columns:
-            if col.lower() == column_name.lower():
+            if str(col).lower() == column_name.lower():
                 return col
         return None
 
@@ -10,95 +10,102 @@ Core модули Network Collector.
 - constants: Константы и маппинги
 """
 
-from .device import Device, DeviceStatus
-from .connection import ConnectionManager
-from .credentials import CredentialsManager, Credentials
-from .context import (
-    RunContext,
-    get_current_context,
-    set_current_context,
-    RunContextFilter,
-    setup_logging_with_context,
-)
-from .logging import (
-    get_logger,
-    setup_json_logging,
-    setup_human_logging,
-    setup_logging,
-    setup_file_logging,
-    setup_logging_from_config,
-    StructuredLogger,
-    JSONFormatter,
-    HumanFormatter,
-    LogContext,
-    OperationLog,
-    LogLevel,
-    LogConfig,
-    RotationType,
-)
-from .exceptions import (
-    NetworkCollectorError,
-    CollectorError,
-    ConnectionError,
-    AuthenticationError,
-    CommandError,
-    ParseError,
-    TimeoutError,
-    NetBoxError,
-    NetBoxConnectionError,
-    NetBoxAPIError,
-    NetBoxValidationError,
-    ConfigError,
-    format_error_for_log,
-    is_retryable,
-)
-from .models import (
-    Interface,
-    MACEntry,
-    LLDPNeighbor,
-    InventoryItem,
-    IPAddressEntry,
-    DeviceInfo,
-    InterfaceStatus,
-    SwitchportMode,
-    NeighborType,
-    Interfaces,
-    MACTable,
-    Neighbors,
-    Inventory,
-    IPAddresses,
-    Devices,
-    interfaces_from_dicts,
-    interfaces_to_dicts,
-    mac_entries_from_dicts,
-    mac_entries_to_dicts,
-    neighbors_from_dicts,
-    neighbors_to_dicts,
-    inventory_from_dicts,
-    inventory_to_dicts,
-    ip_addresses_from_dicts,
-    ip_addresses_to_dicts,
-    devices_from_dicts,
-    devices_to_dicts,
-)
-from .constants import (
-    normalize_interface_short,
-    normalize_interface_full,
-    normalize_mac,
-    normalize_mac_raw,
-    normalize_mac_ieee,
-    normalize_mac_netbox,
-    normalize_mac_cisco,
-    slugify,
-    get_vendor_by_platform,
-    get_netbox_interface_type,
-)
-from .domain import (
-    InterfaceNormalizer,
-    MACNormalizer,
-    LLDPNormalizer,
-    InventoryNormalizer,
-)
+from .lazy import lazy_exports
+
+# Экспорты загружаются при первом обращении (connection тянет scrapli,
+# domain — нормализаторы); `from network_collector.core import X` не меняется
+_EXPORTS = {
+    # device
+    "Device": ".device",
+    "DeviceStatus": ".device",
+    # connection
+    "ConnectionManager": ".connection",
+    # credentials
+    "CredentialsManager": ".credentials",
+    "Credentials": ".credentials",
+    # context
+    "RunContext": ".context",
+    "get_current_context": ".context",
+    "set_current_context": ".context",
+    "RunContextFilter": ".context",
+    "setup_logging_with_context": ".context",
+    # logging
+    "get_logger": ".logging",
+    "setup_json_logging": ".logging",
+    "setup_human_logging": ".logging",
+    "setup_logging": ".logging",
+    "setup_file_logging": ".logging",
+    "setup_logging_from_config": ".logging",
+    "StructuredLogger": ".logging",
+    "JSONFormatter": ".logging",
+    "HumanFormatter": ".logging",
+    "LogContext": ".logging",
+    "OperationLog": ".logging",
+    "LogLevel": ".logging",
+    "LogConfig": ".logging",
+    "RotationType": ".logging",
+    # exceptions
+    "NetworkCollectorError": ".exceptions",
+    "CollectorError": ".exceptions",
+    "ConnectionError": ".exceptions",
+    "AuthenticationError": ".exceptions",
+    "CommandError": ".exceptions",
+    "ParseError": ".exceptions",
+    "TimeoutError": ".exceptions",
+    "NetBoxError": ".exceptions",
+    "NetBoxConnectionError": ".exceptions",
+    "NetBoxAPIError": ".exceptions",
+    "NetBoxValidationError": ".exceptions",
+    "ConfigError": ".exceptions",
+    "format_error_for_log": ".exceptions",
+    "is_retryable": ".exceptions",
+    # models
+    "Interface": ".models",
+    "MACEntry": ".models",
+    "LLDPNeighbor": ".models",
+    "InventoryItem": ".models",
+    "IPAddressEntry": ".models",
+    "DeviceInfo": ".models",
+    "InterfaceStatus": ".models",
+    "SwitchportMode": ".models",
+    "NeighborType": ".models",
+    "Interfaces": ".models",
+    "MACTable": ".models",
+    "Neighbors": ".models",
+    "Inventory": ".models",
+    "IPAddresses": ".models",
+    "Devices": ".models",
+    "interfaces_from_dicts": ".models",
+    "interfaces_to_dicts": ".models",
+    "mac_entries_from_dicts": ".models",
+    "mac_entries_to_dicts": ".models",
+    "neighbors_from_dicts": ".models",
+    "neighbors_to_dicts": ".models",
+    "inventory_from_dicts": ".models",
+    "inventory_to_dicts": ".models",
+    "ip_addresses_from_dicts": ".models",
+    "ip_addresses_to_dicts": ".models",
+    "devices_from_dicts": ".models",
+    "devices_to_dicts": ".models",
+    # constants
+    "normalize_interface_short": ".constants",
+    "normalize_interface_full": ".constants",
+    "normalize_mac": ".constants",
+    "normalize_mac_raw": ".constants",
+    "normalize_mac_ieee": ".constants",
+    "normalize_mac_netbox": ".constants",
+    "normalize_mac_cisco": ".constants",
+    "slugify": ".constants",
+    "get_vendor_by_platform": ".constants",
+    "get_netbox_interface_type": ".constants",
+    # domain
+    "InterfaceNormalizer": ".domain",
+    "MACNormalizer": ".domain",
+    "LLDPNormalizer": ".domain",
+    "InventoryNormalizer": ".domain",
+}
+
+__getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
 
 __all__ = [
     # Device & Connection
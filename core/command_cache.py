@@ -0,0 +1,341 @@
+"""
+Кэш выводов команд между сборами.
+
+В Web UI сбор часто повторяется по тем же устройствам с интервалом
+в минуты: interfaces → mac → lldp. InterfaceCollector и MACCollector
+выполняют одни и те же "show interfaces status", "show interfaces
+switchport" и т.п. Кэш хранит вывод по ключу (host, учётные данные,
+команда) с TTL для каждой команды и отдаёт его без SSH, пока данные
+свежие. Учётные данные входят в ключ: вывод, полученный одним
+пользователем, не отдаётся запросу с другим логином/паролем (иначе
+кэш обходил бы аутентификацию на устройстве).
+
+Кэш стоит между коллекторами и ConnectionManager: connect() отдаёт
+CachedConnection, которая открывает настоящее SSH-подключение только
+при первом промахе. Если все команды устройства есть в кэше, устройство
+не опрашивается вовсе.
+
+Включается в config.yaml:
+    command_cache:
+      enabled: true
+      default_ttl: 300             # секунд
+      max_bytes: 67108864          # 64 MB на все выводы (LRU)
+      ttl:
+        "show mac address-table": 60
+        "show running-config": 0   # 0 — не кэшировать
+
+Пример использования:
+    cache = CommandOutputCache(default_ttl=300)
+    manager = ConnectionManager(command_cache=cache)
+    with manager.connect(device, credentials) as conn:
+        conn.send_command("show interfaces status")  # из кэша, если свежий
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from collections import OrderedDict
+from contextlib import ExitStack
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Ключ для prompt (hostname) устройства
+PROMPT_KEY = "<prompt>"
+
+
+def credentials_identity(credentials: Any) -> str:
+    """
+    Идентичность учётных данных для ключа кэша.
+
+    Пароль в кэше не хранится — только sha256 от логина и паролей.
+
+    Args:
+        credentials: Credentials (username, password, secret) или None
+
+    Returns:
+        str: Хэш учётных данных ("" без credentials)
+    """
+    if credentials is None:
+        return ""
+    raw = "\0".join((
+        credentials.username or "",
+        credentials.password or "",
+        getattr(credentials, "secret", None) or "",
+    ))
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class CommandOutputCache:
+    """
+    LRU-кэш выводов команд с TTL и ограничением по объёму.
+
+    Attributes:
+        default_ttl: TTL по умолчанию (секунды)
+        ttl: TTL для отдельных команд {команда: секунды}, 0 — не кэшировать
+        max_bytes: Предел суммарного размера выводов
+        stats: Счётчики {hits, misses, evictions}
+    """
+
+    def __init__(
+        self,
+        default_ttl: float = 300,
+        ttl: Optional[Dict[str, float]] = None,
+        max_bytes: int = 64 * 1024 * 1024,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """
+        Инициализация кэша.
+
+        Args:
+            default_ttl: TTL по умолчанию (секунды)
+            ttl: TTL для отдельных команд
+            max_bytes: Предел суммарного размера выводов (байт)
+            clock: Источник времени (для тестов)
+        """
+        self.default_ttl = default_ttl
+        self.ttl = {cmd.strip().lower(): value for cmd, value in (ttl or {}).items()}
+        self.max_bytes = max_bytes
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0}
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, str, str], Tuple[float, str]]" = OrderedDict()
+        self._bytes = 0
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _key(host: str, command: str, identity: str) -> Tuple[str, str, str]:
+        return host, identity, " ".join(command.split()).lower()
+
+    def ttl_for(self, command: str) -> float:
+        """TTL команды (секунды)."""
+        return self.ttl.get(" ".join(command.split()).lower(), self.default_ttl)
+
+    def get(self, host: str, command: str, identity: str = "") -> Optional[str]:
+        """
+        Свежий вывод команды или None.
+
+        Args:
+            host: IP/hostname устройства
+            command: Команда
+            identity: credentials_identity() учётных данных запроса
+        """
+        key = self._key(host, command, identity)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] <= self._clock():
+                if entry is not None:
+                    self._remove(key)
+                self.stats["misses"] += 1
+                return None
+            self._entries.move_to_end(key)
+            self.stats["hits"] += 1
+            return entry[1]
+
+    def put(self, host: str, command: str, output: str, identity: str = "") -> None:
+        """
+        Сохраняет вывод команды (если для неё TTL > 0).
+
+        Args:
+            host: IP/hostname устройства
+            command: Команда
+            output: Вывод
+            identity: credentials_identity() учётных данных, с которыми получен вывод
+        """
+        ttl = self.ttl_for(command)
+        size = len(output)
+        if ttl <= 0 or size > self.max_bytes:
+            return
+        key = self._key(host, command, identity)
+        with self._lock:
+            self._remove(key)
+            self._entries[key] = (self._clock() + ttl, output)
+            self._bytes += size
+            while self._bytes > self.max_bytes:
+                oldest = next(iter(self._entries))
+                self._remove(oldest)
+                self.stats["evictions"] += 1
+
+    def invalidate(self, host: Optional[str] = None) -> None:
+        """Удаляет выводы устройства (или все)."""
+        with self._lock:
+            for key in [k for k in self._entries if host is None or k[0] == host]:
+                self._remove(key)
+
+    def _remove(self, key: Tuple[str, str, str]) -> None:
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._bytes -= len(entry[1])
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @property
+    def size_bytes(self) -> int:
+        """Суммарный размер выводов в кэше."""
+        return self._bytes
+
+
+class CachedResponse:
+    """Ответ из кэша с интерфейсом scrapli Response (.result, .failed)."""
+
+    __slots__ = ("channel_input", "result", "failed")
+
+    def __init__(self, command: str, result: str):
+        self.channel_input = command
+        self.result = result
+        self.failed = False
+
+
+class CachedConnection:
+    """
+    Подключение с кэшем выводов команд.
+
+    Настоящее подключение открывается лениво — при первом промахе кэша.
+    Остальные атрибуты (send_configs, send_interactive, ...) делегируются
+    настоящему подключению.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        cache: CommandOutputCache,
+        opener: Callable[[], Any],
+        refresh: bool = False,
+        identity: str = "",
+    ):
+        """
+        Args:
+            host: IP/hostname устройства (ключ кэша)
+            cache: Кэш выводов
+            opener: Открывает настоящее подключение
+            refresh: Не читать кэш (вывод всё равно сохраняется)
+            identity: credentials_identity() учётных данных (ключ кэша)
+        """
+        self._host = host
+        self._identity = identity
+        self._cache = cache
+        self._opener = opener
+        self._refresh = refresh
+        self._connection = None
+        self._open_error: Optional[Exception] = None
+
+    @property
+    def connection(self) -> Any:
+        """Настоящее подключение (открывается при первом обращении)."""
+        if self._connection is None:
+            if self._open_error is not None:
+                # Повторные попытки уже исчерпаны в ConnectionManager
+                raise self._open_error
+            logger.debug(f"Кэш команд: подключение к {self._host}")
+            try:
+                self._connection = self._opener()
+            except Exception as e:
+                self._open_error = e
+                raise
+        return self._connection
+
+    @property
+    def opened(self) -> bool:
+        """Было ли открыто настоящее подключение."""
+        return self._connection is not None
+
+    def _cached(self, command: str) -> Optional[str]:
+        if self._refresh:
+            return None
+        return self._cache.get(self._host, command, self._identity)
+
+    def send_command(self, command: str, **kwargs: Any) -> Any:
+        """Вывод из кэша или с устройства."""
+        output = self._cached(command)
+        if output is not None:
+            return CachedResponse(command, output)
+        response = self.connection.send_command(command, **kwargs)
+        if not getattr(response, "failed", False):
+            self._cache.put(self._host, command, response.result, self._identity)
+        return response
+
+    def send_commands(self, commands: List[str], **kwargs: Any) -> List[Any]:
+        """Выводы из кэша; промахи отправляются на устройство одним пакетом."""
+        responses: List[Any] = [None] * len(commands)
+        missed = []
+        for i, command in enumerate(commands):
+            output = self._cached(command)
+            if output is None:
+                missed.append(i)
+            else:
+                responses[i] = CachedResponse(command, output)
+        if missed:
+            fresh = self.connection.send_commands([commands[i] for i in missed], **kwargs)
+            for i, response in zip(missed, fresh):
+                responses[i] = response
+                if not getattr(response, "failed", False):
+                    self._cache.put(self._host, commands[i], response.result, self._identity)
+            if len(fresh) < len(missed):
+                # stop_on_failed: остальные команды не выполнялись
+                responses = responses[:missed[len(fresh)]]
+        return responses
+
+    def get_prompt(self) -> str:
+        """Prompt устройства (для hostname) из кэша или с устройства."""
+        prompt = self._cached(PROMPT_KEY)
+        if prompt is None:
+            prompt = self.connection.get_prompt()
+            self._cache.put(self._host, PROMPT_KEY, prompt, self._identity)
+        return prompt
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self.connection, name)
+
+
+def open_cached(
+    stack: ExitStack,
+    host: str,
+    cache: CommandOutputCache,
+    connect: Callable[[], Any],
+    refresh: bool = False,
+    identity: str = "",
+) -> CachedConnection:
+    """
+    CachedConnection, чьё настоящее подключение закрывается вместе со stack.
+
+    Args:
+        stack: ExitStack вызывающего контекста
+        host: IP/hostname устройства
+        cache: Кэш выводов
+        connect: Возвращает context manager настоящего подключения
+        refresh: Не читать кэш
+        identity: credentials_identity() учётных данных
+    """
+    return CachedConnection(
+        host, cache, lambda: stack.enter_context(connect()),
+        refresh=refresh, identity=identity,
+    )
+
+
+# Глобальный кэш (API-сервер живёт долго, CLI — один запуск)
+_command_cache: Optional[CommandOutputCache] = None
+_command_cache_lock = threading.Lock()
+
+
+def get_command_cache() -> Optional[CommandOutputCache]:
+    """
+    Глобальный кэш из config.yaml (command_cache.enabled).
+
+    Returns:
+        CommandOutputCache или None, если кэш выключен
+    """
+    global _command_cache
+    from ..config import config
+
+    settings = config.command_cache
+    if not settings or not settings.get("enabled", False):
+        return None
+    with _command_cache_lock:
+        if _command_cache is None:
+            _command_cache = CommandOutputCache(
+                default_ttl=settings.get("default_ttl", 300),
+                ttl=settings.get("ttl") or {},
+                max_bytes=settings.get("max_bytes", 64 * 1024 * 1024),
+            )
+        return _command_cache
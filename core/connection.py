@@ -27,7 +27,7 @@ import random
 import re
 import time
 from typing import Optional, Generator, Any, Dict
-from contextlib import contextmanager
+from contextlib import ExitStack, contextmanager
 
 from scrapli import Scrapli
 from scrapli.exceptions import (
@@ -38,6 +38,7 @@ from scrapli.exceptions import (
 
 from .device import Device, DeviceStatus
 from .credentials import Credentials
+from .command_cache import CommandOutputCache, credentials_identity, open_cached
 from .constants.platforms import (
     DEFAULT_PLATFORM,
     SCRAPLI_PLATFORM_MAP,
@@ -105,6 +106,8 @@ class ConnectionManager:
         transport: Тип транспорта (ssh2, paramiko, system)
         max_retries: Максимум повторных попыток при ошибке
         retry_delay: Задержка между попытками (секунды)
+        command_cache: Кэш выводов команд (None — без кэша)
+        refresh_cache: Не читать кэш, только обновлять его
 
     Example:
         manager = ConnectionManager(timeout_socket=15, max_retries=2)
@@ -120,6 +123,8 @@ class ConnectionManager:
         transport: str = "ssh2",
         max_retries: int = 2,
         retry_delay: int = 5,
+        command_cache: Optional[CommandOutputCache] = None,
+        refresh_cache: bool = False,
     ):
         """
         Инициализация менеджера подключений.
@@ -131,6 +136,8 @@ class ConnectionManager:
             transport: Тип транспорта (ssh2, paramiko, system)
             max_retries: Максимум повторных попыток (0 = без retry)
             retry_delay: Задержка между попытками в секундах
+            command_cache: Кэш выводов команд (None — без кэша)
+            refresh_cache: Не читать кэш (принудительный опрос устройств)
         """
         self.timeout_socket = timeout_socket
         self.timeout_transport = timeout_transport
@@ -138,6 +145,8 @@ class ConnectionManager:
         self.transport = transport
         self.max_retries = max_retries
         self.retry_delay = retry_delay
+        self.command_cache = command_cache
+        self.refresh_cache = refresh_cache
 
     def _get_retry_delay(self, attempt: int) -> float:
         """
@@ -203,6 +212,41 @@ class ConnectionManager:
         self,
         device: Device,
         credentials: Credentials,
+    ) -> Generator[Scrapli, None, None]:
+        """
+        Контекстный менеджер для подключения к устройству.
+
+        С command_cache отдаёт CachedConnection: команды со свежим выводом
+        в кэше (полученным с теми же учётными данными) выполняются без SSH,
+        настоящее подключение открывается при первом промахе.
+
+        Args:
+            device: Объект устройства
+            credentials: Учётные данные
+
+        Yields:
+            Scrapli: Активное подключение Scrapli (или CachedConnection)
+        """
+        if self.command_cache is None:
+            with self._connect(device, credentials) as connection:
+                yield connection
+            return
+
+        with ExitStack() as stack:
+            yield open_cached(
+                stack,
+                device.host,
+                self.command_cache,
+                lambda: self._connect(device, credentials),
+                refresh=self.refresh_cache,
+                identity=credentials_identity(credentials),
+            )
+
+    @contextmanager
+    def _connect(
+        self,
+        device: Device,
+        credentials: Credentials,
     ) -> Generator[Scrapli, None, None]:
         """
         Контекстный менеджер для подключения к устройству с retry.
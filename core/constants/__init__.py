@@ -90,6 +90,10 @@ from .commands import (
     get_collector_command,
     SECONDARY_COMMANDS,
     get_secondary_command,
+    BATCH_PLATFORMS,
+    supports_batch,
+    STRUCTURED_COMMANDS,
+    get_structured_command,
 )
 
 __all__ = [
@@ -146,4 +150,8 @@ __all__ = [
     "get_collector_command",
     "SECONDARY_COMMANDS",
     "get_secondary_command",
+    "BATCH_PLATFORMS",
+    "supports_batch",
+    "STRUCTURED_COMMANDS",
+    "get_structured_command",
 ]
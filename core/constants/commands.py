@@ -76,6 +76,39 @@ COLLECTOR_COMMANDS: Dict[str, Dict[str, str]] = {
 }
 
 
+# =============================================================================
+# СТРУКТУРИРОВАННЫЙ ВЫВОД (JSON)
+# =============================================================================
+# JSON-варианты основных команд. При parser.structured_output: true
+# коллекторы выполняют их вместо текстовых и разбирают вывод без TextFSM
+# (parsers/structured_parser.py). Если устройство не вернуло JSON,
+# выполняется текстовая команда из COLLECTOR_COMMANDS.
+# =============================================================================
+
+STRUCTURED_COMMANDS: Dict[str, Dict[str, str]] = {
+    "interfaces": {
+        "cisco_nxos": "show interface | json",
+        "arista_eos": "show interfaces | json",
+        "juniper_junos": "show interfaces extensive | display json",
+        "juniper": "show interfaces extensive | display json",
+    },
+    "mac": {
+        "cisco_nxos": "show mac address-table | json",
+        "arista_eos": "show mac address-table | json",
+    },
+    "lldp": {
+        "cisco_nxos": "show lldp neighbors detail | json",
+        "arista_eos": "show lldp neighbors detail | json",
+        "juniper_junos": "show lldp neighbors | display json",
+        "juniper": "show lldp neighbors | display json",
+    },
+    "inventory": {
+        "cisco_nxos": "show inventory | json",
+        "arista_eos": "show inventory | json",
+    },
+}
+
+
 # =============================================================================
 # ВТОРИЧНЫЕ КОМАНДЫ КОЛЛЕКТОРОВ
 # =============================================================================
@@ -134,6 +167,46 @@ SECONDARY_COMMANDS: Dict[str, Dict[str, str]] = {
 }
 
 
+# =============================================================================
+# ПАКЕТНАЯ ОТПРАВКА КОМАНД
+# =============================================================================
+# Платформы, где основная и вторичные команды коллектора отправляются одним
+# вызовом send_commands. Выигрыша по задержке это не даёт: send_commands
+# в scrapli — цикл по send_command, число обменов по SSH то же, что при
+# отправке по одной (замер: tests/benchmarks/bench_command_batch.py).
+# Пакет нужен для CachedConnection: команды со свежим выводом отдаются из
+# кэша, на устройство уходят только промахи одним вызовом.
+# Остальные платформы выполняют команды по одной (send_command).
+#
+# Объединение в одну строку (";", "|") не используется: IOS, IOS-XE и QTech
+# его не поддерживают, а общий вывод NX-OS "cmd1 ; cmd2" нельзя надёжно
+# разделить по командам. eager-режим scrapli не подходит по той же причине:
+# вывод всех команд, кроме последней, теряется.
+# =============================================================================
+
+BATCH_PLATFORMS: frozenset = frozenset({
+    "cisco_ios",
+    "cisco_iosxe",
+    "cisco_nxos",
+    "arista_eos",
+    "qtech",
+    "qtech_qsw",
+})
+
+
+def supports_batch(platform: str) -> bool:
+    """
+    Можно ли отправлять команды платформы пакетом (send_commands).
+
+    Args:
+        platform: Платформа устройства
+
+    Returns:
+        bool: True если платформа в BATCH_PLATFORMS
+    """
+    return platform in BATCH_PLATFORMS
+
+
 def get_secondary_command(group: str, platform: str) -> str:
     """
     Возвращает вторичную команду для группы и платформы.
@@ -170,6 +243,25 @@ def get_collector_command(collector: str, platform: str) -> str:
     return commands.get(platform, "")
 
 
+def get_structured_command(collector: str, platform: str) -> str:
+    """
+    Возвращает JSON-команду коллектора для платформы.
+
+    Args:
+        collector: Тип коллектора (interfaces, mac, lldp, inventory)
+        platform: Платформа устройства
+
+    Returns:
+        str: Команда или пустая строка, если платформа не отдаёт JSON
+
+    Examples:
+        >>> get_structured_command("interfaces", "cisco_nxos")
+        'show interface | json'
+    """
+    commands = STRUCTURED_COMMANDS.get(collector, {})
+    return commands.get(platform, "")
+
+
 # =============================================================================
 # КАСТОМНЫЕ TEXTFSM ШАБЛОНЫ
 # =============================================================================
@@ -2,9 +2,16 @@
 Нормализация имён интерфейсов.
 
 Функции для сокращения и расширения имён интерфейсов.
+
+Функции вызываются на каждую строку MAC/LLDP/интерфейсов, а имён
+в сети немного (Gi1/0/1 повторяется на каждом коммутаторе). Поэтому
+префиксы ищутся одним скомпилированным regex (альтернация в порядке
+маппинга), а результаты кэшируются в ограниченном lru_cache.
 """
 
-from typing import Dict, List
+import re
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
 # =============================================================================
 # LAG-ИНТЕРФЕЙСЫ
@@ -92,6 +99,37 @@ INTERFACE_FULL_MAP: Dict[str, str] = {
 }
 
 
+# Размер кэшей нормализации (уникальных имён интерфейсов)
+NAME_CACHE_SIZE = 8192
+
+# Альтернация в порядке INTERFACE_SHORT_MAP: первый совпавший префикс,
+# как при проходе по списку со startswith
+_SHORT_PREFIX_RE = re.compile("|".join(re.escape(full) for full, _ in INTERFACE_SHORT_MAP))
+_SHORT_BY_PREFIX: Dict[str, str] = dict(INTERFACE_SHORT_MAP)
+
+# Сокращение + цифра (Hu0/55, но не HundredGigE0/55)
+_FULL_PREFIX_RE = re.compile(
+    "(" + "|".join(re.escape(short) for short in INTERFACE_FULL_MAP) + r")(?=\d)"
+)
+
+# Дополнительные формы для полных имён: GigabitEthernet0/1 → Gig0/1
+_EXTRA_ALIASES: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("gigabitethernet", ("Gig",)),
+    ("tengigabitethernet", ("Ten",)),
+    ("ethernet", ("Et", "Eth")),
+)
+
+# Дополнительные формы для коротких имён (после префикса — цифра)
+_SHORT_TO_EXTRA: Tuple[Tuple[str, Tuple[str, ...]], ...] = (
+    ("gi", ("Gig",)),
+    ("te", ("Ten",)),
+    ("hu", ("HundredGigabitEthernet",)),  # QTech полное имя
+    ("eth", ("Et",)),
+    ("et", ("Eth",)),
+)
+
+
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def normalize_interface_short(interface: str, lowercase: bool = False) -> str:
     """
     Сокращает имя интерфейса.
@@ -115,17 +153,16 @@ def normalize_interface_short(interface: str, lowercase: bool = False) -> str:
 
     # Убираем пробелы между типом и номером (CDP/LLDP формат: "Ten 1/1/4")
     result = interface.replace(" ", "").strip()
-    result_lower = result.lower()
 
-    # Ищем совпадение в маппинге (порядок важен — длинные первыми)
-    for full_lower, short in INTERFACE_SHORT_MAP:
-        if result_lower.startswith(full_lower):
-            result = short + result[len(full_lower) :]
-            break
+    # Первый префикс из маппинга (порядок важен — длинные первыми)
+    match = _SHORT_PREFIX_RE.match(result.lower())
+    if match:
+        result = _SHORT_BY_PREFIX[match.group()] + result[match.end() :]
 
     return result.lower() if lowercase else result
 
 
+@lru_cache(maxsize=NAME_CACHE_SIZE)
 def normalize_interface_full(interface: str) -> str:
     """
     Расширяет сокращённое имя интерфейса.
@@ -141,15 +178,9 @@ def normalize_interface_full(interface: str) -> str:
     # Убираем пробелы между типом и номером (QTech: "TFGigabitEthernet 0/48" → "TFGigabitEthernet0/48")
     interface = interface.replace(" ", "").strip()
 
-    for short_name, full_name in INTERFACE_FULL_MAP.items():
-        if (
-            interface.startswith(short_name)
-            and not interface.startswith(full_name)
-            # Убеждаемся что после сокращения идёт цифра (Hu0/55, не HundredGig...)
-            and len(interface) > len(short_name)
-            and interface[len(short_name)].isdigit()
-        ):
-            return interface.replace(short_name, full_name, 1)
+    match = _FULL_PREFIX_RE.match(interface)
+    if match:
+        return INTERFACE_FULL_MAP[match.group(1)] + interface[match.end() :]
     return interface
 
 
@@ -174,47 +205,32 @@ def get_interface_aliases(interface: str) -> List[str]:
     """
     if not interface:
         return []
+    # Копия: кэшированный кортеж не должен меняться вызывающим кодом
+    return list(_interface_aliases(interface))
+
 
+@lru_cache(maxsize=NAME_CACHE_SIZE)
+def _interface_aliases(interface: str) -> Tuple[str, ...]:
+    """Варианты написания интерфейса (кэшируются)."""
     aliases = {interface}  # Используем set для уникальности
     clean = interface.replace(" ", "")
     aliases.add(clean)
 
-    # Добавляем короткую форму
-    short = normalize_interface_short(clean)
-    if short != clean:
-        aliases.add(short)
-
-    # Добавляем полную форму
-    full = normalize_interface_full(clean)
-    if full != clean:
-        aliases.add(full)
+    # Короткая и полная формы
+    aliases.add(normalize_interface_short(clean))
+    aliases.add(normalize_interface_full(clean))
 
     # Дополнительные альтернативные сокращения
     clean_lower = clean.lower()
 
-    # Маппинг дополнительных форм
-    EXTRA_ALIASES = {
-        "gigabitethernet": ["Gig"],
-        "tengigabitethernet": ["Ten"],
-        "ethernet": ["Et", "Eth"],
-    }
-
-    for prefix, extras in EXTRA_ALIASES.items():
+    for prefix, extras in _EXTRA_ALIASES:
         if clean_lower.startswith(prefix):
             suffix = clean[len(prefix):]
             for extra in extras:
                 aliases.add(f"{extra}{suffix}")
 
     # Обратные маппинги для коротких форм
-    SHORT_TO_EXTRA = {
-        "gi": ["Gig"],
-        "te": ["Ten"],
-        "hu": ["HundredGigabitEthernet"],  # QTech полное имя
-        "eth": ["Et"],
-        "et": ["Eth"],
-    }
-
-    for short_prefix, extras in SHORT_TO_EXTRA.items():
+    for short_prefix, extras in _SHORT_TO_EXTRA:
         if clean_lower.startswith(short_prefix) and len(clean) > len(short_prefix):
             next_char = clean[len(short_prefix)]
             if next_char.isdigit():
@@ -222,7 +238,7 @@ def get_interface_aliases(interface: str) -> List[str]:
                 for extra in extras:
                     aliases.add(f"{extra}{suffix}")
 
-    return list(aliases)
+    return tuple(aliases)
 
 
 # =============================================================================
@@ -7,6 +7,8 @@ Collectors только собирают сырые данные, Domain обр
 Normalizers:
 - InterfaceNormalizer: нормализация интерфейсов
 - MACNormalizer: нормализация MAC-таблицы
+- ColumnarMACTable: колоночная MAC-таблица (core.domain.mac_table, требует numpy;
+  не импортируется здесь, чтобы не грузить numpy без необходимости)
 - LLDPNormalizer: нормализация LLDP/CDP соседей
 - InventoryNormalizer: нормализация inventory (модули, SFP)
 
@@ -14,9 +16,14 @@ Sync:
 - SyncComparator: сравнение локальных и удалённых данных
 - SyncDiff: результат сравнения (to_create, to_update, to_delete)
 
+Topology:
+- TopologyGraph: граф соседей LLDP/CDP (ID устройств и портов, линки без
+  дублей A-B/B-A, инкрементальное обновление, экспорт JSON/GraphML)
+
 VLAN:
 - parse_vlan_range: парсинг строки "10,20,30-50" в список [10,20,30,31,...,50]
 - VlanSet: множество VLAN для сравнения и операций
+- VlanIndex: индекс VLAN сайта (VID → ID NetBox, битовые маски VID)
 
 Использование:
     from network_collector.core.domain import InterfaceNormalizer, SyncComparator
@@ -35,8 +42,25 @@ from .interface import InterfaceNormalizer
 from .mac import MACNormalizer
 from .lldp import LLDPNormalizer
 from .inventory import InventoryNormalizer
-from .sync import SyncComparator, SyncDiff, SyncItem, ChangeType, FieldChange, get_cable_endpoints
-from .vlan import parse_vlan_range, is_full_vlan_range, VlanSet, FULL_VLAN_RANGES
+from .sync import (
+    SyncComparator,
+    SyncDiff,
+    SyncItem,
+    ChangeType,
+    FieldChange,
+    get_cable_endpoints,
+    get_cable_terminations,
+)
+from .topology import TopologyGraph, TopologyLink, link_key
+from .vlan import (
+    parse_vlan_range,
+    is_full_vlan_range,
+    VlanSet,
+    VlanIndex,
+    vids_to_mask,
+    mask_to_vids,
+    FULL_VLAN_RANGES,
+)
 
 __all__ = [
     "InterfaceNormalizer",
@@ -49,9 +73,17 @@ __all__ = [
     "ChangeType",
     "FieldChange",
     "get_cable_endpoints",
+    "get_cable_terminations",
+    # Topology
+    "TopologyGraph",
+    "TopologyLink",
+    "link_key",
     # VLAN
     "parse_vlan_range",
     "is_full_vlan_range",
     "VlanSet",
+    "VlanIndex",
+    "vids_to_mask",
+    "mask_to_vids",
     "FULL_VLAN_RANGES",
 ]
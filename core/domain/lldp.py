@@ -214,7 +214,7 @@ class LLDPNormalizer:
             local = normalize_interface_short(
                 row.get("local_interface", ""), lowercase=True
             )
-            remote = row.get("remote_hostname", "").lower().split(".")[0]
+            remote = self._hostname_key(row.get("remote_hostname", ""))
             if not local or not remote:
                 # Без ключевых полей — не дедуплицируем
                 seen[id(row)] = row
@@ -373,12 +373,15 @@ class LLDPNormalizer:
                         row["remote_platform"] = platform
             return lldp_data
 
+        # Имена интерфейсов и hostname нормализуются один раз на строку
+        lldp_interfaces = [
+            normalize_interface_short(row.get("local_interface", ""), lowercase=True)
+            for row in lldp_data
+        ]
+
         # Индекс LLDP по local_interface для поиска MAC
         lldp_by_interface = {}
-        for lldp_row in lldp_data:
-            local_intf = normalize_interface_short(
-                lldp_row.get("local_interface", ""), lowercase=True
-            )
+        for lldp_row, local_intf in zip(lldp_data, lldp_interfaces):
             if local_intf:
                 lldp_by_interface[local_intf] = lldp_row
 
@@ -402,77 +405,35 @@ class LLDPNormalizer:
             result["protocol"] = "BOTH"
             merged.append(result)
 
-        # Индекс CDP по hostname для проверки уже обработанных
+        # Короткие hostname CDP-соседей: они уже в merged (CDP как база)
         cdp_hostnames = set()
         for cdp_row in cdp_data:
-            h = cdp_row.get("remote_hostname", "").lower().split(".")[0]
+            h = self._hostname_key(cdp_row.get("remote_hostname", ""))
             if h:
                 cdp_hostnames.add(h)
 
         # Добавляем LLDP соседей без CDP (например, не-Cisco устройства)
-        for lldp_row in lldp_data:
-            local_intf = normalize_interface_short(
-                lldp_row.get("local_interface", ""), lowercase=True
-            )
+        for lldp_row, local_intf in zip(lldp_data, lldp_interfaces):
             # Пропускаем уже обработанные (смерженные с CDP)
             if local_intf and local_intf in used_lldp_interfaces:
                 continue
 
-            lldp_hostname = lldp_row.get("remote_hostname", "")
-            lldp_hostname_short = lldp_hostname.lower().split(".")[0]
-
-            # Пропускаем если этот hostname уже есть в CDP (уже обработан выше)
-            if lldp_hostname_short in cdp_hostnames:
+            # Пропускаем если этот hostname уже есть в CDP (уже обработан выше),
+            # в том числе LLDP без local_interface — иначе сосед задвоится
+            if self._hostname_key(lldp_row.get("remote_hostname", "")) in cdp_hostnames:
                 continue
 
-            # LLDP без local_interface: пытаемся найти соответствие с CDP по hostname
-            if not local_intf:
-                # Ищем CDP запись с таким же hostname
-                for cdp_row in cdp_data:
-                    cdp_hostname = cdp_row.get("remote_hostname", "")
-                    # Сравниваем hostname (могут быть с/без домена)
-                    if self._hostnames_match(lldp_hostname, cdp_hostname):
-                        cdp_local = cdp_row.get("local_interface", "")
-                        if cdp_local:
-                            # Нашли! Берём local_interface из CDP
-                            result = dict(lldp_row)
-                            result["local_interface"] = cdp_local
-                            # Также берём другие поля из CDP если нужно
-                            if not result.get("remote_port"):
-                                result["remote_port"] = cdp_row.get("remote_port", "")
-                            if not result.get("remote_platform"):
-                                result["remote_platform"] = cdp_row.get("remote_platform", "")
-                            result["protocol"] = "BOTH"
-                            merged.append(result)
-                            break
-                else:
-                    # Не нашли соответствие - добавляем как есть
-                    lldp_row = dict(lldp_row)
-                    lldp_row["protocol"] = "BOTH"
-                    merged.append(lldp_row)
-            else:
-                # LLDP с local_interface, но без CDP соответствия
-                lldp_row = dict(lldp_row)
-                lldp_row["protocol"] = "BOTH"
-                merged.append(lldp_row)
+            # Нет соответствия в CDP — как есть
+            result = dict(lldp_row)
+            result["protocol"] = "BOTH"
+            merged.append(result)
 
         return merged
 
-    def _hostnames_match(self, hostname1: str, hostname2: str) -> bool:
-        """
-        Сравнивает hostname'ы с учётом доменов.
-
-        switch-01.corp.domain.ru == switch-01
-        """
-        if not hostname1 or not hostname2:
-            return False
-        # Убираем placeholders типа [MAC:...]
-        if hostname1.startswith("[") or hostname2.startswith("["):
-            return False
-        # Сравниваем короткие имена (без домена)
-        h1 = normalize_hostname(hostname1).lower()
-        h2 = normalize_hostname(hostname2).lower()
-        return h1 == h2
+    @staticmethod
+    def _hostname_key(hostname: str) -> str:
+        """Ключ сравнения hostname: короткое имя без домена, нижний регистр."""
+        return normalize_hostname(hostname).lower()
 
     def _merge_cdp_with_lldp(
         self,
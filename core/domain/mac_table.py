@@ -0,0 +1,450 @@
+"""
+Колоночное хранилище MAC-таблицы для аналитики по всей сети.
+
+Вместо списка словарей (каждая строка повторяет hostname, device_ip,
+vlan, status) — массивы NumPy:
+- MAC упакован в uint64
+- остальные колонки категориальные: int32 коды + кортеж значений
+
+Вопросы "где MAC X" и "сколько MAC в каждом VLAN на каждом устройстве"
+решаются индексом и векторными операциями без перебора строк.
+
+Пример использования:
+    rows = MACCollector(...).collect_dicts(devices)   # normalize_dicts
+    table = ColumnarMACTable.from_dicts(rows, mac_format="ieee")
+
+    table.find("00:11:22:33:44:55")                   # [{"hostname": ...}]
+    table = table.filter_trunk_ports({"Gi0/48"}).deduplicate()
+    table.count_by("hostname", "vlan")                 # {("sw1", "10"): 42}
+    table.filter(vlan=["10", "20"], status="online").to_dicts()
+
+Требует numpy (устанавливается вместе с pandas).
+"""
+
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from ..constants import normalize_mac, normalize_mac_raw
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+MAC_COLUMN = "mac"
+
+# MAC занимает 48 бит: значения выше — не MAC
+# Невалидный MAC хранится как _ODD_MAC_BASE + индекс исходной строки
+_ODD_MAC_BASE = 1 << 48
+# Строка без поля mac
+_MISSING_MAC = (1 << 64) - 1
+# Искомый MAC, которого заведомо нет в таблице
+_NO_MATCH = _MISSING_MAC - 1
+
+
+class ColumnarMACTable:
+    """
+    MAC-таблица в колоночном виде.
+
+    Не путать с core.models.MACTable — это псевдоним List[MACEntry].
+
+    Attributes:
+        macs: uint64 массив MAC (по одному на строку)
+        columns: {колонка: (int32 коды, кортеж значений)}; код -1 — поля нет
+        mac_format: Формат MAC при выводе (ieee, cisco, netbox, unix, raw)
+
+    Таблица неизменяемая: filter/deduplicate возвращают новую таблицу,
+    словари значений колонок общие.
+    """
+
+    def __init__(
+        self,
+        macs: "np.ndarray",
+        columns: Dict[str, Tuple["np.ndarray", Tuple[Any, ...]]],
+        mac_format: str = "ieee",
+        odd_macs: Optional[List[str]] = None,
+    ):
+        """
+        Инициализация таблицы (обычно через from_dicts).
+
+        Args:
+            macs: uint64 массив MAC
+            columns: Категориальные колонки {имя: (коды, значения)}
+            mac_format: Формат MAC в to_dicts/find
+            odd_macs: Исходные строки невалидных MAC
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy не установлен. Установите: pip install numpy")
+
+        self.macs = macs
+        self.columns = columns
+        self.mac_format = mac_format
+        self._odd_macs = odd_macs if odd_macs is not None else []
+        self._index: Optional[Tuple["np.ndarray", Dict[int, Tuple[int, int]]]] = None
+
+    @classmethod
+    def from_dicts(
+        cls,
+        rows: Iterable[Dict[str, Any]],
+        mac_format: str = "ieee",
+    ) -> "ColumnarMACTable":
+        """
+        Создаёт таблицу из словарей (вывод MACNormalizer.normalize_dicts).
+
+        Все поля кроме mac становятся категориальными колонками.
+
+        Args:
+            rows: Строки MAC-таблицы
+            mac_format: Формат MAC при выводе
+
+        Returns:
+            ColumnarMACTable
+        """
+        rows = list(rows)
+        count = len(rows)
+        macs = np.empty(count, dtype=np.uint64)
+        odd_macs: List[str] = []
+        odd_codes: Dict[str, int] = {}
+        codes: Dict[str, List[int]] = {}
+        values: Dict[str, Dict[Any, int]] = {}
+
+        for i, row in enumerate(rows):
+            mac = _MISSING_MAC
+            for key, value in row.items():
+                if key == MAC_COLUMN:
+                    mac = _pack_mac(value, odd_macs, odd_codes)
+                    continue
+                column = codes.get(key)
+                if column is None:
+                    column = codes[key] = [-1] * count
+                    values[key] = {}
+                mapping = values[key]
+                code = mapping.get(value)
+                if code is None:
+                    code = mapping[value] = len(mapping)
+                column[i] = code
+            macs[i] = mac
+
+        columns = {
+            name: (np.array(column, dtype=np.int32), tuple(values[name]))
+            for name, column in codes.items()
+        }
+        return cls(macs, columns, mac_format=mac_format, odd_macs=odd_macs)
+
+    def __len__(self) -> int:
+        return len(self.macs)
+
+    def _take(self, rows: "np.ndarray") -> "ColumnarMACTable":
+        """Новая таблица из строк (индексы или булева маска)."""
+        columns = {
+            name: (codes[rows], categories)
+            for name, (codes, categories) in self.columns.items()
+        }
+        return ColumnarMACTable(self.macs[rows], columns, self.mac_format, self._odd_macs)
+
+    def _codes(self, name: str) -> "np.ndarray":
+        """Коды колонки; отсутствующая колонка — все -1."""
+        column = self.columns.get(name)
+        if column is None:
+            return np.full(len(self), -1, dtype=np.int32)
+        return column[0]
+
+    def _key_codes(self, name: str) -> "np.ndarray":
+        """Коды для сравнения: пустое значение и отсутствие поля — одно и то же."""
+        column = self.columns.get(name)
+        if column is None:
+            return np.full(len(self), -1, dtype=np.int32)
+        codes, categories = column
+        empty = [i for i, value in enumerate(categories) if value in ("", None)]
+        if not empty:
+            return codes
+        return np.where(np.isin(codes, empty), -1, codes)
+
+    def _pack_query(self, mac: Any) -> int:
+        """Упаковывает искомый MAC (невалидный ищется по исходной строке)."""
+        odd_codes = {value: i for i, value in enumerate(self._odd_macs)}
+        packed = _pack_mac(mac, [], {})
+        if packed < _ODD_MAC_BASE:
+            return packed
+        code = odd_codes.get("" if mac is None else str(mac))
+        return _NO_MATCH if code is None else _ODD_MAC_BASE + code
+
+    # ---------- Фильтрация ----------
+
+    def mask(self, **criteria: Any) -> "np.ndarray":
+        """
+        Булева маска строк, подходящих под все условия.
+
+        Значение условия — одно значение или список/множество значений.
+
+        Example:
+            table.mask(hostname="sw1", vlan=["10", "20"])
+        """
+        result = np.ones(len(self), dtype=bool)
+        for name, wanted in criteria.items():
+            if isinstance(wanted, (str, int)) or wanted is None:
+                wanted = [wanted]
+            wanted = set(wanted)
+            if name == MAC_COLUMN:
+                packed = [self._pack_query(mac) for mac in wanted]
+                result &= np.isin(self.macs, np.array(packed, dtype=np.uint64))
+                continue
+            column = self.columns.get(name)
+            if column is None:
+                result &= False
+                continue
+            codes, categories = column
+            wanted_codes = [i for i, value in enumerate(categories) if value in wanted]
+            result &= np.isin(codes, wanted_codes)
+        return result
+
+    def filter(self, **criteria: Any) -> "ColumnarMACTable":
+        """Строки, подходящие под все условия (см. mask)."""
+        return self._take(self.mask(**criteria))
+
+    def exclude(self, **criteria: Any) -> "ColumnarMACTable":
+        """Строки, не подходящие под условия (см. mask)."""
+        return self._take(~self.mask(**criteria))
+
+    def filter_trunk_ports(self, trunk_interfaces: Iterable[str]) -> "ColumnarMACTable":
+        """
+        Убирает MAC с trunk портов (аналог MACNormalizer.filter_trunk_ports).
+
+        Args:
+            trunk_interfaces: Имена trunk интерфейсов
+
+        Returns:
+            ColumnarMACTable: Записи без trunk портов
+        """
+        trunk = set(trunk_interfaces)
+        if not trunk:
+            return self
+        rows = ~self.mask(interface=trunk)
+        if "" in trunk:
+            # Как в MACNormalizer: строка без interface считается ""
+            rows &= self._codes("interface") != -1
+        return self._take(rows)
+
+    def deduplicate(self) -> "ColumnarMACTable":
+        """
+        Удаляет дубликаты (hostname, mac, vlan, interface).
+
+        Аналог MACNormalizer.deduplicate: остаётся первая строка,
+        порядок сохраняется.
+        """
+        if not len(self):
+            return self
+        order, starts = _groups([
+            self._key_codes("hostname"),
+            self.macs,
+            self._key_codes("vlan"),
+            self._key_codes("interface"),
+        ])
+        # lexsort стабилен: первая строка группы — самая ранняя
+        return self._take(np.sort(order[starts]))
+
+    # ---------- Поиск ----------
+
+    def _mac_index(self) -> Tuple["np.ndarray", Dict[int, Tuple[int, int]]]:
+        """Индекс {MAC: (начало, конец)} в массиве строк, отсортированном по MAC."""
+        if self._index is None:
+            order = np.argsort(self.macs, kind="stable")
+            sorted_macs = self.macs[order]
+            unique, starts = np.unique(sorted_macs, return_index=True)
+            ends = np.append(starts[1:], len(sorted_macs))
+            self._index = (
+                order,
+                dict(zip(unique.tolist(), zip(starts.tolist(), ends.tolist()))),
+            )
+        return self._index
+
+    def find_rows(self, mac: str) -> "np.ndarray":
+        """Индексы строк с MAC (в исходном порядке)."""
+        order, index = self._mac_index()
+        bounds = index.get(self._pack_query(mac))
+        if bounds is None:
+            return np.empty(0, dtype=np.intp)
+        return order[bounds[0]:bounds[1]]
+
+    def find(self, mac: str) -> List[Dict[str, Any]]:
+        """
+        Где находится MAC: все строки с этим MAC.
+
+        Args:
+            mac: MAC в любом формате
+
+        Returns:
+            List[Dict]: Строки таблицы
+        """
+        return self._take(self.find_rows(mac)).to_dicts()
+
+    def lookup(self, reference: Dict[str, Any], default: Any = "") -> "np.ndarray":
+        """
+        Сопоставляет MAC каждой строки со справочником.
+
+        Векторный аналог match_mac_data: справочник упаковывается
+        и ищется через searchsorted.
+
+        Args:
+            reference: {MAC в любом формате: значение} (например имя хоста)
+            default: Значение для строк без совпадения
+
+        Returns:
+            np.ndarray: object массив значений по строкам
+        """
+        result = np.full(len(self), default, dtype=object)
+        packed = {}
+        for mac, value in reference.items():
+            key = _pack_mac(mac, [], {})
+            if key < _ODD_MAC_BASE:
+                packed[key] = value
+        if not packed or not len(self):
+            return result
+
+        keys = np.fromiter(packed, dtype=np.uint64, count=len(packed))
+        order = np.argsort(keys)
+        keys = keys[order]
+        names = np.array(list(packed.values()), dtype=object)[order]
+
+        positions = np.minimum(np.searchsorted(keys, self.macs), len(keys) - 1)
+        hit = keys[positions] == self.macs
+        result[hit] = names[positions[hit]]
+        return result
+
+    # ---------- Агрегация ----------
+
+    def count_by(self, *names: str, distinct_macs: bool = False) -> Dict[Tuple[Any, ...], int]:
+        """
+        Количество строк в группах по колонкам.
+
+        Args:
+            names: Колонки группировки (hostname, vlan, status, ...)
+            distinct_macs: Считать уникальные MAC, а не строки
+
+        Returns:
+            Dict: {(значения колонок): количество}; отсутствующее поле — ""
+
+        Example:
+            table.count_by("hostname", "vlan")  # {("sw1", "10"): 42, ...}
+        """
+        if not names:
+            raise ValueError("Не указаны колонки для группировки")
+        if not len(self):
+            return {}
+
+        keys = [self._key_codes(name) for name in names]
+        if distinct_macs:
+            order, starts = _groups(keys + [self.macs])
+            first = order[starts]
+            keys = [codes[first] for codes in keys]
+
+        order, starts = _groups(keys)
+        counts = np.diff(np.append(starts, len(order)))
+        result = {}
+        for group, count in zip(order[starts].tolist(), counts.tolist()):
+            result[tuple(
+                self.columns[name][1][codes[group]] if codes[group] >= 0 else ""
+                for name, codes in zip(names, keys)
+            )] = count
+        return result
+
+    # ---------- Вывод ----------
+
+    def _format_mac(self, value: int) -> Optional[str]:
+        """MAC строкой в mac_format (None если поля не было)."""
+        if value == _MISSING_MAC:
+            return None
+        if value >= _ODD_MAC_BASE:
+            return self._odd_macs[value - _ODD_MAC_BASE]
+        return normalize_mac(f"{value:012x}", format=self.mac_format)
+
+    def to_dicts(self) -> List[Dict[str, Any]]:
+        """
+        Конвертирует обратно в список словарей.
+
+        Returns:
+            List[Dict]: Строки (поля без значения не выводятся)
+        """
+        decoded = [
+            (name, codes.tolist(), categories)
+            for name, (codes, categories) in self.columns.items()
+        ]
+        formatted: Dict[int, Optional[str]] = {}
+        result = []
+        for i, value in enumerate(self.macs.tolist()):
+            mac = formatted.get(value)
+            if value not in formatted:
+                mac = formatted[value] = self._format_mac(value)
+            row = {} if mac is None else {MAC_COLUMN: mac}
+            for name, codes, categories in decoded:
+                code = codes[i]
+                if code >= 0:
+                    row[name] = categories[code]
+            result.append(row)
+        return result
+
+    def to_frame(self) -> "Any":
+        """
+        Конвертирует в pandas DataFrame с категориальными колонками.
+
+        Подходит для DescriptionMatcher.match_mac_frame.
+
+        Returns:
+            pd.DataFrame
+        """
+        import pandas as pd
+
+        frame = pd.DataFrame({
+            MAC_COLUMN: [self._format_mac(v) for v in self.macs.tolist()],
+        })
+        for name, (codes, categories) in self.columns.items():
+            # None не может быть категорией pandas: такие строки — код -1 (NaN)
+            keep = [i for i, value in enumerate(categories) if value is not None]
+            if len(keep) < len(categories):
+                # Лишний последний элемент: код -1 остаётся -1
+                remap = np.full(len(categories) + 1, -1, dtype=np.int32)
+                remap[keep] = np.arange(len(keep), dtype=np.int32)
+                codes = remap[codes]
+                categories = tuple(categories[i] for i in keep)
+            frame[name] = pd.Categorical.from_codes(
+                codes, categories=pd.Index(categories, dtype=object)
+            )
+        return frame
+
+
+def _groups(keys: List["np.ndarray"]) -> Tuple["np.ndarray", "np.ndarray"]:
+    """
+    Группирует строки по набору колонок.
+
+    Returns:
+        (order, starts): порядок сортировки и начала групп в нём
+    """
+    order = np.lexsort(keys[::-1])
+    changed = np.zeros(len(order), dtype=bool)
+    changed[:1] = True
+    for column in keys:
+        ordered = column[order]
+        changed[1:] |= ordered[1:] != ordered[:-1]
+    return order, np.flatnonzero(changed)
+
+
+def _pack_mac(mac: Any, odd_macs: List[str], odd_codes: Dict[str, int]) -> int:
+    """
+    Упаковывает MAC в число.
+
+    Невалидный MAC получает код _ODD_MAC_BASE + индекс в odd_macs
+    (сравнивается по исходной строке).
+    """
+    raw = normalize_mac_raw(mac) if isinstance(mac, str) else ""
+    if raw:
+        try:
+            return int(raw, 16)
+        except ValueError:
+            pass
+    mac = "" if mac is None else str(mac)
+    code = odd_codes.get(mac)
+    if code is None:
+        code = odd_codes[mac] = len(odd_macs)
+        odd_macs.append(mac)
+    return _ODD_MAC_BASE + code
@@ -16,27 +16,29 @@ Domain Layer для Sync операций.
 """
 
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Set, Callable, Tuple
+from typing import List, Dict, Any, Optional, Set, Callable, Tuple, Union
 from enum import Enum
 import logging
 import re
 
-from ..constants import mask_to_prefix, normalize_interface_short, normalize_hostname
+from ..constants import mask_to_prefix
+from .topology import TopologyGraph, link_key
 
 logger = logging.getLogger(__name__)
 
 
-def get_cable_endpoints(cable: Any) -> Optional[Tuple[str, str]]:
+def get_cable_terminations(cable: Any) -> Optional[Tuple[Tuple[str, str], Tuple[str, str]]]:
     """
-    Извлекает endpoints кабеля в нормализованном виде.
+    Извлекает концы кабеля как есть: ((device, interface), (device, interface)).
 
-    Standalone функция для использования в domain и infrastructure слоях.
+    Без склейки в строку — потребителям не нужно резать "device:interface"
+    обратно (имя интерфейса само может содержать ":").
 
     Args:
         cable: NetBox cable object
 
     Returns:
-        Tuple of sorted endpoints ("device:interface", "device:interface") or None
+        Tuple of (device, interface) pairs in A, B order or None
     """
     try:
         a_terms = cable.a_terminations if hasattr(cable, "a_terminations") else []
@@ -54,13 +56,31 @@ def get_cable_endpoints(cable: Any) -> Optional[Tuple[str, str]]:
         b_intf = getattr(b_term, "name", "")
 
         if a_device and a_intf and b_device and b_intf:
-            return tuple(sorted([f"{a_device}:{a_intf}", f"{b_device}:{b_intf}"]))
+            return (str(a_device), str(a_intf)), (str(b_device), str(b_intf))
     except Exception:
         pass
 
     return None
 
 
+def get_cable_endpoints(cable: Any) -> Optional[Tuple[str, str]]:
+    """
+    Извлекает endpoints кабеля в нормализованном виде.
+
+    Standalone функция для использования в domain и infrastructure слоях.
+
+    Args:
+        cable: NetBox cable object
+
+    Returns:
+        Tuple of sorted endpoints ("device:interface", "device:interface") or None
+    """
+    terminations = get_cable_terminations(cable)
+    if terminations:
+        return tuple(sorted(f"{device}:{intf}" for device, intf in terminations))
+    return None
+
+
 class ChangeType(str, Enum):
     """Тип изменения."""
     CREATE = "create"
@@ -455,7 +475,7 @@ class SyncComparator:
 
     def compare_cables(
         self,
-        local: List[Dict[str, Any]],
+        local: Union[List[Dict[str, Any]], TopologyGraph],
         remote: List[Any],
         cleanup: bool = False,
     ) -> SyncDiff:
@@ -463,7 +483,7 @@ class SyncComparator:
         Сравнивает локальные кабели (из LLDP/CDP) с удалёнными.
 
         Args:
-            local: Кабели из LLDP/CDP данных
+            local: Кабели из LLDP/CDP данных (соседи или готовый TopologyGraph)
             remote: Кабели из внешней системы
             cleanup: Удалять лишние
 
@@ -472,42 +492,26 @@ class SyncComparator:
         """
         diff = SyncDiff(object_type="cables")
 
-        # normalize_hostname из core/constants/utils.py (strip domain)
-
-        # Нормализуем local: создаём ключ из endpoints
-        # ВАЖНО: используем SHORT form (Hu, Gi, Te) для interface names потому что
+        # Локальные кабели — линки графа топологии: ключ ("device:port", "device:port")
+        # с hostname без домена и SHORT form интерфейса (Hu, Gi, Te), потому что
         # разные вендоры имеют разные полные имена для одного типа:
         # Cisco: HundredGigE, QTech: HundredGigabitEthernet → оба → Hu (short)
-        local_set = set()
+        # A-B и B-A (сосед виден с обеих сторон) — один линк
+        graph = local if isinstance(local, TopologyGraph) else TopologyGraph.from_neighbors(local)
         local_dict = {}
-        for item in local:
-            if hasattr(item, "to_dict"):
-                item = item.to_dict()
-            # Ключ: (local_device:local_port, remote_device:remote_port) - sorted
-            local_dev = normalize_hostname(item.get("hostname", ""))
-            local_port = normalize_interface_short(item.get("local_interface", ""), lowercase=True)
-            remote_dev = normalize_hostname(item.get("remote_hostname", ""))
-            remote_port = normalize_interface_short(item.get("remote_port", ""), lowercase=True)
-
-            if local_dev and local_port and remote_dev and remote_port:
-                # Сортируем endpoints для уникальности (A-B = B-A)
-                endpoints = tuple(sorted([
-                    f"{local_dev}:{local_port}",
-                    f"{remote_dev}:{remote_port}",
-                ]))
-                local_set.add(endpoints)
-                local_dict[endpoints] = item
-
-        # Нормализуем remote кабели (hostname + interface → short form)
+        for link in graph.links():
+            item = link.neighbor
+            local_dict[link.key] = item.to_dict() if hasattr(item, "to_dict") else item
+        local_set = set(local_dict)
+
+        # Remote кабели нормализуются так же (hostname + interface → short form)
         remote_set = set()
         remote_dict = {}
         for cable in remote:
-            raw_endpoints = get_cable_endpoints(cable)
-            if raw_endpoints:
-                endpoints = tuple(sorted(
-                    f"{normalize_hostname(ep.split(':')[0])}:{normalize_interface_short(':'.join(ep.split(':')[1:]), lowercase=True)}"
-                    for ep in raw_endpoints
-                ))
+            terminations = get_cable_terminations(cable)
+            if terminations:
+                (a_device, a_intf), (b_device, b_intf) = terminations
+                endpoints = link_key(a_device, a_intf, b_device, b_intf)
                 remote_set.add(endpoints)
                 remote_dict[endpoints] = cable
 
@@ -0,0 +1,407 @@
+"""
+Граф топологии сети по LLDP/CDP соседям.
+
+Вместо плоского списка строк (каждый потребитель заново собирает
+"device:interface" и режет строки по ":") — граф в памяти:
+- устройства и порты получают целочисленные ID
+- линк хранится один раз: A→B и B→A (сосед виден с обеих сторон) — одна запись
+- смежность устройств, поиск линка по концам и по порту — O(1)
+
+Граф обновляется инкрементально: update_device() заменяет всё, что
+сообщило одно устройство (результат сбора LLDP с него), не трогая
+остальные. Линк удаляется, когда его не видит ни одна из сторон.
+
+Пример использования:
+    graph = TopologyGraph.from_neighbors(lldp_rows)   # List[LLDPNeighbor] или dict
+    graph.update_device("sw1", new_rows_from_sw1)     # повторный сбор с sw1
+
+    graph.find_link("sw1", "Gi0/1", "sw2", "Gi0/2")    # TopologyLink или None
+    graph.neighbors("sw1")                             # ["sw2", "sw3"]
+    graph.to_json()                                    # для topology views
+    graph.to_graphml()                                 # yEd, Gephi, networkx
+
+Ключи устройств и портов — как при сравнении кабелей: hostname без домена,
+порт в short-форме в нижнем регистре (HundredGigE и HundredGigabitEthernet → hu).
+"""
+
+import json
+import xml.etree.ElementTree as ET
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Set, Tuple
+
+from ..constants import normalize_hostname, normalize_interface_short
+
+# Конец линка: (hostname без домена, порт в short-форме lowercase)
+Endpoint = Tuple[str, str]
+
+GRAPHML_NS = "http://graphml.graphdrawing.org/xmlns"
+
+# Атрибуты GraphML: (id, для чего, имя)
+_GRAPHML_KEYS = (
+    ("name", "node", "name"),
+    ("ip", "node", "ip"),
+    ("platform", "node", "platform"),
+    ("source_port", "edge", "source_port"),
+    ("target_port", "edge", "target_port"),
+    ("protocol", "edge", "protocol"),
+)
+
+
+def _get(row: Any, name: str) -> str:
+    """Поле строки соседа: dict или LLDPNeighbor."""
+    if isinstance(row, dict):
+        return row.get(name) or ""
+    return getattr(row, name, "") or ""
+
+
+def _endpoint(device: str, interface: str) -> Endpoint:
+    return normalize_hostname(device), normalize_interface_short(interface, lowercase=True)
+
+
+def _ordered(a: Endpoint, b: Endpoint) -> Tuple[Endpoint, Endpoint]:
+    """Канонический порядок концов — по строке "device:port" (как ключи кабелей)."""
+    if f"{a[0]}:{a[1]}" <= f"{b[0]}:{b[1]}":
+        return a, b
+    return b, a
+
+
+def link_endpoints(
+    a_device: str, a_interface: str, b_device: str, b_interface: str,
+) -> Tuple[Endpoint, Endpoint]:
+    """Нормализованные концы линка в каноническом порядке (A-B = B-A)."""
+    return _ordered(_endpoint(a_device, a_interface), _endpoint(b_device, b_interface))
+
+
+def link_key(
+    a_device: str, a_interface: str, b_device: str, b_interface: str,
+) -> Tuple[str, str]:
+    """Ключ линка: ("device:port", "device:port") в каноническом порядке."""
+    a, b = link_endpoints(a_device, a_interface, b_device, b_interface)
+    return f"{a[0]}:{a[1]}", f"{b[0]}:{b[1]}"
+
+
+class TopologyLink:
+    """
+    Линк между двумя портами.
+
+    Attributes:
+        id: ID линка (не переиспользуется после удаления)
+        ports: ID портов концов (в порядке endpoints)
+        endpoints: Нормализованные концы ((device, port), (device, port))
+        key: ("device:port", "device:port") — ключ для сравнения с кабелями
+        reporters: ID устройств, которые видят линк (1 или 2)
+        neighbor: Последняя строка соседа, описавшая линк
+    """
+
+    __slots__ = ("id", "ports", "endpoints", "key", "reporters", "neighbor")
+
+    def __init__(
+        self,
+        link_id: int,
+        ports: Tuple[int, int],
+        endpoints: Tuple[Endpoint, Endpoint],
+        neighbor: Any,
+    ):
+        self.id = link_id
+        self.ports = ports
+        self.endpoints = endpoints
+        self.key = tuple(f"{device}:{port}" for device, port in endpoints)
+        self.reporters: Set[int] = set()
+        self.neighbor = neighbor
+
+    def __repr__(self) -> str:
+        return f"TopologyLink({self.key[0]} <-> {self.key[1]})"
+
+
+class TopologyGraph:
+    """
+    Граф топологии: устройства, порты и линки между ними.
+
+    Устройства и порты не удаляются (ID стабильны); в экспорт попадают
+    устройства, у которых есть линки или которые сами сообщали соседей.
+
+    Examples:
+        >>> graph = TopologyGraph.from_neighbors(neighbors)
+        >>> graph.has_link("sw1", "GigabitEthernet0/1", "sw2", "Gi0/2")
+        True
+        >>> [link.key for link in graph.links_at("sw1", "Gi0/1")]
+        [('sw1:gi0/1', 'sw2:gi0/2')]
+    """
+
+    def __init__(self):
+        # Устройства: ID → имя, атрибуты, смежность {ID соседа: число линков}
+        self._node_ids: Dict[str, int] = {}
+        self._node_names: List[str] = []
+        self._node_attrs: List[Dict[str, str]] = []
+        self._adjacency: List[Dict[int, int]] = []
+        # Порты: (ID устройства, порт) → ID; ID → устройство, подпись, линки
+        self._port_ids: Dict[Endpoint, int] = {}
+        self._port_node: List[int] = []
+        self._port_labels: List[str] = []
+        self._port_links: List[Set[int]] = []
+        # Линки: ID → линк, ключ → ID; что сообщило каждое устройство
+        self._links: Dict[int, TopologyLink] = {}
+        self._link_ids: Dict[Tuple[str, str], int] = {}
+        self._reported: Dict[int, Set[int]] = {}
+        self._next_link_id = 0
+
+    @classmethod
+    def from_neighbors(cls, neighbors: Iterable[Any]) -> "TopologyGraph":
+        """Строит граф из соседей (LLDPNeighbor или dict) всех устройств."""
+        graph = cls()
+        for row in neighbors:
+            graph.add(row)
+        return graph
+
+    # =========================================================================
+    # ОБНОВЛЕНИЕ
+    # =========================================================================
+
+    def add(self, row: Any, hostname: Optional[str] = None) -> Optional[TopologyLink]:
+        """
+        Добавляет соседа: линк hostname:local_interface ↔ remote_hostname:remote_port.
+
+        Args:
+            row: LLDPNeighbor или dict
+            hostname: Локальное устройство (по умолчанию row.hostname)
+
+        Returns:
+            TopologyLink или None, если не хватает концов линка
+        """
+        local_device = hostname if hostname is not None else _get(row, "hostname")
+        local_intf = _get(row, "local_interface")
+        remote_device = _get(row, "remote_hostname")
+        remote_port = _get(row, "remote_port")
+        if not (local_device and local_intf and remote_device and remote_port):
+            return None
+
+        local = _endpoint(local_device, local_intf)
+        remote = _endpoint(remote_device, remote_port)
+        local_node = self._node(local[0])
+        remote_node = self._node(remote[0])
+        self._set_attr(local_node, "ip", _get(row, "device_ip"))
+        self._set_attr(remote_node, "ip", _get(row, "remote_ip"))
+        self._set_attr(remote_node, "platform", _get(row, "remote_platform"))
+
+        endpoints = _ordered(local, remote)
+        key = tuple(f"{device}:{port}" for device, port in endpoints)
+        link_id = self._link_ids.get(key)
+        if link_id is None:
+            local_port = self._port(local_node, local[1], local_intf)
+            remote_port_id = self._port(remote_node, remote[1], remote_port)
+            ports = (local_port, remote_port_id) if endpoints[0] == local else (remote_port_id, local_port)
+            link_id = self._next_link_id
+            self._next_link_id += 1
+            link = TopologyLink(link_id, ports, endpoints, row)
+            self._links[link_id] = link
+            self._link_ids[key] = link_id
+            self._port_links[local_port].add(link_id)
+            self._port_links[remote_port_id].add(link_id)
+            self._connect(local_node, remote_node, 1)
+        else:
+            link = self._links[link_id]
+            link.neighbor = row
+
+        link.reporters.add(local_node)
+        self._reported.setdefault(local_node, set()).add(link_id)
+        return link
+
+    def update_device(self, hostname: str, neighbors: Iterable[Any]) -> None:
+        """
+        Заменяет соседей одного устройства результатом нового сбора.
+
+        Линки, которые устройство больше не видит, теряют его как источник;
+        линк без источников удаляется. Остальные устройства не затрагиваются.
+        """
+        self.remove_device(hostname)
+        self._reported.setdefault(self._node(normalize_hostname(hostname)), set())
+        for row in neighbors:
+            self.add(row, hostname=hostname)
+
+    def remove_device(self, hostname: str) -> None:
+        """Убирает всё, что сообщило устройство (само устройство остаётся в графе)."""
+        node = self._node_ids.get(normalize_hostname(hostname))
+        if node is None:
+            return
+        for link_id in self._reported.pop(node, ()):
+            link = self._links.get(link_id)
+            if link is None:
+                continue
+            link.reporters.discard(node)
+            if not link.reporters:
+                self._remove_link(link)
+
+    # =========================================================================
+    # ПОИСК
+    # =========================================================================
+
+    def find_link(
+        self, a_device: str, a_interface: str, b_device: str, b_interface: str,
+    ) -> Optional[TopologyLink]:
+        """Линк по концам (в любом порядке, имена нормализуются) или None."""
+        link_id = self._link_ids.get(link_key(a_device, a_interface, b_device, b_interface))
+        return None if link_id is None else self._links[link_id]
+
+    def has_link(
+        self, a_device: str, a_interface: str, b_device: str, b_interface: str,
+    ) -> bool:
+        """Есть ли линк между портами."""
+        return self.find_link(a_device, a_interface, b_device, b_interface) is not None
+
+    def get(self, key: Tuple[str, str]) -> Optional[TopologyLink]:
+        """Линк по готовому ключу ("device:port", "device:port") или None."""
+        link_id = self._link_ids.get(key)
+        return None if link_id is None else self._links[link_id]
+
+    def links_at(self, device: str, interface: str) -> List[TopologyLink]:
+        """Линки на порту устройства (больше одного — например, хаб или AP)."""
+        node = self._node_ids.get(normalize_hostname(device))
+        if node is None:
+            return []
+        port = self._port_ids.get((node, normalize_interface_short(interface, lowercase=True)))
+        if port is None:
+            return []
+        return [self._links[link_id] for link_id in sorted(self._port_links[port])]
+
+    def neighbors(self, device: str) -> List[str]:
+        """Устройства, соединённые с device хотя бы одним линком."""
+        node = self._node_ids.get(normalize_hostname(device))
+        if node is None:
+            return []
+        return [self._node_names[other] for other in self._adjacency[node]]
+
+    def links(self) -> Iterator[TopologyLink]:
+        """Все линки в порядке добавления."""
+        return iter(self._links.values())
+
+    def devices(self) -> List[str]:
+        """Устройства, которые попадают в экспорт."""
+        return [self._node_names[node] for node in self._exported_nodes()]
+
+    def __contains__(self, key: Tuple[str, str]) -> bool:
+        return key in self._link_ids
+
+    def __len__(self) -> int:
+        return len(self._links)
+
+    def __repr__(self) -> str:
+        return f"TopologyGraph(devices={len(self._exported_nodes())}, links={len(self)})"
+
+    # =========================================================================
+    # ЭКСПОРТ
+    # =========================================================================
+
+    def to_dict(self) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Граф в виде {"nodes": [...], "links": [...]}.
+
+        source/target линка — ID устройств, порты — в short-форме (Gi0/1).
+        """
+        nodes = []
+        for node in self._exported_nodes():
+            item: Dict[str, Any] = {"id": node, "name": self._node_names[node]}
+            item.update(self._node_attrs[node])
+            nodes.append(item)
+
+        links = []
+        for link in self._links.values():
+            a_port, b_port = link.ports
+            links.append({
+                "id": link.id,
+                "source": self._port_node[a_port],
+                "target": self._port_node[b_port],
+                "source_port": self._port_labels[a_port],
+                "target_port": self._port_labels[b_port],
+                "protocol": _get(link.neighbor, "protocol"),
+            })
+        return {"nodes": nodes, "links": links}
+
+    def to_json(self, indent: Optional[int] = 2) -> str:
+        """Граф в JSON (формат to_dict, подходит для d3-force и подобных)."""
+        return json.dumps(self.to_dict(), ensure_ascii=False, indent=indent)
+
+    def to_graphml(self) -> str:
+        """Граф в GraphML (неориентированный; открывается в yEd, Gephi, networkx)."""
+        ET.register_namespace("", GRAPHML_NS)
+        root = ET.Element(f"{{{GRAPHML_NS}}}graphml")
+        for key_id, target, name in _GRAPHML_KEYS:
+            ET.SubElement(root, f"{{{GRAPHML_NS}}}key", {
+                "id": key_id, "for": target, "attr.name": name, "attr.type": "string",
+            })
+        graph = ET.SubElement(root, f"{{{GRAPHML_NS}}}graph", {
+            "id": "topology", "edgedefault": "undirected",
+        })
+
+        data = self.to_dict()
+        for node in data["nodes"]:
+            element = ET.SubElement(graph, f"{{{GRAPHML_NS}}}node", {"id": f"n{node['id']}"})
+            for key_id in ("name", "ip", "platform"):
+                if node.get(key_id):
+                    ET.SubElement(element, f"{{{GRAPHML_NS}}}data", {"key": key_id}).text = node[key_id]
+        for link in data["links"]:
+            element = ET.SubElement(graph, f"{{{GRAPHML_NS}}}edge", {
+                "id": f"e{link['id']}",
+                "source": f"n{link['source']}",
+                "target": f"n{link['target']}",
+            })
+            for key_id in ("source_port", "target_port", "protocol"):
+                if link[key_id]:
+                    ET.SubElement(element, f"{{{GRAPHML_NS}}}data", {"key": key_id}).text = link[key_id]
+
+        ET.indent(root)
+        return ET.tostring(root, encoding="unicode", xml_declaration=True)
+
+    # =========================================================================
+    # ВНУТРЕННЕЕ
+    # =========================================================================
+
+    def _node(self, name: str) -> int:
+        """ID устройства по нормализованному hostname (создаётся при первом упоминании)."""
+        node = self._node_ids.get(name)
+        if node is None:
+            node = len(self._node_names)
+            self._node_ids[name] = node
+            self._node_names.append(name)
+            self._node_attrs.append({})
+            self._adjacency.append({})
+        return node
+
+    def _port(self, node: int, name: str, interface: str) -> int:
+        """ID порта устройства (создаётся при первом упоминании, подпись — short-форма)."""
+        key = (node, name)
+        port = self._port_ids.get(key)
+        if port is None:
+            port = len(self._port_node)
+            self._port_ids[key] = port
+            self._port_node.append(node)
+            self._port_labels.append(normalize_interface_short(interface))
+            self._port_links.append(set())
+        return port
+
+    def _set_attr(self, node: int, name: str, value: str) -> None:
+        if value:
+            self._node_attrs[node][name] = value
+
+    def _connect(self, a: int, b: int, delta: int) -> None:
+        """Изменяет число линков между устройствами a и b в смежности."""
+        for node, other in ((a, b), (b, a)):
+            count = self._adjacency[node].get(other, 0) + delta
+            if count > 0:
+                self._adjacency[node][other] = count
+            else:
+                self._adjacency[node].pop(other, None)
+            if a == b:
+                break
+
+    def _remove_link(self, link: TopologyLink) -> None:
+        del self._links[link.id]
+        del self._link_ids[link.key]
+        a_port, b_port = link.ports
+        self._port_links[a_port].discard(link.id)
+        self._port_links[b_port].discard(link.id)
+        self._connect(self._port_node[a_port], self._port_node[b_port], -1)
+
+    def _exported_nodes(self) -> List[int]:
+        return [
+            node for node in range(len(self._node_names))
+            if self._adjacency[node] or node in self._reported
+        ]
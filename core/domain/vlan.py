@@ -6,7 +6,8 @@ Domain logic для VLAN.
 """
 
 import logging
-from typing import List, Set, Optional
+from array import array
+from typing import Any, Dict, Iterable, List, Set, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +15,9 @@ logger = logging.getLogger(__name__)
 # Полные диапазоны VLAN (все VLAN)
 FULL_VLAN_RANGES = frozenset({"all", "1-4094", "1-4093", "1-4095", "none", ""})
 
+# Размер пространства VID (0-4095): массивы и битовые маски
+VID_SPACE = 4096
+
 
 def parse_vlan_range(vlan_str: str) -> List[int]:
     """
@@ -169,3 +173,108 @@ class VlanSet:
     def intersection(self, other: "VlanSet") -> Set[int]:
         """Общие VLAN."""
         return self._vids & other._vids
+
+
+def vids_to_mask(vids: Iterable[int]) -> int:
+    """
+    Множество VID → битовая маска (бит N — VLAN N).
+
+    Пересечение и разность наборов VLAN становятся операциями & и ~
+    над одним целым числом вместо цикла по VID.
+
+    Examples:
+        >>> vids_to_mask([1, 3])
+        10
+    """
+    bitmap = bytearray(VID_SPACE // 8)
+    for vid in vids:
+        if 0 <= vid < VID_SPACE:
+            bitmap[vid >> 3] |= 1 << (vid & 7)
+    return int.from_bytes(bitmap, "little")
+
+
+def mask_to_vids(mask: int) -> List[int]:
+    """
+    Битовая маска → отсортированный список VID.
+
+    Examples:
+        >>> mask_to_vids(10)
+        [1, 3]
+    """
+    vids = []
+    for offset, byte in enumerate(mask.to_bytes(VID_SPACE // 8, "little")):
+        if byte:
+            base = offset << 3
+            vids.extend(base + bit for bit in range(8) if byte >> bit & 1)
+    return vids
+
+
+class VlanIndex:
+    """
+    Индекс VLAN одного сайта.
+
+    Загружается один раз и используется и sync VLAN, и sync интерфейсов:
+    - VID → ID NetBox: массив на 4096 элементов (0 — VLAN нет)
+    - имя → VID
+    - mask: битовая маска VID, которые есть в NetBox
+
+    Examples:
+        >>> index = VlanIndex.from_vlans(site_vlans)
+        >>> matched = vids_to_mask([10, 20, 30]) & index.mask
+        >>> index.ids(matched)  # ID NetBox найденных VLAN
+    """
+
+    def __init__(self, site: str = ""):
+        """
+        Args:
+            site: Сайт, для которого построен индекс
+        """
+        self.site = site
+        self.mask = 0
+        self.names: Dict[str, int] = {}
+        self._ids = array("q", bytes(8 * VID_SPACE))
+        self._objects: Dict[int, Any] = {}
+
+    @classmethod
+    def from_vlans(cls, vlans: Iterable[Any], site: str = "") -> "VlanIndex":
+        """Строит индекс из VLAN объектов NetBox (.id, .vid, .name)."""
+        index = cls(site)
+        for vlan in vlans:
+            index.add(vlan)
+        return index
+
+    def add(self, vlan: Any) -> None:
+        """Добавляет VLAN (например, только что созданный)."""
+        vid = int(vlan.vid)
+        if not 0 <= vid < VID_SPACE:
+            return
+        self._ids[vid] = int(vlan.id)
+        self._objects[vid] = vlan
+        self.mask |= 1 << vid
+        name = getattr(vlan, "name", None)
+        if name:
+            self.names[name] = vid
+
+    def get(self, vid: int) -> Optional[Any]:
+        """VLAN объект по VID или None."""
+        return self._objects.get(vid)
+
+    def id_of(self, vid: int) -> Optional[int]:
+        """ID NetBox по VID или None."""
+        if 0 <= vid < VID_SPACE and self._ids[vid]:
+            return self._ids[vid]
+        return None
+
+    def ids(self, mask: int) -> List[int]:
+        """ID NetBox для VID из маски (в порядке VID; отсутствующие пропускаются)."""
+        ids = self._ids
+        return [ids[vid] for vid in mask_to_vids(mask & self.mask)]
+
+    def __contains__(self, vid: int) -> bool:
+        return 0 <= vid < VID_SPACE and bool(self.mask >> vid & 1)
+
+    def __len__(self) -> int:
+        return len(self._objects)
+
+    def __repr__(self) -> str:
+        return f"VlanIndex(site={self.site!r}, vlans={len(self)})"
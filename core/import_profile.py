@@ -0,0 +1,118 @@
+"""
+Профилирование импортов CLI (--import-profile).
+
+Аналог `python -X importtime`, но включается флагом CLI и печатает
+сводку после выполнения команды: сколько миллисекунд занял импорт
+каждого модуля (с вложенными импортами и без них).
+
+Устанавливается в __main__.py до импорта CLI, поэтому видит все
+модули, загруженные командой:
+    python -m network_collector --import-profile pipeline list
+
+Вывод (stderr, по убыванию cumulative):
+    Импорт модулей: 42 модулей, 187.3 ms
+      cumulative     self  модуль
+        120.4 ms   3.1 ms  network_collector.collectors.mac
+         80.2 ms  12.0 ms  scrapli
+"""
+
+import atexit
+import sys
+import time
+from importlib.abc import MetaPathFinder
+from typing import Dict, List, Optional, TextIO, Tuple
+
+FLAG = "--import-profile"
+
+
+class ImportProfiler(MetaPathFinder):
+    """
+    Meta path finder, который замеряет exec_module каждого модуля.
+
+    Сам модули не находит: спрашивает остальные finders и оборачивает
+    exec_module найденного loader'а (только у экземпляров loader'ов,
+    builtin/frozen модули не замеряются).
+
+    Attributes:
+        timings: {модуль: (cumulative, self)} в секундах
+    """
+
+    def __init__(self):
+        self.timings: Dict[str, Tuple[float, float]] = {}
+        self._stack: List[float] = []  # время дочерних импортов по уровням
+        self._started = time.perf_counter()
+
+    def find_spec(self, fullname, path=None, target=None):
+        """Находит spec через остальные finders и оборачивает loader."""
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is None:
+                continue
+            loader = spec.loader
+            if loader is not None and not isinstance(loader, type):
+                self._wrap(loader, fullname)
+            return spec
+        return None
+
+    def _wrap(self, loader, fullname: str) -> None:
+        """Подменяет exec_module экземпляра loader'а замеряющей обёрткой."""
+        exec_module = loader.exec_module
+        profiler = self
+
+        def timed_exec_module(module):
+            profiler._stack.append(0.0)
+            start = time.perf_counter()
+            try:
+                exec_module(module)
+            finally:
+                elapsed = time.perf_counter() - start
+                children = profiler._stack.pop()
+                if profiler._stack:
+                    profiler._stack[-1] += elapsed
+                profiler.timings[fullname] = (elapsed, elapsed - children)
+
+        loader.exec_module = timed_exec_module
+
+    def report(self, limit: int = 30, stream: Optional[TextIO] = None) -> None:
+        """
+        Печатает самые медленные импорты.
+
+        Args:
+            limit: Сколько модулей показать
+            stream: Куда писать (по умолчанию stderr)
+        """
+        stream = stream or sys.stderr
+        # Сумма self-времён = общее время выполнения модулей
+        total = sum(own for _, own in self.timings.values())
+        rows = sorted(self.timings.items(), key=lambda item: item[1][0], reverse=True)
+
+        print(
+            f"\nИмпорт модулей: {len(self.timings)} модулей, {total * 1000:.1f} ms "
+            f"(с запуска профилировщика: {(time.perf_counter() - self._started) * 1000:.1f} ms)",
+            file=stream,
+        )
+        print(f"  {'cumulative':>10}  {'self':>8}  модуль", file=stream)
+        for name, (cumulative, own) in rows[:limit]:
+            print(f"  {cumulative * 1000:7.1f} ms  {own * 1000:5.1f} ms  {name}", file=stream)
+
+
+def install_if_requested(argv: Optional[List[str]] = None) -> Optional[ImportProfiler]:
+    """
+    Включает профилирование, если в argv есть --import-profile.
+
+    Отчёт печатается при завершении процесса.
+
+    Args:
+        argv: Аргументы (по умолчанию sys.argv)
+
+    Returns:
+        ImportProfiler или None
+    """
+    if FLAG not in (argv if argv is not None else sys.argv):
+        return None
+    profiler = ImportProfiler()
+    sys.meta_path.insert(0, profiler)
+    atexit.register(profiler.report)
+    return profiler
@@ -0,0 +1,60 @@
+"""
+JSON через orjson, если он установлен, иначе стандартный json.
+
+Общий для потоковых ответов API (NDJSON), JSON-логов и разбора
+JSON-вывода устройств. Результат одинаков в обоих режимах: UTF-8 без
+экранирования не-ASCII, неизвестные типы и нестроковые ключи — через str().
+
+Пример использования:
+    from network_collector.core.jsonutil import dumps, loads
+
+    line = dumps({"mac": "00:11:22:33:44:55"}, newline=True)  # bytes
+    data = loads(output)
+"""
+
+import json
+from typing import Any, Union
+
+# Опционально: orjson для быстрой сериализации
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+
+def dumps(data: Any, newline: bool = False) -> bytes:
+    """
+    Сериализует данные в JSON (UTF-8).
+
+    Args:
+        data: Данные
+        newline: Добавить перевод строки (строка NDJSON)
+
+    Returns:
+        bytes: JSON
+    """
+    if ORJSON_AVAILABLE:
+        option = orjson.OPT_NON_STR_KEYS
+        if newline:
+            option |= orjson.OPT_APPEND_NEWLINE
+        try:
+            return orjson.dumps(data, default=str, option=option)
+        except TypeError:
+            # Например, int больше 64 бит — стандартный json справится
+            pass
+    text = json.dumps(data, ensure_ascii=False, default=str)
+    return (text + "\n" if newline else text).encode("utf-8")
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """
+    Разбирает JSON.
+
+    Raises:
+        ValueError: Некорректный JSON (json.JSONDecodeError / orjson.JSONDecodeError)
+    """
+    if ORJSON_AVAILABLE:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -0,0 +1,48 @@
+"""
+Ленивые экспорты пакетов (PEP 562).
+
+Пакет объявляет {имя: подмодуль}, а подмодуль импортируется при первом
+обращении к имени. `from network_collector import MACCollector` работает
+как раньше, но `python -m network_collector pipeline list` не тянет
+scrapli, openpyxl и pynetbox.
+
+Пример использования (в __init__.py пакета):
+    from .core.lazy import lazy_exports
+
+    _EXPORTS = {"Device": ".core.device", "MACCollector": ".collectors.mac"}
+    __getattr__, __dir__ = lazy_exports(__name__, _EXPORTS)
+"""
+
+import importlib
+import sys
+from typing import Callable, Dict, List, Tuple
+
+
+def lazy_exports(
+    package: str,
+    exports: Dict[str, str],
+) -> Tuple[Callable[[str], object], Callable[[], List[str]]]:
+    """
+    Создаёт __getattr__ и __dir__ модуля для ленивых экспортов.
+
+    Args:
+        package: __name__ пакета
+        exports: {экспортируемое имя: относительный или абсолютный модуль}
+
+    Returns:
+        (__getattr__, __dir__) для присваивания на уровне модуля
+    """
+
+    def __getattr__(name: str) -> object:
+        module_name = exports.get(name)
+        if module_name is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        value = getattr(importlib.import_module(module_name, package), name)
+        # Кэшируем в модуле: следующие обращения без __getattr__
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> List[str]:
+        return sorted(set(vars(sys.modules[package])) | set(exports))
+
+    return __getattr__, __dir__
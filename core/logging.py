@@ -25,9 +25,11 @@ JSON-формат логов для интеграции с ELK/Grafana/Loki.
      "ip": "10.0.0.1", "run_id": "2025-12-27T10-30-00"}
 """
 
+import atexit
 import json
 import logging
 import logging.handlers
+import queue
 import sys
 from datetime import datetime
 from pathlib import Path
@@ -35,6 +37,8 @@ from typing import Optional, Dict, Any, Union, List
 from dataclasses import dataclass, field, asdict
 from enum import Enum
 
+from .jsonutil import dumps
+
 
 class LogLevel(str, Enum):
     """Уровни логирования."""
@@ -67,6 +71,9 @@ class LogConfig:
         backup_count: Количество backup файлов (default: 5)
         when: Интервал для time-ротации (S, M, H, D, midnight)
         interval: Частота ротации для time (default: 1)
+        queue: Форматирование и запись в отдельном потоке
+               (QueueHandler/QueueListener), потоки сбора не ждут диск
+        queue_size: Ёмкость очереди (0 = без ограничения)
 
     Example:
         # JSON в консоль + файл с ротацией по размеру
@@ -88,6 +95,8 @@ class LogConfig:
     backup_count: int = 5
     when: str = "midnight"  # S, M, H, D, W0-W6, midnight
     interval: int = 1
+    queue: bool = False
+    queue_size: int = 10000
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "LogConfig":
@@ -110,6 +119,8 @@ class LogConfig:
             backup_count=data.get("backup_count", 5),
             when=data.get("when", "midnight"),
             interval=data.get("interval", 1),
+            queue=data.get("queue", False),
+            queue_size=data.get("queue_size", 10000),
         )
 
 
@@ -180,16 +191,22 @@ class JSONFormatter(logging.Formatter):
     """
 
     # Поля logging.LogRecord которые не нужно включать в JSON
-    RESERVED_ATTRS = {
+    RESERVED_ATTRS = frozenset({
         "args", "asctime", "created", "exc_info", "exc_text",
         "filename", "funcName", "levelname", "levelno", "lineno",
         "module", "msecs", "msg", "name", "pathname", "process",
         "processName", "relativeCreated", "stack_info", "thread",
         "threadName", "taskName",
-    }
+    })
 
     # Поля которые мы специально обрабатываем
-    KNOWN_EXTRA = {"run_id", "device", "operation", "ip", "platform"}
+    KNOWN_EXTRA = ("run_id", "device", "operation", "ip", "platform")
+
+    # Всё, что не является пользовательским extra (считается один раз):
+    # большинство записей без extra, и разность множеств сразу пустая
+    _SKIP_ATTRS = RESERVED_ATTRS | frozenset(KNOWN_EXTRA) | frozenset(
+        logging.LogRecord("", 0, "", 0, "", None, None).__dict__
+    ) | {"message"}
 
     def format(self, record: logging.LogRecord) -> str:
         """
@@ -210,22 +227,26 @@ class JSONFormatter(logging.Formatter):
         }
 
         # Добавляем известные extra поля
+        attrs = record.__dict__
         for attr in self.KNOWN_EXTRA:
-            value = getattr(record, attr, None)
+            value = attrs.get(attr)
             if value is not None:
                 log_data[attr] = value
 
-        # Добавляем любые другие extra поля
-        for key, value in record.__dict__.items():
-            if key not in self.RESERVED_ATTRS and key not in self.KNOWN_EXTRA:
-                if not key.startswith("_"):
-                    log_data[key] = value
+        # Добавляем любые другие extra поля (в порядке добавления)
+        extra_keys = attrs.keys() - self._SKIP_ATTRS
+        if extra_keys:
+            for key in attrs:
+                if key in extra_keys and not key.startswith("_"):
+                    log_data[key] = attrs[key]
 
         # Exception info
         if record.exc_info:
             log_data["exception"] = self.formatException(record.exc_info)
+        elif record.exc_text:
+            log_data["exception"] = record.exc_text
 
-        return json.dumps(log_data, ensure_ascii=False, default=str)
+        return dumps(log_data).decode("utf-8")
 
 
 class HumanFormatter(logging.Formatter):
@@ -421,6 +442,7 @@ def setup_json_logging(
     # Удаляем существующие handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    stop_queue_logging()
 
     # Создаём новый handler с JSON форматом
     handler = logging.StreamHandler(stream)
@@ -454,6 +476,7 @@ def setup_human_logging(
     # Удаляем существующие handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    stop_queue_logging()
 
     # Создаём новый handler с human форматом
     handler = logging.StreamHandler(stream)
@@ -585,6 +608,7 @@ def setup_file_logging(
     # Удаляем существующие handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    stop_queue_logging()
 
     # Файловый handler
     file_handler = _create_file_handler(
@@ -610,6 +634,76 @@ def setup_file_logging(
     root_logger.setLevel(level)
 
 
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """
+    QueueHandler без форматирования в потоке, который пишет лог.
+
+    Стандартный prepare() форматирует запись сразу (и теряет exc_info).
+    Очередь здесь внутри процесса, поэтому достаточно зафиксировать
+    текст сообщения (args могут измениться позже) — форматтеры и фильтры
+    целевых handlers (RunContextFilter и т.п.) отработают в потоке
+    QueueListener. Фильтры логгеров по-прежнему вызываются в потоке,
+    который пишет лог.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = logging.makeLogRecord(record.__dict__)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record: logging.LogRecord) -> None:
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            # Очередь переполнена — ждём, но не теряем запись
+            self.queue.put(record)
+
+
+# Активный QueueListener (один на процесс)
+_queue_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def stop_queue_logging() -> None:
+    """
+    Останавливает поток записи логов, дописав оставшиеся записи.
+
+    Вызывается автоматически при выходе и при повторной настройке.
+    """
+    global _queue_listener
+    listener, _queue_listener = _queue_listener, None
+    if listener is not None:
+        listener.stop()
+        for handler in listener.handlers:
+            handler.close()
+
+
+def _start_queue_logging(
+    handlers: List[logging.Handler],
+    level: int,
+    queue_size: int,
+) -> logging.Handler:
+    """
+    Запускает QueueListener для handlers.
+
+    Returns:
+        logging.Handler: QueueHandler для root logger
+    """
+    global _queue_listener
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(maxsize=queue_size)
+    _queue_listener = logging.handlers.QueueListener(
+        log_queue, *handlers, respect_handler_level=True
+    )
+    _queue_listener.start()
+
+    queue_handler = _DeferredQueueHandler(log_queue)
+    queue_handler.setLevel(level)
+    return queue_handler
+
+
+atexit.register(stop_queue_logging)
+
+
 def setup_logging_from_config(config: LogConfig) -> None:
     """
     Настраивает логирование из конфигурации.
@@ -626,6 +720,9 @@ def setup_logging_from_config(config: LogConfig) -> None:
             backup_count=10,
         )
         setup_logging_from_config(config)
+
+        # Запись в отдельном потоке (много потоков сбора)
+        setup_logging_from_config(LogConfig(file_path="logs/app.log", queue=True))
     """
     formatter = JSONFormatter() if config.json_format else HumanFormatter()
 
@@ -634,6 +731,7 @@ def setup_logging_from_config(config: LogConfig) -> None:
     # Удаляем существующие handlers
     for handler in root_logger.handlers[:]:
         root_logger.removeHandler(handler)
+    stop_queue_logging()
 
     handlers: List[logging.Handler] = []
 
@@ -658,6 +756,9 @@ def setup_logging_from_config(config: LogConfig) -> None:
         file_handler.setFormatter(formatter)
         handlers.append(file_handler)
 
+    if config.queue and handlers:
+        handlers = [_start_queue_logging(handlers, config.level, config.queue_size)]
+
     for handler in handlers:
         root_logger.addHandler(handler)
 
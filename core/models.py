@@ -19,15 +19,30 @@ Data Models для Network Collector.
 
     # Сериализация обратно в dict
     data = intf.to_dict()
+
+Память:
+    Interface, MACEntry и LLDPNeighbor — dataclass(slots=True): без
+    __dict__ на экземпляр. from_dict() интернирует повторяющиеся строки
+    (hostname, device_ip, interface, vlan, ...), поэтому миллион MAC-записей
+    хранит одну копию каждого hostname. to_dict() собирает словарь
+    напрямую, без копирования через dataclasses.asdict.
+    Замер: python tests/benchmarks/bench_models_memory.py
 """
 
-from dataclasses import dataclass, field, asdict
+import sys
+from dataclasses import dataclass, field, fields, asdict
+from operator import attrgetter
 from typing import Optional, List, Any, Dict, Union
 from enum import Enum
 
 from .constants import mask_to_prefix
 
 
+def _intern(value: Any) -> Any:
+    """Интернирует строку (одна копия на процесс); не-строки как есть."""
+    return sys.intern(value) if type(value) is str else value
+
+
 class InterfaceStatus(str, Enum):
     """Статус интерфейса."""
     UP = "up"
@@ -51,7 +66,7 @@ class NeighborType(str, Enum):
     UNKNOWN = "unknown"
 
 
-@dataclass
+@dataclass(slots=True)
 class Interface:
     """
     Данные интерфейса устройства.
@@ -101,33 +116,38 @@ class Interface:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "Interface":
-        """Создаёт Interface из словаря."""
+        """Создаёт Interface из словаря (повторяющиеся строки интернируются)."""
+        get = data.get
+        mtu = get("mtu")
         return cls(
-            name=data.get("interface") or data.get("name") or "",
-            description=data.get("description") or "",
-            status=data.get("status") or data.get("link_status") or "unknown",
-            ip_address=data.get("ip_address") or "",
-            prefix_length=str(data.get("prefix_length") or data.get("mask") or ""),
-            mac=data.get("mac") or data.get("mac_address") or "",
-            speed=data.get("speed") or "",
-            duplex=data.get("duplex") or "",
-            mtu=int(data["mtu"]) if data.get("mtu") else None,
-            vlan=str(data.get("vlan") or ""),
-            mode=data.get("mode") or "",
-            native_vlan=str(data.get("native_vlan") or ""),
-            tagged_vlans=str(data.get("tagged_vlans") or ""),
-            access_vlan=str(data.get("access_vlan") or ""),
-            port_type=data.get("port_type") or "",
-            media_type=data.get("media_type") or "",
-            hardware_type=data.get("hardware_type") or "",
-            lag=data.get("lag") or "",
-            hostname=data.get("hostname") or "",
-            device_ip=data.get("device_ip") or "",
+            name=_intern(get("interface") or get("name") or ""),
+            description=get("description") or "",
+            status=_intern(get("status") or get("link_status") or "unknown"),
+            ip_address=get("ip_address") or "",
+            prefix_length=_intern(str(get("prefix_length") or get("mask") or "")),
+            mac=get("mac") or get("mac_address") or "",
+            speed=_intern(get("speed") or ""),
+            duplex=_intern(get("duplex") or ""),
+            mtu=int(mtu) if mtu else None,
+            vlan=_intern(str(get("vlan") or "")),
+            mode=_intern(get("mode") or ""),
+            native_vlan=_intern(str(get("native_vlan") or "")),
+            tagged_vlans=str(get("tagged_vlans") or ""),
+            access_vlan=_intern(str(get("access_vlan") or "")),
+            port_type=_intern(get("port_type") or ""),
+            media_type=_intern(get("media_type") or ""),
+            hardware_type=_intern(get("hardware_type") or ""),
+            lag=_intern(get("lag") or ""),
+            hostname=_intern(get("hostname") or ""),
+            device_ip=_intern(get("device_ip") or ""),
         )
 
     def to_dict(self) -> Dict[str, Any]:
         """Конвертирует в словарь."""
-        result = {k: v for k, v in asdict(self).items() if v is not None and v != ""}
+        result = {
+            k: v for k, v in zip(_INTERFACE_FIELDS, _interface_values(self))
+            if v is not None and v != ""
+        }
         # Всегда включаем description (пустая строка - валидное значение для очистки)
         result["description"] = self.description
         # Всегда включаем mode (пустая строка = очистка mode для shutdown портов)
@@ -144,7 +164,12 @@ class Interface:
         return data
 
 
-@dataclass
+# Порядок полей Interface для to_dict() (как в dataclasses.asdict)
+_INTERFACE_FIELDS = tuple(f.name for f in fields(Interface))
+_interface_values = attrgetter(*_INTERFACE_FIELDS)
+
+
+@dataclass(slots=True)
 class MACEntry:
     """
     Запись MAC-адреса.
@@ -168,20 +193,29 @@ class MACEntry:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "MACEntry":
-        """Создаёт MACEntry из словаря."""
+        """Создаёт MACEntry из словаря (повторяющиеся строки интернируются)."""
+        get = data.get
         return cls(
-            mac=data.get("mac", data.get("destination_address", "")),
-            interface=data.get("interface", data.get("destination_port", "")),
-            vlan=str(data.get("vlan", "")),
-            mac_type=data.get("type", data.get("mac_type", "dynamic")),
-            hostname=data.get("hostname", ""),
-            device_ip=data.get("device_ip", ""),
-            vendor=data.get("vendor", ""),
+            mac=get("mac", get("destination_address", "")),
+            interface=_intern(get("interface", get("destination_port", ""))),
+            vlan=_intern(str(get("vlan", ""))),
+            mac_type=_intern(get("type", get("mac_type", "dynamic"))),
+            hostname=_intern(get("hostname", "")),
+            device_ip=_intern(get("device_ip", "")),
+            vendor=_intern(get("vendor", "")),
         )
 
     def to_dict(self) -> Dict[str, Any]:
         """Конвертирует в словарь."""
-        return asdict(self)
+        return {
+            "mac": self.mac,
+            "interface": self.interface,
+            "vlan": self.vlan,
+            "mac_type": self.mac_type,
+            "hostname": self.hostname,
+            "device_ip": self.device_ip,
+            "vendor": self.vendor,
+        }
 
     @classmethod
     def ensure_list(cls, data: Union[List[Dict[str, Any]], List["MACEntry"]]) -> List["MACEntry"]:
@@ -193,7 +227,7 @@ class MACEntry:
         return data
 
 
-@dataclass
+@dataclass(slots=True)
 class LLDPNeighbor:
     """
     Сосед LLDP/CDP.
@@ -225,24 +259,37 @@ class LLDPNeighbor:
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "LLDPNeighbor":
-        """Создаёт LLDPNeighbor из словаря."""
+        """Создаёт LLDPNeighbor из словаря (повторяющиеся строки интернируются)."""
+        get = data.get
         return cls(
-            local_interface=data.get("local_interface", data.get("local_port", "")),
-            remote_hostname=data.get("remote_hostname", data.get("neighbor", "")),
-            remote_port=data.get("remote_port", data.get("neighbor_port", "")),
-            remote_mac=data.get("remote_mac", data.get("chassis_id", "")),
-            remote_ip=data.get("remote_ip", data.get("management_ip", "")),
-            neighbor_type=data.get("neighbor_type", "unknown"),
-            protocol=data.get("protocol", "lldp"),
-            hostname=data.get("hostname", ""),
-            device_ip=data.get("device_ip", ""),
-            capabilities=data.get("capabilities", data.get("capability", "")),
-            remote_platform=data.get("remote_platform", data.get("platform", "")),
+            local_interface=_intern(get("local_interface", get("local_port", ""))),
+            remote_hostname=_intern(get("remote_hostname", get("neighbor", ""))),
+            remote_port=_intern(get("remote_port", get("neighbor_port", ""))),
+            remote_mac=get("remote_mac", get("chassis_id", "")),
+            remote_ip=_intern(get("remote_ip", get("management_ip", ""))),
+            neighbor_type=_intern(get("neighbor_type", "unknown")),
+            protocol=_intern(get("protocol", "lldp")),
+            hostname=_intern(get("hostname", "")),
+            device_ip=_intern(get("device_ip", "")),
+            capabilities=_intern(get("capabilities", get("capability", ""))),
+            remote_platform=_intern(get("remote_platform", get("platform", ""))),
         )
 
     def to_dict(self) -> Dict[str, Any]:
         """Конвертирует в словарь."""
-        return asdict(self)
+        return {
+            "local_interface": self.local_interface,
+            "remote_hostname": self.remote_hostname,
+            "remote_port": self.remote_port,
+            "remote_mac": self.remote_mac,
+            "remote_ip": self.remote_ip,
+            "neighbor_type": self.neighbor_type,
+            "protocol": self.protocol,
+            "hostname": self.hostname,
+            "device_ip": self.device_ip,
+            "capabilities": self.capabilities,
+            "remote_platform": self.remote_platform,
+        }
 
     @classmethod
     def ensure_list(cls, data: Union[List[Dict[str, Any]], List["LLDPNeighbor"]]) -> List["LLDPNeighbor"]:
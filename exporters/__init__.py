@@ -5,6 +5,7 @@
 - Excel (.xlsx) - с форматированием, цветами, фильтрами
 - CSV (.csv) - с настраиваемым разделителем
 - JSON (.json) - структурированные данные
+- Parquet (.parquet) / Feather (.feather) - колоночные форматы (нужен pyarrow)
 - Raw (stdout) - JSON в stdout для pipeline
 
 Пример использования:
@@ -23,11 +24,26 @@
     exporter.export(data, "ignored")  # -> stdout
 """
 
+from ..core.lazy import lazy_exports
 from .base import BaseExporter
 from .csv_exporter import CSVExporter
 from .json_exporter import JSONExporter
 from .excel import ExcelExporter
 from .raw_exporter import RawExporter
 
-__all__ = ["BaseExporter", "CSVExporter", "JSONExporter", "ExcelExporter", "RawExporter"]
+# Колоночные экспортеры импортируют pyarrow — только при обращении
+__getattr__, __dir__ = lazy_exports(__name__, {
+    "ParquetExporter": ".parquet_exporter",
+    "FeatherExporter": ".parquet_exporter",
+})
+
+__all__ = [
+    "BaseExporter",
+    "CSVExporter",
+    "JSONExporter",
+    "ExcelExporter",
+    "RawExporter",
+    "ParquetExporter",
+    "FeatherExporter",
+]
 
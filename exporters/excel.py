@@ -5,11 +5,18 @@ Excel экспортер с форматированием.
 - Заголовками и стилями
 - Автофильтром
 - Цветовой индикацией (для статусов)
-- Автоподбором ширины колонок
+- Автоподбором ширины колонок (по выборке строк)
+
+Для больших выгрузок используется потоковый режим (openpyxl write_only):
+строки пишутся сразу в файл, стили ячеек заранее подготовлены и общие
+для всех ячеек, поэтому память не растёт с числом строк.
 
 Пример использования:
     exporter = ExcelExporter(autofilter=True, freeze_header=True)
     exporter.export(data, "report.xlsx")
+
+    # Потоковый режим принудительно
+    exporter = ExcelExporter(streaming=True)
 """
 
 import logging
@@ -17,6 +24,7 @@ from pathlib import Path
 from typing import List, Dict, Any, Optional, Callable
 
 from openpyxl import Workbook
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
 from openpyxl.utils import get_column_letter
 
@@ -36,6 +44,12 @@ COLORS = {
     "dynamic": "FFFFFF",  # Белый (dynamic)
 }
 
+# С какого числа строк включается потоковый режим (streaming=None)
+STREAMING_THRESHOLD = 50_000
+
+# Сколько строк просматривать для оценки ширины колонок
+WIDTH_SAMPLE_SIZE = 1_000
+
 
 class ExcelExporter(BaseExporter):
     """
@@ -49,6 +63,8 @@ class ExcelExporter(BaseExporter):
         freeze_header: Закрепить строку заголовка
         auto_width: Автоподбор ширины колонок
         color_rules: Правила цветовой индикации
+        streaming: Потоковый режим (None = авто по STREAMING_THRESHOLD)
+        width_sample_size: Размер выборки строк для ширины колонок
 
     Example:
         exporter = ExcelExporter()
@@ -69,6 +85,8 @@ class ExcelExporter(BaseExporter):
         freeze_header: bool = True,
         auto_width: bool = True,
         color_rules: Optional[Dict[str, Dict[str, str]]] = None,
+        streaming: Optional[bool] = None,
+        width_sample_size: int = WIDTH_SAMPLE_SIZE,
     ):
         """
         Инициализация Excel экспортера.
@@ -80,13 +98,24 @@ class ExcelExporter(BaseExporter):
             auto_width: Автоподбор ширины колонок
             color_rules: Правила цветовой индикации
                         {column: {value: color_hex}}
+            streaming: True = write_only книга, False = обычная,
+                       None = потоковый режим от STREAMING_THRESHOLD строк
+            width_sample_size: Сколько строк учитывать при подборе ширины
         """
         super().__init__(output_folder, encoding="utf-8")
 
         self.autofilter = autofilter
         self.freeze_header = freeze_header
         self.auto_width = auto_width
-        self.color_rules = color_rules or {}
+        self.color_rules = {
+            column.lower(): {str(k).lower(): v for k, v in rules.items()}
+            for column, rules in (color_rules or {}).items()
+        }
+        self.streaming = streaming
+        self.width_sample_size = width_sample_size
+
+        # Кэш заливок: один PatternFill на цвет
+        self._fills: Dict[str, PatternFill] = {}
 
         # Стили
         self._init_styles()
@@ -108,6 +137,14 @@ class ExcelExporter(BaseExporter):
             left=thin_border, right=thin_border, top=thin_border, bottom=thin_border
         )
 
+    def _get_fill(self, color: str) -> PatternFill:
+        """Возвращает общий PatternFill для цвета."""
+        fill = self._fills.get(color)
+        if fill is None:
+            fill = PatternFill(start_color=color, end_color=color, fill_type="solid")
+            self._fills[color] = fill
+        return fill
+
     def _write(self, data: List[Dict[str, Any]], file_path: Path) -> None:
         """
         Записывает данные в Excel файл.
@@ -116,6 +153,14 @@ class ExcelExporter(BaseExporter):
             data: Данные для записи
             file_path: Путь к файлу
         """
+        streaming = self.streaming
+        if streaming is None:
+            streaming = len(data) >= STREAMING_THRESHOLD
+
+        if streaming:
+            self._write_streaming(data, file_path)
+            return
+
         wb = Workbook()
         ws = wb.active
         ws.title = "Data"
@@ -184,51 +229,114 @@ class ExcelExporter(BaseExporter):
             value: Значение ячейки
             row: Вся строка данных
         """
+        color = self._get_color(column.lower(), value, row)
+        if color:
+            cell.fill = self._get_fill(color)
+
+    def _get_color(
+        self,
+        column: str,
+        value: Any,
+        row: Dict[str, Any],
+    ) -> Optional[str]:
+        """
+        Определяет цвет ячейки по правилам.
+
+        Args:
+            column: Имя колонки в нижнем регистре
+            value: Значение ячейки
+            row: Вся строка данных
+
+        Returns:
+            str: Цвет (hex) или None
+        """
         # Проверяем кастомные правила
-        if column.lower() in self.color_rules:
-            rules = self.color_rules[column.lower()]
-            str_value = str(value).lower()
-            if str_value in rules:
-                color = rules[str_value]
-                cell.fill = PatternFill(
-                    start_color=color, end_color=color, fill_type="solid"
-                )
-                return
+        if column in self.color_rules:
+            color = self.color_rules[column].get(str(value).lower())
+            if color:
+                return color
 
         # Встроенные правила для status
-        if column.lower() == "status":
+        if column == "status":
             str_value = str(value).lower()
             if str_value == "online":
-                cell.fill = PatternFill(
-                    start_color=COLORS["online"],
-                    end_color=COLORS["online"],
-                    fill_type="solid",
-                )
-            elif str_value == "offline":
-                cell.fill = PatternFill(
-                    start_color=COLORS["offline"],
-                    end_color=COLORS["offline"],
-                    fill_type="solid",
-                )
+                return COLORS["online"]
+            if str_value == "offline":
+                return COLORS["offline"]
 
         # Встроенные правила для type (MAC)
-        if column.lower() == "type":
-            str_value = str(value).lower()
-            if str_value == "sticky":
+        if column == "type":
+            if str(value).lower() == "sticky":
                 # Зелёный только если online
                 status = str(row.get("status", "")).lower()
                 if status == "online":
-                    cell.fill = PatternFill(
-                        start_color=COLORS["sticky"],
-                        end_color=COLORS["sticky"],
-                        fill_type="solid",
-                    )
-                elif status == "offline":
-                    cell.fill = PatternFill(
-                        start_color=COLORS["offline"],
-                        end_color=COLORS["offline"],
-                        fill_type="solid",
-                    )
+                    return COLORS["sticky"]
+                if status == "offline":
+                    return COLORS["offline"]
+
+        return None
+
+    def _write_streaming(self, data: List[Dict[str, Any]], file_path: Path) -> None:
+        """
+        Записывает данные в потоковом режиме (write_only книга).
+
+        Ширина колонок, закрепление и автофильтр задаются до первой
+        строки (требование write_only). Ячейки — WriteOnlyCell; рамка и
+        заливки цветов — общие объекты (заливки кэширует _get_fill).
+
+        Args:
+            data: Данные для записи
+            file_path: Путь к файлу
+        """
+        wb = Workbook(write_only=True)
+        ws = wb.create_sheet("Data")
+
+        columns = self._get_all_columns(data)
+
+        if self.auto_width:
+            self._adjust_column_widths(ws, columns, data)
+
+        if self.freeze_header:
+            ws.freeze_panes = "A2"
+
+        if self.autofilter:
+            ws.auto_filter.ref = f"A1:{get_column_letter(len(columns))}{len(data) + 1}"
+
+        # Заголовок
+        header = []
+        for column in columns:
+            cell = WriteOnlyCell(ws, value=column.upper())
+            cell.font = self.header_font
+            cell.fill = self.header_fill
+            cell.alignment = self.header_alignment
+            cell.border = self.cell_border
+            header.append(cell)
+        ws.append(header)
+
+        colored = {
+            column: column.lower() in self.color_rules
+            or column.lower() in ("status", "type")
+            for column in columns
+        }
+        border = self.cell_border
+
+        for row in data:
+            cells = []
+            for column in columns:
+                value = row.get(column, "")
+                cell = WriteOnlyCell(ws, value=value)
+                cell.border = border
+                if colored[column]:
+                    color = self._get_color(column.lower(), value, row)
+                    if color:
+                        cell.fill = self._get_fill(color)
+                cells.append(cell)
+            ws.append(cells)
+
+        wb.save(file_path)
+        logger.debug(
+            f"Excel записан (streaming): {len(data)} строк, {len(columns)} колонок"
+        )
 
     def _adjust_column_widths(
         self,
@@ -239,19 +347,26 @@ class ExcelExporter(BaseExporter):
         """
         Автоподбор ширины колонок.
 
+        Ширина оценивается по равномерной выборке из width_sample_size
+        строк (для небольших таблиц — по всем строкам).
+
         Args:
             ws: Worksheet
             columns: Список колонок
             data: Данные
         """
+        sample = data
+        if self.width_sample_size and len(data) > self.width_sample_size:
+            step = len(data) // self.width_sample_size
+            sample = data[::step]
+
         for col_idx, column in enumerate(columns, start=1):
             # Начинаем с длины заголовка
             max_length = len(column)
 
             # Проверяем данные
-            for row in data:
-                value = row.get(column, "")
-                cell_length = len(str(value))
+            for row in sample:
+                cell_length = len(str(row.get(column, "")))
                 if cell_length > max_length:
                     max_length = cell_length
 
@@ -119,6 +119,9 @@ class JSONExporter(BaseExporter):
             return obj.isoformat()
         if isinstance(obj, set):
             return list(obj)
+        if hasattr(obj, "to_dict"):
+            # Модели со __slots__ (Interface, MACEntry, ...) без __dict__
+            return obj.to_dict()
         if hasattr(obj, "__dict__"):
             return obj.__dict__
         
@@ -0,0 +1,226 @@
+"""
+Колоночные экспортеры: Parquet и Arrow IPC (Feather).
+
+Для больших выгрузок (MAC-таблицы, интерфейсы всего парка), где Excel
+медленный и упирается в лимит строк. Данные пишутся типизированными
+колонками группами строк (row groups) — pandas/pyarrow/DuckDB читают
+файл без построчного разбора.
+
+Требует pyarrow (опционально): pip install pyarrow
+
+Пример использования:
+    exporter = ParquetExporter(data_type="mac")
+    exporter.export(data, "mac_addresses")
+
+    # Arrow IPC (Feather v2) — zero-copy чтение через memory map
+    exporter = FeatherExporter()
+    exporter.export(data, "interfaces")
+
+    # Чтение
+    import pandas as pd
+    df = pd.read_parquet("reports/mac_addresses.parquet")
+"""
+
+import logging
+from pathlib import Path
+from typing import List, Dict, Any, Optional
+
+from .base import BaseExporter
+
+logger = logging.getLogger(__name__)
+
+# Опционально: pyarrow для колоночных форматов
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+class ParquetExporter(BaseExporter):
+    """
+    Экспортер данных в Parquet.
+
+    Тип колонки определяется по значениям: bool, int64, float64,
+    иначе string (списки, словари и смешанные типы — через str()).
+    Порядок колонок берётся из fields.yaml (get_column_order), если
+    указан data_type; колонки вне конфига идут следом.
+
+    Attributes:
+        data_type: Тип данных fields.yaml (mac, lldp, interfaces, ...)
+        row_group_size: Строк в одной группе (row group / record batch)
+        compression: Сжатие (snappy, zstd, gzip, none)
+
+    Example:
+        exporter = ParquetExporter(data_type="interfaces", compression="zstd")
+        exporter.export(data, "interfaces")
+    """
+
+    file_extension = ".parquet"
+
+    def __init__(
+        self,
+        output_folder: str = "reports",
+        data_type: Optional[str] = None,
+        row_group_size: int = 100_000,
+        compression: str = "snappy",
+    ):
+        """
+        Инициализация колоночного экспортера.
+
+        Args:
+            output_folder: Папка для сохранения
+            data_type: Тип данных для порядка колонок из fields.yaml
+            row_group_size: Размер группы строк
+            compression: Алгоритм сжатия
+        """
+        if not PYARROW_AVAILABLE:
+            raise ImportError(
+                "pyarrow не установлен. Установите: pip install pyarrow"
+            )
+
+        super().__init__(output_folder, encoding="utf-8")
+
+        self.data_type = data_type
+        self.row_group_size = max(1, row_group_size)
+        self.compression = compression
+
+    def _write(self, data: List[Dict[str, Any]], file_path: Path) -> None:
+        """
+        Записывает данные группами строк.
+
+        Args:
+            data: Данные для записи
+            file_path: Путь к файлу
+        """
+        columns = self._get_ordered_columns(data)
+        schema = self._build_schema(data, columns)
+
+        with self._open_writer(file_path, schema) as writer:
+            for start in range(0, len(data), self.row_group_size):
+                chunk = data[start:start + self.row_group_size]
+                writer.write_batch(self._build_batch(chunk, schema))
+
+        logger.debug(
+            f"{self.file_extension[1:]} записан: {len(data)} строк, "
+            f"{len(columns)} колонок"
+        )
+
+    def _open_writer(self, file_path: Path, schema: "pa.Schema"):
+        """Открывает writer формата (переопределяется в наследниках)."""
+        return pq.ParquetWriter(
+            str(file_path),
+            schema,
+            compression=None if self.compression == "none" else self.compression,
+        )
+
+    def _get_ordered_columns(self, data: List[Dict[str, Any]]) -> List[str]:
+        """Колонки в порядке fields.yaml, затем остальные в порядке появления."""
+        columns = self._get_all_columns(data)
+        if not self.data_type:
+            return columns
+
+        from ..fields_config import get_column_order
+
+        present = set(columns)
+        ordered = [c for c in get_column_order(self.data_type) if c in present]
+        seen = set(ordered)
+        return ordered + [c for c in columns if c not in seen]
+
+    def _build_schema(
+        self,
+        data: List[Dict[str, Any]],
+        columns: List[str],
+    ) -> "pa.Schema":
+        """Определяет тип каждой колонки по всем значениям."""
+        return pa.schema([
+            pa.field(column, self._infer_type(row.get(column) for row in data))
+            for column in columns
+        ])
+
+    @staticmethod
+    def _infer_type(values) -> "pa.DataType":
+        """
+        Выводит тип колонки.
+
+        bool не смешивается с int (bool — подкласс int в Python).
+        Пустые строки допустимы в числовой колонке и становятся null.
+        """
+        kinds = set()
+        for value in values:
+            if value is None or value == "":
+                continue
+            if isinstance(value, bool):
+                kinds.add(bool)
+            elif isinstance(value, int):
+                kinds.add(int)
+            elif isinstance(value, float):
+                kinds.add(float)
+            else:
+                return pa.string()
+
+        if kinds == {bool}:
+            return pa.bool_()
+        if kinds == {int}:
+            return pa.int64()
+        if kinds and kinds <= {int, float}:
+            return pa.float64()
+        return pa.string()
+
+    @staticmethod
+    def _build_batch(
+        chunk: List[Dict[str, Any]],
+        schema: "pa.Schema",
+    ) -> "pa.RecordBatch":
+        """Собирает RecordBatch из группы строк по готовой схеме."""
+        arrays = []
+        for field in schema:
+            values = [row.get(field.name) for row in chunk]
+            if pa.types.is_string(field.type):
+                values = [None if v is None else str(v) for v in values]
+            else:
+                values = [None if v == "" else v for v in values]
+            arrays.append(pa.array(values, type=field.type))
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
+
+
+class FeatherExporter(ParquetExporter):
+    """
+    Экспортер данных в Arrow IPC (Feather v2).
+
+    Тот же вывод типов и порядок колонок, что у ParquetExporter.
+    Файл читается через memory map без копирования:
+        pyarrow.ipc.open_file(pyarrow.memory_map(path)).read_all()
+
+    Example:
+        exporter = FeatherExporter(compression="none")
+        exporter.export(data, "mac_addresses")
+    """
+
+    file_extension = ".feather"
+
+    def __init__(
+        self,
+        output_folder: str = "reports",
+        data_type: Optional[str] = None,
+        row_group_size: int = 100_000,
+        compression: str = "none",
+    ):
+        """
+        Инициализация Feather экспортера.
+
+        Args:
+            output_folder: Папка для сохранения
+            data_type: Тип данных для порядка колонок из fields.yaml
+            row_group_size: Размер record batch
+            compression: lz4, zstd или none (none — zero-copy чтение)
+        """
+        super().__init__(output_folder, data_type, row_group_size, compression)
+
+    def _open_writer(self, file_path: Path, schema: "pa.Schema"):
+        """Открывает Arrow IPC writer."""
+        options = pa.ipc.IpcWriteOptions(
+            compression=None if self.compression == "none" else self.compression,
+        )
+        return pa.ipc.new_file(str(file_path), schema, options=options)
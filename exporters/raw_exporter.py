@@ -93,6 +93,9 @@ class RawExporter(BaseExporter):
             return obj.isoformat()
         if isinstance(obj, set):
             return list(obj)
+        if hasattr(obj, "to_dict"):
+            # Модели со __slots__ (Interface, MACEntry, ...) без __dict__
+            return obj.to_dict()
         if hasattr(obj, "__dict__"):
             return obj.__dict__
         raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
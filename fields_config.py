@@ -19,6 +19,11 @@ FIELDS_CONFIG_FILE = os.path.join(os.path.dirname(__file__), "fields.yaml")
 # Глобальный кэш конфигурации
 _config_cache: Optional[Dict[str, Any]] = None
 
+# Кэш скомпилированных проекций: {data_type: FieldProjection}
+# Действителен пока _config_cache — тот же объект (сбрасывается reload_config)
+_projection_cache: Dict[str, "FieldProjection"] = {}
+_projection_source: Optional[Dict[str, Any]] = None
+
 
 def _load_yaml() -> Dict[str, Any]:
     """Загружает YAML файл (с кэшированием)."""
@@ -85,6 +90,112 @@ def get_enabled_fields(data_type: str) -> List[Tuple[str, str, int, Any]]:
     return enabled
 
 
+class FieldProjection:
+    """
+    Скомпилированная проекция полей fields.yaml для одного типа данных.
+
+    Строится один раз на тип данных: lowercase имена полей, display names
+    и default. Для каждого набора ключей строки (строки одного коллектора
+    обычно имеют одинаковые ключи) сопоставление ключей с полями
+    вычисляется один раз и переиспользуется — на строку остаётся только
+    выборка значений по готовому списку.
+
+    Attributes:
+        fields: [(field_lower, display_name, default), ...] в порядке order
+    """
+
+    # Максимум запоминаемых наборов ключей (защита от неоднородных данных)
+    MAX_SHAPES = 1024
+
+    def __init__(self, enabled_fields: List[Tuple[str, str, int, Any]]):
+        self.fields: List[Tuple[str, str, Any]] = [
+            (field_name.lower(), display_name, default_value)
+            for field_name, display_name, _, default_value in enabled_fields
+        ]
+        self._shapes: Dict[Tuple[str, ...], List[Tuple[Optional[str], str, Any]]] = {}
+
+    def _resolve(self, keys: Tuple[str, ...]) -> List[Tuple[Optional[str], str, Any]]:
+        """
+        Сопоставляет ключи строки с полями (без учёта регистра).
+
+        При нескольких ключах, отличающихся регистром, берётся первый.
+        """
+        lowered: Dict[str, str] = {}
+        for key in keys:
+            lowered.setdefault(key.lower(), key)
+
+        plan = [
+            (lowered.get(field_lower), display_name, default_value)
+            for field_lower, display_name, default_value in self.fields
+        ]
+        if len(self._shapes) >= self.MAX_SHAPES:
+            self._shapes.clear()
+        self._shapes[keys] = plan
+        return plan
+
+    def apply(self, data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Применяет проекцию к строкам.
+
+        Args:
+            data: Исходные данные
+
+        Returns:
+            List[Dict]: Строки с display names (пустые строки отбрасываются)
+        """
+        shapes = self._shapes
+        result = []
+        for row in data:
+            keys = tuple(row)
+            plan = shapes.get(keys)
+            if plan is None:
+                plan = self._resolve(keys)
+
+            new_row = {}
+            for key, display_name, default_value in plan:
+                value = row[key] if key is not None else None
+
+                # Применяем default если значение пустое/None
+                if value is None or value == "":
+                    if default_value is not None:
+                        value = default_value
+
+                if value is not None:
+                    new_row[display_name] = value
+
+            if new_row:
+                result.append(new_row)
+
+        return result
+
+
+def get_field_projection(data_type: str) -> Optional[FieldProjection]:
+    """
+    Возвращает скомпилированную проекцию полей (с кэшированием).
+
+    Кэш сбрасывается при reload_config() и при замене конфигурации.
+
+    Args:
+        data_type: Тип данных (lldp, mac, devices, interfaces, inventory)
+
+    Returns:
+        FieldProjection или None если включённых полей нет
+    """
+    global _projection_source
+
+    config = _load_yaml()
+    if config is not _projection_source:
+        _projection_cache.clear()
+        _projection_source = config
+
+    if data_type not in _projection_cache:
+        enabled_fields = get_enabled_fields(data_type)
+        _projection_cache[data_type] = (
+            FieldProjection(enabled_fields) if enabled_fields else None
+        )
+    return _projection_cache[data_type]
+
+
 def apply_fields_config(data: List[Dict[str, Any]], data_type: str) -> List[Dict[str, Any]]:
     """
     Применяет конфигурацию полей к данным:
@@ -93,6 +204,9 @@ def apply_fields_config(data: List[Dict[str, Any]], data_type: str) -> List[Dict
     - Сортирует по order
     - Применяет default если значение пустое
 
+    Использует скомпилированную проекцию (get_field_projection):
+    конфиг разбирается один раз на тип данных.
+
     Args:
         data: Исходные данные
         data_type: Тип данных (lldp, mac, devices, interfaces, inventory)
@@ -103,34 +217,12 @@ def apply_fields_config(data: List[Dict[str, Any]], data_type: str) -> List[Dict
     if not data:
         return data
 
-    enabled_fields = get_enabled_fields(data_type)
-    if not enabled_fields:
+    projection = get_field_projection(data_type)
+    if projection is None:
         # Если конфиг не найден, возвращаем как есть
         return data
 
-    result = []
-    for row in data:
-        new_row = {}
-        for field_name, display_name, _, default_value in enabled_fields:
-            # Ищем поле (учитываем разный регистр)
-            value = None
-            for key in row.keys():
-                if key.lower() == field_name.lower():
-                    value = row[key]
-                    break
-
-            # Применяем default если значение пустое/None
-            if value is None or value == "":
-                if default_value is not None:
-                    value = default_value
-
-            if value is not None:
-                new_row[display_name] = value
-
-        if new_row:
-            result.append(new_row)
-
-    return result
+    return projection.apply(data)
 
 
 def get_column_order(data_type: str) -> List[str]:
@@ -250,9 +342,10 @@ def get_sync_config(entity_type: str) -> SyncEntityConfig:
 
 
 def reload_config() -> None:
-    """Перезагружает конфигурацию из файла."""
+    """Перезагружает конфигурацию из файла (и сбрасывает кэш проекций)."""
     global _config_cache
     _config_cache = None
+    _projection_cache.clear()
     _load_yaml()
 
 
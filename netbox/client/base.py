@@ -7,11 +7,14 @@
 import os
 import time
 import logging
-from typing import Optional
+import threading
+from typing import Any, Dict, List, Optional, Union
 
 import requests
+from requests.adapters import HTTPAdapter
 
 from ...core.constants import slugify
+from .cache import NetBoxObjectCache
 
 logger = logging.getLogger(__name__)
 
@@ -29,6 +32,9 @@ except ImportError:
 MAX_RETRIES_429 = 3
 DEFAULT_RETRY_DELAY = 2  # секунды
 
+# Пул соединений по умолчанию (как у requests)
+DEFAULT_POOL_SIZE = 10
+
 
 class NetBoxSession(requests.Session):
     """
@@ -36,26 +42,100 @@ class NetBoxSession(requests.Session):
 
     - timeout применяется ко всем запросам (config.netbox.timeout)
     - При получении 429 — ждёт Retry-After и повторяет (до MAX_RETRIES_429 раз)
+    - Пул keep-alive соединений размером pool_size (config.netbox.pool_size)
+    - Размер страницы списков (?limit=)
+    - Счётчики: запросы, время, байты (stats)
     """
 
-    def __init__(self, timeout: int = 30, verify=True):
+    def __init__(
+        self,
+        timeout: int = 30,
+        verify=True,
+        pool_size: int = DEFAULT_POOL_SIZE,
+        keep_alive: bool = True,
+        page_size: Optional[int] = None,
+    ):
         """
         Args:
             timeout: Таймаут запросов (секунды)
             verify: True — системный CA (+ truststore если установлен),
                     False — без проверки,
                     "/path/to/cert.pem" — путь к CA-сертификату.
+            pool_size: Соединений в пуле на хост (при исчерпании потоки ждут)
+            keep_alive: Держать соединения открытыми между запросами
+            page_size: limit для списков (None — по умолчанию NetBox, обычно 50)
         """
         super().__init__()
         self.timeout = timeout
         self.verify = verify
+        self.pool_size = pool_size
+        self.page_size = page_size
+
+        adapter = HTTPAdapter(
+            pool_connections=pool_size, pool_maxsize=pool_size, pool_block=True,
+        )
+        self.mount("https://", adapter)
+        self.mount("http://", adapter)
+        self.headers["Connection"] = "keep-alive" if keep_alive else "close"
+
+        self._stats_lock = threading.Lock()
+        self.stats = {"requests": 0, "seconds": 0.0, "bytes": 0, "wire_bytes": 0}
+
+    def reset_stats(self) -> None:
+        """Обнуляет счётчики запросов."""
+        with self._stats_lock:
+            self.stats = {"requests": 0, "seconds": 0.0, "bytes": 0, "wire_bytes": 0}
+
+    def stats_summary(self) -> str:
+        """Сводка счётчиков для лога."""
+        stats = dict(self.stats)
+        return (
+            f"NetBox HTTP: {stats['requests']} запросов, {stats['seconds']:.1f} с, "
+            f"получено {stats['bytes'] / 1024:.0f} KB "
+            f"(по сети {stats['wire_bytes'] / 1024:.0f} KB)"
+        )
+
+    def _apply_page_size(self, method: str, url: str, kwargs: Dict[str, Any]) -> None:
+        """Добавляет ?limit= к GET списков, если limit не задан."""
+        if not self.page_size or method.upper() != "GET" or "limit=" in url:
+            return
+        params = kwargs.get("params")
+        if params is None:
+            kwargs["params"] = {"limit": self.page_size}
+        elif isinstance(params, dict) and "limit" not in params:
+            kwargs["params"] = {**params, "limit": self.page_size}
+
+    def _record(self, method: str, url: str, response, elapsed: float, stream: bool) -> None:
+        """Учитывает запрос в счётчиках."""
+        size = wire = 0
+        if not stream:
+            size = len(response.content or b"")
+            try:
+                wire = int(response.headers.get("Content-Length") or size)
+            except ValueError:
+                wire = size
+        with self._stats_lock:
+            self.stats["requests"] += 1
+            self.stats["seconds"] += elapsed
+            self.stats["bytes"] += size
+            self.stats["wire_bytes"] += wire
+        logger.debug(
+            f"NetBox {method} {url} → {response.status_code} "
+            f"{elapsed * 1000:.0f} ms, {size} B (по сети {wire} B)"
+        )
 
     def request(self, method, url, **kwargs):
         # Устанавливаем timeout если не задан явно
         kwargs.setdefault("timeout", self.timeout)
+        self._apply_page_size(method, url, kwargs)
 
         for attempt in range(1, MAX_RETRIES_429 + 1):
+            started = time.perf_counter()
             response = super().request(method, url, **kwargs)
+            self._record(
+                method, url, response, time.perf_counter() - started,
+                bool(kwargs.get("stream")),
+            )
 
             if response.status_code != 429:
                 return response
@@ -91,6 +171,8 @@ class NetBoxClientBase:
         token: Optional[str] = None,
         ssl_verify=True,
         timeout: Optional[int] = None,
+        object_cache: Optional[Union[str, os.PathLike]] = None,
+        read_backend: Optional[str] = None,
     ):
         """
         Инициализация клиента NetBox.
@@ -104,6 +186,10 @@ class NetBoxClientBase:
             token: API токен (опционально)
             ssl_verify: Проверять SSL сертификат
             timeout: Таймаут запросов в секундах (или config.netbox.timeout)
+            object_cache: Путь к кэшу объектов на диске (или
+                config.netbox.object_cache; пусто — без кэша)
+            read_backend: Чтение состояния для sync: "rest" или "graphql"
+                (или config.netbox.read_backend; по умолчанию rest)
 
         Raises:
             ImportError: pynetbox не установлен
@@ -132,20 +218,73 @@ class NetBoxClientBase:
                 "или установите NETBOX_TOKEN. См. документацию SECURITY.md"
             )
 
+        from ...config import config as app_config
+        netbox_config = getattr(app_config, "netbox", None)
+
         # Таймаут: параметр > config.yaml > дефолт 30с
         if timeout is None:
-            from ...config import config as app_config
-            timeout = getattr(getattr(app_config, "netbox", None), "timeout", None) or 30
+            timeout = getattr(netbox_config, "timeout", None) or 30
+
+        # Кэш объектов между запусками: параметр > config.yaml > выключен
+        if object_cache is None:
+            object_cache = getattr(netbox_config, "object_cache", None)
+        self.object_cache: Optional[NetBoxObjectCache] = (
+            NetBoxObjectCache(os.fspath(object_cache))
+            if isinstance(object_cache, (str, os.PathLike)) and object_cache else None
+        )
+
+        # Чтение состояния для sync: параметр > config.yaml > REST
+        if read_backend is None:
+            read_backend = getattr(netbox_config, "read_backend", None)
+        self.read_backend = read_backend if read_backend in ("rest", "graphql") else "rest"
 
         # Инициализируем pynetbox API
         self.api = pynetbox.api(self.url, token=self._token)
 
-        # Настройка HTTP сессии с таймаутом и retry 429
-        session = NetBoxSession(timeout=timeout, verify=ssl_verify)
+        # Настройка HTTP сессии: таймаут, retry 429, пул, размер страницы
+        session = NetBoxSession(
+            timeout=timeout,
+            verify=ssl_verify,
+            pool_size=self._pool_size(netbox_config),
+            keep_alive=netbox_config.get("keep_alive", True) if netbox_config else True,
+            page_size=netbox_config.get("page_size") if netbox_config else None,
+        )
         self.api.http_session = session
+        self.http_session = session
 
         logger.info(f"NetBox клиент инициализирован: {self.url} (timeout={timeout}s)")
 
+    @staticmethod
+    def _pool_size(netbox_config: Any) -> int:
+        """
+        Размер пула соединений.
+
+        config.netbox.pool_size или 0 — по числу потоков sync
+        (connection.max_workers): каждому потоку своё соединение плюс запас.
+        """
+        pool_size = netbox_config.get("pool_size", 0) if netbox_config else 0
+        if pool_size:
+            return pool_size
+        from ...config import config as app_config
+        workers = app_config.connection.get("max_workers", 0) if app_config.connection else 0
+        return max(DEFAULT_POOL_SIZE, workers * 2)
+
+    def _filter(self, endpoint: Any, params: Dict[str, Any]) -> List[Any]:
+        """
+        list(endpoint.filter(**params)) через кэш объектов, если он включён.
+
+        Args:
+            endpoint: pynetbox Endpoint
+            params: Фильтры
+
+        Returns:
+            List: Объекты NetBox
+        """
+        cache = getattr(self, "object_cache", None)
+        if cache is None:
+            return list(endpoint.filter(**params))
+        return cache.fetch(endpoint, params)
+
     def _resolve_site_slug(self, site_name_or_slug: str) -> Optional[str]:
         """Находит slug сайта по имени или slug."""
         # Сначала пробуем как slug
@@ -0,0 +1,163 @@
+"""
+Кэш объектов NetBox на диске между запусками.
+
+Каждый запуск CLI/pipeline заново скачивает те же устройства, интерфейсы,
+VLAN и IP. С кэшем список объектов хранится в SQLite по ключу
+"URL endpoint + фильтры", а при следующем запросе докачиваются только
+изменения:
+
+    1. filter(..., last_updated__gte=<время прошлой синхронизации>)
+       — изменённые и новые объекты (обычно пустой ответ)
+    2. count(...) — сверка количества; не совпало (объект удалён или
+       ушёл из фильтра) → полная перезагрузка
+
+Включается в config.yaml:
+    netbox:
+      object_cache: "data/netbox_cache.sqlite"
+
+Пример использования:
+    cache = NetBoxObjectCache("data/netbox_cache.sqlite")
+    interfaces = cache.fetch(api.dcim.interfaces, {"device_id": 1})
+"""
+
+import json
+import logging
+import sqlite3
+import threading
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Версия формата: при изменении старые записи игнорируются
+CACHE_VERSION = 1
+
+
+class NetBoxObjectCache:
+    """
+    Кэш списков объектов NetBox в SQLite с дельта-ревалидацией.
+
+    Attributes:
+        path: Путь к файлу SQLite
+        clock_skew: Запас (секунды) на расхождение часов клиента и NetBox
+        stats: Счётчики {full, delta, reloaded}
+    """
+
+    def __init__(self, path: str, clock_skew: float = 60.0):
+        """
+        Инициализация кэша.
+
+        Args:
+            path: Путь к файлу SQLite (каталог создаётся)
+            clock_skew: Запас времени для last_updated__gte (секунды)
+        """
+        self.path = Path(path)
+        self.clock_skew = clock_skew
+        self.stats = {"full": 0, "delta": 0, "reloaded": 0}
+        self._lock = threading.Lock()
+
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS objects ("
+                " key TEXT PRIMARY KEY,"
+                " version INTEGER NOT NULL,"
+                " synced_at TEXT NOT NULL,"
+                " payload TEXT NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(str(self.path), timeout=30)
+
+    @staticmethod
+    def make_key(url: str, params: Dict[str, Any]) -> str:
+        """Ключ кэша: URL endpoint + отсортированные фильтры."""
+        return f"{url}?{json.dumps(params, sort_keys=True, default=str)}"
+
+    def load(self, key: str) -> Optional[Tuple[datetime, Dict[int, Dict[str, Any]]]]:
+        """
+        Читает запись кэша.
+
+        Returns:
+            (время синхронизации, {id: объект}) или None
+        """
+        with self._lock, self._connect() as conn:
+            row = conn.execute(
+                "SELECT version, synced_at, payload FROM objects WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None or row[0] != CACHE_VERSION:
+            return None
+        try:
+            objects = {int(k): v for k, v in json.loads(row[2]).items()}
+            return datetime.fromisoformat(row[1]), objects
+        except (ValueError, TypeError) as e:
+            logger.debug(f"Запись кэша NetBox повреждена ({key}): {e}")
+            return None
+
+    def store(self, key: str, synced_at: datetime, objects: Dict[int, Dict[str, Any]]) -> None:
+        """Сохраняет запись кэша."""
+        payload = json.dumps(objects, default=str)
+        with self._lock, self._connect() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO objects (key, version, synced_at, payload)"
+                " VALUES (?, ?, ?, ?)",
+                (key, CACHE_VERSION, synced_at.isoformat(), payload),
+            )
+
+    def clear(self) -> None:
+        """Удаляет все записи."""
+        with self._lock, self._connect() as conn:
+            conn.execute("DELETE FROM objects")
+
+    def fetch(self, endpoint: Any, params: Dict[str, Any]) -> List[Any]:
+        """
+        Возвращает объекты endpoint.filter(**params) с учётом кэша.
+
+        Args:
+            endpoint: pynetbox Endpoint (api.dcim.interfaces, ...)
+            params: Фильтры запроса
+
+        Returns:
+            List: pynetbox Record (как list(endpoint.filter(**params)))
+        """
+        key = self.make_key(endpoint.url, params)
+        started = datetime.now(timezone.utc)
+        objects = self._revalidate(endpoint, params, key)
+
+        if objects is None:
+            self.stats["full"] += 1
+            objects = {record.id: dict(record) for record in endpoint.filter(**params)}
+
+        self.store(key, started, objects)
+        return [
+            endpoint.return_obj(values, endpoint.api, endpoint)
+            for values in objects.values()
+        ]
+
+    def _revalidate(
+        self,
+        endpoint: Any,
+        params: Dict[str, Any],
+        key: str,
+    ) -> Optional[Dict[int, Dict[str, Any]]]:
+        """Докачивает изменения с прошлой синхронизации (None — нужна полная загрузка)."""
+        cached = self.load(key)
+        if cached is None:
+            return None
+
+        synced_at, objects = cached
+        since = synced_at - timedelta(seconds=self.clock_skew)
+        changed = list(endpoint.filter(**params, last_updated__gte=since.isoformat()))
+        for record in changed:
+            objects[record.id] = dict(record)
+
+        if endpoint.count(**params) != len(objects):
+            # Объект удалён или перестал подходить под фильтр
+            self.stats["reloaded"] += 1
+            logger.debug(f"Кэш NetBox устарел, полная загрузка: {key}")
+            return None
+
+        self.stats["delta"] += 1
+        logger.debug(f"Кэш NetBox: {len(objects)} объектов, изменено {len(changed)}: {key}")
+        return objects
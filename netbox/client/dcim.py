@@ -5,7 +5,7 @@ Device Types, Manufacturers, Device Roles, Sites, Platforms, MAC-адреса.
 """
 
 import logging
-from typing import Any, Optional
+from typing import Any, Dict, List, Optional
 
 from ...core.constants import slugify
 
@@ -121,6 +121,36 @@ class DCIMMixin:
             return macs[0].mac_address
         return None
 
+    def get_interfaces_macs(
+        self,
+        interface_ids: List[int],
+        chunk_size: int = 200,
+    ) -> Dict[int, str]:
+        """
+        Получает MAC-адреса нескольких интерфейсов пачками.
+
+        Один запрос на chunk_size интерфейсов вместо запроса на каждый
+        (assigned_object_id передаётся списком — NetBox объединяет через OR).
+
+        Args:
+            interface_ids: ID интерфейсов
+            chunk_size: Интерфейсов в одном запросе (ограничение длины URL)
+
+        Returns:
+            Dict: {interface_id: MAC} — как get_interface_mac, первый MAC
+            интерфейса; интерфейсы без MAC отсутствуют
+        """
+        ids = list(dict.fromkeys(interface_ids))
+        result: Dict[int, str] = {}
+        for start in range(0, len(ids), chunk_size):
+            chunk = ids[start:start + chunk_size]
+            for mac in self.api.dcim.mac_addresses.filter(
+                assigned_object_type="dcim.interface",
+                assigned_object_id=chunk,
+            ):
+                result.setdefault(mac.assigned_object_id, mac.mac_address)
+        return result
+
     # ==================== DEVICE TYPES ====================
 
     def get_or_create_device_type(
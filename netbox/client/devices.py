@@ -3,7 +3,7 @@ Mixin для работы с устройствами NetBox.
 """
 
 import logging
-from typing import List, Any, Optional
+from typing import Dict, Iterable, List, Any, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -54,7 +54,7 @@ class DevicesMixin:
             params["status"] = status
         params.update(filters)
 
-        devices = list(self.api.dcim.devices.filter(**params))
+        devices = self._filter(self.api.dcim.devices, params)
         logger.debug(f"Получено устройств: {len(devices)}")
         return devices
 
@@ -87,7 +87,7 @@ class DevicesMixin:
                 return interface.device
         return None
 
-    def get_device_by_mac(self, mac: str) -> Optional[Any]:
+    def get_device_by_mac(self, mac: str, raise_errors: bool = False) -> Optional[Any]:
         """
         Находит устройство по MAC-адресу.
 
@@ -95,6 +95,7 @@ class DevicesMixin:
 
         Args:
             mac: MAC-адрес в любом формате
+            raise_errors: Пробрасывать ошибки API (иначе — None, как "не найден")
 
         Returns:
             Device или None
@@ -128,6 +129,158 @@ class DevicesMixin:
                 return device
 
         except Exception as e:
+            if raise_errors:
+                raise
             logger.debug(f"Ошибка поиска по MAC {mac}: {e}")
 
         return None
+
+    def get_devices_by_macs(
+        self,
+        macs: Iterable[str],
+        chunk_size: int = 200,
+    ) -> Dict[str, Any]:
+        """
+        Находит устройства по нескольким MAC-адресам пачками.
+
+        Аналог get_device_by_mac для списка: mac_address передаётся списком
+        (NetBox объединяет через OR), один запрос на chunk_size MAC.
+        Ненайденные в dcim.mac_addresses MAC ищутся в интерфейсах так же пачкой.
+
+        Args:
+            macs: MAC-адреса в любом формате
+            chunk_size: MAC в одном запросе (ограничение длины URL)
+
+        Returns:
+            Dict: {MAC без разделителей в нижнем регистре: Device};
+            ненайденные MAC отсутствуют
+        """
+        formatted: Dict[str, str] = {}
+        for mac in macs:
+            raw = (mac or "").replace(":", "").replace("-", "").replace(".", "").lower()
+            if len(raw) == 12:
+                formatted[raw] = ":".join(raw[i:i+2] for i in range(0, 12, 2)).upper()
+
+        found: Dict[str, Any] = {}
+        pending = list(formatted)
+        for start in range(0, len(pending), chunk_size):
+            chunk = [formatted[raw] for raw in pending[start:start + chunk_size]]
+            for mac_obj in self.api.dcim.mac_addresses.filter(mac_address=chunk):
+                assigned = mac_obj.assigned_object
+                if assigned and hasattr(assigned, "device"):
+                    found.setdefault(_raw_mac(mac_obj.mac_address), assigned.device)
+
+        # Fallback: MAC интерфейса (как в get_device_by_mac)
+        pending = [raw for raw in formatted if raw not in found]
+        for start in range(0, len(pending), chunk_size):
+            chunk = [formatted[raw] for raw in pending[start:start + chunk_size]]
+            for intf in self.api.dcim.interfaces.filter(mac_address=chunk):
+                if intf.device and intf.mac_address:
+                    found.setdefault(_raw_mac(intf.mac_address), intf.device)
+
+        logger.debug(f"Найдено устройств по MAC: {len(found)} из {len(formatted)}")
+        return found
+
+    def get_devices_by_names(
+        self,
+        names: Iterable[str],
+        chunk_size: int = 200,
+    ) -> Dict[str, Any]:
+        """
+        Находит устройства по нескольким именам пачками.
+
+        Аналог get_device_by_name для списка: один запрос на chunk_size имён.
+
+        Args:
+            names: Имена устройств
+            chunk_size: Имён в одном запросе (ограничение длины URL)
+
+        Returns:
+            Dict: {имя: Device}; ненайденные отсутствуют
+        """
+        pending = list(dict.fromkeys(n for n in names if n))
+        found: Dict[str, Any] = {}
+        for start in range(0, len(pending), chunk_size):
+            for device in self.api.dcim.devices.filter(name=pending[start:start + chunk_size]):
+                found.setdefault(device.name, device)
+        logger.debug(f"Найдено устройств по имени: {len(found)} из {len(pending)}")
+        return found
+
+    def get_devices_by_ips(
+        self,
+        ips: Iterable[str],
+        chunk_size: int = 200,
+    ) -> Dict[str, Any]:
+        """
+        Находит устройства по нескольким IP-адресам пачками.
+
+        Аналог get_device_by_ip для списка. Устройства дозапрашиваются
+        полными объектами (без lazy-load вложенных ссылок).
+
+        Args:
+            ips: IP-адреса (без маски)
+            chunk_size: Адресов в одном запросе
+
+        Returns:
+            Dict: {IP без маски: Device}; ненайденные отсутствуют
+        """
+        pending = list(dict.fromkeys(ip.split("/")[0] for ip in ips if ip))
+        device_ids: Dict[str, int] = {}
+        for start in range(0, len(pending), chunk_size):
+            chunk = pending[start:start + chunk_size]
+            for ip_obj in self.api.ipam.ip_addresses.filter(address=chunk):
+                interface = ip_obj.assigned_object
+                device = getattr(interface, "device", None) if interface else None
+                if device:
+                    device_ids.setdefault(str(ip_obj.address).split("/")[0], device.id)
+
+        ids = list(dict.fromkeys(device_ids.values()))
+        devices: Dict[int, Any] = {}
+        for start in range(0, len(ids), chunk_size):
+            for device in self.api.dcim.devices.filter(id=ids[start:start + chunk_size]):
+                devices[device.id] = device
+
+        found = {ip: devices[i] for ip, i in device_ids.items() if i in devices}
+        logger.debug(f"Найдено устройств по IP: {len(found)} из {len(pending)}")
+        return found
+
+    def bulk_create_devices(self, devices_data: List[dict]) -> List[Any]:
+        """
+        Создаёт несколько устройств одним API-вызовом.
+
+        Args:
+            devices_data: Список словарей с данными устройств
+
+        Returns:
+            List: Список созданных устройств
+        """
+        if not devices_data:
+            return []
+        result = self.api.dcim.devices.create(devices_data)
+        created = result if isinstance(result, list) else [result]
+        logger.debug(f"Bulk create: создано {len(created)} устройств")
+        return created
+
+    def bulk_update_devices(self, updates: List[dict]) -> List[Any]:
+        """
+        Обновляет несколько устройств одним API-вызовом.
+
+        Каждый dict должен содержать 'id'.
+
+        Args:
+            updates: Список словарей с полем 'id' и обновляемыми полями
+
+        Returns:
+            List: Список обновлённых устройств
+        """
+        if not updates:
+            return []
+        result = self.api.dcim.devices.update(updates)
+        updated = result if isinstance(result, list) else [result]
+        logger.debug(f"Bulk update: обновлено {len(updated)} устройств")
+        return updated
+
+
+def _raw_mac(mac: Optional[str]) -> str:
+    """MAC без разделителей в нижнем регистре."""
+    return (mac or "").replace(":", "").replace("-", "").replace(".", "").lower()
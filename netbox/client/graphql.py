@@ -0,0 +1,348 @@
+"""
+Чтение состояния NetBox через GraphQL.
+
+REST отдаёт объект целиком (со всеми вложенными ссылками, custom fields,
+тегами) и требует отдельного запроса на каждое устройство. Для сравнения
+в sync нужны 10-15 полей, поэтому GraphQL-запрос забирает только их и сразу
+для пачки устройств:
+
+    interface_list(filters: {device_id: ["1", "2", ...]}) {
+        id name type enabled mtu ... untagged_vlan { id vid } ...
+    }
+
+IP-адреса и кабели читаются вложенными в interface_list (ip_addresses,
+cable): у IPAddressFilter и CableFilter нет фильтра по устройству, а фильтр
+интерфейсов по device одинаково работает во всех версиях NetBox.
+
+Записи возвращаются как GraphQLRecord — атрибутный доступ как у pynetbox
+Record (intf.type.value, intf.untagged_vlan.vid), поэтому SyncComparator и
+sync-методы работают без изменений. Запись (create/update/delete) остаётся
+на REST: GraphQLRecord.update()/delete() идут через REST endpoint.
+
+Включается в config.yaml:
+    netbox:
+      read_backend: "graphql"   # rest (по умолчанию) | graphql
+"""
+
+import json
+import logging
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+from ...core.exceptions import NetBoxAPIError
+
+logger = logging.getLogger(__name__)
+
+# Устройств в одном GraphQL-запросе
+GRAPHQL_CHUNK_SIZE = 50
+
+# Поля-choices: GraphQL отдаёт имя enum ("type_1000base_t"), REST — значение
+CHOICE_FIELDS = ("type", "mode", "duplex", "status")
+
+_INTERFACE_FIELDS = """
+    id name description enabled mtu speed type mode duplex
+    untagged_vlan { id vid }
+    tagged_vlans { id vid }
+    lag { id name }
+    device { id name site { id name } }
+"""
+
+# IP-адреса — вложенные в интерфейсы (assigned_object = интерфейс строки)
+_INTERFACE_IP_FIELDS = """
+    id name device { id name }
+    ip_addresses { id address description status tenant { id } }
+"""
+
+# Кабели — вложенные в интерфейсы (кабель приходит с каждого своего конца)
+_INTERFACE_CABLE_FIELDS = """
+    id device { id }
+    cable {
+        id
+        a_terminations { ... on InterfaceType { id name device { id name } } }
+        b_terminations { ... on InterfaceType { id name device { id name } } }
+    }
+"""
+
+
+def _choice_key(text: str) -> str:
+    """Ключ сопоставления имени enum и значения choice: только [a-z0-9]."""
+    return re.sub(r"[^a-z0-9]", "", text.lower())
+
+
+def _choice_value(field: str, value: Any, values: Optional[Dict[str, str]] = None) -> Any:
+    """
+    Имя enum GraphQL → значение choice REST.
+
+    NetBox строит enum из ChoiceSet через slugify: "-" → "_", "." и другие
+    символы теряются, к значениям добавляется префикс поля
+    ("1000base-t" → "type_1000base_t", "ieee802.11a" → "type_ieee802_11a").
+    Обратно значение восстанавливается по списку значений ChoiceSet
+    (values: {_choice_key(значение): значение}). Без списка — эвристика
+    "_" → "-", верная только для значений без "." и "_".
+    """
+    if not isinstance(value, str):
+        return value
+    name = value.lower()
+    unprefixed = re.sub(rf"^{field}_", "", name)
+    for candidate in (unprefixed, name):
+        found = (values or {}).get(_choice_key(candidate))
+        if found is not None:
+            return found
+    return re.sub(rf"^{field}_?(?=\d)", "", name).replace("_", "-")
+
+
+class GraphQLChoice:
+    """Choice-поле как у pynetbox: .value и str()."""
+
+    __slots__ = ("value",)
+
+    def __init__(self, value: str):
+        self.value = value
+
+    def __str__(self) -> str:
+        return self.value
+
+    def __repr__(self) -> str:
+        return f"GraphQLChoice({self.value!r})"
+
+
+class GraphQLRecord:
+    """
+    Объект из ответа GraphQL с атрибутным доступом.
+
+    Вложенные dict становятся GraphQLRecord, списки — списками записей.
+    update() и delete() выполняются через REST endpoint.
+    """
+
+    def __init__(
+        self,
+        values: Dict[str, Any],
+        endpoint: Any = None,
+        choices: Optional[Dict[str, Dict[str, str]]] = None,
+    ):
+        """
+        Args:
+            values: Поля объекта из ответа GraphQL
+            endpoint: pynetbox Endpoint для update()/delete() (только верхний уровень)
+            choices: Значения choices endpoint: {поле: {_choice_key(значение): значение}}
+        """
+        self._endpoint = endpoint
+        self._values = values
+        for key, value in values.items():
+            setattr(self, key, self._wrap(key, value, choices or {}))
+
+    @staticmethod
+    def _wrap(key: str, value: Any, choices: Dict[str, Dict[str, str]]) -> Any:
+        if isinstance(value, dict):
+            return GraphQLRecord(value)
+        if isinstance(value, list):
+            return [GraphQLRecord(v) if isinstance(v, dict) else v for v in value]
+        if key == "id" and isinstance(value, str) and value.isdigit():
+            return int(value)
+        if key in CHOICE_FIELDS and value is not None:
+            return GraphQLChoice(_choice_value(key, value, choices.get(key)))
+        return value
+
+    def __iter__(self):
+        """dict(record) — как у pynetbox Record."""
+        return iter(self._values.items())
+
+    def __repr__(self) -> str:
+        return f"GraphQLRecord({getattr(self, 'name', None) or getattr(self, 'id', None)!r})"
+
+    def update(self, data: Dict[str, Any]) -> bool:
+        """Обновляет объект через REST (PATCH), как pynetbox Record.update()."""
+        if self._endpoint is None:
+            raise NetBoxAPIError("GraphQLRecord без endpoint: обновление невозможно")
+        return bool(self._endpoint.update([{"id": self.id, **data}]))
+
+    def delete(self) -> bool:
+        """Удаляет объект через REST."""
+        if self._endpoint is None:
+            raise NetBoxAPIError("GraphQLRecord без endpoint: удаление невозможно")
+        return self._endpoint.delete([self.id])
+
+
+class GraphQLMixin:
+    """Mixin для пакетного чтения через GraphQL."""
+
+    def graphql(self, query: str) -> Dict[str, Any]:
+        """
+        Выполняет GraphQL-запрос.
+
+        Args:
+            query: Текст запроса
+
+        Returns:
+            Dict: Содержимое "data" ответа
+
+        Raises:
+            NetBoxAPIError: HTTP-ошибка или errors в ответе
+        """
+        token = self._token
+        scheme = "Bearer" if token.startswith("nbt_") else "Token"
+        response = self.http_session.post(
+            f"{self.url.rstrip('/')}/graphql/",
+            json={"query": query},
+            headers={
+                "Authorization": f"{scheme} {token}",
+                "Accept": "application/json",
+            },
+        )
+        if response.status_code != 200:
+            raise NetBoxAPIError(
+                f"GraphQL: HTTP {response.status_code}",
+                status_code=response.status_code,
+                endpoint="/graphql/",
+            )
+        payload = response.json()
+        if payload.get("errors"):
+            message = "; ".join(e.get("message", str(e)) for e in payload["errors"])
+            raise NetBoxAPIError(f"GraphQL: {message}", endpoint="/graphql/")
+        return payload.get("data") or {}
+
+    def _graphql_legacy_filters(self) -> bool:
+        """
+        Синтаксис фильтров: до NetBox 4.3 — как у REST (device_id: [...]),
+        с 4.3 — lookups strawberry-django (device: {id: {in_list: [...]}}).
+        """
+        legacy = getattr(self, "_graphql_legacy", None)
+        if legacy is None:
+            try:
+                major, minor = (int(p) for p in str(self.api.version).split(".")[:2])
+                legacy = (major, minor) < (4, 3)
+            except Exception as e:
+                logger.debug(f"Версия NetBox не определена: {e}")
+                legacy = True
+            self._graphql_legacy = legacy
+        return legacy
+
+    def _graphql_choices(self, endpoint: Any) -> Dict[str, Dict[str, str]]:
+        """
+        Значения choices endpoint (OPTIONS через REST, один раз на endpoint).
+
+        Нужны, чтобы вернуть имени enum GraphQL точное значение ChoiceSet
+        ("type_ieee802_11a" → "ieee802.11a").
+
+        Returns:
+            Dict: {поле: {_choice_key(значение): значение}}
+        """
+        cache = getattr(self, "_graphql_choice_maps", None)
+        if cache is None:
+            cache = self._graphql_choice_maps = {}
+        name = endpoint.name
+        if name not in cache:
+            try:
+                cache[name] = {
+                    field: {_choice_key(opt["value"]): opt["value"] for opt in options}
+                    for field, options in endpoint.choices().items()
+                    if field in CHOICE_FIELDS
+                }
+            except Exception as e:
+                logger.warning(f"Choices {name} не загружены, значения enum по эвристике: {e}")
+                cache[name] = {}
+        return cache[name]
+
+    def _graphql_filter(self, relation: str, ids: Iterable[int]) -> str:
+        """Фильтр по списку ID связанного объекта в синтаксисе версии NetBox."""
+        values = json.dumps([str(i) for i in ids])
+        if self._graphql_legacy_filters():
+            return f"{{{relation}_id: {values}}}"
+        return f"{{{relation}: {{id: {{in_list: {values}}}}}}}"
+
+    def _graphql_list(self, name: str, filters: str, fields: str) -> List[Dict[str, Any]]:
+        data = self.graphql(f"query {{ {name}(filters: {filters}) {{ {fields} }} }}")
+        return data.get(name) or []
+
+    def get_site_device_ids(self, site_id: int) -> List[int]:
+        """
+        ID всех устройств сайта.
+
+        Args:
+            site_id: ID сайта
+
+        Returns:
+            List[int]: ID устройств
+        """
+        rows = self._graphql_list("device_list", self._graphql_filter("site", [site_id]), "id")
+        return [int(row["id"]) for row in rows]
+
+    def _interface_rows(self, fields: str, device_ids: List[int]) -> Iterable[Dict[str, Any]]:
+        """Строки interface_list пачками по GRAPHQL_CHUNK_SIZE устройств."""
+        for start in range(0, len(device_ids), GRAPHQL_CHUNK_SIZE):
+            chunk = device_ids[start:start + GRAPHQL_CHUNK_SIZE]
+            yield from self._graphql_list(
+                "interface_list", self._graphql_filter("device", chunk), fields,
+            )
+
+    def get_interfaces_bulk(self, device_ids: List[int]) -> Dict[int, List[GraphQLRecord]]:
+        """
+        Интерфейсы нескольких устройств (поля для сравнения в sync).
+
+        Args:
+            device_ids: ID устройств
+
+        Returns:
+            Dict: {device_id: [GraphQLRecord, ...]}
+        """
+        result: Dict[int, List[GraphQLRecord]] = {int(i): [] for i in device_ids}
+        endpoint = self.api.dcim.interfaces
+        choices = self._graphql_choices(endpoint)
+        for row in self._interface_rows(_INTERFACE_FIELDS, list(device_ids)):
+            record = GraphQLRecord(row, endpoint, choices)
+            if record.device and record.device.id in result:
+                result[record.device.id].append(record)
+        return result
+
+    def get_ip_addresses_bulk(self, device_ids: List[int]) -> Dict[int, List[GraphQLRecord]]:
+        """
+        IP-адреса на интерфейсах нескольких устройств.
+
+        assigned_object — интерфейс, в который вложен адрес; assigned_object_id
+        (GenericForeignKey в схеме GraphQL не выставлен) берётся из него,
+        чтобы запись сравнивалась как REST Record.
+
+        Args:
+            device_ids: ID устройств
+
+        Returns:
+            Dict: {device_id: [GraphQLRecord, ...]}
+        """
+        result: Dict[int, List[GraphQLRecord]] = {int(i): [] for i in device_ids}
+        endpoint = self.api.ipam.ip_addresses
+        choices = self._graphql_choices(endpoint)
+        for row in self._interface_rows(_INTERFACE_IP_FIELDS, list(device_ids)):
+            interface = GraphQLRecord({k: v for k, v in row.items() if k != "ip_addresses"})
+            if not interface.device or interface.device.id not in result:
+                continue
+            for ip_row in row.get("ip_addresses") or []:
+                record = GraphQLRecord(ip_row, endpoint, choices)
+                record.assigned_object = interface
+                record.assigned_object_id = interface.id
+                result[interface.device.id].append(record)
+        return result
+
+    def get_cables_bulk(self, device_ids: List[int]) -> Dict[int, List[GraphQLRecord]]:
+        """
+        Кабели нескольких устройств (кабель попадает к обоим концам).
+
+        Args:
+            device_ids: ID устройств
+
+        Returns:
+            Dict: {device_id: [GraphQLRecord, ...]}
+        """
+        result: Dict[int, List[GraphQLRecord]] = {int(i): [] for i in device_ids}
+        seen = set()
+        endpoint = self.api.dcim.cables
+        for row in self._interface_rows(_INTERFACE_CABLE_FIELDS, list(device_ids)):
+            cable = row.get("cable")
+            device = row.get("device")
+            if not cable or not device:
+                continue
+            device_id = int(device["id"])
+            key = (device_id, cable["id"])
+            if device_id in result and key not in seen:
+                seen.add(key)
+                result[device_id].append(GraphQLRecord(cable, endpoint))
+        return result
@@ -37,7 +37,7 @@ class InterfacesMixin:
             params["device"] = device_name
         params.update(filters)
 
-        interfaces = list(self.api.dcim.interfaces.filter(**params))
+        interfaces = self._filter(self.api.dcim.interfaces, params)
         logger.debug(f"Получено интерфейсов: {len(interfaces)}")
         return interfaces
 
@@ -35,7 +35,7 @@ class IPAddressesMixin:
             params["interface_id"] = interface_id
         params.update(filters)
 
-        ips = list(self.api.ipam.ip_addresses.filter(**params))
+        ips = self._filter(self.api.ipam.ip_addresses, params)
         logger.debug(f"Получено IP-адресов: {len(ips)}")
         return ips
 
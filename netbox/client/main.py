@@ -9,6 +9,7 @@ from .ip_addresses import IPAddressesMixin
 from .vlans import VLANsMixin
 from .inventory import InventoryMixin
 from .dcim import DCIMMixin
+from .graphql import GraphQLMixin
 
 
 class NetBoxClient(
@@ -18,6 +19,7 @@ class NetBoxClient(
     VLANsMixin,
     InventoryMixin,
     DCIMMixin,
+    GraphQLMixin,
     NetBoxClientBase,
 ):
     """
@@ -31,6 +33,7 @@ class NetBoxClient(
     - VLAN
     - Inventory Items
     - Device Types, Manufacturers, Roles, Sites, Platforms
+    - Пакетное чтение через GraphQL (read_backend: graphql)
 
     Attributes:
         url: URL NetBox сервера
@@ -35,7 +35,7 @@ class VLANsMixin:
             params["site"] = site_slug
         params.update(filters)
 
-        vlans = list(self.api.ipam.vlans.filter(**params))
+        vlans = self._filter(self.api.ipam.vlans, params)
         logger.debug(f"Получено VLAN: {len(vlans)}")
         return vlans
 
@@ -90,17 +90,48 @@ class VLANsMixin:
         if description:
             data["description"] = description
 
-        if site:
-            site_obj = self.api.dcim.sites.get(slug=site)
-            if not site_obj:
-                site_obj = self.api.dcim.sites.get(name=site)
-            if site_obj:
-                data["site"] = site_obj.id
+        site_id = self._get_site_id(site)
+        if site_id:
+            data["site"] = site_id
 
         vlan = self.api.ipam.vlans.create(data)
         logger.info(f"Создан VLAN: {vid} ({name})")
         return vlan
 
+    def bulk_create_vlans(
+        self,
+        vlans_data: List[dict],
+        site: Optional[str] = None,
+    ) -> List[Any]:
+        """
+        Создаёт несколько VLAN одним API-вызовом.
+
+        Args:
+            vlans_data: Список словарей {vid, name, status, ...}
+            site: Сайт для всех VLAN (slug или имя)
+
+        Returns:
+            List: Список созданных VLAN
+        """
+        if not vlans_data:
+            return []
+        site_id = self._get_site_id(site)
+        if site_id:
+            vlans_data = [{**data, "site": site_id} for data in vlans_data]
+        result = self.api.ipam.vlans.create(vlans_data)
+        created = result if isinstance(result, list) else [result]
+        logger.debug(f"Bulk create: создано {len(created)} VLAN")
+        return created
+
+    def _get_site_id(self, site: Optional[str]) -> Optional[int]:
+        """ID сайта по slug или имени (None если не найден)."""
+        if not site:
+            return None
+        site_obj = self.api.dcim.sites.get(slug=site)
+        if not site_obj:
+            site_obj = self.api.dcim.sites.get(name=site)
+        return site_obj.id if site_obj else None
+
     def update_interface_vlan(
         self,
         interface_id: int,
@@ -8,13 +8,17 @@
 """
 
 import re
+import time
 import logging
 from typing import List, Dict, Any, Optional, Tuple, Callable
 
 from ..client import NetBoxClient
 from ...core.context import RunContext, get_current_context
 from ...core.models import Interface, IPAddressEntry, InventoryItem, LLDPNeighbor, DeviceInfo
-from ...core.domain.sync import SyncComparator, SyncDiff, ChangeType, get_cable_endpoints
+from ...core.domain.sync import (
+    SyncComparator, SyncDiff, ChangeType, get_cable_endpoints, get_cable_terminations,
+)
+from ...core.domain.vlan import VlanIndex
 from ...core.exceptions import (
     NetBoxError,
     NetBoxConnectionError,
@@ -89,6 +93,16 @@ class SyncBase:
     используемые во всех sync-операциях.
     """
 
+    # Сколько секунд помнить, что MAC не найден в NetBox
+    MAC_MISS_TTL = 300.0
+
+    # Пакетное чтение через GraphQL (read_backend: graphql): вид → метод клиента
+    _BULK_READERS = {
+        "interfaces": "get_interfaces_bulk",
+        "ip_addresses": "get_ip_addresses_bulk",
+        "cables": "get_cables_bulk",
+    }
+
     def __init__(
         self,
         client: NetBoxClient,
@@ -116,12 +130,20 @@ class SyncBase:
         # Кэш для поиска устройств
         self._device_cache: Dict[str, Any] = {}
         self._mac_cache: Dict[str, Any] = {}
-        # Кэш VLAN: (vid, site) -> VLAN object
-        self._vlan_cache: Dict[Tuple[int, str], Any] = {}
+        # Негативный кэш MAC: MAC -> время истечения (time.monotonic)
+        self._mac_miss_cache: Dict[str, float] = {}
+        # Справочники (производители, типы, сайты, роли...) на время запуска:
+        # (endpoint, поле, значение) -> объект
+        self._lookup_cache: Dict[Tuple[str, str, str], Any] = {}
+        # Индексы VLAN по сайтам (общие для sync VLAN и интерфейсов)
+        self._vlan_indexes: Dict[str, VlanIndex] = {}
         # Обратный кэш VLAN: NetBox ID -> VID (для избежания lazy-load pynetbox)
         self._vlan_id_to_vid: Dict[int, int] = {}
         # Кэш интерфейсов: device_id -> {name: interface_obj}
         self._interface_cache: Dict[int, Dict[str, Any]] = {}
+        # Состояние из GraphQL: вид -> device_id -> записи; загруженные (вид, site_id)
+        self._remote_state: Dict[str, Dict[int, List[Any]]] = {}
+        self._remote_state_loaded: set = set()
 
     def _log_prefix(self) -> str:
         """Возвращает префикс для логов с run_id."""
@@ -149,6 +171,51 @@ class SyncBase:
             self._device_cache[name] = device
         return device
 
+    def _get_remote_state(
+        self,
+        kind: str,
+        device: Any,
+        rest_fetch: Callable[[], Any],
+    ) -> List[Any]:
+        """
+        Текущие объекты устройства в NetBox для сравнения.
+
+        При read_backend=graphql первый запрос по сайту загружает объекты
+        всех устройств сайта пачками GraphQL, остальные устройства берут
+        их из памяти. Запись выдаётся один раз: повторная синхронизация
+        того же устройства читает свежее состояние через REST.
+
+        Args:
+            kind: interfaces, ip_addresses или cables
+            device: Устройство NetBox
+            rest_fetch: Чтение через REST (по умолчанию и при ошибке GraphQL)
+
+        Returns:
+            List: Объекты NetBox (pynetbox Record или GraphQLRecord)
+        """
+        site = getattr(device, "site", None)
+        site_id = getattr(site, "id", None) if site else None
+        if getattr(self.client, "read_backend", "rest") != "graphql" or site_id is None:
+            return list(rest_fetch())
+
+        state = self._remote_state.setdefault(kind, {})
+        if (kind, site_id) not in self._remote_state_loaded:
+            self._remote_state_loaded.add((kind, site_id))
+            try:
+                device_ids = self.client.get_site_device_ids(site_id)
+                reader = getattr(self.client, self._BULK_READERS[kind])
+                state.update(reader(device_ids))
+                logger.debug(
+                    f"GraphQL: {kind} для {len(device_ids)} устройств сайта {site_id}"
+                )
+            except Exception as e:
+                logger.warning(f"GraphQL недоступен ({kind}), чтение через REST: {e}")
+
+        records = state.pop(device.id, None)
+        if records is None:
+            return list(rest_fetch())
+        return records
+
     def _find_interface(self, device_id: int, interface_name: str) -> Optional[Any]:
         """
         Находит интерфейс устройства (с кэшированием).
@@ -216,55 +283,114 @@ class SyncBase:
 
         if mac_normalized in self._mac_cache:
             return self._mac_cache[mac_normalized]
+        if self._is_mac_miss_cached(mac_normalized):
+            return None
 
-        device = self.client.get_device_by_mac(mac)
+        try:
+            device = self.client.get_device_by_mac(mac, raise_errors=True)
+        except Exception as e:
+            # Ошибка API — не "не найден": в негативный кэш не пишем,
+            # следующий поиск повторит запрос
+            logger.warning(f"Ошибка поиска устройства по MAC {mac}: {e}")
+            return None
         if device:
             self._mac_cache[mac_normalized] = device
             return device
 
+        self._mac_miss_cache[mac_normalized] = time.monotonic() + self.MAC_MISS_TTL
         return None
 
-    def _get_vlan_by_vid(self, vid: int, site: Optional[str] = None) -> Optional[Any]:
+    def _is_mac_miss_cached(self, mac_normalized: str) -> bool:
+        """Проверяет, что MAC недавно не был найден (запись не истекла)."""
+        expires = self._mac_miss_cache.get(mac_normalized)
+        if expires is None:
+            return False
+        if time.monotonic() < expires:
+            return True
+        del self._mac_miss_cache[mac_normalized]
+        return False
+
+    def _prefetch_devices_by_mac(self, macs: List[str]) -> None:
         """
-        Находит VLAN по VID с кэшированием.
+        Разрешает MAC-адреса в устройства пачкой до основного цикла.
 
-        Args:
-            vid: Номер VLAN (1-4094)
-            site: Имя сайта (ищем VLAN только в этом сайте)
+        MAC, которых нет в кэшах, ищутся несколькими запросами
+        (client.get_devices_by_macs); найденные попадают в _mac_cache,
+        ненайденные — в негативный кэш. При ошибке пакетного поиска
+        _find_device_by_mac работает по одному MAC, как раньше.
 
-        Returns:
-            VLAN или None
+        Args:
+            macs: MAC-адреса в любом формате
         """
-        cache_key = (vid, site or "")
-        if cache_key in self._vlan_cache:
-            return self._vlan_cache[cache_key]
+        pending = []
+        for mac in macs:
+            mac_normalized = (mac or "").replace(":", "").replace("-", "").replace(".", "").lower()
+            if len(mac_normalized) != 12 or mac_normalized in self._mac_cache:
+                continue
+            if self._is_mac_miss_cached(mac_normalized):
+                continue
+            pending.append(mac_normalized)
+        pending = list(dict.fromkeys(pending))
+        if not pending:
+            return
 
-        # Загружаем все VLAN сайта одним запросом (если ещё не загружены)
-        site_cache_key = f"_site_loaded_{site or ''}"
-        if site_cache_key not in self._vlan_cache:
-            self._load_site_vlans(site)
-            self._vlan_cache[site_cache_key] = True
+        try:
+            found = dict(self.client.get_devices_by_macs(pending))
+        except Exception as e:
+            logger.debug(f"Пакетный поиск устройств по MAC недоступен: {e}")
+            return
+
+        expires = time.monotonic() + self.MAC_MISS_TTL
+        resolved = 0
+        for mac_normalized in pending:
+            device = found.get(mac_normalized)
+            if device:
+                self._mac_cache[mac_normalized] = device
+                resolved += 1
+            else:
+                self._mac_miss_cache[mac_normalized] = expires
+        logger.debug(f"Устройства по MAC: найдено {resolved} из {len(pending)}")
+
+    def _get_vlan_index(self, site: Optional[str] = None) -> VlanIndex:
+        """
+        Индекс VLAN сайта: все VLAN загружаются одним запросом при первом
+        обращении и дальше используются всеми этапами sync.
 
-        # Теперь ищем в кэше
-        if cache_key in self._vlan_cache:
-            return self._vlan_cache[cache_key]
+        Args:
+            site: Имя сайта (None — VLAN без фильтра по сайту)
 
-        return None
+        Returns:
+            VlanIndex (пустой при ошибке загрузки)
+        """
+        key = site or ""
+        index = self._vlan_indexes.get(key)
+        if index is not None:
+            return index
 
-    def _load_site_vlans(self, site: Optional[str] = None) -> None:
-        """Загружает все VLAN сайта в кэш одним запросом."""
+        index = VlanIndex(site=key)
         try:
-            vlans = list(self.client.get_vlans(site=site))
-            count = 0
-            for vlan in vlans:
-                cache_key = (vlan.vid, site or "")
-                self._vlan_cache[cache_key] = vlan
+            for vlan in self.client.get_vlans(site=site):
+                index.add(vlan)
                 # Обратный кэш: ID → VID (для _check_untagged_vlan без lazy-load)
                 self._vlan_id_to_vid[vlan.id] = vlan.vid
-                count += 1
-            logger.debug(f"Загружено {count} VLANs для сайта '{site}'")
+            logger.debug(f"Загружено {len(index)} VLANs для сайта '{site}'")
         except Exception as e:
             logger.warning(f"Ошибка загрузки VLANs для сайта '{site}': {e}")
+        self._vlan_indexes[key] = index
+        return index
+
+    def _get_vlan_by_vid(self, vid: int, site: Optional[str] = None) -> Optional[Any]:
+        """
+        Находит VLAN по VID через индекс сайта.
+
+        Args:
+            vid: Номер VLAN (1-4094)
+            site: Имя сайта (ищем VLAN только в этом сайте)
+
+        Returns:
+            VLAN или None
+        """
+        return self._get_vlan_index(site).get(vid)
 
     # ==================== GET OR CREATE ====================
 
@@ -291,17 +417,23 @@ class SyncBase:
         Returns:
             Найденный или созданный объект, либо None
         """
+        cache_key = (self._endpoint_key(endpoint), get_field, name)
+        cached = self._lookup_cache.get(cache_key)
+        if cached is not None:
+            return cached
+
         try:
             obj = endpoint.get(**{get_field: name})
-            if obj:
-                return obj
+            if not obj:
+                slug = transliterate_to_slug(name) if use_transliterate else slugify(name)
+                create_data = {get_field: name, "slug": slug}
+                if extra_data:
+                    create_data.update(extra_data)
+                obj = endpoint.create(create_data)
 
-            slug = transliterate_to_slug(name) if use_transliterate else slugify(name)
-            create_data = {get_field: name, "slug": slug}
-            if extra_data:
-                create_data.update(extra_data)
-
-            return endpoint.create(create_data)
+            if obj:
+                self._lookup_cache[cache_key] = obj
+            return obj
 
         except NetBoxError as e:
             log_fn = logger.debug if log_level == "debug" else logger.error
@@ -312,6 +444,41 @@ class SyncBase:
             log_fn(f"Неизвестная ошибка ({get_field}={name}): {e}")
             return None
 
+    @staticmethod
+    def _endpoint_key(endpoint) -> str:
+        """Ключ endpoint для кэша справочников (pynetbox создаёт Endpoint заново)."""
+        return str(getattr(endpoint, "url", None) or id(endpoint))
+
+    def _prefetch_lookups(
+        self,
+        endpoint,
+        values: List[str],
+        get_field: str = "name",
+        chunk_size: int = 200,
+    ) -> None:
+        """
+        Загружает существующие объекты справочника списком запросов
+        (filter с multi-value фильтром) в кэш _get_or_create.
+
+        Args:
+            endpoint: NetBox API endpoint
+            values: Значения поля (имена, модели)
+            get_field: Поле для поиска (как в _get_or_create)
+            chunk_size: Значений в одном запросе
+        """
+        key = self._endpoint_key(endpoint)
+        pending = [
+            v for v in dict.fromkeys(values)
+            if v and (key, get_field, v) not in self._lookup_cache
+        ]
+        try:
+            for start in range(0, len(pending), chunk_size):
+                chunk = pending[start:start + chunk_size]
+                for obj in endpoint.filter(**{get_field: chunk}):
+                    self._lookup_cache.setdefault((key, get_field, getattr(obj, get_field)), obj)
+        except Exception as e:
+            logger.warning(f"Предзагрузка справочника не удалась ({get_field}): {e}")
+
     def _get_or_create_manufacturer(self, name: str) -> Optional[Any]:
         """Получает или создаёт производителя."""
         return self._get_or_create(self.client.api.dcim.manufacturers, name)
@@ -375,6 +542,7 @@ class SyncBase:
         operation: str,
         entity_name: str,
         detail_key: str = "name",
+        item_details: Optional[List[dict]] = None,
     ) -> Optional[list]:
         """
         Batch операция с автоматическим fallback на поштучную обработку.
@@ -391,6 +559,7 @@ class SyncBase:
             operation: Ключ для stats/details ("created"/"deleted"/"updated")
             entity_name: Название сущности для логов ("интерфейс"/"inventory"/"IP")
             detail_key: Ключ для details dict ("name" или "address")
+            item_details: Записи details (параллельный список) вместо {detail_key: имя}
 
         Returns:
             Результат bulk_fn при успехе, None при fallback
@@ -400,25 +569,27 @@ class SyncBase:
 
         # Определяем ключ для details (created -> create, deleted -> delete, updated -> update)
         detail_section = operation.rstrip("d").rstrip("e") + "e"  # created->create, deleted->delete
+        if item_details is None:
+            item_details = [{detail_key: name} for name in item_names]
 
         try:
             result = bulk_fn(batch_data)
-            for name in item_names:
+            for name, detail in zip(item_names, item_details):
                 logger.info(f"{self._log_prefix()}{'Создан' if operation == 'created' else 'Удалён' if operation == 'deleted' else 'Обновлён'} {entity_name}: {name}")
                 stats[operation] = stats.get(operation, 0) + 1
-                details[detail_section].append({detail_key: name})
+                details[detail_section].append(detail)
             return result
         except Exception as e:
             logger.warning(
                 f"{self._log_prefix()}Batch {operation} {entity_name} не удался ({e}), "
                 f"fallback на поштучную обработку"
             )
-            for data, name in zip(batch_data, item_names):
+            for data, name, detail in zip(batch_data, item_names, item_details):
                 try:
                     fallback_fn(data, name)
                     logger.info(f"{self._log_prefix()}{'Создан' if operation == 'created' else 'Удалён' if operation == 'deleted' else 'Обновлён'} {entity_name}: {name}")
                     stats[operation] = stats.get(operation, 0) + 1
-                    details[detail_section].append({detail_key: name})
+                    details[detail_section].append(detail)
                 except Exception as exc:
                     logger.error(f"{self._log_prefix()}Ошибка {operation} {entity_name} {name}: {exc}")
                     stats["failed"] = stats.get("failed", 0) + 1
@@ -8,11 +8,11 @@ import logging
 from typing import List, Dict, Any, Optional
 
 from .base import (
-    SyncBase, SyncStats, LLDPNeighbor, get_cable_endpoints,
+    SyncBase, SyncStats, LLDPNeighbor, get_cable_endpoints, get_cable_terminations,
     NetBoxError, format_error_for_log, logger,
-    normalize_interface_short,
 )
 from ...core.constants import normalize_hostname
+from ...core.domain.topology import TopologyGraph, link_endpoints
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +49,13 @@ class CablesSyncMixin:
             if entry.hostname:
                 lldp_devices.add(entry.hostname)
 
+        # MAC соседей разрешаем пачкой до цикла (вместо запроса на каждый MAC)
+        self._prefetch_devices_by_mac([
+            entry.remote_mac for entry in neighbors
+            if entry.remote_mac
+            and not (skip_unknown and (entry.neighbor_type or "unknown") == "unknown")
+        ])
+
         for entry in neighbors:
             local_device = entry.hostname
             local_intf = entry.local_interface
@@ -171,23 +178,15 @@ class CablesSyncMixin:
         deleted_details = []
         failed_devices = 0
 
-        # Строим set валидных endpoints с нормализованными hostname и интерфейсами
-        # ВАЖНО: используем normalize_interface_short (не full!) потому что разные
+        # Граф топологии из LLDP: линки с нормализованными hostname и интерфейсами
+        # ВАЖНО: ключи используют normalize_interface_short (не full!) потому что разные
         # вендоры имеют разные полные имена для одного типа:
         # Cisco: HundredGigE, QTech: HundredGigabitEthernet → оба → Hu (short)
-        valid_endpoints = set()
-        for entry in lldp_neighbors:
-            if entry.hostname and entry.local_interface and entry.remote_hostname and entry.remote_port:
-                local_intf_norm = normalize_interface_short(entry.local_interface, lowercase=True)
-                remote_port_norm = normalize_interface_short(entry.remote_port, lowercase=True)
-                endpoints = tuple(sorted([
-                    f"{normalize_hostname(entry.hostname)}:{local_intf_norm}",
-                    f"{normalize_hostname(entry.remote_hostname)}:{remote_port_norm}",
-                ]))
-                valid_endpoints.add(endpoints)
+        graph = TopologyGraph.from_neighbors(lldp_neighbors)
 
         # Нормализуем lldp_devices для проверки
         normalized_lldp_devices = {normalize_hostname(d) for d in lldp_devices}
+        seen_cables = set()
 
         for device_name in lldp_devices:
             device = self._find_device(device_name)
@@ -196,42 +195,40 @@ class CablesSyncMixin:
                 continue
 
             try:
-                cables = self.client.get_cables(device_id=device.id)
+                cables = self._get_remote_state(
+                    "cables", device, lambda: self.client.get_cables(device_id=device.id)
+                )
             except Exception as e:
                 logger.error(f"Ошибка получения кабелей для {device_name}: {e}")
                 failed_devices += 1
                 continue
 
             for cable in cables:
-                raw_endpoints = get_cable_endpoints(cable)
-                if not raw_endpoints:
+                # Кабель между двумя устройствами из списка приходит дважды
+                if cable.id in seen_cables:
+                    continue
+                seen_cables.add(cable.id)
+                terminations = get_cable_terminations(cable)
+                if not terminations:
                     continue
                 # Нормализуем hostname (strip domain) и interface name (short form)
                 # Short form нужна потому что NetBox может хранить HundredGigabitEthernet,
                 # а LLDP дать HundredGigE — оба → Hu (одинаковая short form)
-                cable_endpoints = tuple(sorted(
-                    f"{normalize_hostname(ep.split(':')[0])}:{normalize_interface_short(':'.join(ep.split(':')[1:]), lowercase=True)}"
-                    for ep in raw_endpoints
-                ))
-                if cable_endpoints not in valid_endpoints:
-                    endpoint_devices = set()
-                    for ep in cable_endpoints:
-                        dev = ep.split(":")[0]
-                        endpoint_devices.add(dev)
-
-                    if endpoint_devices.issubset(normalized_lldp_devices):
+                (a_device, a_intf), (b_device, b_intf) = terminations
+                if not graph.has_link(a_device, a_intf, b_device, b_intf):
+                    (a_dev, a_port), (b_dev, b_port) = link_endpoints(
+                        a_device, a_intf, b_device, b_intf
+                    )
+
+                    if {a_dev, b_dev}.issubset(normalized_lldp_devices):
                         # Формируем детали до удаления
-                        endpoints_list = list(cable_endpoints)
                         cable_detail = {
-                            "name": " ↔ ".join(endpoints_list),
+                            "name": f"{a_dev}:{a_port} ↔ {b_dev}:{b_port}",
+                            "a_device": a_dev,
+                            "a_interface": a_port,
+                            "b_device": b_dev,
+                            "b_interface": b_port,
                         }
-                        if len(endpoints_list) >= 2:
-                            a_parts = endpoints_list[0].split(":")
-                            b_parts = endpoints_list[1].split(":")
-                            cable_detail["a_device"] = a_parts[0] if a_parts else ""
-                            cable_detail["a_interface"] = a_parts[1] if len(a_parts) > 1 else ""
-                            cable_detail["b_device"] = b_parts[0] if b_parts else ""
-                            cable_detail["b_interface"] = b_parts[1] if len(b_parts) > 1 else ""
 
                         self._delete_cable(cable)
                         deleted_details.append(cable_detail)
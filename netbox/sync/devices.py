@@ -5,7 +5,7 @@ Mixin класс для create_device, sync_devices_from_inventory и связа
 """
 
 import logging
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 
 from .base import (
     SyncBase, SyncStats, DeviceInfo, get_sync_config, normalize_device_model,
@@ -15,6 +15,9 @@ from .base import (
 
 logger = logging.getLogger(__name__)
 
+# Устройств в одном bulk POST/PATCH (пакетный режим)
+DEVICE_BATCH_SIZE = 100
+
 
 class DevicesSyncMixin:
     """Mixin для синхронизации устройств."""
@@ -75,51 +78,13 @@ class DevicesSyncMixin:
             return None
 
         try:
-            mfr = self._get_or_create_manufacturer(manufacturer)
-            if not mfr:
-                logger.error(f"Не удалось создать производителя: {manufacturer}")
-                return None
-
-            dtype = self._get_or_create_device_type(device_type, mfr.id)
-            if not dtype:
-                logger.error(f"Не удалось создать тип устройства: {device_type}")
-                return None
-
-            site_obj = self._get_or_create_site(site)
-            if not site_obj:
-                logger.error(f"Не удалось создать сайт: {site}")
-                return None
-
-            role_obj = self._get_or_create_role(role)
-            if not role_obj:
-                logger.error(f"Не удалось создать роль: {role}")
+            device_data = self._build_device_data(
+                name, device_type, site, role, manufacturer,
+                serial, status, platform, tenant,
+            )
+            if device_data is None:
                 return None
 
-            tenant_obj = None
-            if tenant:
-                tenant_obj = self._get_or_create_tenant(tenant)
-                if not tenant_obj:
-                    logger.warning(f"Не удалось создать tenant: {tenant}")
-
-            device_data = {
-                "name": name,
-                "device_type": dtype.id,
-                "site": site_obj.id,
-                "role": role_obj.id,
-                "status": status,
-            }
-
-            if serial:
-                device_data["serial"] = serial
-
-            if tenant_obj:
-                device_data["tenant"] = tenant_obj.id
-
-            if platform:
-                platform_obj = self._get_or_create_platform(platform)
-                if platform_obj:
-                    device_data["platform"] = platform_obj.id
-
             device = self.client.api.dcim.devices.create(device_data)
             logger.info(f"Создано устройство: {name}")
             return device
@@ -134,6 +99,71 @@ class DevicesSyncMixin:
             logger.error(f"Неизвестная ошибка создания устройства {name}: {e}")
             return None
 
+    def _build_device_data(
+        self: SyncBase,
+        name: str,
+        device_type: str,
+        site: str,
+        role: str,
+        manufacturer: str,
+        serial: str,
+        status: str,
+        platform: str,
+        tenant: Optional[str],
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Данные для создания устройства (справочники получает или создаёт).
+
+        Returns:
+            Dict для POST /api/dcim/devices/ или None если справочник не создан
+        """
+        mfr = self._get_or_create_manufacturer(manufacturer)
+        if not mfr:
+            logger.error(f"Не удалось создать производителя: {manufacturer}")
+            return None
+
+        dtype = self._get_or_create_device_type(device_type, mfr.id)
+        if not dtype:
+            logger.error(f"Не удалось создать тип устройства: {device_type}")
+            return None
+
+        site_obj = self._get_or_create_site(site)
+        if not site_obj:
+            logger.error(f"Не удалось создать сайт: {site}")
+            return None
+
+        role_obj = self._get_or_create_role(role)
+        if not role_obj:
+            logger.error(f"Не удалось создать роль: {role}")
+            return None
+
+        tenant_obj = None
+        if tenant:
+            tenant_obj = self._get_or_create_tenant(tenant)
+            if not tenant_obj:
+                logger.warning(f"Не удалось создать tenant: {tenant}")
+
+        device_data = {
+            "name": name,
+            "device_type": dtype.id,
+            "site": site_obj.id,
+            "role": role_obj.id,
+            "status": status,
+        }
+
+        if serial:
+            device_data["serial"] = serial
+
+        if tenant_obj:
+            device_data["tenant"] = tenant_obj.id
+
+        if platform:
+            platform_obj = self._get_or_create_platform(platform)
+            if platform_obj:
+                device_data["platform"] = platform_obj.id
+
+        return device_data
+
     def sync_devices_from_inventory(
         self: SyncBase,
         inventory_data: List[DeviceInfo],
@@ -143,10 +173,15 @@ class DevicesSyncMixin:
         cleanup: bool = False,
         tenant: Optional[str] = None,
         set_primary_ip: bool = False,
+        bulk: Optional[bool] = None,
     ) -> Dict[str, Any]:
         """
         Синхронизирует устройства в NetBox из инвентаризационных данных.
 
+        Пакетный режим (bulk) для больших онбордингов: существующие
+        устройства и справочники загружаются несколькими list-запросами,
+        новые устройства создаются bulk POST, изменения — bulk PATCH.
+
         Args:
             inventory_data: Список DeviceInfo
             site: Сайт по умолчанию (используется если у устройства нет своего site)
@@ -155,6 +190,7 @@ class DevicesSyncMixin:
             cleanup: Удалять устройства не из списка
             tenant: Арендатор
             set_primary_ip: Устанавливать primary IP
+            bulk: Пакетный режим (None — из fields.yaml sync.devices.options.bulk)
 
         Returns:
             Dict: Статистика {created, updated, skipped, deleted, failed, details}
@@ -165,6 +201,8 @@ class DevicesSyncMixin:
             site = sync_cfg.get_default("site", "Main")
         if role is None:
             role = sync_cfg.get_default("role", "switch")
+        if bulk is None:
+            bulk = sync_cfg.get_option("bulk", False)
 
         ss = SyncStats("created", "updated", "skipped", "deleted", "failed")
         stats, details = ss.stats, ss.details
@@ -172,6 +210,17 @@ class DevicesSyncMixin:
         devices = DeviceInfo.ensure_list(inventory_data)
         inventory_names = set()
 
+        # Пакетный режим: найденные заранее устройства и отложенные POST/PATCH
+        by_name: Dict[str, Any] = {}
+        by_ip: Dict[str, Any] = {}
+        pending_create: List[Tuple[Dict[str, Any], Dict[str, str]]] = []
+        pending_update: List[Tuple[Any, Dict[str, Any], str, Dict[str, str]]] = []
+        pending_names = set()
+        if bulk:
+            by_name, by_ip = self._prefetch_inventory(
+                devices, site, role, tenant, update_existing,
+            )
+
         for entry in devices:
             name = entry.name or entry.hostname
             model = entry.model or "Unknown"
@@ -190,16 +239,44 @@ class DevicesSyncMixin:
             inventory_names.add(name)
 
             # Ищем устройство сначала по имени, потом по IP
-            existing = self.client.get_device_by_name(name)
+            if bulk:
+                existing = by_name.get(name)
+            else:
+                existing = self.client.get_device_by_name(name)
             if not existing and ip_address:
                 # Fallback: ищем по IP если имя похоже на IP-адрес
-                existing = self.client.get_device_by_ip(ip_address)
+                if bulk:
+                    existing = by_ip.get(ip_address.split("/")[0])
+                else:
+                    existing = self.client.get_device_by_ip(ip_address)
                 if existing:
                     logger.info(f"Устройство найдено по IP {ip_address}: {existing.name}")
                     # Используем имя из NetBox для дальнейшей работы
                     name = existing.name
             if existing:
-                if update_existing:
+                if update_existing and bulk and not self.dry_run:
+                    primary_ip = ip_address if set_primary_ip else ""
+                    updates, need_primary_ip = self._device_changes(
+                        existing,
+                        model=model,
+                        serial=serial,
+                        manufacturer=manufacturer,
+                        platform=platform,
+                        tenant=tenant,
+                        site=device_site,
+                        role=role,
+                        primary_ip=primary_ip,
+                    )
+                    if updates or need_primary_ip:
+                        pending_update.append((
+                            existing, updates,
+                            primary_ip.strip() if need_primary_ip else "",
+                            {"name": name, "model": model, "ip": ip_address},
+                        ))
+                    else:
+                        stats["skipped"] += 1
+                        details["skip"].append({"name": name, "reason": "no changes"})
+                elif update_existing:
                     updated = self._update_device(
                         existing,
                         model=model,
@@ -223,6 +300,38 @@ class DevicesSyncMixin:
                     details["skip"].append({"name": name, "reason": "already exists"})
                 continue
 
+            if bulk and self.dry_run:
+                logger.info(
+                    f"[DRY-RUN] Создание устройства: {name} "
+                    f"(type={model}, site={device_site}, role={role})"
+                )
+                stats["created"] += 1
+                details["create"].append({"name": name, "model": model, "ip": ip_address})
+                continue
+
+            if bulk:
+                if name in pending_names:
+                    stats["skipped"] += 1
+                    details["skip"].append({"name": name, "reason": "duplicate"})
+                    continue
+                pending_names.add(name)
+                try:
+                    device_data = self._build_device_data(
+                        name, model, device_site, role, manufacturer, serial,
+                        sync_cfg.get_default("status", "active"), platform,
+                        tenant if tenant is not None else sync_cfg.get_default("tenant", None),
+                    )
+                except Exception as e:
+                    logger.error(f"Ошибка подготовки устройства {name}: {e}")
+                    device_data = None
+                if device_data is None:
+                    stats["failed"] += 1
+                else:
+                    pending_create.append(
+                        (device_data, {"name": name, "model": model, "ip": ip_address})
+                    )
+                continue
+
             result = self.create_device(
                 name=name,
                 device_type=model,
@@ -244,6 +353,9 @@ class DevicesSyncMixin:
                     stats["created"] += 1
                     details["create"].append({"name": name, "model": model, "ip": ip_address})
 
+        if pending_create or pending_update:
+            self._flush_device_batches(pending_create, pending_update, stats, details)
+
         if cleanup and tenant:
             deleted = self._cleanup_devices(inventory_names, site, tenant)
             stats["deleted"] = deleted
@@ -257,6 +369,125 @@ class DevicesSyncMixin:
         stats["details"] = details
         return stats
 
+    def _prefetch_inventory(
+        self: SyncBase,
+        devices: List[DeviceInfo],
+        site: str,
+        role: str,
+        tenant: Optional[str],
+        update_existing: bool,
+    ) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Пакетный режим: загружает устройства и справочники списками.
+
+        Устройства ищутся по именам, ненайденные — по IP (как в поштучном
+        режиме). Справочники попадают в кэш _get_or_create, поэтому
+        _build_device_data/_device_changes не делают GET на каждое устройство.
+
+        Returns:
+            ({имя: Device}, {IP: Device})
+        """
+        names = [entry.name or entry.hostname for entry in devices]
+        by_name = self.client.get_devices_by_names(names)
+        missing_ips = [
+            entry.ip_address for entry in devices
+            if entry.ip_address and (entry.name or entry.hostname) not in by_name
+        ]
+        by_ip = self.client.get_devices_by_ips(missing_ips) if missing_ips else {}
+
+        sync_cfg = get_sync_config("devices")
+        if tenant is None:
+            tenant = sync_cfg.get_default("tenant", None)
+        api = self.client.api
+        self._prefetch_lookups(
+            api.dcim.manufacturers,
+            [entry.manufacturer or "Cisco" for entry in devices],
+        )
+        self._prefetch_lookups(
+            api.dcim.device_types,
+            [normalize_device_model(entry.model or "Unknown") for entry in devices],
+            get_field="model",
+        )
+        self._prefetch_lookups(api.dcim.sites, [entry.site or site for entry in devices])
+        self._prefetch_lookups(api.dcim.device_roles, [role])
+        self._prefetch_lookups(api.dcim.platforms, [entry.platform for entry in devices])
+        if tenant:
+            self._prefetch_lookups(api.tenancy.tenants, [tenant])
+
+        logger.info(
+            f"Предзагрузка: найдено {len(by_name)} устройств по имени, "
+            f"{len(by_ip)} по IP из {len(devices)}"
+        )
+        return by_name, by_ip
+
+    def _flush_device_batches(
+        self: SyncBase,
+        pending_create: List[Tuple[Dict[str, Any], Dict[str, str]]],
+        pending_update: List[Tuple[Any, Dict[str, Any], str, Dict[str, str]]],
+        stats: Dict[str, Any],
+        details: Dict[str, list],
+    ) -> None:
+        """
+        Пакетный режим: bulk POST новых и bulk PATCH изменённых устройств
+        пачками по DEVICE_BATCH_SIZE через _batch_with_fallback.
+
+        Primary IP ставится после PATCH и только устройствам, которые
+        обновились без ошибок. Записи details — как в поштучном режиме
+        ({"name", "model", "ip"}).
+        """
+        for start in range(0, len(pending_create), DEVICE_BATCH_SIZE):
+            chunk = pending_create[start:start + DEVICE_BATCH_SIZE]
+            self._batch_with_fallback(
+                batch_data=[data for data, _ in chunk],
+                item_names=[data["name"] for data, _ in chunk],
+                item_details=[detail for _, detail in chunk],
+                bulk_fn=self.client.bulk_create_devices,
+                fallback_fn=lambda data, name: self.client.api.dcim.devices.create(data),
+                stats=stats,
+                details=details,
+                operation="created",
+                entity_name="устройство",
+            )
+
+        patched = [
+            (device, updates, detail)
+            for device, updates, _, detail in pending_update if updates
+        ]
+        by_id = {device.id: device for device, _, _ in patched}
+        done_ids = set()
+
+        def patch_one(data: Dict[str, Any], name: str) -> None:
+            updates = {key: value for key, value in data.items() if key != "id"}
+            by_id[data["id"]].update(updates)
+            done_ids.add(data["id"])
+
+        for start in range(0, len(patched), DEVICE_BATCH_SIZE):
+            chunk = patched[start:start + DEVICE_BATCH_SIZE]
+            batch = [{"id": device.id, **updates} for device, updates, _ in chunk]
+            result = self._batch_with_fallback(
+                batch_data=batch,
+                item_names=[device.name for device, _, _ in chunk],
+                item_details=[detail for _, _, detail in chunk],
+                bulk_fn=self.client.bulk_update_devices,
+                fallback_fn=patch_one,
+                stats=stats,
+                details=details,
+                operation="updated",
+                entity_name="устройство",
+            )
+            if result is not None:
+                done_ids.update(data["id"] for data in batch)
+
+        for device, updates, primary_ip, detail in pending_update:
+            if updates and device.id not in done_ids:
+                continue
+            if primary_ip and not self._set_primary_ip(device, primary_ip):
+                logger.warning(f"Primary IP {primary_ip} не установлен для {device.name}")
+            if not updates:
+                # Изменился только primary IP — PATCH полей не было
+                stats["updated"] += 1
+                details["update"].append(detail)
+
     def _update_device(
         self: SyncBase,
         device,
@@ -270,6 +501,60 @@ class DevicesSyncMixin:
         primary_ip: str = "",
     ) -> bool:
         """Обновляет существующее устройство в NetBox."""
+        updates, need_primary_ip = self._device_changes(
+            device, model=model, serial=serial, manufacturer=manufacturer,
+            platform=platform, tenant=tenant, site=site, role=role,
+            primary_ip=primary_ip,
+        )
+        primary_ip = (primary_ip or "").strip()
+
+        if not updates and not need_primary_ip:
+            logger.debug(f"  → нет изменений для {device.name}")
+            return False
+
+        if self.dry_run:
+            if updates:
+                logger.info(f"[DRY-RUN] Обновление устройства {device.name}: {updates}")
+            if need_primary_ip:
+                logger.info(f"[DRY-RUN] Установка primary IP {primary_ip} для {device.name}")
+            return True
+
+        try:
+            if updates:
+                device.update(updates)
+                logger.info(f"Обновлено устройство: {device.name}")
+
+            if need_primary_ip:
+                ip_set = self._set_primary_ip(device, primary_ip)
+                if not ip_set:
+                    logger.warning(f"Primary IP {primary_ip} не установлен для {device.name}")
+
+            return True
+        except NetBoxError as e:
+            logger.error(f"Ошибка NetBox обновления устройства {device.name}: {format_error_for_log(e)}")
+            return False
+        except Exception as e:
+            logger.error(f"Неизвестная ошибка обновления устройства {device.name}: {e}")
+            return False
+
+    def _device_changes(
+        self: SyncBase,
+        device,
+        model: str = "",
+        serial: str = "",
+        manufacturer: str = "",
+        platform: str = "",
+        tenant: Optional[str] = None,
+        site: Optional[str] = None,
+        role: Optional[str] = None,
+        primary_ip: str = "",
+    ) -> Tuple[Dict[str, Any], bool]:
+        """
+        Вычисляет изменения существующего устройства.
+
+        Returns:
+            (поля для PATCH, нужно ли установить primary IP)
+        """
         updates = {}
 
         serial = (serial or "").strip()
@@ -334,34 +619,7 @@ class DevicesSyncMixin:
             if primary_ip_only != current_primary:
                 need_primary_ip = True
 
-        if not updates and not need_primary_ip:
-            logger.debug(f"  → нет изменений для {device.name}")
-            return False
-
-        if self.dry_run:
-            if updates:
-                logger.info(f"[DRY-RUN] Обновление устройства {device.name}: {updates}")
-            if need_primary_ip:
-                logger.info(f"[DRY-RUN] Установка primary IP {primary_ip} для {device.name}")
-            return True
-
-        try:
-            if updates:
-                device.update(updates)
-                logger.info(f"Обновлено устройство: {device.name}")
-
-            if need_primary_ip:
-                ip_set = self._set_primary_ip(device, primary_ip)
-                if not ip_set:
-                    logger.warning(f"Primary IP {primary_ip} не установлен для {device.name}")
-
-            return True
-        except NetBoxError as e:
-            logger.error(f"Ошибка NetBox обновления устройства {device.name}: {format_error_for_log(e)}")
-            return False
-        except Exception as e:
-            logger.error(f"Неизвестная ошибка обновления устройства {device.name}: {e}")
-            return False
+        return updates, need_primary_ip
 
     def _cleanup_devices(
         self: SyncBase,
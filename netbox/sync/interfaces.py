@@ -12,11 +12,19 @@ from .base import (
     SyncBase, SyncStats, SyncComparator, Interface, get_sync_config,
     normalize_mac_netbox, get_netbox_interface_type, logger,
 )
-from ...core.domain.vlan import parse_vlan_range, VlanSet
+from ...core.domain.vlan import parse_vlan_range, VlanSet, vids_to_mask, mask_to_vids
 
 logger = logging.getLogger(__name__)
 
 
+def _index_interfaces_by_name(interfaces: List[Interface]) -> Dict[str, Interface]:
+    """Индекс локальных интерфейсов по имени (при дублях — первый, как next())."""
+    index: Dict[str, Interface] = {}
+    for intf in interfaces:
+        index.setdefault(intf.name, intf)
+    return index
+
+
 class InterfacesSyncMixin:
     """Mixin для синхронизации интерфейсов."""
 
@@ -83,9 +91,11 @@ class InterfacesSyncMixin:
 
         # Предзагружаем кэш VLAN для сайта (один API-запрос)
         if sync_cfg.get_option("sync_vlans", False) and site_name:
-            self._get_vlan_by_vid(1, site_name)  # Форсирует загрузку всех VLAN сайта
+            self._get_vlan_index(site_name)
 
-        existing = list(self.client.get_interfaces(device_id=device.id))
+        existing = self._get_remote_state(
+            "interfaces", device, lambda: self.client.get_interfaces(device_id=device.id)
+        )
         exclude_patterns = sync_cfg.get_option("exclude_interfaces", [])
         interface_models = Interface.ensure_list(interfaces)
 
@@ -202,10 +212,11 @@ class InterfacesSyncMixin:
             return
 
         # Разделяем на LAG и остальные интерфейсы
+        by_name = _index_interfaces_by_name(sorted_interfaces)
         lag_items = []
         member_items = []
         for item in to_create:
-            intf = next((i for i in sorted_interfaces if i.name == item.name), None)
+            intf = by_name.get(item.name)
             if not intf:
                 logger.warning(f"Интерфейс {item.name} не найден в локальных данных")
                 continue
@@ -298,8 +309,9 @@ class InterfacesSyncMixin:
         update_batch = []  # Список (updates_with_id, name, changes)
         update_mac_queue = []  # (interface_id, mac_address, name) для post-update
 
+        by_name = _index_interfaces_by_name(sorted_interfaces)
         for item in to_update:
-            intf = next((i for i in sorted_interfaces if i.name == item.name), None)
+            intf = by_name.get(item.name)
             if not intf or not item.remote_data:
                 continue
 
@@ -423,17 +435,17 @@ class InterfacesSyncMixin:
         if not sync_cfg.is_field_enabled("mac_address"):
             return 0
 
-        mac_queue = []  # (interface_id, mac_address, name)
+        sync_mac_only_with_ip = sync_cfg.get_option("sync_mac_only_with_ip", False)
+        by_name = _index_interfaces_by_name(sorted_interfaces)
 
+        candidates = []  # (interface_id, mac_address, name)
         for item in to_skip:
             if not item.remote_data:
                 continue
-            intf = next((i for i in sorted_interfaces if i.name == item.name), None)
+            intf = by_name.get(item.name)
             if not intf or not intf.mac:
                 continue
 
-            # Проверяем sync_mac_only_with_ip
-            sync_mac_only_with_ip = sync_cfg.get_option("sync_mac_only_with_ip", False)
             if sync_mac_only_with_ip and not intf.ip_address:
                 continue
 
@@ -441,10 +453,22 @@ class InterfacesSyncMixin:
             if not new_mac:
                 continue
 
-            # Проверяем текущий MAC — назначаем только если отличается
-            current_mac = self.client.get_interface_mac(item.remote_data.id)
-            if new_mac.upper() != (current_mac or "").upper():
-                mac_queue.append((item.remote_data.id, new_mac, item.name))
+            candidates.append((item.remote_data.id, new_mac, item.name))
+
+        if not candidates:
+            return 0
+
+        # Текущие MAC всех кандидатов — пачкой, а не GET на каждый интерфейс
+        current_macs = self.client.get_interfaces_macs(
+            [intf_id for intf_id, _, _ in candidates]
+        )
+
+        # Назначаем только если MAC отличается
+        mac_queue = [
+            (intf_id, new_mac, name)
+            for intf_id, new_mac, name in candidates
+            if new_mac.upper() != (current_macs.get(intf_id) or "").upper()
+        ]
 
         if not mac_queue:
             return 0
@@ -544,11 +568,8 @@ class InterfacesSyncMixin:
             if intf.mode == "tagged" and intf.tagged_vlans:
                 target_vids = parse_vlan_range(intf.tagged_vlans)
                 if target_vids:
-                    tagged_ids = []
-                    for vid in target_vids:
-                        vlan = self._get_vlan_by_vid(vid, site_name)
-                        if vlan:
-                            tagged_ids.append(vlan.id)
+                    index = self._get_vlan_index(site_name)
+                    tagged_ids = index.ids(vids_to_mask(target_vids))
                     if tagged_ids:
                         data["tagged_vlans"] = sorted(tagged_ids)
 
@@ -746,16 +767,12 @@ class InterfacesSyncMixin:
                     if device and hasattr(device, 'site') and device.site:
                         site_name = getattr(device.site, 'name', None)
 
-                target_vlan_ids = []
-                matched_vids = []
-                not_found_vids = []
-                for vid in target_vids:
-                    vlan = self._get_vlan_by_vid(vid, site_name)
-                    if vlan:
-                        target_vlan_ids.append(vlan.id)
-                        matched_vids.append(vid)
-                    else:
-                        not_found_vids.append(vid)
+                # Наборы VLAN — битовые маски VID: сопоставление с NetBox
+                # и diff без цикла по каждому VID (trunk до 4094 VLAN)
+                index = self._get_vlan_index(site_name)
+                target_mask = vids_to_mask(target_vids)
+                matched = target_mask & index.mask
+                not_found_vids = mask_to_vids(target_mask & ~index.mask)
 
                 if not_found_vids:
                     if len(not_found_vids) > 10:
@@ -767,18 +784,17 @@ class InterfacesSyncMixin:
                             f"  {nb_interface.name}: VLANs {not_found_vids} не найдены в NetBox"
                         )
 
-                current = VlanSet.from_vlan_objects(nb_interface.tagged_vlans)
-                target = VlanSet.from_ids(matched_vids)
+                current = vids_to_mask(v.vid for v in nb_interface.tagged_vlans or [])
 
-                if current != target:
-                    updates["tagged_vlans"] = sorted(target_vlan_ids)
-                    added = target.added(current)
-                    removed = target.removed(current)
+                if current != matched:
+                    updates["tagged_vlans"] = sorted(index.ids(matched))
+                    added = mask_to_vids(matched & ~current)
+                    removed = mask_to_vids(current & ~matched)
                     parts = []
                     if added:
-                        parts.append(f"+{sorted(added)}")
+                        parts.append(f"+{added}")
                     if removed:
-                        parts.append(f"-{sorted(removed)}")
+                        parts.append(f"-{removed}")
                     change_detail = ", ".join(parts) if parts else "изменено"
                     actual_changes.append(f"tagged_vlans: {change_detail}")
 
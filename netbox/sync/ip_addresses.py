@@ -57,7 +57,9 @@ class IPAddressesSyncMixin:
             intf.name: intf for intf in self.client.get_interfaces(device_id=device.id)
         }
 
-        existing_ips = list(self.client.get_ip_addresses(device_id=device.id))
+        existing_ips = self._get_remote_state(
+            "ip_addresses", device, lambda: self.client.get_ip_addresses(device_id=device.id)
+        )
         entries = IPAddressEntry.ensure_list(ip_data)
 
         comparator = SyncComparator()
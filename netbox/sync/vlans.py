@@ -8,10 +8,7 @@ import re
 import logging
 from typing import List, Dict, Any, Optional
 
-from .base import (
-    SyncBase, SyncStats, Interface,
-    NetBoxError, NetBoxValidationError, format_error_for_log, logger,
-)
+from .base import SyncBase, SyncStats, Interface, logger
 
 logger = logging.getLogger(__name__)
 
@@ -58,35 +55,35 @@ class VLANsSyncMixin:
 
         logger.info(f"Найдено {len(vlans_to_create)} VLAN SVI на {device_name}")
 
-        for vid, name in vlans_to_create.items():
-            existing = self.client.get_vlan_by_vid(vid, site=site)
-            if existing:
+        # Индекс VLAN сайта общий с sync интерфейсов: один запрос на сайт,
+        # созданные VLAN сразу попадают в индекс
+        index = self._get_vlan_index(site)
+        batch = []
+        for vid, name in sorted(vlans_to_create.items()):
+            if vid in index:
                 logger.debug(f"VLAN {vid} уже существует")
                 stats["skipped"] += 1
                 continue
-
-            if self.dry_run:
-                logger.info(f"[DRY-RUN] Создание VLAN: {vid} ({name})")
-                stats["created"] += 1
-                continue
-
-            try:
-                self.client.create_vlan(
-                    vid=vid,
-                    name=name,
-                    site=site,
-                    status="active",
-                )
-                stats["created"] += 1
-            except NetBoxValidationError as e:
-                logger.error(f"Ошибка валидации VLAN {vid}: {format_error_for_log(e)}")
-                stats["failed"] += 1
-            except NetBoxError as e:
-                logger.error(f"Ошибка NetBox создания VLAN {vid}: {format_error_for_log(e)}")
-                stats["failed"] += 1
-            except Exception as e:
-                logger.error(f"Неизвестная ошибка создания VLAN {vid}: {e}")
-                stats["failed"] += 1
+            batch.append({"vid": vid, "name": name, "status": "active"})
+
+        if self.dry_run:
+            for data in batch:
+                logger.info(f"[DRY-RUN] Создание VLAN: {data['vid']} ({data['name']})")
+            stats["created"] += len(batch)
+        else:
+            def create_one(data: Dict[str, Any], name: str) -> None:
+                index.add(self.client.create_vlan(site=site, **data))
+
+            created = self._batch_with_fallback(
+                batch_data=batch,
+                item_names=[f"{data['vid']} ({data['name']})" for data in batch],
+                bulk_fn=lambda data: self.client.bulk_create_vlans(data, site=site),
+                fallback_fn=create_one,
+                stats=stats, details=details,
+                operation="created", entity_name="VLAN",
+            )
+            for vlan in created or []:
+                index.add(vlan)
 
         logger.info(
             f"Синхронизация VLAN {device_name}: "
@@ -4,6 +4,7 @@
 Модуль предоставляет:
 - NTCParser: Универсальный парсер на базе NTC Templates
 - TextFSMParser: Алиас для NTCParser (обратная совместимость)
+- parse_structured: Разбор JSON-вывода (NX-OS, EOS, Junos) без TextFSM
 
 Пример использования:
     from network_collector.parsers import NTCParser
@@ -27,6 +28,13 @@
 """
 
 from .textfsm_parser import NTCParser, TextFSMParser, NTC_AVAILABLE
-
-__all__ = ["NTCParser", "TextFSMParser", "NTC_AVAILABLE"]
+from .structured_parser import parse_structured, is_structured_output
+
+__all__ = [
+    "NTCParser",
+    "TextFSMParser",
+    "NTC_AVAILABLE",
+    "parse_structured",
+    "is_structured_output",
+]
 
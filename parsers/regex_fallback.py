@@ -0,0 +1,344 @@
+"""
+Regex fallback-парсеры для выводов, которые не разобрал TextFSM.
+
+Раньше каждый коллектор компилировал свои паттерны при каждом вызове
+и шёл по выводу построчно (splitlines + проверки подстрок) или резал
+его на блоки и запускал по 5–7 search на блок. На MAC-таблице в 60 тыс.
+строк это заметное время на устройство.
+
+Здесь паттерны компилируются один раз при импорте, а каждый вывод
+проходится одним findall/finditer: строки, не относящиеся к делу,
+отбрасывает движок regex, а не Python. Привязка к началу строки —
+ведущий "\n" (к выводу добавляется "\n" в начало), а не ^ + MULTILINE:
+у паттерна появляется литеральный префикс, и re быстро прыгает между
+переводами строк вместо попытки совпадения на каждом символе.
+Результат совпадает с прежними реализациями (см.
+tests/benchmarks/bench_regex_fallbacks.py).
+
+Функции возвращают сырые данные; алиасы интерфейсов и нормализацию
+добавляют коллекторы и Domain Layer.
+"""
+
+import re
+from typing import Dict, List, Optional, Pattern, Tuple
+
+# =============================================================================
+# MAC-ТАБЛИЦА (show mac address-table)
+# =============================================================================
+# Формат: VLAN  MAC  TYPE  INTERFACE
+
+MAC_TABLE_RE = re.compile(
+    r"\n\s*(\d+)\s+"  # VLAN
+    r"([0-9a-fA-F.:]+)\s+"  # MAC
+    r"(\w+)\s+"  # TYPE (DYNAMIC, STATIC, etc.)
+    r"(\S+)"  # INTERFACE
+)
+
+
+def parse_mac_table(output: str) -> List[Dict[str, str]]:
+    """
+    Строки MAC-таблицы.
+
+    Returns:
+        List[Dict]: [{"vlan", "mac", "type", "interface"}]
+    """
+    return [
+        {"vlan": vlan, "mac": mac, "type": mac_type.lower(), "interface": interface}
+        for vlan, mac, mac_type, interface in MAC_TABLE_RE.findall("\n" + output)
+    ]
+
+
+# =============================================================================
+# СТАТУС ИНТЕРФЕЙСОВ (show interfaces status)
+# =============================================================================
+
+# Имя порта идёт словами (а не ленивым .*?): без перебора каждого символа
+# и квадратичного отката на строках с неизвестным статусом (NX-OS "notconnec").
+INTERFACE_STATUS_RE = re.compile(
+    r"\n((?:Gi|Fa|Te|Et|Po|Vl)\S+)"  # Port (Gi0/1, Fa0/1, etc.)
+    r"(?:(?:[^\S\n]+\S+)+?[^\S\n]+|[^\S\n]{2,})"  # Name (optional, может быть пустым)
+    r"(connected|notconnect|disabled|err-disabled|inactive|suspended)(?=\s)",  # Status
+    re.IGNORECASE,
+)
+
+
+def parse_interface_status(output: str) -> List[Tuple[str, str]]:
+    """
+    Статусы портов.
+
+    Returns:
+        List[Tuple]: [(интерфейс, статус в нижнем регистре)]
+    """
+    return [(iface, status.lower()) for iface, status in INTERFACE_STATUS_RE.findall("\n" + output)]
+
+
+# =============================================================================
+# TRUNK-ПОРТЫ (show interfaces trunk)
+# =============================================================================
+# Порты берутся из первой секции ("Port  Mode  Encapsulation ...") до
+# секции "Vlans allowed" / "Vlans in spanning".
+
+TRUNK_HEADER_RE = re.compile(r"\n[^\S\n]*Port[^\n]*Mode")
+TRUNK_END_RE = re.compile(r"\n(?![^\S\n]*Port[^\n]*Mode)[^\n]*(?:Vlans allowed|Vlans in spanning)")
+TRUNK_PORT_RE = re.compile(r"\n[^\S\n]*(?!Port[^\n]*Mode)((?i:Gi|Fa|Te|Eth|Po)\S*)")
+
+
+def parse_trunk_ports(output: str) -> List[str]:
+    """
+    Имена trunk-портов.
+
+    Returns:
+        List[str]: Порты в порядке вывода
+    """
+    text = "\n" + output
+    end = TRUNK_END_RE.search(text)
+    endpos = end.start() if end else len(text)
+    header = TRUNK_HEADER_RE.search(text, 0, endpos)
+    if not header:
+        return []
+    return TRUNK_PORT_RE.findall(text, header.end(), endpos)
+
+
+# =============================================================================
+# SWITCHPORT (show interfaces switchport)
+# =============================================================================
+# Блоки "Name: Gi0/1" + строки режима и VLAN.
+
+SWITCHPORT_RE = re.compile(
+    r"\n[^\S\n]*(Name|Administrative Mode|Trunking VLANs Enabled"
+    r"|Access Mode VLAN|(?:Trunking )?Native Mode VLAN):([^\n]*)"
+)
+
+
+def parse_switchport_modes(output: str) -> Dict[str, Dict[str, str]]:
+    """
+    Режимы портов.
+
+    Returns:
+        Dict: {interface: {mode, native_vlan, access_vlan}},
+              mode — access / tagged / tagged-all
+    """
+    modes: Dict[str, Dict[str, str]] = {}
+    current: Optional[Dict[str, str]] = None
+
+    for key, value in SWITCHPORT_RE.findall("\n" + output):
+        value = value.strip()
+        if key == "Name":
+            current = {"mode": "", "native_vlan": "", "access_vlan": ""} if value else None
+            if value:
+                modes[value] = current
+        elif current is None:
+            continue
+        elif key == "Administrative Mode":
+            mode = value.lower()
+            if "access" in mode:
+                current["mode"] = "access"
+            elif "trunk" in mode or "dynamic" in mode:
+                # По умолчанию tagged-all, если не указаны конкретные VLAN
+                current["mode"] = "tagged-all"
+        elif key == "Trunking VLANs Enabled":
+            vlans = value.lower()
+            if vlans != "all" and vlans and current["mode"] in ("tagged-all", "tagged"):
+                current["mode"] = "tagged"
+        elif value:
+            field = "access_vlan" if key == "Access Mode VLAN" else "native_vlan"
+            current[field] = value.split()[0]
+
+    return modes
+
+
+# =============================================================================
+# LAG (show etherchannel summary / show port-channel summary)
+# =============================================================================
+# 1      Po1(SU)         LACP      Gi0/1(P)    Gi0/2(P)
+
+LAG_RE = re.compile(
+    r"(Po\d+)\([^)]*\)\s+"  # Po1(SU)
+    r"(?:LACP|PAgP|ON|-)\s+"  # Protocol
+    r"(.+)$",  # Member ports
+    re.MULTILINE,
+)
+LAG_MEMBER_RE = re.compile(r"([A-Za-z]+[\d/]+)\([^)]*\)")
+
+
+def parse_lag_membership(output: str) -> List[Tuple[str, str]]:
+    """
+    Члены LAG.
+
+    Returns:
+        List[Tuple]: [(member, lag)] например [("Gi0/1", "Po1")]
+    """
+    return [
+        (member, lag_name)
+        for lag_name, members in LAG_RE.findall(output)
+        for member in LAG_MEMBER_RE.findall(members)
+    ]
+
+
+# =============================================================================
+# БЛОЧНЫЕ ВЫВОДЫ (LLDP / CDP detail)
+# =============================================================================
+# Один finditer по меткам полей в начале строк. Метка границы открывает
+# новый блок; для каждого поля запоминается позиция за первой меткой в блоке,
+# а значение берётся при закрытии блока паттерном, ограниченным концом
+# блока (как search по вырезанному блоку, но без копирования строк).
+
+
+def _scan_blocks(
+    output: str,
+    labels: Pattern,
+    boundary: str,
+) -> List[Tuple[int, Dict[str, int]]]:
+    """
+    Блоки вывода: [(конец блока, {поле: позиция за меткой})].
+
+    Args:
+        output: Вывод команды
+        labels: Паттерн меток (именованные группы — поля)
+        boundary: Имя группы, открывающей новый блок
+    """
+    blocks = []
+    fields: Dict[str, int] = {}
+    for match in labels.finditer(output):
+        field = match.lastgroup
+        if field == boundary:
+            blocks.append((match.start(field), fields))
+            fields = {}
+        fields.setdefault(field, match.end())
+    blocks.append((len(output), fields))
+    return blocks
+
+
+def _values(
+    output: str,
+    fields: Dict[str, int],
+    patterns: Dict[str, Pattern],
+    end: int,
+) -> Dict[str, str]:
+    """Значения найденных полей блока (паттерн ограничен концом блока)."""
+    values = {}
+    for field, pos in fields.items():
+        pattern = patterns.get(field)
+        if pattern is not None:
+            match = pattern.match(output, pos, end)
+            if match:
+                values[field] = match.group(1)
+    return values
+
+
+# LLDP (Cisco IOS show lldp neighbors detail)
+# Первый символ метки проверяется до перебора альтернатив — строки
+# с другими полями отбрасываются сразу
+LLDP_LABELS_RE = re.compile(
+    r"\n[^\S\n]*(?=[LCPSI-])(?:"
+    r"(?P<local>Local Intf:)"
+    r"|(?P<sep>-{20,})"
+    r"|(?P<chassis>Chassis id:)"
+    r"|Port (?:(?P<port_id>id:)|(?P<port_desc>Description:))"
+    r"|System (?:(?P<sys_name>Name:)|(?P<sys_desc>Description:))"
+    r"|(?P<ip>IP:(?=\s*\d+\.\d+\.\d+\.\d+)))"
+)
+LLDP_VALUES: Dict[str, Pattern] = {
+    "local": re.compile(r"\s*(\S+)"),
+    "chassis": re.compile(r"\s*(\S+)"),
+    "port_id": re.compile(r"\s*(.+?)(?:\n|$)"),
+    "port_desc": re.compile(r"\s*(.+?)(?:\n|$)"),
+    "sys_name": re.compile(r"\s*(.+?)(?:\n|$)"),
+    "sys_desc": re.compile(r"\s*\n(.+?)(?:\n\n|\nTime)", re.DOTALL),
+    "ip": re.compile(r"\s*(\d+\.\d+\.\d+\.\d+)"),
+}
+NOT_ADVERTISED = "- not advertised"
+
+
+def parse_lldp_detail(output: str) -> List[Dict[str, str]]:
+    """
+    Соседи из show lldp neighbors detail.
+
+    Блоки разделяются по "Local Intf:" (новые IOS) или по строке
+    из дефисов (старые устройства без "Local Intf:").
+
+    Returns:
+        List[Dict]: Сырые данные: local_interface, chassis_id, port_id,
+            port_description, remote_hostname, remote_description, remote_ip
+    """
+    boundary = "local" if "Local Intf:" in output else "sep"
+    text = "\n" + output
+    neighbors = []
+    for end, fields in _scan_blocks(text, LLDP_LABELS_RE, boundary):
+        # Пропускаем блоки без данных соседа
+        if "chassis" not in fields:
+            continue
+        values = _values(text, fields, LLDP_VALUES, end)
+
+        neighbor = {}
+        if "local" in values:
+            neighbor["local_interface"] = values["local"]
+        if "chassis" in values:
+            neighbor["chassis_id"] = values["chassis"]
+        if "port_id" in values:
+            # Port ID может быть числом, MAC или именем интерфейса
+            neighbor["port_id"] = values["port_id"].strip()
+        for field, key in (("port_desc", "port_description"), ("sys_name", "remote_hostname")):
+            value = values.get(field, "").strip()
+            if value and value != NOT_ADVERTISED:
+                neighbor[key] = value
+        sys_desc = values.get("sys_desc", "").strip()
+        if sys_desc:
+            neighbor["remote_description"] = sys_desc
+        if "ip" in values:
+            neighbor["remote_ip"] = values["ip"]
+
+        # Добавляем только если есть хоть какие-то данные о соседе
+        if neighbor.get("chassis_id") or neighbor.get("remote_hostname"):
+            neighbors.append(neighbor)
+
+    return neighbors
+
+
+# CDP (show cdp neighbors detail)
+# Port ID — в строке "Interface: Gi0/1,  Port ID (outgoing port): Gi0/2"
+CDP_LABELS_RE = re.compile(
+    r"\n[^\S\n]*(?=[DIP])(?:"
+    r"(?P<device>Device ID:)"
+    r"|(?P<local>Interface:(?=[^\S\n]*\S+,))"
+    r"|(?P<platform>Platform:)"
+    r"|(?P<ip>IP address:))"
+)
+CDP_VALUES: Dict[str, Pattern] = {
+    "device": re.compile(r"\s*(\S+)"),
+    "local": re.compile(r"\s*(\S+),"),
+    "port": re.compile(r"[^\n]*?Port ID[^\n]*?:\s*(\S+)"),
+    "platform": re.compile(r"\s*(.+?),"),
+    "ip": re.compile(r"\s*(\S+)"),
+}
+CDP_KEYS = {
+    "device": "remote_hostname",
+    "local": "local_interface",
+    "port": "remote_port",
+    "platform": "remote_platform",
+    "ip": "remote_ip",
+}
+
+
+def parse_cdp_detail(output: str) -> List[Dict[str, str]]:
+    """
+    Соседи из show cdp neighbors detail (блоки по "Device ID:").
+
+    Returns:
+        List[Dict]: Сырые данные: remote_hostname, local_interface,
+            remote_port, remote_platform, remote_ip
+    """
+    text = "\n" + output
+    neighbors = []
+    for end, fields in _scan_blocks(text, CDP_LABELS_RE, "device"):
+        if "local" not in fields:
+            continue
+        fields["port"] = fields["local"]
+        values = _values(text, fields, CDP_VALUES, end)
+        neighbor = {CDP_KEYS[field]: values[field] for field in CDP_KEYS if field in values}
+        if "remote_platform" in neighbor:
+            neighbor["remote_platform"] = neighbor["remote_platform"].strip()
+        if neighbor.get("local_interface"):
+            neighbors.append(neighbor)
+
+    return neighbors
@@ -0,0 +1,378 @@
+"""
+Парсер структурированного вывода (JSON) сетевых устройств.
+
+NX-OS и Arista EOS отдают вывод show-команд в JSON ("| json"), Junos —
+"| display json". Для таких платформ коллекторы могут выполнять
+JSON-команду (STRUCTURED_COMMANDS в core/constants/commands.py) вместо
+текстовой и обходиться без TextFSM и regex: JSON сразу раскладывается
+в те же сырые словари, что возвращает NTCParser, и дальше идёт
+в обычные нормализаторы Domain Layer.
+
+Парсеры зарегистрированы по ключу (платформа, коллектор):
+
+    rows = parse_structured(output, "cisco_nxos", "interfaces")
+    # [{"interface": "Ethernet1/1", "status": "up", "mtu": "1500", ...}]
+
+Возвращает None, если вывод не JSON (устройство не поддерживает "| json")
+или для платформы нет парсера — тогда коллектор использует текстовую команду.
+"""
+
+import logging
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+from ..core.jsonutil import loads
+
+logger = logging.getLogger(__name__)
+
+RowParser = Callable[[Any], List[Dict[str, Any]]]
+
+
+def is_structured_output(output: str) -> bool:
+    """Похож ли вывод на JSON (без полного разбора)."""
+    return output.lstrip().startswith("{")
+
+
+def _str(value: Any) -> str:
+    """Значение JSON как строка TextFSM (None → "")."""
+    if value is None:
+        return ""
+    return str(value)
+
+
+def _kbit(value: Any) -> str:
+    """Полоса в формате TextFSM: 1000000 → "1000000 Kbit"."""
+    return f"{value} Kbit" if value not in (None, "") else ""
+
+
+# =============================================================================
+# CISCO NX-OS (| json)
+# =============================================================================
+# Таблицы NX-OS: {"TABLE_x": {"ROW_x": [...]}}; при одной строке ROW_x — dict.
+
+
+def _nxos_rows(data: Dict[str, Any], table: str, row: str) -> Iterator[Dict[str, Any]]:
+    rows = (data.get(table) or {}).get(row) or []
+    if isinstance(rows, dict):
+        rows = [rows]
+    return iter(rows)
+
+
+def _nxos_interfaces(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    result = []
+    for item in _nxos_rows(data, "TABLE_interface", "ROW_interface"):
+        name = item.get("interface", "")
+        # SVI (Vlan10) — поля с префиксом svi_
+        if "svi_line_proto" in item or "svi_admin_state" in item:
+            result.append({
+                "interface": name,
+                "status": _str(item.get("svi_line_proto")),
+                "admin_state": _str(item.get("svi_admin_state")),
+                "hardware_type": _str(item.get("svi_hw_desc")),
+                "mac": _str(item.get("svi_mac")),
+                "description": _str(item.get("svi_desc")),
+                "ip_address": _str(item.get("svi_ip_addr")),
+                "prefix_length": _str(item.get("svi_ip_mask")),
+                "mtu": _str(item.get("svi_mtu")),
+                "bandwidth": _kbit(item.get("svi_bw")),
+            })
+            continue
+
+        # Статус как в тексте: "down (Administratively down)"
+        state = _str(item.get("state"))
+        reason = _str(item.get("state_rsn_desc"))
+        status = f"{state} ({reason})" if reason and state != "up" else state
+        result.append({
+            "interface": name,
+            "status": status,
+            "admin_state": _str(item.get("admin_state")),
+            "hardware_type": _str(item.get("eth_hw_desc")),
+            "mac": _str(item.get("eth_hw_addr")),
+            "bia": _str(item.get("eth_bia_addr")),
+            "description": _str(item.get("desc")),
+            "ip_address": _str(item.get("eth_ip_addr")),
+            "prefix_length": _str(item.get("eth_ip_mask")),
+            "mtu": _str(item.get("eth_mtu")),
+            "mode": _str(item.get("eth_mode")),
+            "duplex": _str(item.get("eth_duplex")),
+            "speed": _str(item.get("eth_speed")),
+            "bandwidth": _kbit(item.get("eth_bw")),
+            "media_type": _str(item.get("eth_media")),
+            "input_packets": _str(item.get("eth_inpkts")),
+            "output_packets": _str(item.get("eth_outpkts")),
+            "input_errors": _str(item.get("eth_inerr")),
+            "output_errors": _str(item.get("eth_outerr")),
+            "crc": _str(item.get("eth_crc")),
+            "last_link_flapped": _str(item.get("eth_link_flapped")),
+        })
+    return result
+
+
+def _nxos_mac(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "vlan": _str(item.get("disp_vlan")),
+            "mac": _str(item.get("disp_mac_addr")),
+            "type": "static" if item.get("disp_is_static") == "enabled" else "dynamic",
+            "interface": _str(item.get("disp_port")),
+        }
+        for item in _nxos_rows(data, "TABLE_mac_address", "ROW_mac_address")
+    ]
+
+
+def _nxos_lldp(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "local_interface": _str(item.get("l_port_id")),
+            "neighbor_name": _str(item.get("sys_name")),
+            "neighbor_port_id": _str(item.get("port_id")),
+            "neighbor_interface": _str(item.get("port_desc")),
+            "chassis_id": _str(item.get("chassis_id")),
+            "mgmt_address": _str(item.get("mgmt_addr")),
+            "neighbor_description": _str(item.get("sys_desc")),
+            "capabilities": _str(item.get("enabled_capability") or item.get("system_capability")),
+            "vlan": _str(item.get("vlan_id")),
+        }
+        for item in _nxos_rows(data, "TABLE_nbor_detail", "ROW_nbor_detail")
+    ]
+
+
+def _nxos_inventory(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "name": _str(item.get("name")),
+            "descr": _str(item.get("desc")),
+            "pid": _str(item.get("productid")),
+            "vid": _str(item.get("vendorid")),
+            "serial": _str(item.get("serialnum")),
+        }
+        for item in _nxos_rows(data, "TABLE_inv", "ROW_inv")
+    ]
+
+
+# =============================================================================
+# ARISTA EOS (| json)
+# =============================================================================
+
+
+def _eos_interfaces(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    result = []
+    for name, item in (data.get("interfaces") or {}).items():
+        ip_address = prefix_length = ""
+        for address in item.get("interfaceAddress") or []:
+            primary = address.get("primaryIp") or {}
+            if primary.get("address") and primary.get("address") != "0.0.0.0":
+                ip_address = primary["address"]
+                prefix_length = _str(primary.get("maskLen"))
+                break
+
+        counters = item.get("interfaceCounters") or {}
+        bandwidth = item.get("bandwidth")
+        result.append({
+            "interface": item.get("name", name),
+            "link_status": _str(item.get("interfaceStatus")),
+            "protocol": _str(item.get("lineProtocolStatus")),
+            "hardware_type": _str(item.get("hardware")),
+            "mac": _str(item.get("physicalAddress")),
+            "bia": _str(item.get("burnedInAddress")),
+            "description": _str(item.get("description")),
+            "ip_address": ip_address,
+            "prefix_length": prefix_length,
+            "mtu": _str(item.get("mtu")),
+            # EOS отдаёт bandwidth в бит/с
+            "bandwidth": _kbit(bandwidth // 1000) if isinstance(bandwidth, int) else "",
+            "duplex": _str(item.get("duplex")),
+            "input_errors": _str(counters.get("totalInErrors")),
+            "output_errors": _str(counters.get("totalOutErrors")),
+            "crc": _str((counters.get("inputErrorsDetail") or {}).get("fcsErrors")),
+        })
+    return result
+
+
+def _eos_mac(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {
+            "vlan": _str(item.get("vlanId")),
+            "mac": _str(item.get("macAddress")),
+            "type": _str(item.get("entryType")),
+            "interface": _str(item.get("interface")),
+        }
+        for item in (data.get("unicastTable") or {}).get("tableEntries") or []
+    ]
+
+
+def _eos_lldp(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    result = []
+    for local_interface, neighbors in (data.get("lldpNeighbors") or {}).items():
+        for item in neighbors.get("lldpNeighborInfo") or []:
+            port = item.get("neighborInterfaceInfo") or {}
+            # interfaceId в старых EOS в кавычках: "\"Ethernet2\""
+            port_id = port.get("interfaceId_v2") or _str(port.get("interfaceId")).strip('"')
+            addresses = item.get("managementAddresses") or []
+            capabilities = item.get("systemCapabilities") or {}
+            result.append({
+                "local_interface": local_interface,
+                "neighbor_name": _str(item.get("systemName")),
+                "neighbor_port_id": port_id,
+                "neighbor_interface": _str(port.get("interfaceDescription")),
+                "chassis_id": _str(item.get("chassisId")),
+                "mgmt_address": _str(addresses[0].get("address")) if addresses else "",
+                "neighbor_description": _str(item.get("systemDescription")),
+                "capabilities": ", ".join(name for name, enabled in capabilities.items() if enabled),
+            })
+    return result
+
+
+def _eos_inventory(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    system = data.get("systemInformation") or {}
+    result = [{
+        "name": "Chassis",
+        "descr": _str(system.get("description")),
+        "pid": _str(system.get("name")),
+        "vid": _str(system.get("hardwareRev")),
+        "serial": _str(system.get("serialNum")),
+    }] if system else []
+
+    slots = (
+        ("powerSupplySlots", "PowerSupply"),
+        ("fanTraySlots", "Fan"),
+        ("cardSlots", ""),
+    )
+    for section, prefix in slots:
+        for slot, item in (data.get(section) or {}).items():
+            pid = _str(item.get("modelName") or item.get("name"))
+            if not item.get("serialNum") or pid in ("Not Inserted", "Unknown"):
+                continue
+            result.append({
+                "name": f"{prefix}{slot}",
+                "descr": pid,
+                "pid": pid,
+                "vid": _str(item.get("hardwareRev")),
+                "serial": _str(item.get("serialNum")),
+            })
+
+    for slot, item in (data.get("xcvrSlots") or {}).items():
+        if not item.get("serialNum"):
+            continue
+        result.append({
+            "name": f"Ethernet{slot}",
+            "descr": f"{_str(item.get('mfgName'))} {_str(item.get('modelName'))}".strip(),
+            "pid": _str(item.get("modelName")),
+            "vid": _str(item.get("hardwareRev")),
+            "serial": _str(item.get("serialNum")),
+        })
+    return result
+
+
+# =============================================================================
+# JUNIPER JUNOS (| display json)
+# =============================================================================
+# Каждое значение Junos — список: {"name": [{"data": "ge-0/0/0"}]}.
+
+
+def _junos(item: Dict[str, Any], key: str) -> str:
+    value = item.get(key)
+    if isinstance(value, list):
+        value = value[0] if value else None
+    if isinstance(value, dict):
+        value = value.get("data")
+    return _str(value)
+
+
+def _junos_list(item: Dict[str, Any], *path: str) -> List[Dict[str, Any]]:
+    """Вложенный список по пути ключей (берётся первый элемент на каждом уровне)."""
+    items = [item]
+    for key in path:
+        if not items:
+            return []
+        items = items[0].get(key) or []
+    return items
+
+
+def _junos_interfaces(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    result = []
+    for item in _junos_list(data, "interface-information", "physical-interface"):
+        ip_address = prefix_length = ""
+        for logical in item.get("logical-interface") or []:
+            for family in logical.get("address-family") or []:
+                if _junos(family, "address-family-name") != "inet":
+                    continue
+                for address in family.get("interface-address") or []:
+                    ip_address = _junos(address, "ifa-local")
+                    destination = _junos(address, "ifa-destination")
+                    prefix_length = destination.split("/")[1] if "/" in destination else ""
+                    break
+                if ip_address:
+                    break
+            if ip_address:
+                break
+
+        result.append({
+            "interface": _junos(item, "name"),
+            "link_status": _junos(item, "oper-status"),
+            "admin_state": _junos(item, "admin-status"),
+            "hardware_type": _junos(item, "link-level-type"),
+            "mac": _junos(item, "current-physical-address"),
+            "description": _junos(item, "description"),
+            "ip_address": ip_address,
+            "prefix_length": prefix_length,
+            "mtu": _junos(item, "mtu"),
+        })
+    return result
+
+
+def _junos_lldp(data: Dict[str, Any]) -> List[Dict[str, Any]]:
+    return [
+        {
+            # Junos до 14.x: lldp-local-interface
+            "local_interface": _junos(item, "lldp-local-port-id") or _junos(item, "lldp-local-interface"),
+            "neighbor_name": _junos(item, "lldp-remote-system-name"),
+            "neighbor_port_id": _junos(item, "lldp-remote-port-id"),
+            "neighbor_interface": _junos(item, "lldp-remote-port-description"),
+            "chassis_id": _junos(item, "lldp-remote-chassis-id"),
+        }
+        for item in _junos_list(data, "lldp-neighbors-information", "lldp-neighbor-information")
+    ]
+
+
+# Реестр парсеров: (платформа, коллектор) → функция JSON → сырые строки
+STRUCTURED_PARSERS: Dict[Tuple[str, str], RowParser] = {
+    ("cisco_nxos", "interfaces"): _nxos_interfaces,
+    ("cisco_nxos", "mac"): _nxos_mac,
+    ("cisco_nxos", "lldp"): _nxos_lldp,
+    ("cisco_nxos", "inventory"): _nxos_inventory,
+    ("arista_eos", "interfaces"): _eos_interfaces,
+    ("arista_eos", "mac"): _eos_mac,
+    ("arista_eos", "lldp"): _eos_lldp,
+    ("arista_eos", "inventory"): _eos_inventory,
+    ("juniper_junos", "interfaces"): _junos_interfaces,
+    ("juniper_junos", "lldp"): _junos_lldp,
+    ("juniper", "interfaces"): _junos_interfaces,
+    ("juniper", "lldp"): _junos_lldp,
+}
+
+
+def parse_structured(
+    output: str,
+    platform: str,
+    collector: str,
+) -> Optional[List[Dict[str, Any]]]:
+    """
+    Разбирает JSON-вывод в сырые строки коллектора.
+
+    Args:
+        output: Вывод JSON-команды
+        platform: Платформа устройства (cisco_nxos, arista_eos, ...)
+        collector: Коллектор (interfaces, mac, lldp, inventory)
+
+    Returns:
+        List[Dict] или None, если вывод не JSON или нет парсера
+    """
+    parser = STRUCTURED_PARSERS.get((platform, collector))
+    if parser is None or not is_structured_output(output):
+        return None
+    try:
+        return parser(loads(output))
+    except (ValueError, AttributeError, TypeError) as e:
+        # Некорректный JSON или неожиданная структура (другая версия ОС)
+        logger.warning(f"Не удалось разобрать JSON {platform}/{collector}: {e}")
+        return None
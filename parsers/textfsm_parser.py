@@ -69,6 +69,46 @@ except ImportError:
 # Импортируем маппинги
 from ..core.constants import CUSTOM_TEXTFSM_TEMPLATES, NTC_PLATFORM_MAP
 
+# Кэш текстов кастомных шаблонов: {путь: содержимое}
+# Заполняется при первом чтении; процессы-парсеры получают его целиком
+# (load_template_cache) и не читают файлы шаблонов с диска.
+_TEMPLATE_CACHE: Dict[str, str] = {}
+
+
+def get_template_cache() -> Dict[str, str]:
+    """
+    Загружает все кастомные шаблоны и возвращает копию кэша.
+
+    Returns:
+        Dict: {путь к шаблону: содержимое}
+    """
+    for template_file in set(CUSTOM_TEXTFSM_TEMPLATES.values()):
+        path = os.path.join(TEMPLATES_DIR, template_file)
+        if os.path.exists(path):
+            _read_template(path)
+    return dict(_TEMPLATE_CACHE)
+
+
+def load_template_cache(cache: Dict[str, str]) -> None:
+    """
+    Устанавливает заранее загруженные шаблоны (в процессе-парсере).
+
+    Args:
+        cache: Результат get_template_cache() из родительского процесса
+    """
+    _TEMPLATE_CACHE.update(cache)
+
+
+def _read_template(path: str) -> str:
+    """Возвращает текст шаблона из кэша, при промахе читает файл."""
+    content = _TEMPLATE_CACHE.get(path)
+    if content is None:
+        # utf-8-sig автоматически убирает BOM
+        with open(path, "r", encoding="utf-8-sig") as f:
+            content = f.read()
+        _TEMPLATE_CACHE[path] = content
+    return content
+
 
 # Универсальный маппинг полей для разных платформ
 # Ключ - стандартное имя поля, значение - список возможных названий
@@ -231,9 +271,7 @@ class NTCParser:
             List[Dict]: Распарсенные данные
         """
         try:
-            # Читаем шаблон с utf-8-sig (автоматически убирает BOM)
-            with open(template_path, "r", encoding="utf-8-sig") as f:
-                template_content = f.read()
+            template_content = _read_template(template_path)
 
             # Debug: показываем первые символы шаблона
             logger.debug(f"Template first 100 chars: {repr(template_content[:100])}")
@@ -0,0 +1 @@
+"""Ручные бенчмарки (не запускаются pytest: файлы bench_*.py)."""
@@ -0,0 +1,28 @@
+"""
+Общее для бенчмарков tests/benchmarks/bench_*.py.
+
+Импорт модуля добавляет каталог над network_collector в sys.path
+(как tests/conftest.py), поэтому импортируется до network_collector:
+
+    from _common import best_time
+    from network_collector.core import models
+"""
+
+import sys
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+project_root = Path(__file__).parent.parent.parent.parent
+if str(project_root) not in sys.path:
+    sys.path.insert(0, str(project_root))
+
+
+def best_time(func: Callable[..., Any], *args: Any, repeat: int = 5) -> float:
+    """Лучшее из repeat время вызова func(*args) (секунды)."""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(*args)
+        best = min(best, time.perf_counter() - start)
+    return best
@@ -0,0 +1,94 @@
+"""
+Бенчмарк пакетной отправки команд (BaseCollector._send_batch).
+
+Соединение имитирует scrapli: каждая send_command — один обмен по SSH
+с задержкой RTT, send_commands — цикл по send_command (как Driver.send_commands).
+Сравниваются:
+- поштучная отправка (платформа не из BATCH_PLATFORMS)
+- пакет send_commands
+- пакет, оборвавшийся после первой команды: прежний fallback повторял
+  все команды, текущий — только команды без ответа
+
+Запуск:
+    python tests/benchmarks/bench_command_batch.py [RTT, мс]
+"""
+
+import sys
+import time
+from typing import Dict, List
+
+from _common import best_time
+
+from network_collector.collectors.interfaces import InterfaceCollector
+from network_collector.core.device import Device
+
+
+class FakeResponse:
+    def __init__(self, result: str):
+        self.result = result
+        self.failed = False
+
+
+class FakeConnection:
+    """scrapli-подобное соединение: RTT на каждую команду."""
+
+    def __init__(self, rtt: float, answered: int = 0):
+        self.rtt = rtt
+        self.answered = answered
+        self.sent = 0
+
+    def send_command(self, command: str) -> FakeResponse:
+        time.sleep(self.rtt)
+        self.sent += 1
+        return FakeResponse(command)
+
+    def send_commands(self, commands: List[str]) -> List[FakeResponse]:
+        responses = []
+        for command in commands:
+            if self.answered and len(responses) == self.answered:
+                # Пакет оборвался (stop_on_failed / разрыв канала)
+                break
+            responses.append(self.send_command(command))
+        return responses
+
+
+def legacy_send_batch(conn, device: Device, commands: Dict[str, str]) -> Dict[str, str]:
+    """Прежний _send_batch: неполный пакет — все команды заново по одной."""
+    keys = list(commands)
+    responses = conn.send_commands([commands[key] for key in keys])
+    if len(responses) == len(keys):
+        return {key: r.result for key, r in zip(keys, responses)}
+    return {key: conn.send_command(commands[key]).result for key in keys}
+
+
+def main(rtt_ms: float = 20.0) -> None:
+    rtt = rtt_ms / 1000
+    collector = InterfaceCollector(credentials=None)
+    commands = {
+        "main": "show interfaces",
+        "lag": "show etherchannel summary",
+        "switchport": "show interfaces switchport",
+        "media_type": "show interfaces transceiver",
+    }
+    batch = Device(host="10.0.0.1", platform="cisco_ios")
+    single = Device(host="10.0.0.2", platform="juniper_junos")
+
+    cases = [
+        ("по одной", lambda: collector._send_batch(FakeConnection(rtt), single, commands), None),
+        ("пакет", lambda: collector._send_batch(FakeConnection(rtt), batch, commands), None),
+        (
+            "пакет оборвался",
+            lambda: collector._send_batch(FakeConnection(rtt, answered=1), batch, commands),
+            lambda: legacy_send_batch(FakeConnection(rtt, answered=1), batch, commands),
+        ),
+    ]
+    print(f"Команд: {len(commands)}, RTT: {rtt_ms:.0f} мс")
+    print(f"  {'сценарий':<18}{'до, мс':>9}{'после, мс':>12}")
+    for name, current, legacy in cases:
+        after = best_time(current, repeat=3) * 1000
+        before = f"{best_time(legacy, repeat=3) * 1000:.0f}" if legacy else "-"
+        print(f"  {name:<18}{before:>9}{after:>12.0f}")
+
+
+if __name__ == "__main__":
+    main(float(sys.argv[1]) if len(sys.argv) > 1 else 20.0)
@@ -0,0 +1,158 @@
+"""
+Микро-бенчмарк нормализации имён интерфейсов (core/constants/interfaces.py).
+
+Сравнивает прежние реализации (проход по INTERFACE_SHORT_MAP / INTERFACE_FULL_MAP
+со startswith на каждый вызов) с текущими (одна скомпилированная альтернация
++ lru_cache). Нагрузка — имена, как их видит полный сбор: MAC-таблицы,
+LLDP и LAG десятков коммутаторов с одинаковой нумерацией портов, в полной,
+короткой и CDP-форме ("Ten 1/1/4"). Перед замером проверяется совпадение
+результатов.
+
+Запуск:
+    python tests/benchmarks/bench_interface_names.py [вызовов]
+"""
+
+import sys
+from typing import Callable, List
+
+from _common import best_time
+
+from network_collector.core.constants import interfaces
+from network_collector.core.constants.interfaces import (
+    INTERFACE_FULL_MAP,
+    INTERFACE_SHORT_MAP,
+)
+
+
+# =============================================================================
+# ПРЕЖНИЕ РЕАЛИЗАЦИИ
+# =============================================================================
+
+
+def legacy_short(interface: str, lowercase: bool = False) -> str:
+    if not interface:
+        return ""
+    result = interface.replace(" ", "").strip()
+    result_lower = result.lower()
+    for full_lower, short in INTERFACE_SHORT_MAP:
+        if result_lower.startswith(full_lower):
+            result = short + result[len(full_lower):]
+            break
+    return result.lower() if lowercase else result
+
+
+def legacy_full(interface: str) -> str:
+    interface = interface.replace(" ", "").strip()
+    for short_name, full_name in INTERFACE_FULL_MAP.items():
+        if (
+            interface.startswith(short_name)
+            and not interface.startswith(full_name)
+            and len(interface) > len(short_name)
+            and interface[len(short_name)].isdigit()
+        ):
+            return interface.replace(short_name, full_name, 1)
+    return interface
+
+
+def legacy_aliases(interface: str) -> List[str]:
+    if not interface:
+        return []
+    aliases = {interface}
+    clean = interface.replace(" ", "")
+    aliases.add(clean)
+    short = legacy_short(clean)
+    if short != clean:
+        aliases.add(short)
+    full = legacy_full(clean)
+    if full != clean:
+        aliases.add(full)
+    clean_lower = clean.lower()
+    extra_aliases = {
+        "gigabitethernet": ["Gig"],
+        "tengigabitethernet": ["Ten"],
+        "ethernet": ["Et", "Eth"],
+    }
+    for prefix, extras in extra_aliases.items():
+        if clean_lower.startswith(prefix):
+            suffix = clean[len(prefix):]
+            for extra in extras:
+                aliases.add(f"{extra}{suffix}")
+    short_to_extra = {
+        "gi": ["Gig"],
+        "te": ["Ten"],
+        "hu": ["HundredGigabitEthernet"],
+        "eth": ["Et"],
+        "et": ["Eth"],
+    }
+    for short_prefix, extras in short_to_extra.items():
+        if clean_lower.startswith(short_prefix) and len(clean) > len(short_prefix):
+            if clean[len(short_prefix)].isdigit():
+                suffix = clean[len(short_prefix):]
+                for extra in extras:
+                    aliases.add(f"{extra}{suffix}")
+    return list(aliases)
+
+
+# =============================================================================
+# НАГРУЗКА И ЗАМЕР
+# =============================================================================
+
+PREFIXES = [
+    "GigabitEthernet", "Gi", "Gig ", "TenGigabitEthernet", "Te", "Ten ",
+    "TwentyFiveGigE", "Twe", "HundredGigE", "Hu", "FortyGigabitEthernet",
+    "TFGigabitEthernet ", "TF", "FastEthernet", "Fa", "Ethernet", "Eth", "Et",
+    "Port-channel", "Po", "AggregatePort ", "Ag", "Vlan", "Vl", "Loopback",
+    "mgmt", "",
+]
+
+
+def names() -> List[str]:
+    """Уникальные имена: префиксы × номера портов (1/0/1 … 2/0/48)."""
+    return [
+        f"{prefix}{stack}/0/{port}"
+        for prefix in PREFIXES
+        for stack in (1, 2)
+        for port in range(1, 49)
+    ]
+
+
+def workload(unique: List[str], calls: int) -> List[str]:
+    """Поток вызовов: имена повторяются, как строки MAC/LLDP по портам."""
+    return [unique[i * 7919 % len(unique)] for i in range(calls)]
+
+
+def run_stream(func: Callable[[str], object], stream: List[str]) -> None:
+    for name in stream:
+        func(name)
+
+
+def main(calls: int = 200_000) -> None:
+    unique = names()
+    for name in unique + [""]:
+        assert legacy_short(name) == interfaces.normalize_interface_short(name), name
+        assert legacy_short(name, True) == interfaces.normalize_interface_short(name, True), name
+        if name:
+            assert legacy_full(name) == interfaces.normalize_interface_full(name), name
+        assert sorted(legacy_aliases(name)) == sorted(interfaces.get_interface_aliases(name)), name
+
+    stream = workload(unique, calls)
+    current_short = interfaces.normalize_interface_short.__wrapped__
+    current_full = interfaces.normalize_interface_full.__wrapped__
+    print(f"Вызовов: {calls}, уникальных имён: {len(unique)}")
+    print(f"  {'функция':<26}{'до, нс':>9}{'regex, нс':>11}{'+кэш, нс':>10}")
+    for name, legacy, uncached, cached in (
+        ("normalize_interface_short", legacy_short, current_short,
+         interfaces.normalize_interface_short),
+        ("normalize_interface_full", legacy_full, current_full,
+         interfaces.normalize_interface_full),
+        ("get_interface_aliases", legacy_aliases, None, interfaces.get_interface_aliases),
+    ):
+        before = best_time(run_stream, legacy, stream) / calls * 1e9
+        # get_interface_aliases без кэша отдельно не существует
+        regex = f"{best_time(run_stream, uncached, stream) / calls * 1e9:.0f}" if uncached else "-"
+        after = best_time(run_stream, cached, stream) / calls * 1e9
+        print(f"  {name:<26}{before:>9.0f}{regex:>11}{after:>10.0f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 200_000)
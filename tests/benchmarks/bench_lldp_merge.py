@@ -0,0 +1,158 @@
+"""
+Бенчмарк объединения LLDP/CDP (LLDPNormalizer.merge_lldp_cdp) на ядре сети.
+
+Синтетический core-коммутатор с 2000 соседями: половина — Cisco (есть
+в CDP и LLDP), половина — сторонние устройства только в LLDP, у части
+которых нет local_interface (старый формат LLDP без "Local Intf:").
+Прежняя реализация для каждой LLDP-записи без local_interface проходила
+по всем CDP-записям (O(LLDP × CDP)). Совпасть этот перебор не мог: LLDP
+с hostname из CDP отсеивается раньше, поэтому в текущей реализации его нет.
+Перед замером проверяется совпадение результатов.
+
+Запуск:
+    python tests/benchmarks/bench_lldp_merge.py [соседей]
+"""
+
+import copy
+import sys
+from typing import Any, Dict, List, Tuple
+
+from _common import best_time
+
+from network_collector.core.constants import normalize_hostname, normalize_interface_short
+from network_collector.core.domain.lldp import LLDPNormalizer
+
+
+# =============================================================================
+# ПРЕЖНЯЯ РЕАЛИЗАЦИЯ
+# =============================================================================
+
+
+def legacy_hostnames_match(hostname1: str, hostname2: str) -> bool:
+    if not hostname1 or not hostname2:
+        return False
+    if hostname1.startswith("[") or hostname2.startswith("["):
+        return False
+    return normalize_hostname(hostname1).lower() == normalize_hostname(hostname2).lower()
+
+
+def legacy_merge(
+    normalizer: LLDPNormalizer,
+    lldp_data: List[Dict[str, Any]],
+    cdp_data: List[Dict[str, Any]],
+) -> List[Dict[str, Any]]:
+    lldp_by_interface = {}
+    for lldp_row in lldp_data:
+        local_intf = normalize_interface_short(lldp_row.get("local_interface", ""), lowercase=True)
+        if local_intf:
+            lldp_by_interface[local_intf] = lldp_row
+
+    merged = []
+    used_lldp_interfaces = set()
+    for cdp_row in cdp_data:
+        local_intf = normalize_interface_short(cdp_row.get("local_interface", ""), lowercase=True)
+        lldp_row = lldp_by_interface.get(local_intf)
+        if lldp_row:
+            result = normalizer._merge_cdp_with_lldp(cdp_row, lldp_row)
+            used_lldp_interfaces.add(local_intf)
+        else:
+            result = dict(cdp_row)
+        result["protocol"] = "BOTH"
+        merged.append(result)
+
+    cdp_hostnames = set()
+    for cdp_row in cdp_data:
+        h = cdp_row.get("remote_hostname", "").lower().split(".")[0]
+        if h:
+            cdp_hostnames.add(h)
+
+    for lldp_row in lldp_data:
+        local_intf = normalize_interface_short(lldp_row.get("local_interface", ""), lowercase=True)
+        if local_intf and local_intf in used_lldp_interfaces:
+            continue
+        lldp_hostname = lldp_row.get("remote_hostname", "")
+        if lldp_hostname.lower().split(".")[0] in cdp_hostnames:
+            continue
+        if not local_intf:
+            for cdp_row in cdp_data:
+                if legacy_hostnames_match(lldp_hostname, cdp_row.get("remote_hostname", "")):
+                    cdp_local = cdp_row.get("local_interface", "")
+                    if cdp_local:
+                        result = dict(lldp_row)
+                        result["local_interface"] = cdp_local
+                        if not result.get("remote_port"):
+                            result["remote_port"] = cdp_row.get("remote_port", "")
+                        if not result.get("remote_platform"):
+                            result["remote_platform"] = cdp_row.get("remote_platform", "")
+                        result["protocol"] = "BOTH"
+                        merged.append(result)
+                        break
+            else:
+                lldp_row = dict(lldp_row)
+                lldp_row["protocol"] = "BOTH"
+                merged.append(lldp_row)
+        else:
+            lldp_row = dict(lldp_row)
+            lldp_row["protocol"] = "BOTH"
+            merged.append(lldp_row)
+    return merged
+
+
+# =============================================================================
+# ДАННЫЕ И ЗАМЕР
+# =============================================================================
+
+
+def core_switch(neighbors: int) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """LLDP и CDP записи core-коммутатора (уже нормализованные)."""
+    lldp, cdp = [], []
+    for i in range(neighbors):
+        port = f"Ethernet{i // 48 + 1}/{i % 48 + 1}"
+        mac = f"00:aa:bb:{i >> 16 & 255:02x}:{i >> 8 & 255:02x}:{i & 255:02x}"
+        if i % 2 == 0:
+            # Cisco: CDP + LLDP на одном порту
+            hostname = f"access-{i}.corp.example.ru"
+            cdp.append({
+                "local_interface": port,
+                "remote_hostname": hostname,
+                "remote_port": "TenGigabitEthernet1/1/1",
+                "remote_platform": "cisco C9200L-48P-4X",
+                "remote_ip": f"10.{i >> 8 & 255}.{i & 255}.1",
+            })
+            lldp.append({
+                "local_interface": port,
+                "remote_hostname": hostname,
+                "remote_port": "Te1/1/1",
+                "remote_mac": mac,
+                "capabilities": "B,R",
+            })
+        else:
+            # Сторонние устройства: только LLDP, у каждого третьего нет local_interface
+            lldp.append({
+                "local_interface": "" if i % 3 == 1 else port,
+                "remote_hostname": f"vendor-{i}",
+                "remote_port": "eth0",
+                "remote_mac": mac,
+            })
+    return lldp, cdp
+
+
+def main(neighbors: int = 2000) -> None:
+    normalizer = LLDPNormalizer()
+    lldp, cdp = core_switch(neighbors)
+
+    expected = legacy_merge(normalizer, copy.deepcopy(lldp), copy.deepcopy(cdp))
+    actual = normalizer.merge_lldp_cdp(copy.deepcopy(lldp), copy.deepcopy(cdp))
+    assert expected == actual, "результаты различаются"
+
+    before = best_time(lambda: legacy_merge(normalizer, lldp, cdp))
+    after = best_time(lambda: normalizer.merge_lldp_cdp(lldp, cdp))
+    print(f"Соседей: {neighbors} (LLDP: {len(lldp)}, CDP: {len(cdp)})")
+    print(f"  {'операция':<16}{'до, мс':>10}{'после, мс':>12}{'ускорение':>11}")
+    print(f"  {'merge_lldp_cdp':<16}{before * 1000:>10.1f}{after * 1000:>12.1f}{before / after:>10.1f}x")
+    dedup = best_time(lambda: normalizer._deduplicate_neighbors(list(lldp)))
+    print(f"  {'дедупликация':<16}{'':>10}{dedup * 1000:>12.1f}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 2000)
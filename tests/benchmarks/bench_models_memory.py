@@ -0,0 +1,142 @@
+"""
+Бенчмарк памяти моделей: байт на запись до и после __slots__.
+
+Сравнивает слотовые Interface/MACEntry/LLDPNeighbor с их обычными
+(с __dict__) копиями. Данные — типичная MAC-таблица: десятки устройств,
+сотни портов, повторяющиеся hostname/interface/vlan.
+
+Запуск:
+    python tests/benchmarks/bench_models_memory.py [количество записей]
+"""
+
+import dataclasses
+import gc
+import sys
+import tracemalloc
+from typing import Any, Callable, Dict, List
+
+import _common  # noqa: F401  (sys.path для network_collector)
+
+from network_collector.core import models
+from network_collector.core.models import Interface, LLDPNeighbor, MACEntry, _intern
+
+
+def make_dict_model(cls: type) -> type:
+    """Та же модель без slots (как до оптимизации)."""
+    return dataclasses.make_dataclass(
+        f"Dict{cls.__name__}",
+        [(f.name, f.type, f) for f in dataclasses.fields(cls)],
+    )
+
+
+def mac_rows(count: int) -> List[Dict[str, Any]]:
+    """Строки MAC-таблицы как их отдаёт парсер (новые строки на каждую запись)."""
+    return [
+        {
+            "mac": f"00:11:22:{i >> 16 & 255:02x}:{i >> 8 & 255:02x}:{i & 255:02x}",
+            "interface": "GigabitEthernet1/0/" + str(i % 48 + 1),
+            "vlan": str(i % 20 + 1),
+            "type": "dynamic",
+            "hostname": "switch-" + str(i % 50),
+            "device_ip": "10.0.0." + str(i % 50),
+        }
+        for i in range(count)
+    ]
+
+
+def interface_rows(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "interface": "GigabitEthernet1/0/" + str(i % 48 + 1),
+            "status": "up",
+            "mode": "access",
+            "access_vlan": str(i % 20 + 1),
+            "speed": "1000Mb/s",
+            "duplex": "full",
+            "hostname": "switch-" + str(i % 50),
+            "device_ip": "10.0.0." + str(i % 50),
+        }
+        for i in range(count)
+    ]
+
+
+def lldp_rows(count: int) -> List[Dict[str, Any]]:
+    return [
+        {
+            "local_interface": "GigabitEthernet1/0/" + str(i % 48 + 1),
+            "remote_hostname": "switch-" + str((i + 1) % 50),
+            "remote_port": "GigabitEthernet1/0/" + str(i % 4 + 49),
+            "remote_mac": f"00:aa:bb:00:{i >> 8 & 255:02x}:{i & 255:02x}",
+            "hostname": "switch-" + str(i % 50),
+            "device_ip": "10.0.0." + str(i % 50),
+        }
+        for i in range(count)
+    ]
+
+
+def measure(rows: List[Dict[str, Any]], build: Callable[[list], list]) -> int:
+    """
+    Память (байт), которую удерживают объекты build() после удаления строк.
+
+    Строки копируются внутри замера (новые str, как после парсинга),
+    поэтому в результат попадают и строки, которые держат объекты.
+    """
+    gc.collect()
+    tracemalloc.start()
+    copies = [{k: "".join(list(v)) for k, v in r.items()} for r in rows]
+    objects = build(copies)
+    del copies
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del objects
+    return size
+
+
+def bytes_per_entry(cls: type, rows: List[Dict[str, Any]]) -> Dict[str, float]:
+    """Байт на запись: модель с __dict__ без интернирования против слотовой."""
+    dict_cls = make_dict_model(cls)
+    names = [f.name for f in dataclasses.fields(cls)]
+
+    def build_dict_model(copies):
+        # До оптимизации: без интернирования строк
+        models._intern = _identity
+        try:
+            return [
+                dict_cls(**{n: getattr(obj, n) for n in names})
+                for obj in map(cls.from_dict, copies)
+            ]
+        finally:
+            models._intern = _intern
+
+    def build_slotted(copies):
+        return [cls.from_dict(r) for r in copies]
+
+    return {
+        "before": measure(rows, build_dict_model) / len(rows),
+        "after": measure(rows, build_slotted) / len(rows),
+    }
+
+
+def _identity(value: Any) -> Any:
+    return value
+
+
+def main(count: int = 100_000) -> None:
+    print(f"Записей: {count}")
+    print(f"  {'модель':<14}{'до, байт':>10}{'после, байт':>13}{'экономия':>10}")
+    for cls, rows in (
+        (MACEntry, mac_rows(count)),
+        (Interface, interface_rows(count)),
+        (LLDPNeighbor, lldp_rows(count)),
+    ):
+        result = bytes_per_entry(cls, rows)
+        saved = 1 - result["after"] / result["before"]
+        print(
+            f"  {cls.__name__:<14}{result['before']:>10.0f}"
+            f"{result['after']:>13.0f}{saved:>9.0%}"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 100_000)
@@ -0,0 +1,288 @@
+"""
+Бенчмарк regex fallback-парсеров: прежние реализации против parsers/regex_fallback.py.
+
+Прежние реализации (копии методов коллекторов до переноса) компилировали
+паттерны при каждом вызове и шли по выводу построчно или блоками
+с несколькими search на блок. Корпус — выводы из tests/fixtures,
+размноженные до заданного числа строк (MAC-таблица крупного ядра —
+десятки тысяч строк). Перед замером проверяется, что результаты совпадают.
+
+Запуск:
+    python tests/benchmarks/bench_regex_fallbacks.py [строк в выводе]
+"""
+
+import re
+import sys
+from pathlib import Path
+from typing import Any, Dict, List
+
+from _common import best_time
+
+from network_collector.parsers import regex_fallback
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+TRUNK_OUTPUT = """
+Port        Mode             Encapsulation  Status        Native vlan
+Gi1/0/1     on               802.1q         trunking      1
+Gi1/0/2     on               802.1q         trunking      1
+Po1         on               802.1q         trunking      1
+
+Port        Vlans allowed on trunk
+Gi1/0/1     1-4094
+Gi1/0/2     1-4094
+Po1         1-4094
+"""
+
+
+# =============================================================================
+# ПРЕЖНИЕ РЕАЛИЗАЦИИ (без алиасов интерфейсов — сырые данные)
+# =============================================================================
+
+
+def legacy_mac_table(output: str) -> List[Dict[str, str]]:
+    data = []
+    pattern = re.compile(
+        r"^\s*(\d+)\s+([0-9a-fA-F.:]+)\s+(\w+)\s+(\S+)",
+        re.MULTILINE,
+    )
+    for match in pattern.finditer(output):
+        vlan, mac, mac_type, interface = match.groups()
+        data.append({"vlan": vlan, "mac": mac, "type": mac_type.lower(), "interface": interface})
+    return data
+
+
+def legacy_interface_status(output: str) -> List[tuple]:
+    pattern = re.compile(
+        r"^((?:Gi|Fa|Te|Et|Po|Vl)\S+)\s+(?:\S.*?)?\s+"
+        r"(connected|notconnect|disabled|err-disabled|inactive|suspended)\s+",
+        re.MULTILINE | re.IGNORECASE,
+    )
+    return [(m.group(1), m.group(2).lower()) for m in pattern.finditer(output)]
+
+
+def legacy_trunk_ports(output: str) -> List[str]:
+    ports = []
+    in_port_section = False
+    for line in output.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("Port") and "Mode" in line:
+            in_port_section = True
+            continue
+        if "Vlans allowed" in line or "Vlans in spanning" in line:
+            break
+        if in_port_section:
+            parts = line.split()
+            if parts and re.match(r"^(Gi|Fa|Te|Eth|Po)", parts[0], re.IGNORECASE):
+                ports.append(parts[0])
+    return ports
+
+
+def legacy_lag_membership(output: str) -> List[tuple]:
+    result = []
+    pattern = re.compile(
+        r"(Po\d+)\([^)]*\)\s+(?:LACP|PAgP|ON|-)\s+(.+)$",
+        re.MULTILINE,
+    )
+    for match in pattern.finditer(output):
+        member_pattern = re.compile(r"([A-Za-z]+[\d/]+)\([^)]*\)")
+        for member_match in member_pattern.finditer(match.group(2)):
+            result.append((member_match.group(1), match.group(1)))
+    return result
+
+
+def legacy_switchport_modes(output: str) -> Dict[str, Dict[str, str]]:
+    modes = {}
+    current_interface = None
+    current_data = {}
+    for line in output.splitlines():
+        line = line.strip()
+        if line.startswith("Name:"):
+            if current_interface and current_data:
+                modes[current_interface] = current_data
+            current_interface = line.split(":", 1)[1].strip()
+            current_data = {"mode": "", "native_vlan": "", "access_vlan": ""}
+            continue
+        if current_interface:
+            if "Administrative Mode:" in line:
+                mode = line.split(":", 1)[1].strip().lower()
+                if "access" in mode:
+                    current_data["mode"] = "access"
+                elif "trunk" in mode or "dynamic" in mode:
+                    current_data["mode"] = "tagged-all"
+            elif "Trunking VLANs Enabled:" in line:
+                vlans = line.split(":", 1)[1].strip().lower()
+                if vlans != "all" and vlans and current_data.get("mode") in ("tagged-all", "tagged"):
+                    current_data["mode"] = "tagged"
+            elif "Access Mode VLAN:" in line:
+                parts = line.split(":", 1)[1].strip().split()
+                if parts:
+                    current_data["access_vlan"] = parts[0]
+            elif "Native Mode VLAN:" in line:
+                parts = line.split(":", 1)[1].strip().split()
+                if parts:
+                    current_data["native_vlan"] = parts[0]
+    if current_interface and current_data:
+        modes[current_interface] = current_data
+    return modes
+
+
+def legacy_lldp_detail(output: str) -> List[Dict[str, Any]]:
+    neighbors = []
+    local_intf_pattern = re.compile(r"Local Intf:\s*(\S+)")
+    chassis_id_pattern = re.compile(r"Chassis id:\s*(\S+)")
+    port_id_pattern = re.compile(r"Port id:\s*(.+?)(?:\n|$)")
+    port_desc_pattern = re.compile(r"Port Description:\s*(.+?)(?:\n|$)")
+    system_name_pattern = re.compile(r"System Name:\s*(.+?)(?:\n|$)")
+    system_desc_pattern = re.compile(r"System Description:\s*\n(.+?)(?:\n\n|\nTime)", re.DOTALL)
+    mgmt_ip_pattern = re.compile(r"IP:\s*(\d+\.\d+\.\d+\.\d+)")
+
+    if "Local Intf:" in output:
+        blocks = re.split(r"(?=Local Intf:)", output)
+    else:
+        blocks = re.split(r"-{20,}", output)
+
+    for block in blocks:
+        if not block.strip() or "Chassis id:" not in block:
+            continue
+        neighbor = {}
+        match = local_intf_pattern.search(block)
+        if match:
+            neighbor["local_interface"] = match.group(1)
+        match = chassis_id_pattern.search(block)
+        if match:
+            neighbor["chassis_id"] = match.group(1)
+        match = port_id_pattern.search(block)
+        if match:
+            neighbor["port_id"] = match.group(1).strip()
+        match = port_desc_pattern.search(block)
+        if match:
+            port_desc = match.group(1).strip()
+            if port_desc and port_desc != "- not advertised":
+                neighbor["port_description"] = port_desc
+        match = system_name_pattern.search(block)
+        if match:
+            sys_name = match.group(1).strip()
+            if sys_name and sys_name != "- not advertised":
+                neighbor["remote_hostname"] = sys_name
+        match = system_desc_pattern.search(block)
+        if match:
+            sys_desc = match.group(1).strip()
+            if sys_desc:
+                neighbor["remote_description"] = sys_desc
+        match = mgmt_ip_pattern.search(block)
+        if match:
+            neighbor["remote_ip"] = match.group(1)
+        if neighbor.get("chassis_id") or neighbor.get("remote_hostname"):
+            neighbors.append(neighbor)
+    return neighbors
+
+
+def legacy_cdp_detail(output: str) -> List[Dict[str, Any]]:
+    neighbors = []
+    device_id_pattern = re.compile(r"Device ID:\s*(\S+)")
+    local_intf_pattern = re.compile(r"Interface:\s*(\S+),")
+    remote_intf_pattern = re.compile(r"Port ID.*?:\s*(\S+)")
+    platform_pattern = re.compile(r"Platform:\s*(.+?),")
+    ip_pattern = re.compile(r"IP address:\s*(\S+)")
+
+    for block in re.split(r"(?=Device ID:)", output):
+        if not block.strip():
+            continue
+        neighbor = {}
+        match = device_id_pattern.search(block)
+        if match:
+            neighbor["remote_hostname"] = match.group(1)
+        match = local_intf_pattern.search(block)
+        if match:
+            neighbor["local_interface"] = match.group(1)
+        match = remote_intf_pattern.search(block)
+        if match:
+            neighbor["remote_port"] = match.group(1)
+        match = platform_pattern.search(block)
+        if match:
+            neighbor["remote_platform"] = match.group(1).strip()
+        match = ip_pattern.search(block)
+        if match:
+            neighbor["remote_ip"] = match.group(1)
+        if neighbor.get("local_interface"):
+            neighbors.append(neighbor)
+    return neighbors
+
+
+# =============================================================================
+# КОРПУС И ЗАМЕР
+# =============================================================================
+
+# (название, прежняя функция, новая функция, файлы корпуса)
+CASES = [
+    ("mac table", legacy_mac_table, regex_fallback.parse_mac_table, [
+        "cisco_ios/show_mac_address_table.txt",
+        "cisco_nxos/show_mac_address_table.txt",
+        "qtech/show_mac_address_table.txt",
+    ]),
+    ("intf status", legacy_interface_status, regex_fallback.parse_interface_status, [
+        "cisco_ios/show_interface_status.txt",
+        "cisco_nxos/show_interface_status.txt",
+    ]),
+    ("trunk", legacy_trunk_ports, regex_fallback.parse_trunk_ports, []),
+    ("lag", legacy_lag_membership, regex_fallback.parse_lag_membership, [
+        "cisco_ios/show_etherchannel_summary.txt",
+        "cisco_nxos/show_port_channel_summary.txt",
+    ]),
+    ("switchport", legacy_switchport_modes, regex_fallback.parse_switchport_modes, [
+        "cisco_ios/show_interfaces_switchport.txt",
+        "cisco_nxos/show_interface_switchport.txt",
+        "qtech/show_interface_switchport.txt",
+    ]),
+    ("lldp detail", legacy_lldp_detail, regex_fallback.parse_lldp_detail, [
+        "cisco_ios/show_lldp_neighbors_detail.txt",
+        "cisco_nxos/show_lldp_neighbors_detail.txt",
+        "qtech/show_lldp_neighbors_detail.txt",
+        "real_output/lldp_cisco_ios.txt",
+    ]),
+    ("cdp detail", legacy_cdp_detail, regex_fallback.parse_cdp_detail, [
+        "cisco_ios/show_cdp_neighbors_detail.txt",
+        "cisco_nxos/show_cdp_neighbors_detail.txt",
+        "real_output/cdp_cisco_ios.txt",
+    ]),
+]
+
+
+def corpus(files: List[str]) -> List[str]:
+    """Выводы корпуса (для trunk фикстуры нет — встроенный пример)."""
+    if not files:
+        return [TRUNK_OUTPUT]
+    return [(FIXTURES_DIR / name).read_text(encoding="utf-8") for name in files]
+
+
+def scale(output: str, lines: int) -> str:
+    """Вывод, размноженный до lines строк (целыми копиями)."""
+    if not output.endswith("\n"):
+        output += "\n"
+    copies = max(1, lines // output.count("\n"))
+    return output * copies
+
+
+def main(lines: int = 60_000) -> None:
+    print(f"Строк в выводе: ~{lines}")
+    print(f"  {'парсер':<13}{'до, мс':>10}{'после, мс':>12}{'ускорение':>11}")
+    for name, legacy, current, files in CASES:
+        before = after = 0.0
+        for output in corpus(files):
+            # Результаты должны совпадать и на исходном, и на размноженном выводе
+            assert legacy(output) == current(output), f"{name}: результаты различаются"
+            big = scale(output, lines)
+            assert legacy(big) == current(big), f"{name}: результаты различаются"
+            before += best_time(legacy, big)
+            after += best_time(current, big)
+        print(
+            f"  {name:<13}{before * 1000:>10.1f}{after * 1000:>12.1f}"
+            f"{before / after:>10.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 60_000)
@@ -1,5 +1,7 @@
 """Тесты collector endpoints."""
 
+import json
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -102,6 +104,58 @@ class TestMACEndpoint:
         assert len(data["entries"]) == 2
         assert data["entries"][0]["mac"] == "00:11:22:33:44:55"
 
+    @patch("network_collector.api.services.collector_service.MACCollector")
+    def test_collect_mac_ndjson_stream(self, mock_collector_class, client_with_credentials):
+        """Accept: application/x-ndjson — строки потоком, без MACResponse."""
+        mock_collector = MagicMock()
+        mock_collector.iter_collect.return_value = iter([
+            [{"mac": "00:11:22:33:44:55", "vlan": 100, "hostname": "switch1"}],
+            [{"mac": "AA:BB:CC:DD:EE:FF", "vlan": 200, "hostname": "switch2"}],
+        ])
+        mock_collector_class.return_value = mock_collector
+
+        response = client_with_credentials.post(
+            "/api/mac/collect",
+            json={"devices": ["10.0.0.1", "10.0.0.2"]},
+            headers={"Accept": "application/x-ndjson"},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert [r["hostname"] for r in rows] == ["switch1", "switch2"]
+        assert rows[0]["vlan"] == 100
+        mock_collector.collect_dicts.assert_not_called()
+
+    @patch("network_collector.api.services.collector_service.MACCollector")
+    def test_collect_mac_ndjson_no_devices(self, mock_collector_class, client_with_credentials):
+        """Нет устройств — строка с ошибкой вместо пустого тела."""
+        with patch(
+            "network_collector.api.services.collector_service.CollectorService._get_devices",
+            return_value=[],
+        ):
+            response = client_with_credentials.post(
+                "/api/mac/collect",
+                json={"devices": []},
+                headers={"Accept": "application/x-ndjson"},
+            )
+
+        assert response.status_code == 200
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert rows == [{"success": False, "errors": ["No devices to collect from"]}]
+        mock_collector_class.assert_not_called()
+
+    @patch("network_collector.api.services.collector_service.MACCollector")
+    def test_collect_mac_refresh_flag(self, mock_collector_class, client_with_credentials):
+        """refresh=true — коллектор не читает кэш выводов команд."""
+        mock_collector_class.return_value.collect_dicts.return_value = []
+
+        client_with_credentials.post(
+            "/api/mac/collect",
+            json={"devices": ["10.0.0.1"], "refresh": True},
+        )
+
+        assert mock_collector_class.call_args.kwargs["refresh_cache"] is True
+
 
 class TestLLDPEndpoint:
     """Тесты /api/lldp."""
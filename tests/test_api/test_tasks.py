@@ -2,10 +2,15 @@
 Тесты для Tasks API и TaskManager.
 """
 
+import json
+
 import pytest
 from fastapi.testclient import TestClient
 
 from network_collector.api.main import app
+from network_collector.api.routes import tasks as tasks_routes
+from network_collector.api.services.collector_service import CollectorService
+from network_collector.api.services.result_store import TaskResultStore
 from network_collector.api.services.task_manager import (
     TaskManager,
     TaskStatus,
@@ -279,6 +284,106 @@ class TestTasksAPI:
         assert "progress_percent" in step
 
 
+def _rows(count, hostnames=("sw1", "sw2")):
+    return [
+        {"hostname": hostnames[i % len(hostnames)], "mac": f"00:00:00:00:00:{i:02x}"}
+        for i in range(count)
+    ]
+
+
+@pytest.fixture
+def store(tmp_path, monkeypatch):
+    """Хранилище результатов во временном каталоге."""
+    store = TaskResultStore(tmp_path / "results")
+    monkeypatch.setattr(tasks_routes, "result_store", store)
+    return store
+
+
+class TestTaskResultStore:
+    """Результаты задач на диске."""
+
+    def test_save_and_read_page(self, store):
+        ref = store.save("t1", _rows(10))
+
+        assert ref["rows"] == 10
+        assert ref["url"] == "/api/tasks/t1/results"
+        items, total = store.read_page("t1", offset=8, limit=5)
+        assert total == 10
+        assert [r["mac"] for r in items] == ["00:00:00:00:00:08", "00:00:00:00:00:09"]
+
+    def test_hostname_filter(self, store):
+        store.save("t1", _rows(10))
+
+        items, total = store.read_page("t1", limit=2, hostname="SW2")
+
+        assert total == 5
+        assert {r["hostname"] for r in items} == {"sw2"}
+
+    def test_retention_by_bytes(self, tmp_path):
+        store = TaskResultStore(tmp_path, max_bytes=1)
+        store.save("old", _rows(50))
+        store.save("new", _rows(50))
+
+        # Последний результат остаётся даже если сам больше лимита
+        assert not store.exists("old")
+        assert store.exists("new")
+
+    def test_spill_keeps_handle_only(self, monkeypatch, tmp_path):
+        from network_collector.api.services import collector_service
+
+        monkeypatch.setattr(collector_service, "result_store", TaskResultStore(tmp_path))
+        service = CollectorService.__new__(CollectorService)
+
+        result = service._spill_results("t1", {"total": 3, "data": _rows(3)})
+
+        assert "data" not in result
+        assert result["total"] == 3
+        assert result["data_ref"]["rows"] == 3
+
+    def test_spill_without_rows(self):
+        service = CollectorService.__new__(CollectorService)
+
+        assert service._spill_results("t1", {"total": 0}) == {"total": 0}
+
+
+class TestTaskResultsAPI:
+    """GET /api/tasks/{id}/results."""
+
+    @pytest.fixture
+    def client(self):
+        return TestClient(app)
+
+    def test_page(self, client, store):
+        store.save("res1", _rows(30))
+
+        response = client.get("/api/tasks/res1/results?offset=10&limit=5&hostname=sw1")
+
+        assert response.status_code == 200
+        data = response.json()
+        assert data["total"] == 15
+        assert len(data["items"]) == 5
+        assert data["offset"] == 10
+
+    def test_ndjson_stream(self, client, store):
+        store.save("res2", _rows(4))
+
+        response = client.get("/api/tasks/res2/results?format=ndjson")
+
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("application/x-ndjson")
+        rows = [json.loads(line) for line in response.text.splitlines()]
+        assert rows == _rows(4)
+
+    def test_not_found(self, client, store):
+        assert client.get("/api/tasks/missing/results").status_code == 404
+
+    def test_expired(self, client, store):
+        task = task_manager.create_task(task_type="test_results")
+        task_manager.complete_task(task.id, result={"total": 1, "data_ref": {"rows": 1}})
+
+        assert client.get(f"/api/tasks/{task.id}/results").status_code == 410
+
+
 class TestTaskManagerSingleton:
     """Тесты синглтона TaskManager."""
 
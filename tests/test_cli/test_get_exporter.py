@@ -0,0 +1,36 @@
+"""
+Тесты выбора экспортера CLI (cli/utils.py get_exporter).
+
+Проверяет:
+- Формат -> класс экспортера
+- parquet/feather без pyarrow — понятное сообщение и выход, а не ImportError
+"""
+
+import logging
+
+import pytest
+from unittest.mock import patch
+
+from network_collector.cli.utils import get_exporter
+from network_collector.exporters import CSVExporter, JSONExporter, ExcelExporter
+
+
+class TestGetExporter:
+    """Экспортер по --format."""
+
+    @pytest.mark.parametrize("format_type,expected", [
+        ("csv", CSVExporter),
+        ("json", JSONExporter),
+        ("excel", ExcelExporter),
+    ])
+    def test_format_to_exporter(self, format_type, expected, tmp_path):
+        assert isinstance(get_exporter(format_type, str(tmp_path)), expected)
+
+    @pytest.mark.parametrize("format_type", ["parquet", "feather"])
+    def test_columnar_without_pyarrow(self, format_type, tmp_path, caplog):
+        with patch("network_collector.exporters.parquet_exporter.PYARROW_AVAILABLE", False):
+            with caplog.at_level(logging.ERROR), pytest.raises(SystemExit) as exc:
+                get_exporter(format_type, str(tmp_path), data_type="mac")
+
+        assert exc.value.code == 1
+        assert "pip install pyarrow" in caplog.text
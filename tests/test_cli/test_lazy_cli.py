@@ -0,0 +1,135 @@
+"""
+Тесты ленивой загрузки CLI.
+
+Проверяем что:
+- импорт CLI не тянет тяжёлые вендорные библиотеки
+- обработчик команды загружается только для запущенной команды
+- ленивые экспорты пакетов работают как обычные импорты
+- --import-profile собирает время импорта модулей
+"""
+
+import atexit
+import json
+import os
+import subprocess
+import sys
+from io import StringIO
+
+import pytest
+
+
+def _loaded_modules(code: str) -> set:
+    """Выполняет код в чистом интерпретаторе и возвращает sys.modules."""
+    env = dict(os.environ, PYTHONPATH=os.pathsep.join(p for p in sys.path if p))
+    result = subprocess.run(
+        [sys.executable, "-c", code + "\nimport sys, json; print(json.dumps(sorted(sys.modules)))"],
+        capture_output=True, text=True, env=env, check=True,
+    )
+    return set(json.loads(result.stdout.strip().splitlines()[-1]))
+
+
+HEAVY_MODULES = {"scrapli", "netmiko", "openpyxl", "pynetbox", "ntc_templates", "pandas"}
+
+
+class TestLazyImports:
+    """Импорт CLI и пакета без вендорных зависимостей."""
+
+    def test_cli_import_is_light(self):
+        modules = _loaded_modules("import network_collector.cli")
+        assert not HEAVY_MODULES & modules
+
+    def test_pipeline_handler_is_light(self):
+        modules = _loaded_modules(
+            "from network_collector.cli import get_command_handler\n"
+            "get_command_handler('pipeline')"
+        )
+        assert "network_collector.cli.commands.pipeline" in modules
+        assert "network_collector.cli.commands.collect" not in modules
+        assert not HEAVY_MODULES & modules
+
+    def test_exporters_import_skips_pyarrow(self):
+        """Parquet/Feather экспортеры (и pyarrow) грузятся только при обращении."""
+        modules = _loaded_modules("import network_collector.exporters")
+        assert "network_collector.exporters.parquet_exporter" not in modules
+        assert "pyarrow" not in modules
+
+        modules = _loaded_modules("from network_collector.exporters import FeatherExporter")
+        assert "network_collector.exporters.parquet_exporter" in modules
+
+    def test_package_exports_resolve(self):
+        from network_collector import MACCollector, Device
+        from network_collector.collectors.mac import MACCollector as Direct
+        from network_collector.core import Device as CoreDevice
+
+        assert MACCollector is Direct
+        assert Device is CoreDevice
+        assert "MACCollector" in dir(__import__("network_collector"))
+
+    def test_unknown_attribute(self):
+        import network_collector.core as core
+
+        with pytest.raises(AttributeError):
+            core.NoSuchThing
+
+
+class TestCommandDispatch:
+    """Диспетчеризация подкоманд через COMMAND_HANDLERS."""
+
+    def test_all_commands_resolve(self):
+        from network_collector.cli import COMMAND_HANDLERS, get_command_handler, setup_parser
+
+        parser = setup_parser()
+        subparsers = next(
+            a for a in parser._actions if a.__class__.__name__ == "_SubParsersAction"
+        )
+        assert set(COMMAND_HANDLERS) == set(subparsers.choices)
+        for command, (_, func_name) in COMMAND_HANDLERS.items():
+            assert get_command_handler(command).__name__ == func_name
+
+    def test_unknown_command(self):
+        from network_collector.cli import get_command_handler
+
+        assert get_command_handler(None) is None
+        assert get_command_handler("nope") is None
+
+    def test_legacy_names_from_cli(self):
+        from network_collector.cli import cmd_pipeline
+        from network_collector.cli.commands.pipeline import cmd_pipeline as direct
+
+        assert cmd_pipeline is direct
+
+
+class TestImportProfile:
+    """Профилировщик импортов --import-profile."""
+
+    def test_records_and_reports(self, tmp_path, monkeypatch):
+        from network_collector.core.import_profile import install_if_requested
+
+        (tmp_path / "nc_profile_probe.py").write_text("import nc_profile_child\n")
+        (tmp_path / "nc_profile_child.py").write_text("X = 1\n")
+        monkeypatch.syspath_prepend(str(tmp_path))
+
+        assert install_if_requested(["prog", "mac"]) is None
+        profiler = install_if_requested(["prog", "--import-profile", "mac"])
+        try:
+            import nc_profile_probe  # noqa: F401
+        finally:
+            atexit.unregister(profiler.report)
+            sys.meta_path.remove(profiler)
+            sys.modules.pop("nc_profile_probe", None)
+            sys.modules.pop("nc_profile_child", None)
+
+        probe_cum, probe_self = profiler.timings["nc_profile_probe"]
+        child_cum, _ = profiler.timings["nc_profile_child"]
+        assert probe_cum >= child_cum
+        assert probe_self <= probe_cum
+
+        out = StringIO()
+        profiler.report(stream=out)
+        assert "nc_profile_probe" in out.getvalue()
+
+    def test_flag_accepted_by_parser(self):
+        from network_collector.cli import setup_parser
+
+        args = setup_parser().parse_args(["--import-profile", "pipeline", "list"])
+        assert args.import_profile is True
@@ -0,0 +1,226 @@
+"""Тесты DescriptionMatcher: векторная загрузка справочника, merge-сопоставление, кэш."""
+
+import pytest
+from unittest.mock import patch
+
+pd = pytest.importorskip("pandas")
+pytest.importorskip("openpyxl")
+
+from network_collector.configurator.description import (
+    DescriptionMatcher,
+    normalize_mac,
+    normalize_mac_series,
+)
+
+
+# =============================================================================
+# Fixtures
+# =============================================================================
+
+@pytest.fixture
+def hosts_file(tmp_path):
+    """Справочник хостов: разные форматы MAC, несколько MAC в ячейке, пустые имена."""
+    df = pd.DataFrame({
+        "MAC": [
+            "AA:BB:CC:DD:EE:01",
+            "aabb.ccdd.ee02; 11-22-33-44-55-66",
+            "aabbccddee03",
+            None,
+            "aabbccddee05",
+            "bad-mac",
+        ],
+        "Name": ["PC-01", "PC-02", None, "PC-04", "PC-05", "PC-06"],
+        "User": ["ivanov", None, "petrov", "sidorov", "smirnov", "kuznetsov"],
+    })
+    path = tmp_path / "hosts.xlsx"
+    df.to_excel(path, index=False)
+    return path
+
+
+@pytest.fixture
+def mac_data():
+    """Данные MAC от MACCollector."""
+    return [
+        {"hostname": "sw1", "device_ip": "10.0.0.1", "interface": "Gi0/1",
+         "mac": "aa:bb:cc:dd:ee:01", "vlan": "10", "description": ""},
+        {"hostname": "sw1", "device_ip": "10.0.0.1", "interface": "Gi0/2",
+         "mac": "1122.3344.5566", "vlan": "10", "description": "old"},
+        {"hostname": "sw2", "device_ip": "10.0.0.2", "interface": "Gi0/3",
+         "mac": "aa:bb:cc:dd:ee:03", "vlan": "20", "description": ""},
+        {"hostname": "sw2", "device_ip": "10.0.0.2", "interface": "Gi0/4",
+         "mac": "AA-BB-CC-DD-EE-05", "vlan": "20", "description": ""},
+    ]
+
+
+# =============================================================================
+# Нормализация
+# =============================================================================
+
+class TestNormalizeMacSeries:
+    """Векторная нормализация совпадает с построчной."""
+
+    def test_matches_scalar_normalize(self):
+        values = [
+            "AA:BB:CC:DD:EE:FF", "aabb.ccdd.eeff", "aa-bb-cc-dd-ee-ff",
+            " aabbccddeeff ", "short", "", None, float("nan"),
+        ]
+        result = normalize_mac_series(pd.Series(values, dtype=object))
+        assert list(result) == [normalize_mac(v) for v in values]
+
+
+# =============================================================================
+# Загрузка справочника
+# =============================================================================
+
+class TestLoadHostsFile:
+    """Загрузка справочника хостов."""
+
+    def test_load_counts_macs(self, hosts_file):
+        matcher = DescriptionMatcher()
+        count = matcher.load_hosts_file(str(hosts_file), additional_columns=["user"])
+
+        # PC-01, PC-02 (2 MAC), PC-05; без имени / без MAC / невалидный — пропущены
+        assert count == 4
+        assert set(matcher.reference_data) == {
+            "aabbccddee01", "aabbccddee02", "112233445566", "aabbccddee05",
+        }
+
+    def test_reference_data_fields(self, hosts_file):
+        matcher = DescriptionMatcher()
+        matcher.load_hosts_file(str(hosts_file), additional_columns=["User"])
+
+        assert matcher.reference_data["aabbccddee01"] == {
+            "name": "PC-01", "_source_file": "hosts.xlsx", "User": "ivanov",
+        }
+        # NaN в дополнительной колонке не попадает в словарь
+        assert "User" not in matcher.reference_data["112233445566"]
+
+    def test_missing_mac_column(self, hosts_file):
+        matcher = DescriptionMatcher()
+        with pytest.raises(ValueError):
+            matcher.load_hosts_file(str(hosts_file), mac_column="Missing")
+
+    def test_file_not_found(self, tmp_path):
+        matcher = DescriptionMatcher()
+        with pytest.raises(FileNotFoundError):
+            matcher.load_hosts_file(str(tmp_path / "nope.xlsx"))
+
+    def test_later_file_wins(self, hosts_file, tmp_path):
+        other = tmp_path / "other.xlsx"
+        pd.DataFrame({"MAC": ["aabbccddee01"], "Name": ["PC-NEW"]}).to_excel(
+            other, index=False
+        )
+        matcher = DescriptionMatcher()
+        matcher.load_hosts_file(str(hosts_file))
+        matcher.load_hosts_file(str(other))
+
+        assert matcher.reference_data["aabbccddee01"]["name"] == "PC-NEW"
+        assert matcher.get_stats()["reference_hosts"] == 4
+
+
+# =============================================================================
+# Кэш справочника
+# =============================================================================
+
+class TestReferenceCache:
+    """Кэш нормализованного справочника по mtime файла."""
+
+    def test_second_load_skips_excel(self, hosts_file, tmp_path):
+        cache_dir = tmp_path / "cache"
+        DescriptionMatcher(cache_dir=str(cache_dir)).load_hosts_file(str(hosts_file))
+        assert list(cache_dir.glob("*.pkl"))
+
+        matcher = DescriptionMatcher(cache_dir=str(cache_dir))
+        with patch.object(pd, "read_excel", side_effect=AssertionError("read")):
+            count = matcher.load_hosts_file(str(hosts_file))
+
+        assert count == 4
+        assert matcher.reference_data["aabbccddee05"]["name"] == "PC-05"
+
+    def test_changed_file_invalidates_cache(self, hosts_file, tmp_path):
+        cache_dir = tmp_path / "cache"
+        DescriptionMatcher(cache_dir=str(cache_dir)).load_hosts_file(str(hosts_file))
+
+        pd.DataFrame({"MAC": ["aabbccddee99"], "Name": ["PC-99"]}).to_excel(
+            hosts_file, index=False
+        )
+        matcher = DescriptionMatcher(cache_dir=str(cache_dir))
+        count = matcher.load_hosts_file(str(hosts_file))
+
+        assert count == 1
+        assert "aabbccddee99" in matcher.reference_data
+
+
+# =============================================================================
+# Сопоставление
+# =============================================================================
+
+class TestMatch:
+    """Сопоставление MAC со справочником."""
+
+    def test_match_mac_data(self, hosts_file, mac_data):
+        matcher = DescriptionMatcher()
+        matcher.load_hosts_file(str(hosts_file))
+        entries = matcher.match_mac_data(mac_data)
+
+        assert [e.interface for e in entries] == ["Gi0/1", "Gi0/2", "Gi0/3", "Gi0/4"]
+        assert [e.matched for e in entries] == [True, True, False, True]
+        assert entries[0].host_name == "PC-01"
+        assert entries[1].host_name == "PC-02"
+        assert entries[1].current_description == "old"
+        assert entries[2].host_name == ""
+        # MAC сохраняется в исходном формате
+        assert entries[3].mac == "AA-BB-CC-DD-EE-05"
+
+    def test_match_frame_and_stats(self, hosts_file, mac_data):
+        matcher = DescriptionMatcher()
+        matcher.load_hosts_file(str(hosts_file))
+        result = matcher.match_mac_frame(pd.DataFrame(mac_data))
+
+        assert len(result) == 4
+        assert result["matched"].sum() == 3
+        stats = matcher.get_stats()
+        assert stats["matched"] == 3
+        assert stats["unmatched"] == 1
+        assert stats["match_rate"] == "75.0%"
+
+    def test_match_missing_columns(self, hosts_file):
+        matcher = DescriptionMatcher()
+        matcher.load_hosts_file(str(hosts_file))
+        entries = matcher.match_mac_data([{"mac": "aabbccddee01"}])
+
+        assert entries[0].matched is True
+        assert entries[0].hostname == ""
+        assert entries[0].vlan == ""
+
+    def test_generate_commands(self, hosts_file, mac_data):
+        matcher = DescriptionMatcher()
+        matcher.load_hosts_file(str(hosts_file))
+        matcher.match_mac_data(mac_data)
+
+        assert matcher.generate_description_commands() == {
+            "sw1": ["interface Gi0/1", "description PC-01"],
+            "sw2": ["interface Gi0/4", "description PC-05"],
+        }
+        overwrite = matcher.generate_description_commands(overwrite=True)
+        assert overwrite["sw1"] == [
+            "interface Gi0/1", "description PC-01",
+            "interface Gi0/2", "description PC-02",
+        ]
+
+    def test_save_matched(self, hosts_file, mac_data, tmp_path):
+        matcher = DescriptionMatcher()
+        matcher.load_hosts_file(str(hosts_file))
+        matcher.match_mac_data(mac_data)
+
+        output = tmp_path / "matched.xlsx"
+        matcher.save_matched(str(output), include_unmatched=False)
+        saved = pd.read_excel(output)
+
+        assert list(saved["Host_Name"]) == ["PC-01", "PC-02", "PC-05"]
+        assert set(saved["Matched"]) == {"Yes"}
+
+    def test_save_without_match_raises(self, tmp_path):
+        matcher = DescriptionMatcher()
+        with pytest.raises(ValueError):
+            matcher.save_matched(str(tmp_path / "out.xlsx"))
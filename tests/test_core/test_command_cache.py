@@ -0,0 +1,190 @@
+"""
+Тесты кэша выводов команд (core/command_cache.py).
+
+Проверяет:
+- TTL по команде, 0 — не кэшировать
+- LRU-вытеснение по объёму
+- Подключение открывается только при промахе кэша
+- refresh_cache: опрос устройства без чтения кэша
+- Ошибка подключения не повторяется на каждой команде
+- Вывод не отдаётся запросу с другими учётными данными
+"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+
+from scrapli.exceptions import ScrapliConnectionError
+
+from network_collector.core.command_cache import CommandOutputCache, credentials_identity
+from network_collector.core.connection import ConnectionManager
+from network_collector.core.credentials import Credentials
+from network_collector.core.device import Device
+from network_collector.core.exceptions import ConnectionError as CollectorConnectionError
+
+
+class _Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+@pytest.fixture
+def clock():
+    return _Clock()
+
+
+@pytest.fixture
+def device():
+    return Device(host="10.0.0.1", device_type="cisco_ios")
+
+
+@pytest.fixture
+def credentials():
+    return Credentials(username="admin", password="admin")
+
+
+def _scrapli(outputs):
+    """Mock Scrapli: send_command отдаёт outputs[команда]."""
+    conn = MagicMock()
+    conn.get_prompt.return_value = "switch-01#"
+    conn.send_command.side_effect = lambda cmd, **kw: MagicMock(result=outputs[cmd], failed=False)
+    conn.send_commands.side_effect = lambda cmds, **kw: [
+        MagicMock(result=outputs[cmd], failed=False) for cmd in cmds
+    ]
+    return conn
+
+
+class TestCommandOutputCache:
+    """TTL и вытеснение."""
+
+    def test_ttl_per_command(self, clock):
+        cache = CommandOutputCache(default_ttl=300, ttl={"show mac address-table": 60}, clock=clock)
+        cache.put("h", "show mac address-table", "mac")
+        cache.put("h", "show interfaces status", "status")
+
+        clock.now += 120
+        assert cache.get("h", "show mac address-table") is None
+        assert cache.get("h", "show  interfaces   STATUS") == "status"
+        assert cache.stats == {"hits": 1, "misses": 1, "evictions": 0}
+
+    def test_zero_ttl_not_cached(self, clock):
+        cache = CommandOutputCache(ttl={"show running-config": 0}, clock=clock)
+        cache.put("h", "show running-config", "config")
+
+        assert len(cache) == 0
+
+    def test_lru_eviction_by_bytes(self, clock):
+        cache = CommandOutputCache(max_bytes=10, clock=clock)
+        cache.put("h", "a", "xxxx")
+        cache.put("h", "b", "xxxx")
+        cache.get("h", "a")  # a — недавно использован
+        cache.put("h", "c", "xxxx")
+
+        assert cache.get("h", "b") is None
+        assert cache.get("h", "a") == "xxxx"
+        assert cache.size_bytes == 8
+        assert cache.stats["evictions"] == 1
+
+    def test_invalidate_host(self, clock):
+        cache = CommandOutputCache(clock=clock)
+        cache.put("h1", "a", "1")
+        cache.put("h2", "a", "2")
+        cache.invalidate("h1")
+
+        assert cache.get("h1", "a") is None
+        assert cache.get("h2", "a") == "2"
+
+
+class TestCachedConnect:
+    """ConnectionManager.connect с command_cache."""
+
+    @patch("network_collector.core.connection.Scrapli")
+    def test_second_collection_skips_ssh(self, mock_scrapli, device, credentials):
+        mock_scrapli.return_value = _scrapli({"show interfaces status": "status"})
+        manager = ConnectionManager(command_cache=CommandOutputCache())
+
+        for _ in range(2):
+            with manager.connect(device, credentials) as conn:
+                assert manager.get_hostname(conn) == "switch-01"
+                assert conn.send_command("show interfaces status").result == "status"
+
+        assert mock_scrapli.call_count == 1
+        assert mock_scrapli.return_value.send_command.call_count == 1
+        mock_scrapli.return_value.close.assert_called()
+
+    @patch("network_collector.core.connection.Scrapli")
+    def test_batch_sends_only_misses(self, mock_scrapli, device, credentials):
+        mock_scrapli.return_value = _scrapli({"a": "1", "b": "2"})
+        cache = CommandOutputCache()
+        identity = credentials_identity(credentials)
+        cache.put(device.host, "a", "cached", identity)
+
+        with ConnectionManager(command_cache=cache).connect(device, credentials) as conn:
+            results = [r.result for r in conn.send_commands(["a", "b"])]
+
+        assert results == ["cached", "2"]
+        mock_scrapli.return_value.send_commands.assert_called_once_with(["b"])
+        assert cache.get(device.host, "b", identity) == "2"
+
+    @patch("network_collector.core.connection.Scrapli")
+    def test_refresh_reads_device(self, mock_scrapli, device, credentials):
+        mock_scrapli.return_value = _scrapli({"show version": "v1"})
+        cache = CommandOutputCache()
+        identity = credentials_identity(credentials)
+        cache.put(device.host, "show version", "old", identity)
+        manager = ConnectionManager(command_cache=cache, refresh_cache=True)
+
+        with manager.connect(device, credentials) as conn:
+            assert conn.send_command("show version").result == "v1"
+
+        # Свежий вывод сохранён для следующих сборов
+        assert cache.get(device.host, "show version", identity) == "v1"
+
+    @patch("network_collector.core.connection.Scrapli")
+    def test_other_credentials_miss(self, mock_scrapli, device, credentials):
+        """Вывод, полученный admin, не отдаётся запросу с другим паролем."""
+        mock_scrapli.return_value = _scrapli({"show version": "v1"})
+        manager = ConnectionManager(command_cache=CommandOutputCache())
+
+        for creds in (credentials, Credentials(username="admin", password="wrong")):
+            with manager.connect(device, creds) as conn:
+                assert conn.send_command("show version").result == "v1"
+
+        assert mock_scrapli.call_count == 2
+        assert mock_scrapli.call_args.kwargs["auth_password"] == "wrong"
+        assert credentials_identity(credentials) != credentials_identity(
+            Credentials(username="guest", password="admin")
+        )
+
+    @patch("network_collector.core.connection.Scrapli")
+    def test_failed_response_not_cached(self, mock_scrapli, device, credentials):
+        conn = MagicMock()
+        conn.send_command.return_value = MagicMock(result="% Invalid input", failed=True)
+        mock_scrapli.return_value = conn
+        cache = CommandOutputCache()
+
+        with ConnectionManager(command_cache=cache).connect(device, credentials) as cached:
+            cached.send_command("show foo")
+
+        assert len(cache) == 0
+
+    @patch("network_collector.core.connection.Scrapli")
+    def test_open_error_raised_once(self, mock_scrapli, device, credentials):
+        mock_scrapli.return_value.open.side_effect = ScrapliConnectionError("refused")
+        manager = ConnectionManager(command_cache=CommandOutputCache(), max_retries=0)
+
+        with manager.connect(device, credentials) as conn:
+            for command in ("a", "b"):
+                with pytest.raises(CollectorConnectionError):
+                    conn.send_command(command)
+
+        assert mock_scrapli.call_count == 1
+
+    @patch("network_collector.core.connection.Scrapli")
+    def test_without_cache_unchanged(self, mock_scrapli, device, credentials):
+        mock_scrapli.return_value = MagicMock()
+
+        with ConnectionManager().connect(device, credentials) as conn:
+            assert conn is mock_scrapli.return_value
@@ -17,6 +17,7 @@ from network_collector.core.constants import (
     normalize_mac,
     normalize_interface_short,
     normalize_interface_full,
+    get_interface_aliases,
     slugify,
 )
 
@@ -202,11 +203,28 @@ class TestNormalizeInterfaceFull:
         ("Lo0", "Loopback0"),
         # Полные — без изменений
         ("GigabitEthernet0/1", "GigabitEthernet0/1"),
+        ("HundredGigE0/55", "HundredGigE0/55"),
+        ("Eth1/1", "Ethernet1/1"),  # Eth, а не Et + "h1/1"
+        ("TFGigabitEthernet 0/48", "TFGigabitEthernet0/48"),
     ])
     def test_expands_interface(self, interface: str, expected: str):
         assert normalize_interface_full(interface) == expected
 
 
+class TestInterfaceAliasesCache:
+    """get_interface_aliases: результат кэшируется, но отдаётся копией."""
+
+    def test_aliases(self):
+        assert sorted(get_interface_aliases("Te1/0/1")) == [
+            "Te1/0/1", "Ten1/0/1", "TenGigabitEthernet1/0/1",
+        ]
+
+    def test_returned_list_is_copy(self):
+        aliases = get_interface_aliases("Gi0/1")
+        aliases.append("garbage")
+        assert "garbage" not in get_interface_aliases("Gi0/1")
+
+
 # =============================================================================
 # SLUGIFY TESTS
 # =============================================================================
@@ -402,6 +402,57 @@ class TestLLDPNormalizerMerge:
         # MAC из LLDP дополняет
         assert result[0]["remote_mac"] == "aa:bb:cc:dd:ee:ff"
 
+    def test_merge_lldp_without_local_interface_and_cdp(self):
+        """LLDP без local_interface и без CDP соответствия — добавляется как есть."""
+        lldp_data = [
+            {"local_interface": "", "remote_hostname": "ap-01", "remote_mac": "aa:bb:cc:dd:ee:01"},
+            {"local_interface": "", "remote_hostname": "[MAC:aa:bb:cc:dd:ee:02]"},
+        ]
+        cdp_data = [
+            {"local_interface": "Gi0/1", "remote_hostname": "switch2", "remote_port": "Gi0/2"},
+        ]
+
+        result = self.normalizer.merge_lldp_cdp(lldp_data, cdp_data)
+
+        assert len(result) == 3
+        assert [r["remote_hostname"] for r in result[1:]] == [
+            "ap-01", "[MAC:aa:bb:cc:dd:ee:02]",
+        ]
+        assert all(r["local_interface"] == "" for r in result[1:])
+        assert all(r["protocol"] == "BOTH" for r in result)
+
+    def test_merge_lldp_without_local_interface_matching_cdp(self):
+        """LLDP без local_interface с hostname из CDP — сосед не задваивается."""
+        lldp_data = [
+            {"local_interface": "", "remote_hostname": "sw2.corp.ru",
+             "remote_mac": "aa:bb:cc:dd:ee:02"},
+        ]
+        cdp_data = [
+            {"local_interface": "Gi0/1", "remote_hostname": "SW2", "remote_port": "Gi0/2"},
+        ]
+
+        result = self.normalizer.merge_lldp_cdp(lldp_data, cdp_data)
+
+        assert len(result) == 1
+        assert result[0]["remote_hostname"] == "SW2"
+        assert result[0]["local_interface"] == "Gi0/1"
+        assert result[0]["protocol"] == "BOTH"
+
+    def test_deduplicate_hostname_with_domain(self):
+        """Дедупликация: hostname сравнивается без домена и регистра."""
+        data = [
+            {"local_interface": "Te1/1/1", "remote_hostname": "Core-01.corp.ru",
+             "remote_port": "", "remote_mac": "aa:bb:cc:dd:ee:ff"},
+            {"local_interface": "TenGigabitEthernet1/1/1", "remote_hostname": "core-01",
+             "remote_port": "Te1/0/1", "remote_mac": ""},
+        ]
+
+        result = self.normalizer._deduplicate_neighbors(data)
+
+        assert len(result) == 1
+        assert result[0]["remote_port"] == "Te1/0/1"
+        assert result[0]["remote_mac"] == "aa:bb:cc:dd:ee:ff"
+
 
 @pytest.mark.unit
 class TestLLDPNormalizerFilter:
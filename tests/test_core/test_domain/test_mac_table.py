@@ -0,0 +1,149 @@
+"""
+Tests for ColumnarMACTable.
+
+Проверяет колоночную MAC-таблицу:
+- Построение из normalize_dicts и обратную конвертацию
+- Поиск MAC по индексу
+- Фильтрацию, дедупликацию и trunk фильтр (как у MACNormalizer)
+- Группировку и сопоставление со справочником
+"""
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from network_collector.core.domain import MACNormalizer
+from network_collector.core.domain.mac_table import ColumnarMACTable
+
+
+def _fleet_rows():
+    """MAC-таблица двух устройств после normalize_dicts."""
+    normalizer = MACNormalizer(mac_format="ieee")
+    raw = [
+        {"mac": "0011.2233.4455", "interface": "Gi0/1", "vlan": "10", "type": "DYNAMIC"},
+        {"mac": "0011.2233.4466", "interface": "Gi0/2", "vlan": "10", "type": "DYNAMIC"},
+        {"mac": "0011.2233.4477", "interface": "Gi0/48", "vlan": "20", "type": "DYNAMIC"},
+        {"mac": "0011.2233.4488", "interface": "Gi0/3", "vlan": "20", "type": "STATIC"},
+    ]
+    status = {"Gi0/1": "connected", "Gi0/2": "notconnect"}
+    rows = normalizer.normalize_dicts(raw, status, hostname="sw1", device_ip="10.0.0.1")
+    rows += normalizer.normalize_dicts(raw[:2], status, hostname="sw2", device_ip="10.0.0.2")
+    return rows
+
+
+@pytest.mark.unit
+class TestMACTableBuild:
+    """Построение и обратная конвертация."""
+
+    def test_roundtrip(self):
+        rows = _fleet_rows()
+        table = ColumnarMACTable.from_dicts(rows)
+
+        assert len(table) == 6
+        assert table.macs.dtype.name == "uint64"
+        assert table.to_dicts() == rows
+
+    def test_categories_shared(self):
+        table = ColumnarMACTable.from_dicts(_fleet_rows())
+        codes, categories = table.columns["hostname"]
+
+        assert categories == ("sw1", "sw2")
+        assert codes.tolist() == [0, 0, 0, 0, 1, 1]
+
+    def test_mac_format_on_output(self):
+        table = ColumnarMACTable.from_dicts([{"mac": "00:11:22:33:44:55"}], mac_format="cisco")
+
+        assert table.to_dicts() == [{"mac": "0011.2233.4455"}]
+
+    def test_invalid_mac_kept(self):
+        rows = [{"mac": "bad", "vlan": "1"}, {"vlan": "2"}]
+        table = ColumnarMACTable.from_dicts(rows)
+
+        assert table.to_dicts() == rows
+        assert table.find("bad") == [{"mac": "bad", "vlan": "1"}]
+
+    def test_empty(self):
+        table = ColumnarMACTable.from_dicts([])
+
+        assert len(table) == 0
+        assert table.deduplicate().to_dicts() == []
+        assert table.count_by("vlan") == {}
+
+
+@pytest.mark.unit
+class TestMACTableOperations:
+    """Поиск, фильтрация, дедупликация."""
+
+    def setup_method(self):
+        self.rows = _fleet_rows()
+        self.table = ColumnarMACTable.from_dicts(self.rows)
+
+    def test_find_any_format(self):
+        found = self.table.find("0011.2233.4455")
+
+        assert [r["hostname"] for r in found] == ["sw1", "sw2"]
+        assert self.table.find("ff:ff:ff:ff:ff:ff") == []
+
+    def test_filter(self):
+        result = self.table.filter(hostname="sw1", vlan=["20"])
+
+        assert [r["interface"] for r in result.to_dicts()] == ["Gi0/48", "Gi0/3"]
+        assert len(self.table.filter(unknown="x")) == 0
+
+    def test_filter_by_mac(self):
+        result = self.table.filter(mac={"00-11-22-33-44-66"})
+
+        assert len(result) == 2
+
+    def test_filter_trunk_ports_matches_normalizer(self):
+        trunk = {"Gi0/48"}
+        expected = MACNormalizer().filter_trunk_ports(self.rows, trunk)
+
+        assert self.table.filter_trunk_ports(trunk).to_dicts() == expected
+
+    def test_deduplicate_matches_normalizer(self):
+        rows = self.rows + [dict(self.rows[0]), dict(self.rows[5], vlan="30")]
+        rows.append({k: v for k, v in self.rows[1].items() if k != "hostname"})
+        rows.append(dict(rows[-1], hostname=""))
+        expected = MACNormalizer().deduplicate(rows)
+
+        assert ColumnarMACTable.from_dicts(rows).deduplicate().to_dicts() == expected
+
+    def test_count_by(self):
+        counts = self.table.count_by("hostname", "vlan")
+
+        assert counts == {("sw1", "10"): 2, ("sw1", "20"): 2, ("sw2", "10"): 2}
+        assert self.table.count_by("status") == {
+            ("online",): 2, ("offline",): 2, ("unknown",): 2,
+        }
+
+    def test_count_distinct_macs(self):
+        assert self.table.count_by("vlan", distinct_macs=True) == {("10",): 2, ("20",): 2}
+
+    def test_lookup(self):
+        names = self.table.lookup({"00:11:22:33:44:55": "PC-1", "0011.2233.4488": "PRN"})
+
+        assert names.tolist() == ["PC-1", "", "", "PRN", "PC-1", ""]
+
+    def test_to_frame(self):
+        pytest.importorskip("pandas")
+        frame = self.table.to_frame()
+
+        assert list(frame["mac"])[:1] == ["00:11:22:33:44:55"]
+        assert frame["hostname"].dtype.name == "category"
+        assert len(frame) == 6
+
+    def test_to_frame_none_values(self):
+        """None в колонке (vlan, description) — пропуск, а не категория."""
+        pd = pytest.importorskip("pandas")
+        rows = [
+            {"mac": "00:11:22:33:44:55", "vlan": None, "description": "pc"},
+            {"mac": "00:11:22:33:44:66", "vlan": "10", "description": None},
+            {"mac": "00:11:22:33:44:77", "vlan": "20"},
+        ]
+        frame = ColumnarMACTable.from_dicts(rows).to_frame()
+
+        assert list(frame["vlan"].cat.categories) == ["10", "20"]
+        assert frame["vlan"].isna().tolist() == [True, False, False]
+        assert frame["vlan"].tolist()[1:] == ["10", "20"]
+        assert pd.isna(frame["description"][1]) and pd.isna(frame["description"][2])
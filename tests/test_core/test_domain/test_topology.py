@@ -0,0 +1,217 @@
+"""
+Тесты графа топологии (core/domain/topology.py).
+
+Проверяет:
+- Линк A-B и B-A — одна запись, имена нормализуются (домен, short form)
+- Поиск по концам, по порту, смежность
+- Инкрементальное обновление по устройству
+- Экспорт JSON и GraphML
+- compare_cables с готовым графом
+"""
+
+import json
+import xml.etree.ElementTree as ET
+from unittest.mock import Mock
+
+import pytest
+
+from network_collector.core.domain import (
+    SyncComparator,
+    TopologyGraph,
+    get_cable_terminations,
+    link_key,
+)
+from network_collector.core.models import LLDPNeighbor
+
+GRAPHML = "{http://graphml.graphdrawing.org/xmlns}"
+
+
+def neighbor(hostname, local_interface, remote_hostname, remote_port, **extra):
+    return LLDPNeighbor(
+        hostname=hostname,
+        local_interface=local_interface,
+        remote_hostname=remote_hostname,
+        remote_port=remote_port,
+        **extra,
+    )
+
+
+def make_cable(a_device, a_intf, b_device, b_intf):
+    cable = Mock()
+    a = Mock(); a.device = Mock(); a.device.name = a_device; a.name = a_intf
+    b = Mock(); b.device = Mock(); b.device.name = b_device; b.name = b_intf
+    cable.a_terminations = [a]
+    cable.b_terminations = [b]
+    return cable
+
+
+@pytest.mark.unit
+class TestTopologyGraphBuild:
+    """Построение графа и поиск."""
+
+    def test_bidirectional_link_deduplicated(self):
+        """sw1 видит sw2 и sw2 видит sw1 — один линк с двумя источниками."""
+        graph = TopologyGraph.from_neighbors([
+            neighbor("sw1", "GigabitEthernet0/1", "sw2.corp.ru", "Gi0/2"),
+            {"hostname": "sw2", "local_interface": "Gi0/2",
+             "remote_hostname": "sw1", "remote_port": "Gi0/1"},
+        ])
+
+        assert len(graph) == 1
+        link = next(graph.links())
+        assert link.key == ("sw1:gi0/1", "sw2:gi0/2")
+        assert len(link.reporters) == 2
+        assert graph.devices() == ["sw1", "sw2"]
+
+    def test_hostname_case_preserved(self):
+        """Регистр hostname не меняется — как в ключах кабелей NetBox sync."""
+        graph = TopologyGraph.from_neighbors([
+            neighbor("sw1", "Gi0/1", "sw2", "Gi0/2"),
+            neighbor("sw2", "Gi0/2", "SW1", "Gi0/1"),
+        ])
+
+        assert len(graph) == 2
+
+    def test_find_link_any_order_and_form(self):
+        graph = TopologyGraph.from_neighbors([
+            neighbor("QSW-01", "HundredGigabitEthernet 0/51", "C9500-01", "Hu2/0/52"),
+        ])
+
+        assert graph.has_link("C9500-01.corp.ru", "HundredGigE2/0/52", "QSW-01", "Hu0/51")
+        assert not graph.has_link("QSW-01", "Hu0/52", "C9500-01", "Hu2/0/52")
+        assert link_key("C9500-01", "HundredGigE2/0/52", "QSW-01", "Hu0/51") in graph
+
+    def test_incomplete_rows_skipped(self):
+        graph = TopologyGraph()
+
+        assert graph.add(neighbor("sw1", "Gi0/1", "", "")) is None
+        assert graph.add(neighbor("", "Gi0/1", "sw2", "Gi0/1")) is None
+        assert len(graph) == 0
+        assert graph.devices() == []
+
+    def test_links_at_port_and_neighbors(self):
+        """Порт с несколькими соседями (хаб) и смежность устройств."""
+        graph = TopologyGraph.from_neighbors([
+            neighbor("sw1", "Gi0/1", "ap-1", "eth0"),
+            neighbor("sw1", "Gi0/1", "ap-2", "eth0"),
+            neighbor("sw1", "Te1/1/1", "core", "Te1/0/1"),
+        ])
+
+        assert [link.key[1] for link in graph.links_at("sw1", "GigabitEthernet0/1")] == [
+            "sw1:gi0/1", "sw1:gi0/1",
+        ]
+        assert graph.links_at("sw1", "Gi0/9") == []
+        assert graph.links_at("unknown", "Gi0/1") == []
+        assert sorted(graph.neighbors("sw1")) == ["ap-1", "ap-2", "core"]
+        assert graph.neighbors("core") == ["sw1"]
+
+
+@pytest.mark.unit
+class TestTopologyGraphUpdate:
+    """Инкрементальное обновление по результатам сбора с устройства."""
+
+    def test_update_device_replaces_own_links(self):
+        graph = TopologyGraph.from_neighbors([
+            neighbor("sw1", "Gi0/1", "sw2", "Gi0/1"),
+            neighbor("sw1", "Gi0/2", "sw3", "Gi0/1"),
+        ])
+
+        graph.update_device("sw1", [neighbor("sw1", "Gi0/2", "sw3", "Gi0/1")])
+
+        assert not graph.has_link("sw1", "Gi0/1", "sw2", "Gi0/1")
+        assert graph.has_link("sw1", "Gi0/2", "sw3", "Gi0/1")
+        assert graph.neighbors("sw1") == ["sw3"]
+        assert graph.neighbors("sw2") == []
+        # sw2 больше ни с кем не связан и сам соседей не сообщал
+        assert graph.devices() == ["sw1", "sw3"]
+
+    def test_link_kept_while_other_side_sees_it(self):
+        graph = TopologyGraph.from_neighbors([
+            neighbor("sw1", "Gi0/1", "sw2", "Gi0/1"),
+            neighbor("sw2", "Gi0/1", "sw1", "Gi0/1"),
+        ])
+
+        graph.update_device("sw1", [])
+        assert graph.has_link("sw1", "Gi0/1", "sw2", "Gi0/1")
+
+        graph.remove_device("sw2")
+        assert len(graph) == 0
+
+    def test_relinked_port_gets_new_id(self):
+        graph = TopologyGraph()
+        first = graph.add(neighbor("sw1", "Gi0/1", "sw2", "Gi0/1"))
+        graph.update_device("sw1", [neighbor("sw1", "Gi0/1", "sw2", "Gi0/1")])
+
+        link = graph.find_link("sw1", "Gi0/1", "sw2", "Gi0/1")
+        assert link.id != first.id
+        assert [item.id for item in graph.links()] == [link.id]
+
+
+@pytest.mark.unit
+class TestTopologyGraphExport:
+    """Экспорт для topology views."""
+
+    @pytest.fixture
+    def graph(self):
+        return TopologyGraph.from_neighbors([
+            neighbor("sw1", "GigabitEthernet0/1", "core.corp.ru", "TenGigabitEthernet1/0/1",
+                     device_ip="10.0.0.1", remote_ip="10.0.0.254",
+                     remote_platform="C9500", protocol="cdp"),
+            neighbor("core", "Te1/0/1", "sw1", "Gi0/1", device_ip="10.0.0.254"),
+        ])
+
+    def test_to_dict(self, graph):
+        data = graph.to_dict()
+
+        assert data["nodes"] == [
+            {"id": 0, "name": "sw1", "ip": "10.0.0.1"},
+            {"id": 1, "name": "core", "ip": "10.0.0.254", "platform": "C9500"},
+        ]
+        assert data["links"] == [{
+            "id": 0, "source": 1, "target": 0,
+            "source_port": "Te1/0/1", "target_port": "Gi0/1", "protocol": "lldp",
+        }]
+        assert json.loads(graph.to_json()) == data
+
+    def test_to_graphml(self, graph):
+        root = ET.fromstring(graph.to_graphml())
+
+        nodes = root.findall(f"{GRAPHML}graph/{GRAPHML}node")
+        edges = root.findall(f"{GRAPHML}graph/{GRAPHML}edge")
+        assert [node.get("id") for node in nodes] == ["n0", "n1"]
+        assert len(edges) == 1
+        assert (edges[0].get("source"), edges[0].get("target")) == ("n1", "n0")
+        ports = {data.get("key"): data.text for data in edges[0]}
+        assert ports["source_port"] == "Te1/0/1"
+        assert ports["target_port"] == "Gi0/1"
+
+
+@pytest.mark.unit
+class TestTopologyCables:
+    """Сравнение с кабелями NetBox."""
+
+    def test_get_cable_terminations(self):
+        cable = make_cable("sw2", "GigabitEthernet0/2", "sw1", "GigabitEthernet0/1")
+
+        assert get_cable_terminations(cable) == (
+            ("sw2", "GigabitEthernet0/2"), ("sw1", "GigabitEthernet0/1"),
+        )
+        assert get_cable_terminations(Mock(a_terminations=[], b_terminations=[])) is None
+
+    def test_compare_cables_accepts_graph(self):
+        graph = TopologyGraph.from_neighbors([
+            neighbor("sw1", "Gi0/1", "sw2", "Gi0/2"),
+            neighbor("sw2", "Gi0/2", "sw1", "Gi0/1"),
+            neighbor("sw1", "Gi0/3", "sw3", "Gi0/1"),
+        ])
+        remote = [
+            make_cable("sw2", "GigabitEthernet0/2", "sw1", "GigabitEthernet0/1"),
+            make_cable("sw1", "GigabitEthernet0/9", "sw3", "GigabitEthernet0/9"),
+        ]
+
+        diff = SyncComparator().compare_cables(local=graph, remote=remote, cleanup=True)
+
+        assert [item.name for item in diff.to_skip] == ["sw1:gi0/1 <-> sw2:gi0/2"]
+        assert [item.name for item in diff.to_create] == ["sw1:gi0/3 <-> sw3:gi0/1"]
+        assert diff.to_create[0].local_data["hostname"] == "sw1"
+        assert [item.name for item in diff.to_delete] == ["sw1:gi0/9 <-> sw3:gi0/9"]
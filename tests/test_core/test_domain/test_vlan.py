@@ -4,6 +4,7 @@ Tests for VLAN domain logic.
 Проверяет:
 - Парсинг диапазонов VLAN
 - VlanSet операции (сравнение, разница)
+- Битовые маски VID и VlanIndex
 """
 
 import pytest
@@ -12,6 +13,9 @@ from network_collector.core.domain.vlan import (
     parse_vlan_range,
     is_full_vlan_range,
     VlanSet,
+    VlanIndex,
+    vids_to_mask,
+    mask_to_vids,
     FULL_VLAN_RANGES,
 )
 
@@ -296,3 +300,57 @@ class TestVlanSetUseCases:
 
         # Нужно добавить 151-179
         assert local.added(remote) == set(range(151, 180))
+
+
+class _VLAN:
+    def __init__(self, id, vid, name=""):
+        self.id, self.vid, self.name = id, vid, name
+
+
+@pytest.mark.unit
+class TestVlanMask:
+    """Битовые маски VID."""
+
+    def test_roundtrip(self):
+        vids = [1, 7, 8, 100, 4094]
+
+        assert mask_to_vids(vids_to_mask(vids)) == vids
+
+    def test_full_trunk(self):
+        vids = parse_vlan_range("1-100,200-4094")
+
+        assert mask_to_vids(vids_to_mask(vids)) == vids
+
+    def test_out_of_range_ignored(self):
+        assert vids_to_mask([-1, 5000]) == 0
+        assert mask_to_vids(0) == []
+
+
+@pytest.mark.unit
+class TestVlanIndex:
+    """Индекс VLAN сайта."""
+
+    def setup_method(self):
+        self.index = VlanIndex.from_vlans(
+            [_VLAN(100, 10, "Users"), _VLAN(200, 20, "Voice"), _VLAN(300, 30)],
+            site="Office",
+        )
+
+    def test_lookup(self):
+        assert self.index.get(10).name == "Users"
+        assert self.index.id_of(20) == 200
+        assert self.index.id_of(40) is None
+        assert self.index.names["Voice"] == 20
+        assert 30 in self.index and 40 not in self.index
+        assert len(self.index) == 3
+
+    def test_ids_for_mask(self):
+        target = vids_to_mask([10, 30, 40])
+
+        assert self.index.ids(target) == [100, 300]
+        assert mask_to_vids(target & ~self.index.mask) == [40]
+
+    def test_add(self):
+        self.index.add(_VLAN(400, 40))
+
+        assert self.index.ids(vids_to_mask([40])) == [400]
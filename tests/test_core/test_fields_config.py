@@ -217,6 +217,64 @@ class TestApplyFieldsConfig:
 
         assert result[0]["Hostname"] == "SWITCH1"
 
+    def test_heterogeneous_rows(self):
+        """Строки с разным набором ключей обрабатываются корректно."""
+        mock_config = {
+            "mac": {
+                "hostname": {"enabled": True, "name": "Device", "order": 1},
+                "vlan": {"enabled": True, "name": "VLAN", "order": 2, "default": "1"},
+            }
+        }
+        fields_config._config_cache = mock_config
+
+        data = [
+            {"hostname": "sw1", "vlan": "10"},
+            {"Hostname": "sw2"},
+            {"other": "x"},
+            {"hostname": "sw3", "vlan": ""},
+        ]
+        result = apply_fields_config(data, "mac")
+
+        assert result == [
+            {"Device": "sw1", "VLAN": "10"},
+            {"Device": "sw2", "VLAN": "1"},
+            {"VLAN": "1"},
+            {"Device": "sw3", "VLAN": "1"},
+        ]
+
+    def test_first_key_wins_on_case_conflict(self):
+        """При ключах, отличающихся регистром, берётся первый."""
+        fields_config._config_cache = {
+            "devices": {"hostname": {"enabled": True, "name": "Hostname", "order": 1}},
+        }
+
+        result = apply_fields_config([{"HostName": "a", "hostname": "b"}], "devices")
+
+        assert result == [{"Hostname": "a"}]
+
+    def test_projection_cached_until_config_changes(self):
+        """Проекция компилируется один раз и сбрасывается при смене конфига."""
+        fields_config._config_cache = {
+            "devices": {"hostname": {"enabled": True, "name": "Name", "order": 1}},
+        }
+        first = fields_config.get_field_projection("devices")
+        assert fields_config.get_field_projection("devices") is first
+
+        fields_config._config_cache = {
+            "devices": {"hostname": {"enabled": True, "name": "Host", "order": 1}},
+        }
+        result = apply_fields_config([{"hostname": "sw1"}], "devices")
+
+        assert fields_config.get_field_projection("devices") is not first
+        assert result == [{"Host": "sw1"}]
+
+    def test_reload_config_resets_projection(self):
+        """reload_config() сбрасывает кэш проекций."""
+        projection = fields_config.get_field_projection("mac")
+        reload_config()
+
+        assert fields_config.get_field_projection("mac") is not projection
+
 
 class TestGetColumnOrder:
     """Тесты get_column_order."""
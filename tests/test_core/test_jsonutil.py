@@ -0,0 +1,55 @@
+"""
+Тесты JSON-обёртки core/jsonutil.py.
+
+Проверяет: одинаковый результат с orjson и без него (fallback на json),
+не-ASCII без экранирования, default=str, нестроковые ключи, перевод строки.
+"""
+
+import json
+from datetime import date
+
+import pytest
+from unittest.mock import patch
+
+from network_collector.core import jsonutil
+
+
+@pytest.fixture(params=[True, False], ids=["orjson", "json"])
+def backend(request):
+    """Оба режима: orjson (если установлен) и стандартный json."""
+    if request.param and not jsonutil.ORJSON_AVAILABLE:
+        pytest.skip("orjson не установлен")
+    with patch.object(jsonutil, "ORJSON_AVAILABLE", request.param):
+        yield request.param
+
+
+class TestDumps:
+    """jsonutil.dumps."""
+
+    def test_non_ascii_default_and_keys(self, backend):
+        data = {"описание": "порт", 1: date(2025, 1, 2)}
+
+        result = jsonutil.dumps(data)
+
+        assert isinstance(result, bytes)
+        assert "порт".encode("utf-8") in result
+        assert json.loads(result) == {"описание": "порт", "1": "2025-01-02"}
+
+    def test_newline(self, backend):
+        assert jsonutil.dumps({"a": 1}, newline=True).endswith(b"\n")
+        assert not jsonutil.dumps({"a": 1}).endswith(b"\n")
+
+    def test_big_int_falls_back_to_json(self, backend):
+        assert json.loads(jsonutil.dumps({"counter": 2**70})) == {"counter": 2**70}
+
+
+class TestLoads:
+    """jsonutil.loads."""
+
+    def test_str_and_bytes(self, backend):
+        assert jsonutil.loads('{"a": [1, "б"]}') == {"a": [1, "б"]}
+        assert jsonutil.loads(b'{"a": null}') == {"a": None}
+
+    def test_invalid_raises_value_error(self, backend):
+        with pytest.raises(ValueError):
+            jsonutil.loads("{not json")
@@ -33,6 +33,7 @@ from network_collector.core.logging import (
     LogLevel,
     LogConfig,
     RotationType,
+    stop_queue_logging,
 )
 
 
@@ -663,6 +664,7 @@ class TestLogConfig:
         assert config.backup_count == 5
         assert config.when == "midnight"
         assert config.interval == 1
+        assert config.queue is False
 
     def test_from_dict_basic(self):
         """Создание из словаря."""
@@ -821,3 +823,95 @@ class TestFileLogging:
         assert log_file.exists()
         content = log_file.read_text()
         assert "Test" in content
+
+
+class TestQueueLogging:
+    """Запись логов в отдельном потоке (LogConfig.queue)."""
+
+    @pytest.fixture(autouse=True)
+    def _stop_listener(self):
+        yield
+        stop_queue_logging()
+        for handler in logging.getLogger().handlers[:]:
+            logging.getLogger().removeHandler(handler)
+
+    def test_from_dict(self):
+        """queue/queue_size из config.yaml."""
+        config = LogConfig.from_dict({"queue": True, "queue_size": 100})
+
+        assert config.queue is True
+        assert config.queue_size == 100
+
+    def test_writes_in_listener_thread(self, tmp_path):
+        """Root logger получает только QueueHandler, файл пишет listener."""
+        import threading
+
+        log_file = tmp_path / "app.log"
+        setup_logging_from_config(LogConfig(
+            json_format=True, console=False, file_path=str(log_file), queue=True,
+        ))
+
+        root_handlers = logging.getLogger().handlers
+        assert len(root_handlers) == 1
+        assert isinstance(root_handlers[0], logging.handlers.QueueHandler)
+
+        threads = [
+            threading.Thread(target=lambda i=i: logging.info("Device %d", i))
+            for i in range(20)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        stop_queue_logging()
+
+        messages = {json.loads(line)["message"] for line in log_file.read_text().splitlines()}
+        assert messages == {f"Device {i}" for i in range(20)}
+
+    def test_args_frozen_and_exception_kept(self, tmp_path):
+        """Сообщение фиксируется при вызове, traceback доходит до форматтера."""
+        log_file = tmp_path / "app.log"
+        setup_logging_from_config(LogConfig(
+            json_format=True, console=False, file_path=str(log_file), queue=True,
+        ))
+
+        items = ["a"]
+        logging.info("Items: %s", items)
+        items.append("b")
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logging.exception("Failed")
+        stop_queue_logging()
+
+        lines = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert lines[0]["message"] == "Items: ['a']"
+        assert "ValueError: boom" in lines[1]["exception"]
+
+    def test_handler_filters_run_in_listener(self):
+        """RunContextFilter на целевом handler по-прежнему добавляет run_id."""
+        from network_collector.core.context import (
+            RunContext,
+            RunContextFilter,
+            set_current_context,
+        )
+        from network_collector.core.logging import _start_queue_logging
+
+        stream = StringIO()
+        target = logging.StreamHandler(stream)
+        target.setFormatter(JSONFormatter())
+        target.addFilter(RunContextFilter())
+
+        ctx = RunContext.create(command="test")
+        set_current_context(ctx)
+        try:
+            logging.getLogger().addHandler(_start_queue_logging([target], logging.INFO, 0))
+            logging.getLogger().setLevel(logging.INFO)
+            logging.getLogger("queue.test").info("Collected")
+            stop_queue_logging()
+        finally:
+            set_current_context(None)
+
+        data = json.loads(stream.getvalue())
+        assert data["run_id"] == ctx.run_id
+        assert data["message"] == f"[{ctx.run_id}] Collected"
@@ -516,3 +516,38 @@ class TestEdgeCases:
         intf = Interface.from_dict(data)
         assert intf.vlan == "100"
         assert isinstance(intf.vlan, str)
+
+
+class TestCompactModels:
+    """Слотовые модели для больших таблиц (MAC, интерфейсы, LLDP)."""
+
+    @pytest.mark.parametrize("cls", [Interface, MACEntry, LLDPNeighbor])
+    def test_no_instance_dict(self, cls):
+        obj = cls.from_dict({})
+        assert not hasattr(obj, "__dict__")
+        with pytest.raises(AttributeError):
+            obj.unknown_field = 1
+
+    @pytest.mark.parametrize("cls", [MACEntry, LLDPNeighbor])
+    def test_to_dict_matches_asdict(self, cls):
+        from dataclasses import asdict
+
+        obj = cls.from_dict({"hostname": "sw1", "interface": "Gi0/1", "vlan": 10})
+        assert obj.to_dict() == asdict(obj)
+        assert list(obj.to_dict()) == list(asdict(obj))
+
+    def test_interface_to_dict_key_order(self):
+        intf = Interface.from_dict({"interface": "Gi0/1", "status": "up", "mtu": 1500})
+        assert list(intf.to_dict()) == ["name", "status", "mtu", "description", "mode"]
+
+    def test_repeated_strings_interned(self):
+        rows = [
+            {"mac": f"00:11:22:33:44:{i:02x}", "interface": "".join(["Gi0/", "1"]),
+             "vlan": 10, "hostname": "".join(["sw", "1"])}
+            for i in range(3)
+        ]
+        entries = [MACEntry.from_dict(r) for r in rows]
+
+        assert entries[0].hostname is entries[2].hostname
+        assert entries[0].interface is entries[1].interface
+        assert entries[0].vlan is entries[1].vlan
@@ -10,6 +10,7 @@ E2E тесты для InterfaceCollector.
 
 import pytest
 from typing import List, Dict
+from unittest.mock import MagicMock
 
 from network_collector.collectors.interfaces import InterfaceCollector
 from network_collector.core.models import Interface
@@ -243,3 +244,79 @@ class TestInterfaceCollectorNormalization:
 
         names = [m.name for m in models if m.name]
         assert len(names) > 0, "Должны быть имена интерфейсов"
+
+
+class TestInterfaceCollectorBatch:
+    """Основная и вторичные команды — одним пакетом send_commands."""
+
+    @staticmethod
+    def _conn(outputs):
+        conn = MagicMock()
+        conn.send_command.side_effect = lambda cmd: MagicMock(result=outputs[cmd])
+        conn.send_commands.side_effect = lambda cmds: [MagicMock(result=outputs[c]) for c in cmds]
+        return conn
+
+    def test_single_batch_for_supported_platform(self):
+        collector = InterfaceCollector(credentials=None)
+        conn = self._conn({
+            "show interfaces": "main",
+            "show etherchannel summary": "lag",
+            "show interfaces switchport": "switchport",
+        })
+
+        outputs = collector._fetch_outputs(conn, create_mock_device("cisco_ios"))
+
+        assert outputs == {"main": "main", "lag": "lag", "switchport": "switchport"}
+        conn.send_commands.assert_called_once()
+        conn.send_command.assert_not_called()
+
+    def test_batch_error_falls_back_to_single_commands(self):
+        collector = InterfaceCollector(credentials=None, collect_lag_info=False)
+        conn = self._conn({"show interface": "main", "show interface switchport": "sw"})
+        conn.send_commands.side_effect = RuntimeError("channel")
+
+        outputs = collector._fetch_outputs(conn, create_mock_device("cisco_nxos"))
+
+        assert outputs["main"] == "main"
+        assert outputs["switchport"] == "sw"
+
+    def test_short_batch_resends_only_missing(self):
+        """Пакет оборвался на второй команде — первая не отправляется повторно."""
+        collector = InterfaceCollector(credentials=None)
+        outputs = {
+            "show interfaces": "main",
+            "show etherchannel summary": "lag",
+            "show interfaces switchport": "switchport",
+        }
+        conn = self._conn(outputs)
+        conn.send_commands.side_effect = lambda cmds: [MagicMock(result=outputs[cmds[0]])]
+
+        result = collector._fetch_outputs(conn, create_mock_device("cisco_ios"))
+
+        assert result == {"main": "main", "lag": "lag", "switchport": "switchport"}
+        assert [c.args[0] for c in conn.send_command.call_args_list] == [
+            "show etherchannel summary", "show interfaces switchport",
+        ]
+
+    def test_failed_response_not_resent(self):
+        collector = InterfaceCollector(credentials=None, collect_lag_info=False)
+        conn = self._conn({})
+        conn.send_commands.side_effect = lambda cmds: [
+            MagicMock(result="main", failed=False),
+            MagicMock(result="% Invalid input", failed=True),
+        ]
+
+        result = collector._fetch_outputs(conn, create_mock_device("cisco_ios"))
+
+        assert result == {"main": "main", "switchport": "% Invalid input"}
+        conn.send_command.assert_not_called()
+
+    def test_secondary_error_does_not_fail_collection(self):
+        collector = InterfaceCollector(credentials=None)
+        conn = MagicMock()
+        conn.send_command.side_effect = [MagicMock(result="main"), TimeoutError("lag")]
+
+        outputs = collector._fetch_outputs(conn, create_mock_device("juniper_junos"))
+
+        assert outputs == {"main": "main"}
+        conn.send_commands.assert_not_called()
@@ -281,6 +281,57 @@ class TestProgressCallback:
         assert len(progress_calls) == 2
 
 
+class TestIterCollect:
+    """Выдача данных по мере готовности устройств (для потокового API)."""
+
+    def _collector(self):
+        return InterfaceCollector(
+            credentials=None,
+            collect_lag_info=False,
+            collect_switchport=False,
+            collect_media_type=False,
+        )
+
+    def test_yields_per_device(self):
+        """Одна пачка строк на устройство, пустые и упавшие пропускаются."""
+        devices = [
+            create_mock_device("cisco_ios", "ios-1", "10.0.0.1"),
+            create_mock_device("cisco_ios", "ios-2", "10.0.0.2"),
+            create_mock_device("cisco_ios", "ios-3", "10.0.0.3"),
+        ]
+
+        def fake_collect(device):
+            if device.host == "10.0.0.2":
+                raise ConnectionError(f"Fail: {device.host}")
+            if device.host == "10.0.0.3":
+                return []
+            return [{"interface": "Gi0/1", "device_ip": device.host}] * 2
+
+        collector = self._collector()
+        with patch.object(collector, '_collect_from_device', side_effect=fake_collect):
+            batches = list(collector.iter_collect(devices))
+
+        assert batches == [[{"interface": "Gi0/1", "device_ip": "10.0.0.1"}] * 2]
+
+    def test_early_close_cancels_pending(self):
+        """Остановка генератора отменяет ещё не начатые опросы."""
+        devices = [create_mock_device("cisco_ios", f"ios-{i}", f"10.0.0.{i}") for i in range(1, 11)]
+        collected = []
+
+        def fake_collect(device):
+            collected.append(device.host)
+            return [{"interface": "Gi0/1", "device_ip": device.host}]
+
+        collector = self._collector()
+        collector.max_workers = 1
+        with patch.object(collector, '_collect_from_device', side_effect=fake_collect):
+            batches = collector.iter_collect(devices)
+            next(batches)
+            batches.close()
+
+        assert len(collected) < len(devices)
+
+
 # =============================================================================
 # Inventory Multi-Device Collection
 # =============================================================================
@@ -0,0 +1,159 @@
+"""
+E2E тесты шардированного сбора (parse_workers > 0).
+
+Проверяет:
+- Упаковку строк в компактные пачки и обратно
+- Совпадение результата пула процессов с обычным сбором
+- Ошибки подключения на I/O стадии
+- Fallback для коллекторов со своим _collect_from_device
+
+Без реального SSH — мокаем ConnectionManager, парсинг идёт в настоящих процессах.
+"""
+
+from contextlib import contextmanager
+from unittest.mock import MagicMock, patch
+
+from network_collector.collectors.base import pack_rows, unpack_rows
+from network_collector.collectors.interfaces import InterfaceCollector
+from network_collector.collectors.lldp import LLDPCollector
+from network_collector.collectors.mac import MACCollector
+from network_collector.core.device import Device, DeviceStatus
+from network_collector.core.exceptions import ConnectionError
+
+
+# Вывод команд cisco_ios по fixtures
+COMMAND_FIXTURES = {
+    "show mac address-table": "show_mac_address_table.txt",
+    "show interfaces status": "show_interface_status.txt",
+    "show interfaces": "show_interfaces.txt",
+    "show interfaces switchport": "show_interfaces_switchport.txt",
+    "show etherchannel summary": "show_etherchannel_summary.txt",
+}
+
+
+def _patch_connections(collector, load_fixture, failing_hosts=()):
+    """Подменяет подключение: send_command отдаёт fixtures cisco_ios."""
+
+    def send_command(command):
+        filename = COMMAND_FIXTURES.get(command)
+        return MagicMock(result=load_fixture("cisco_ios", filename) if filename else "")
+
+    @contextmanager
+    def connect(device, credentials):
+        if device.host in failing_hosts:
+            raise ConnectionError(f"{device.host} недоступен")
+        yield MagicMock(
+            send_command=MagicMock(side_effect=send_command),
+            send_commands=MagicMock(side_effect=lambda cmds: [send_command(c) for c in cmds]),
+        )
+
+    collector._conn_manager.connect = connect
+    collector._conn_manager.get_hostname = lambda conn: "switch"
+
+
+def _devices(count=3):
+    return [Device(host=f"10.0.0.{i}", platform="cisco_ios") for i in range(1, count + 1)]
+
+
+def _sorted(rows):
+    return sorted(rows, key=lambda r: sorted((k, str(v)) for k, v in r.items()))
+
+
+class TestRowBatch:
+    """Компактные пачки строк между процессами."""
+
+    def test_roundtrip_keeps_order_and_shapes(self):
+        rows = [
+            {"mac": "a", "vlan": "1"},
+            {"mac": "b", "vlan": "2"},
+            {"interface": "Gi0/1", "mac": "c"},
+            {},
+        ]
+        shapes, packed = pack_rows(rows)
+
+        assert shapes == [("mac", "vlan"), ("interface", "mac"), ()]
+        assert unpack_rows((shapes, packed)) == rows
+
+
+class TestShardedCollection:
+    """Парсинг в ProcessPoolExecutor даёт тот же результат, что и в потоках."""
+
+    def test_mac_same_as_threaded(self, load_fixture):
+        threaded = MACCollector(credentials=None, collect_trunk_ports=True)
+        _patch_connections(threaded, load_fixture)
+        expected = threaded.collect_dicts(_devices())
+
+        sharded = MACCollector(credentials=None, collect_trunk_ports=True, parse_workers=2)
+        _patch_connections(sharded, load_fixture)
+        with patch.object(sharded, "_collect_parallel", side_effect=AssertionError):
+            result = sharded.collect_dicts(_devices())
+
+        assert expected
+        assert _sorted(result) == _sorted(expected)
+
+    def test_interfaces_same_as_threaded(self, load_fixture):
+        threaded = InterfaceCollector(credentials=None, collect_media_type=False)
+        _patch_connections(threaded, load_fixture)
+        expected = threaded.collect_dicts(_devices(2))
+
+        sharded = InterfaceCollector(
+            credentials=None, collect_media_type=False, parse_workers=2
+        )
+        _patch_connections(sharded, load_fixture)
+        result = sharded.collect_dicts(_devices(2))
+
+        assert expected
+        assert _sorted(result) == _sorted(expected)
+
+    def test_connection_error_marks_device(self, load_fixture):
+        collector = MACCollector(credentials=None, collect_trunk_ports=True, parse_workers=1)
+        _patch_connections(collector, load_fixture, failing_hosts={"10.0.0.2"})
+        devices = _devices()
+        progress = []
+
+        result = collector.collect_dicts(
+            devices, progress_callback=lambda i, total, host, ok: progress.append((host, ok))
+        )
+
+        assert {row["device_ip"] for row in result} == {"10.0.0.1", "10.0.0.3"}
+        assert devices[1].status == DeviceStatus.ERROR
+        assert sorted(progress) == [
+            ("10.0.0.1", True), ("10.0.0.2", False), ("10.0.0.3", True),
+        ]
+
+    def test_worker_logs_reach_parent(self, load_fixture, caplog):
+        """Лог процесса-парсера (spawn) выводится через handlers родителя."""
+        collector = InterfaceCollector(
+            credentials=None, collect_media_type=False, parse_workers=1
+        )
+        _patch_connections(collector, load_fixture)
+
+        with caplog.at_level("INFO"):
+            result = collector.collect_dicts(_devices(1))
+
+        assert result
+        worker_messages = [
+            r.getMessage() for r in caplog.records if r.processName != "MainProcess"
+        ]
+        assert f"switch: собрано {len(result)} интерфейсов" in worker_messages
+
+    def test_mac_process_outputs_keeps_state(self, load_fixture):
+        """_process_outputs (процесс-парсер) не меняет атрибуты коллектора."""
+        collector = MACCollector(credentials=None, collect_trunk_ports=True)
+        outputs = {
+            "mac": load_fixture("cisco_ios", "show_mac_address_table.txt"),
+            "status": load_fixture("cisco_ios", "show_interface_status.txt"),
+            "descriptions": "",
+        }
+        before = dict(vars(collector))
+
+        rows = collector._process_outputs(outputs, _devices(1)[0], "switch")
+
+        assert rows
+        assert vars(collector) == before
+
+    def test_custom_collect_from_device_not_sharded(self):
+        collector = LLDPCollector(credentials=None, parse_workers=2)
+
+        assert collector._supports_parse_pool() is False
+        assert MACCollector(credentials=None)._supports_parse_pool() is True
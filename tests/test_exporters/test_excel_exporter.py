@@ -299,3 +299,67 @@ class TestExcelExporterIntegration:
         assert ws.cell(row=2, column=count_col).value == 100
         assert ws.cell(row=2, column=price_col).value == 99.99
         wb.close()
+
+
+class TestExcelExporterStreaming:
+    """Tests для потокового режима (write_only книга)."""
+
+    @pytest.fixture
+    def mac_data(self):
+        """MAC данные со статусами и типами."""
+        return [
+            {"hostname": "switch-01", "mac": "00:11:22:33:44:55", "type": "sticky", "status": "online"},
+            {"hostname": "switch-01", "mac": "aa:bb:cc:dd:ee:ff", "type": "sticky", "status": "offline"},
+            {"hostname": "switch-02", "mac": "11:22:33:44:55:66", "type": "dynamic", "status": "online", "vlan": 10},
+        ]
+
+    def test_streaming_matches_regular_output(self, tmp_path, mac_data):
+        """Потоковый режим даёт те же значения, цвета и настройки листа."""
+        regular = ExcelExporter(output_folder=str(tmp_path), streaming=False)
+        streaming = ExcelExporter(output_folder=str(tmp_path), streaming=True)
+
+        ws_regular = load_workbook(regular.export(mac_data, "regular.xlsx")).active
+        ws_streaming = load_workbook(streaming.export(mac_data, "streaming.xlsx")).active
+
+        assert ws_streaming.title == "Data"
+        assert ws_streaming.freeze_panes == ws_regular.freeze_panes == "A2"
+        assert ws_streaming.auto_filter.ref == ws_regular.auto_filter.ref
+        for row_regular, row_streaming in zip(ws_regular.iter_rows(), ws_streaming.iter_rows()):
+            assert [c.value for c in row_regular] == [c.value for c in row_streaming]
+            assert [c.fill.fgColor.rgb for c in row_regular] == [
+                c.fill.fgColor.rgb for c in row_streaming
+            ]
+            assert [c.border.left.style for c in row_regular] == [
+                c.border.left.style for c in row_streaming
+            ]
+        for letter in "ABCDE":
+            assert (
+                ws_streaming.column_dimensions[letter].width
+                == ws_regular.column_dimensions[letter].width
+            )
+
+    def test_streaming_auto_by_threshold(self, tmp_path, monkeypatch, mac_data):
+        """streaming=None включает потоковый режим от порога строк."""
+        from network_collector.exporters import excel
+
+        monkeypatch.setattr(excel, "STREAMING_THRESHOLD", 2)
+        exporter = ExcelExporter(output_folder=str(tmp_path))
+        calls = []
+        monkeypatch.setattr(
+            exporter, "_write_streaming", lambda data, path: calls.append(len(data))
+        )
+
+        exporter._write(mac_data, tmp_path / "auto.xlsx")
+        exporter._write(mac_data[:1], tmp_path / "small.xlsx")
+
+        assert calls == [3]
+
+    def test_width_estimated_from_sample(self, tmp_path):
+        """Ширина колонок считается по выборке строк."""
+        data = [{"name": "x"} for _ in range(10)]
+        data[3] = {"name": "very long value that is not in the sample"}
+
+        exporter = ExcelExporter(output_folder=str(tmp_path), width_sample_size=2)
+        ws = load_workbook(exporter.export(data, "sample.xlsx")).active
+
+        assert ws.column_dimensions["A"].width == len("name") + 2
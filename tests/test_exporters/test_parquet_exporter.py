@@ -0,0 +1,91 @@
+"""
+Integration tests для Parquet/Feather экспортеров.
+
+Проверяет типы колонок, порядок из fields.yaml и запись группами строк.
+"""
+
+import pytest
+from unittest.mock import patch
+
+pa = pytest.importorskip("pyarrow")
+pq = pytest.importorskip("pyarrow.parquet")
+
+from network_collector.exporters import ParquetExporter, FeatherExporter
+
+
+@pytest.fixture
+def sample_data():
+    """Тестовые данные со смешанными типами."""
+    return [
+        {"hostname": "switch-01", "mac": "00:11:22:33:44:55", "vlan": 10,
+         "speed": 1.5, "enabled": True, "tags": ["a"]},
+        {"hostname": "switch-01", "mac": "aa:bb:cc:dd:ee:ff", "vlan": "",
+         "speed": 2, "enabled": False, "tags": []},
+        {"hostname": "switch-02", "mac": "11:22:33:44:55:66", "vlan": 30,
+         "speed": None, "enabled": True},
+    ]
+
+
+class TestParquetExporter:
+    """Tests для ParquetExporter."""
+
+    def test_file_created(self, tmp_path, sample_data):
+        exporter = ParquetExporter(output_folder=str(tmp_path))
+        result = exporter.export(sample_data, "test")
+
+        assert result is not None
+        assert result.suffix == ".parquet"
+        assert pq.read_table(result).num_rows == 3
+
+    def test_column_types(self, tmp_path, sample_data):
+        exporter = ParquetExporter(output_folder=str(tmp_path))
+        schema = pq.read_schema(exporter.export(sample_data, "test"))
+
+        assert schema.field("hostname").type == pa.string()
+        assert schema.field("vlan").type == pa.int64()
+        assert schema.field("speed").type == pa.float64()
+        assert schema.field("enabled").type == pa.bool_()
+        assert schema.field("tags").type == pa.string()
+
+    def test_empty_string_becomes_null_in_numeric(self, tmp_path, sample_data):
+        exporter = ParquetExporter(output_folder=str(tmp_path))
+        table = pq.read_table(exporter.export(sample_data, "test"))
+
+        assert table.column("vlan").to_pylist() == [10, None, 30]
+        assert table.column("tags").to_pylist() == ["['a']", "[]", None]
+
+    def test_row_groups(self, tmp_path, sample_data):
+        exporter = ParquetExporter(output_folder=str(tmp_path), row_group_size=2)
+        meta = pq.ParquetFile(exporter.export(sample_data, "test")).metadata
+
+        assert meta.num_row_groups == 2
+        assert meta.num_rows == 3
+
+    def test_column_order_from_fields_config(self, tmp_path, sample_data):
+        exporter = ParquetExporter(output_folder=str(tmp_path), data_type="mac")
+        with patch(
+            "network_collector.fields_config.get_column_order",
+            return_value=["vlan", "mac", "missing"],
+        ):
+            schema = pq.read_schema(exporter.export(sample_data, "test"))
+
+        assert schema.names[:3] == ["vlan", "mac", "hostname"]
+
+
+class TestFeatherExporter:
+    """Tests для FeatherExporter (Arrow IPC)."""
+
+    def test_roundtrip(self, tmp_path, sample_data):
+        exporter = FeatherExporter(output_folder=str(tmp_path), row_group_size=2)
+        result = exporter.export(sample_data, "test")
+
+        assert result.suffix == ".feather"
+        with pa.memory_map(str(result)) as source:
+            reader = pa.ipc.open_file(source)
+            assert reader.num_record_batches == 2
+            table = reader.read_all()
+
+        assert table.num_rows == 3
+        assert table.column("hostname").to_pylist() == [
+            "switch-01", "switch-01", "switch-02",
+        ]
@@ -6,6 +6,7 @@
 - Batch операции в sync (interfaces, inventory, ip_addresses)
 - Fallback на поштучные операции при ошибке batch
 - Dry-run режим с batch
+- Пакетный режим sync устройств (предзагрузка, bulk POST/PATCH)
 """
 
 import pytest
@@ -800,3 +801,248 @@ class TestInterfaceCache:
 
         result = sync._find_interface(100, "TenGigabitEthernet1/0/1")
         assert result is None
+
+
+# ==================== ТЕСТЫ POST-SYNC MAC ====================
+
+class TestPostSyncMacCheck:
+    """MAC пропущенных интерфейсов проверяется одним запросом, а не GET на каждый."""
+
+    @pytest.fixture
+    def mac_cfg(self):
+        cfg = MagicMock()
+        cfg.is_field_enabled.side_effect = lambda field: field == "mac_address"
+        cfg.get_option.side_effect = lambda key, default=None: default
+        return cfg
+
+    @staticmethod
+    def _skip_items(count):
+        from types import SimpleNamespace
+        return [
+            SimpleNamespace(name=f"Gi0/{i}", remote_data=SimpleNamespace(id=100 + i))
+            for i in range(count)
+        ]
+
+    @patch("network_collector.netbox.sync.interfaces.get_sync_config")
+    def test_unchanged_macs_single_prefetch(self, mock_sync_cfg, mac_cfg):
+        mock_sync_cfg.return_value = mac_cfg
+        interfaces = [
+            Interface(name=f"Gi0/{i}", mac=f"00:11:22:33:{i // 256:02x}:{i % 256:02x}")
+            for i in range(400)
+        ]
+        client = Mock()
+        client.get_interfaces_macs.return_value = {
+            100 + i: f"00:11:22:33:{i // 256:02X}:{i % 256:02X}" for i in range(400)
+        }
+        stats = {"updated": 0}
+        details = {"update": []}
+
+        sync = NetBoxSync(client)
+        assigned = sync._post_sync_mac_check(self._skip_items(400), interfaces, stats, details)
+
+        assert assigned == 0
+        client.get_interfaces_macs.assert_called_once()
+        assert len(client.get_interfaces_macs.call_args[0][0]) == 400
+        client.get_interface_mac.assert_not_called()
+        client.bulk_assign_macs.assert_not_called()
+
+    @patch("network_collector.netbox.sync.interfaces.get_sync_config")
+    def test_assigns_missing_and_changed(self, mock_sync_cfg, mac_cfg):
+        mock_sync_cfg.return_value = mac_cfg
+        interfaces = [
+            Interface(name="Gi0/0", mac="00:11:22:33:44:00"),
+            Interface(name="Gi0/1", mac="00:11:22:33:44:01"),
+            Interface(name="Gi0/2", mac=""),
+        ]
+        client = Mock()
+        client.get_interfaces_macs.return_value = {101: "AA:AA:AA:AA:AA:AA"}
+        client.bulk_assign_macs.return_value = 2
+        stats = {"updated": 0}
+        details = {"update": []}
+
+        sync = NetBoxSync(client)
+        assigned = sync._post_sync_mac_check(self._skip_items(3), interfaces, stats, details)
+
+        assert assigned == 2
+        # Интерфейс без локального MAC не запрашивается
+        assert client.get_interfaces_macs.call_args[0][0] == [100, 101]
+        client.bulk_assign_macs.assert_called_once_with([
+            (100, "00:11:22:33:44:00"), (101, "00:11:22:33:44:01"),
+        ])
+
+    def test_client_prefetch_chunks(self):
+        from types import SimpleNamespace
+        from network_collector.netbox.client.dcim import DCIMMixin
+
+        mixin = DCIMMixin()
+        mixin.api = Mock()
+        mixin.api.dcim.mac_addresses.filter.side_effect = lambda **kw: [
+            SimpleNamespace(assigned_object_id=i, mac_address=f"MAC-{i}")
+            for i in kw["assigned_object_id"]
+        ] + [SimpleNamespace(assigned_object_id=kw["assigned_object_id"][0], mac_address="SECOND")]
+
+        result = mixin.get_interfaces_macs([1, 2, 3, 2], chunk_size=2)
+
+        assert result == {1: "MAC-1", 2: "MAC-2", 3: "MAC-3"}
+        assert mixin.api.dcim.mac_addresses.filter.call_count == 2
+
+
+# ==================== BULK DEVICES ====================
+
+class TestBulkSyncDevices:
+    """Пакетный режим sync_devices_from_inventory."""
+
+    @staticmethod
+    def _nb_device(id, name, serial=""):
+        from network_collector.core.constants import normalize_device_model
+
+        device = MagicMock()
+        device.id = id
+        device.name = name
+        device.serial = serial
+        device.device_type.model = normalize_device_model("WS-C2960")
+        device.platform = None
+        device.tenant = None
+        device.site.name = "Lab"
+        device.role.name = "switch"
+        device.primary_ip4 = None
+        return device
+
+    @pytest.fixture
+    def client(self):
+        from types import SimpleNamespace
+
+        client = Mock()
+        existing = self._nb_device(1, "sw-old", serial="OLD")
+        client.get_devices_by_names.return_value = {"sw-old": existing}
+        client.get_devices_by_ips.return_value = {}
+
+        def lookup(field):
+            return lambda **kw: [
+                SimpleNamespace(id=100 + i, **{field: v}) for i, v in enumerate(kw[field])
+            ]
+
+        api = client.api
+        for endpoint in (api.dcim.manufacturers, api.dcim.sites, api.dcim.device_roles,
+                         api.dcim.platforms, api.tenancy.tenants):
+            endpoint.filter.side_effect = lookup("name")
+        api.dcim.device_types.filter.side_effect = lookup("model")
+        return client
+
+    def _devices(self, count):
+        from network_collector.core.models import DeviceInfo
+
+        devices = [DeviceInfo(hostname="sw-old", serial="NEW", model="WS-C2960")]
+        devices += [
+            DeviceInfo(hostname=f"sw-{i}", ip_address=f"10.0.0.{i}", model="WS-C2960")
+            for i in range(count)
+        ]
+        return devices
+
+    def test_prefetch_and_bulk_requests(self, client):
+        sync = NetBoxSync(client)
+
+        result = sync.sync_devices_from_inventory(
+            self._devices(3), site="Lab", role="switch", bulk=True,
+        )
+
+        assert result["created"] == 3
+        assert result["updated"] == 1
+        client.get_device_by_name.assert_not_called()
+        client.get_device_by_ip.assert_not_called()
+        # Справочники: только list-запросы, без get/create на устройство
+        client.api.dcim.manufacturers.get.assert_not_called()
+        client.api.dcim.device_types.get.assert_not_called()
+        client.api.dcim.devices.create.assert_not_called()
+
+        created = client.bulk_create_devices.call_args[0][0]
+        assert [d["name"] for d in created] == ["sw-0", "sw-1", "sw-2"]
+        assert {d["site"] for d in created} == {created[0]["site"]}
+        client.bulk_update_devices.assert_called_once_with([{"id": 1, "serial": "NEW"}])
+
+    def test_ip_fallback_for_unknown_names(self, client):
+        sync = NetBoxSync(client)
+        sync.sync_devices_from_inventory(self._devices(2), site="Lab", role="switch", bulk=True)
+
+        client.get_devices_by_ips.assert_called_once_with(["10.0.0.0", "10.0.0.1"])
+
+    def test_bulk_create_failure_falls_back(self, client):
+        client.bulk_create_devices.side_effect = Exception("400")
+        client.api.dcim.devices.create.side_effect = [MagicMock(), Exception("dup")]
+        sync = NetBoxSync(client)
+
+        result = sync.sync_devices_from_inventory(
+            self._devices(2), site="Lab", role="switch", bulk=True,
+        )
+
+        assert result["created"] == 1
+        assert result["failed"] == 1
+
+    def test_bulk_update_failure_falls_back(self, client):
+        client.bulk_update_devices.side_effect = Exception("400")
+        existing = client.get_devices_by_names.return_value["sw-old"]
+        sync = NetBoxSync(client)
+
+        result = sync.sync_devices_from_inventory(
+            self._devices(1), site="Lab", role="switch", bulk=True,
+        )
+
+        existing.update.assert_called_once_with({"serial": "NEW"})
+        assert result["updated"] == 1
+        assert result["details"]["update"] == [
+            {"name": "sw-old", "model": "WS-C2960", "ip": ""},
+        ]
+        assert result["details"]["create"] == [
+            {"name": "sw-0", "model": "WS-C2960", "ip": "10.0.0.0"},
+        ]
+
+    def test_dry_run_no_writes(self, client):
+        sync = NetBoxSync(client, dry_run=True)
+
+        result = sync.sync_devices_from_inventory(
+            self._devices(2), site="Lab", role="switch", bulk=True,
+        )
+
+        assert result["created"] == 2
+        assert result["updated"] == 1
+        client.bulk_create_devices.assert_not_called()
+        client.bulk_update_devices.assert_not_called()
+
+    def test_prefetch_error_logged_as_warning(self, client, caplog):
+        client.api.dcim.manufacturers.filter.side_effect = Exception("502")
+        sync = NetBoxSync(client)
+
+        with caplog.at_level("WARNING"):
+            result = sync.sync_devices_from_inventory(
+                self._devices(1), site="Lab", role="switch", bulk=True,
+            )
+
+        assert result["created"] == 1
+        assert "Предзагрузка справочника не удалась" in caplog.text
+
+    def test_lookup_memoized(self):
+        client = Mock()
+        client.api.dcim.manufacturers.get.return_value = MagicMock(id=10)
+        sync = NetBoxSync(client)
+
+        sync._get_or_create_manufacturer("Cisco")
+        sync._get_or_create_manufacturer("Cisco")
+
+        client.api.dcim.manufacturers.get.assert_called_once_with(name="Cisco")
+
+    def test_client_devices_by_ips(self):
+        from types import SimpleNamespace
+        from network_collector.netbox.client.devices import DevicesMixin
+
+        mixin = DevicesMixin()
+        mixin.api = Mock()
+        intf = SimpleNamespace(device=SimpleNamespace(id=7))
+        mixin.api.ipam.ip_addresses.filter.return_value = [
+            SimpleNamespace(address="10.0.0.1/24", assigned_object=intf),
+            SimpleNamespace(address="10.0.0.9/24", assigned_object=None),
+        ]
+        full = SimpleNamespace(id=7, name="sw-7")
+        mixin.api.dcim.devices.filter.return_value = [full]
+
+        assert mixin.get_devices_by_ips(["10.0.0.1", "10.0.0.9/24"]) == {"10.0.0.1": full}
+        mixin.api.dcim.devices.filter.assert_called_once_with(id=[7])
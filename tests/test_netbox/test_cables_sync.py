@@ -374,6 +374,122 @@ class TestFindNeighborDevice:
         assert result is None
 
 
+class TestNeighborMacResolution:
+    """Негативный кэш MAC и пакетное разрешение MAC соседей."""
+
+    def test_miss_cached(self, mock_client):
+        """Ненайденный MAC не запрашивается повторно."""
+        mock_client.get_device_by_mac.return_value = None
+        sync = NetBoxSync(mock_client)
+
+        assert sync._find_device_by_mac("00:11:22:33:44:55") is None
+        assert sync._find_device_by_mac("0011.2233.4455") is None
+        mock_client.get_device_by_mac.assert_called_once()
+
+    def test_api_error_not_cached(self, mock_client):
+        """Ошибка NetBox — не "не найден": следующий поиск повторяет запрос."""
+        sw2 = Mock(id=2, name="sw2")
+        mock_client.get_device_by_mac.side_effect = [Exception("502"), sw2]
+        sync = NetBoxSync(mock_client)
+
+        assert sync._find_device_by_mac("00:11:22:33:44:55") is None
+        assert sync._find_device_by_mac("00:11:22:33:44:55") is sw2
+        assert mock_client.get_device_by_mac.call_args.kwargs == {"raise_errors": True}
+
+    def test_miss_expires(self, mock_client):
+        """После TTL ненайденный MAC запрашивается снова."""
+        mock_client.get_device_by_mac.return_value = None
+        sync = NetBoxSync(mock_client)
+
+        with patch("network_collector.netbox.sync.base.time.monotonic", return_value=1000.0):
+            sync._find_device_by_mac("00:11:22:33:44:55")
+        with patch(
+            "network_collector.netbox.sync.base.time.monotonic",
+            return_value=1000.0 + sync.MAC_MISS_TTL + 1,
+        ):
+            sync._find_device_by_mac("00:11:22:33:44:55")
+
+        assert mock_client.get_device_by_mac.call_count == 2
+
+    def test_prefetch_before_cable_loop(self, mock_client):
+        """MAC соседей разрешаются одним пакетным вызовом."""
+        sw1 = Mock(id=1, name="sw1")
+        phone = Mock(id=2, name="phone")
+        mock_client.get_device_by_name.side_effect = lambda name: sw1 if name == "sw1" else None
+        mock_client.get_interfaces.side_effect = lambda device_id: {
+            1: [make_intf("Gi0/1"), make_intf("Gi0/2")],
+            2: [make_intf("eth0", device_name="phone")],
+        }[device_id]
+        mock_client.get_devices_by_macs.return_value = {"001122334455": phone}
+        mock_client.get_device_by_ip.return_value = None
+
+        sync = NetBoxSync(mock_client, dry_run=True)
+        result = sync.sync_cables_from_lldp([
+            make_lldp(local_interface="Gi0/1", neighbor_type="mac",
+                      remote_mac="00:11:22:33:44:55", remote_port="eth0"),
+            make_lldp(local_interface="Gi0/2", neighbor_type="mac",
+                      remote_mac="00:11:22:33:44:66", remote_port="eth0"),
+        ])
+
+        assert result["created"] == 1
+        assert result["skipped"] == 1
+        mock_client.get_devices_by_macs.assert_called_once()
+        assert sorted(mock_client.get_devices_by_macs.call_args[0][0]) == [
+            "001122334455", "001122334466",
+        ]
+        mock_client.get_device_by_mac.assert_not_called()
+
+    def test_prefetch_error_falls_back(self, mock_client):
+        """Ошибка пакетного поиска → поиск по одному MAC."""
+        phone = Mock(id=2, name="phone")
+        mock_client.get_devices_by_macs.side_effect = Exception("boom")
+        mock_client.get_device_by_mac.return_value = phone
+        sync = NetBoxSync(mock_client)
+
+        sync._prefetch_devices_by_mac(["00:11:22:33:44:55"])
+
+        assert sync._find_device_by_mac("00:11:22:33:44:55") is phone
+
+
+class TestGetDevicesByMacs:
+    """Клиент: пакетный поиск устройств по MAC."""
+
+    def test_chunks_and_interface_fallback(self):
+        from network_collector.netbox.client.devices import DevicesMixin
+
+        client = DevicesMixin()
+        client.api = Mock()
+        dev_a, dev_b = Mock(name="a"), Mock(name="b")
+        client.api.dcim.mac_addresses.filter.side_effect = lambda mac_address: [
+            Mock(mac_address="00:11:22:33:44:01", assigned_object=Mock(device=dev_a)),
+        ] if "00:11:22:33:44:01" in mac_address else []
+        client.api.dcim.interfaces.filter.return_value = [
+            Mock(mac_address="00:11:22:33:44:02", device=dev_b),
+        ]
+
+        found = client.get_devices_by_macs(
+            ["0011.2233.4401", "00-11-22-33-44-02", "00:11:22:33:44:03", "bad"],
+            chunk_size=2,
+        )
+
+        assert found == {"001122334401": dev_a, "001122334402": dev_b}
+        assert client.api.dcim.mac_addresses.filter.call_count == 2
+        client.api.dcim.interfaces.filter.assert_called_once_with(
+            mac_address=["00:11:22:33:44:02", "00:11:22:33:44:03"]
+        )
+
+    def test_single_mac_error_raised_on_request(self):
+        from network_collector.netbox.client.devices import DevicesMixin
+
+        client = DevicesMixin()
+        client.api = Mock()
+        client.api.dcim.mac_addresses.filter.side_effect = Exception("502")
+
+        assert client.get_device_by_mac("00:11:22:33:44:55") is None
+        with pytest.raises(Exception, match="502"):
+            client.get_device_by_mac("00:11:22:33:44:55", raise_errors=True)
+
+
 # ==================== CLEANUP ====================
 
 class TestCablesCleanup:
@@ -0,0 +1,433 @@
+"""
+Тесты чтения NetBox через GraphQL (netbox/client/graphql.py).
+
+Проверяет:
+- Имена enum GraphQL превращаются в значения choices REST
+- GraphQLRecord совместим с SyncComparator
+- Ошибки GraphQL → NetBoxAPIError
+- Синтаксис фильтров для NetBox до и после 4.3
+- Пакетное чтение: группировка по устройствам, пачки устройств
+- Запросы валидны для схемы NetBox 4.3 (fixtures/netbox/graphql_schema_4_3.graphql)
+- IP-адреса из GraphQL обновляются через REST (_update_ip_address)
+- SyncBase._get_remote_state: REST по умолчанию, GraphQL по сайту, fallback
+"""
+
+import re
+from pathlib import Path
+
+import pytest
+from unittest.mock import MagicMock
+
+from network_collector.core.domain.sync import SyncComparator, get_cable_endpoints
+from network_collector.core.exceptions import NetBoxAPIError
+from network_collector.netbox.client import graphql as graphql_module
+from network_collector.netbox.client.graphql import (
+    GraphQLMixin,
+    GraphQLRecord,
+    _choice_key,
+    _choice_value,
+)
+from network_collector.netbox.sync import NetBoxSync
+from network_collector.netbox.sync.base import SyncBase
+
+
+def _interface_row(id, name, device_id=1, **extra):
+    row = {
+        "id": str(id), "name": name, "description": "", "enabled": True,
+        "mtu": None, "speed": None, "type": "type_1000base_t", "mode": "access",
+        "duplex": None, "untagged_vlan": {"id": "7", "vid": 10}, "tagged_vlans": [],
+        "lag": None,
+        "device": {"id": str(device_id), "name": f"sw{device_id}",
+                   "site": {"id": "1", "name": "HQ"}},
+    }
+    row.update(extra)
+    return row
+
+
+class _Client(GraphQLMixin):
+    """Клиент с подменённой HTTP-сессией."""
+
+    def __init__(self, responses, version="4.2"):
+        self.url = "http://netbox.local/"
+        self._token = "secret"
+        self.api = MagicMock()
+        self.api.version = version
+        self.http_session = MagicMock()
+        self.http_session.post.side_effect = [
+            MagicMock(status_code=200, json=MagicMock(return_value=r)) for r in responses
+        ]
+
+    def queries(self):
+        return [c.kwargs["json"]["query"] for c in self.http_session.post.call_args_list]
+
+
+@pytest.mark.unit
+class TestGraphQLRecord:
+    """Записи в формате pynetbox Record."""
+
+    @pytest.mark.parametrize("field, name, value", [
+        ("type", "type_1000base_t", "1000base-t"),
+        ("type", "TYPE_10GBASE_X_SFPP", "10gbase-x-sfpp"),
+        ("type", "virtual", "virtual"),
+        ("mode", "tagged_all", "tagged-all"),
+        ("duplex", "FULL", "full"),
+    ])
+    def test_choice_value(self, field, name, value):
+        assert _choice_value(field, name) == value
+
+    @pytest.mark.parametrize("name, value", [
+        ("type_ieee802_11a", "ieee802.11a"),
+        ("TYPE_IEEE802_11A", "ieee802.11a"),
+        ("type_1000base_t", "1000base-t"),
+        ("type_virtual", "virtual"),
+        ("virtual", "virtual"),
+    ])
+    def test_choice_value_from_choiceset(self, name, value):
+        values = {_choice_key(v): v for v in ("ieee802.11a", "1000base-t", "virtual")}
+
+        assert _choice_value("type", name, values) == value
+
+    def test_attributes(self):
+        record = GraphQLRecord(_interface_row(5, "Gi0/1"))
+
+        assert record.id == 5
+        assert record.type.value == "1000base-t"
+        assert record.untagged_vlan.vid == 10
+        assert record.device.site.name == "HQ"
+        assert record.duplex is None
+        assert not hasattr(record, "cable")
+
+    def test_comparator_sees_no_changes(self):
+        remote = [GraphQLRecord(_interface_row(5, "Gi0/1", description="uplink"))]
+        local = [{"name": "Gi0/1", "description": "uplink", "enabled": True, "mode": "access"}]
+
+        diff = SyncComparator().compare_interfaces(local, remote)
+
+        assert not diff.to_update
+        assert not diff.to_create
+
+    def test_cable_endpoints(self):
+        cable = GraphQLRecord({
+            "id": "3",
+            "a_terminations": [{"id": "1", "name": "Gi0/1", "device": {"id": "1", "name": "sw1"}}],
+            "b_terminations": [{"id": "2", "name": "Gi0/2", "device": {"id": "2", "name": "sw2"}}],
+        })
+
+        assert get_cable_endpoints(cable) == ("sw1:Gi0/1", "sw2:Gi0/2")
+
+    def test_delete_via_rest(self):
+        endpoint = MagicMock()
+        GraphQLRecord({"id": "3"}, endpoint).delete()
+
+        endpoint.delete.assert_called_once_with([3])
+
+    def test_update_via_rest(self):
+        endpoint = MagicMock()
+
+        assert GraphQLRecord({"id": "3"}, endpoint).update({"description": "x"}) is True
+        endpoint.update.assert_called_once_with([{"id": 3, "description": "x"}])
+
+    def test_nested_record_cannot_update(self):
+        with pytest.raises(NetBoxAPIError):
+            GraphQLRecord({"id": "3"}).update({"description": "x"})
+
+
+@pytest.mark.unit
+class TestGraphQLClient:
+    """Запросы к /graphql/."""
+
+    def test_request(self):
+        client = _Client([{"data": {"device_list": [{"id": "4"}, {"id": "9"}]}}])
+
+        assert client.get_site_device_ids(1) == [4, 9]
+        call = client.http_session.post.call_args
+        assert call.args[0] == "http://netbox.local/graphql/"
+        assert call.kwargs["headers"]["Authorization"] == "Token secret"
+        assert 'device_list(filters: {site_id: ["1"]})' in client.queries()[0]
+
+    def test_new_filter_syntax(self):
+        client = _Client([{"data": {"device_list": []}}], version="4.3")
+        client.get_site_device_ids(1)
+
+        assert 'filters: {site: {id: {in_list: ["1"]}}}' in client.queries()[0]
+
+    def test_errors_raise(self):
+        client = _Client([{"errors": [{"message": "Unknown field"}]}])
+
+        with pytest.raises(NetBoxAPIError, match="Unknown field"):
+            client.graphql("query { x }")
+
+    def test_http_error(self):
+        client = _Client([])
+        client.http_session.post.side_effect = None
+        client.http_session.post.return_value = MagicMock(status_code=400)
+
+        with pytest.raises(NetBoxAPIError):
+            client.graphql("query { x }")
+
+    def test_interfaces_grouped_by_device(self, monkeypatch):
+        monkeypatch.setattr(graphql_module, "GRAPHQL_CHUNK_SIZE", 2)
+        client = _Client([
+            {"data": {"interface_list": [
+                _interface_row(1, "Gi0/1", device_id=1),
+                _interface_row(2, "Gi0/1", device_id=2),
+            ]}},
+            {"data": {"interface_list": [_interface_row(3, "Gi0/2", device_id=3)]}},
+        ])
+
+        result = client.get_interfaces_bulk([1, 2, 3, 4])
+
+        assert {k: [r.id for r in v] for k, v in result.items()} == {
+            1: [1], 2: [2], 3: [3], 4: [],
+        }
+        assert len(client.queries()) == 2
+        assert 'device_id: ["3", "4"]' in client.queries()[1]
+
+    def test_choices_loaded_once_per_endpoint(self):
+        """Тип интерфейса берётся из choices REST, а не восстанавливается из имени."""
+        row = _interface_row(1, "wlan0", type="TYPE_IEEE802_11A")
+        client = _Client([{"data": {"interface_list": [row]}}, {"data": {"interface_list": [row]}}])
+        client.api.dcim.interfaces.choices.return_value = {
+            "type": [{"value": "ieee802.11a", "display_name": "IEEE 802.11a"}],
+            "mode": [{"value": "tagged-all", "display_name": "Tagged (All)"}],
+        }
+
+        for _ in range(2):
+            record = client.get_interfaces_bulk([1])[1][0]
+            assert record.type.value == "ieee802.11a"
+            assert record.mode.value == "access"
+
+        client.api.dcim.interfaces.choices.assert_called_once_with()
+
+    def test_choices_error_falls_back(self):
+        client = _Client([{"data": {"interface_list": [_interface_row(1, "Gi0/1")]}}])
+        client.api.dcim.interfaces.choices.side_effect = Exception("403")
+
+        assert client.get_interfaces_bulk([1])[1][0].type.value == "1000base-t"
+
+    def test_cables_belong_to_both_ends(self):
+        cable = {
+            "id": "3",
+            "a_terminations": [{"id": "1", "name": "Gi0/1", "device": {"id": "1", "name": "sw1"}}],
+            "b_terminations": [{"id": "2", "name": "Gi0/2", "device": {"id": "2", "name": "sw2"}}],
+        }
+        client = _Client([{"data": {"interface_list": [
+            {"id": "1", "device": {"id": "1"}, "cable": cable},
+            {"id": "2", "device": {"id": "2"}, "cable": cable},
+            {"id": "4", "device": {"id": "2"}, "cable": None},
+        ]}}])
+
+        result = client.get_cables_bulk([1, 2])
+
+        assert [c.id for c in result[1]] == [3]
+        assert [c.id for c in result[2]] == [3]
+        assert get_cable_endpoints(result[1][0]) == ("sw1:Gi0/1", "sw2:Gi0/2")
+        assert "interface_list" in client.queries()[0]
+
+
+@pytest.mark.unit
+class TestGraphQLIPAddresses:
+    """IP-адреса из GraphQL в _update_ip_address (read_backend: graphql)."""
+
+    ROW = {
+        "id": "5", "address": "10.0.0.1/24", "description": "Uplink", "status": "ACTIVE",
+        "tenant": {"id": "3"},
+    }
+
+    def _ip(self, **extra):
+        interface = {
+            "id": "10", "name": "Gi0/1", "device": {"id": "1", "name": "sw1"},
+            "ip_addresses": [dict(self.ROW, **extra)],
+        }
+        client = _Client([{"data": {"interface_list": [interface]}}])
+        ip_obj = client.get_ip_addresses_bulk([1])[1][0]
+        return client, ip_obj
+
+    def _interface(self, id=10, description="Uplink"):
+        interface = MagicMock()
+        interface.id = id
+        interface.description = description
+        return interface
+
+    def test_query_fields(self):
+        client, ip_obj = self._ip()
+
+        assert "tenant { id }" in client.queries()[0]
+        assert ip_obj.tenant.id == 3
+        assert ip_obj.assigned_object_id == 10
+        assert ip_obj.assigned_object.device.name == "sw1"
+
+    def test_unchanged_ip_not_updated(self):
+        client, ip_obj = self._ip()
+        sync = NetBoxSync(MagicMock())
+        device = MagicMock()
+        device.tenant.id = 3
+
+        assert sync._update_ip_address(ip_obj, device, self._interface()) is False
+        client.api.ipam.ip_addresses.update.assert_not_called()
+
+    def test_update_goes_through_rest(self):
+        client, ip_obj = self._ip()
+        sync = NetBoxSync(MagicMock())
+        device = MagicMock()
+        device.tenant.id = 3
+
+        assert sync._update_ip_address(ip_obj, device, self._interface(id=20)) is True
+        client.api.ipam.ip_addresses.update.assert_called_once_with([{
+            "id": 5, "assigned_object_type": "dcim.interface", "assigned_object_id": 20,
+        }])
+
+
+SCHEMA_4_3 = Path(__file__).parent.parent / "fixtures" / "netbox" / "graphql_schema_4_3.graphql"
+
+
+class _Schema:
+    """
+    Проверка запроса по SDL-схеме: поля типов, ключи фильтров, фрагменты.
+
+    Без graphql-core: разбирается только подмножество синтаксиса, которое
+    генерирует GraphQLMixin.
+    """
+
+    def __init__(self, sdl: str):
+        sdl = re.sub(r"#.*", "", sdl)
+        self.fields = {}
+        self.args = {}
+        for _, name, body in re.findall(r"(type|input)\s+(\w+)\s*\{([^}]*)\}", sdl):
+            self.fields[name] = {}
+            for field, args, ftype in re.findall(r"(\w+)\s*(\([^)]*\))?\s*:\s*\[?(\w+)", body):
+                self.fields[name][field] = ftype
+                self.args[(name, field)] = dict(re.findall(r"(\w+)\s*:\s*(\w+)", args))
+        self.unions = {
+            name: {m.strip() for m in members.split("|")}
+            for name, members in re.findall(r"union\s+(\w+)\s*=\s*([^\n]+)", sdl)
+        }
+
+    def validate(self, query: str) -> None:
+        self._tokens = re.findall(r'\.\.\.|[{}():\[\],]|"[^"]*"|\w+', query)
+        self._pos = 0
+        self._expect("query")
+        self._selection("Query")
+
+    def _next(self) -> str:
+        token = self._tokens[self._pos]
+        self._pos += 1
+        return token
+
+    def _peek(self) -> str:
+        return self._tokens[self._pos] if self._pos < len(self._tokens) else ""
+
+    def _expect(self, token: str) -> None:
+        assert self._next() == token
+
+    def _selection(self, type_name: str) -> None:
+        self._expect("{")
+        while self._peek() != "}":
+            token = self._next()
+            if token == "...":
+                self._expect("on")
+                fragment = self._next()
+                assert fragment in self.unions.get(type_name, {type_name}), (
+                    f"{fragment} не входит в {type_name}"
+                )
+                self._selection(fragment)
+                continue
+            assert token in self.fields[type_name], f"{type_name}.{token} нет в схеме"
+            if self._peek() == "(":
+                self._next()
+                while self._peek() != ")":
+                    arg = self._next()
+                    self._expect(":")
+                    self._value(self.args[(type_name, token)][arg])
+                self._next()
+            if self._peek() == "{":
+                self._selection(self.fields[type_name][token])
+        self._next()
+
+    def _value(self, input_type: str) -> None:
+        token = self._next()
+        if token == "{":
+            while self._peek() != "}":
+                key = self._next()
+                assert key in self.fields[input_type], f"{input_type}.{key} нет в схеме"
+                self._expect(":")
+                self._value(self.fields[input_type][key])
+                if self._peek() == ",":
+                    self._next()
+            self._next()
+        elif token == "[":
+            while self._next() != "]":
+                pass
+
+
+@pytest.mark.unit
+class TestGraphQLSchema43:
+    """Запросы клиента проходят по схеме NetBox 4.3."""
+
+    @pytest.fixture
+    def schema(self):
+        return _Schema(SCHEMA_4_3.read_text(encoding="utf-8"))
+
+    @pytest.mark.parametrize("method, name", [
+        ("get_site_device_ids", "device_list"),
+        ("get_interfaces_bulk", "interface_list"),
+        ("get_ip_addresses_bulk", "interface_list"),
+        ("get_cables_bulk", "interface_list"),
+    ])
+    def test_queries_valid(self, schema, method, name):
+        client = _Client([{"data": {name: []}}], version="4.3")
+        arg = 1 if method == "get_site_device_ids" else [1, 2]
+
+        getattr(client, method)(arg)
+
+        schema.validate(client.queries()[0])
+
+    def test_device_filter_on_ip_list_rejected(self, schema):
+        """IPAddressFilter без поля device — прежний запрос не проходил бы."""
+        with pytest.raises(AssertionError, match="IPAddressFilter.device"):
+            schema.validate(
+                'query { ip_address_list(filters: {device: {id: {in_list: ["1"]}}}) { id } }'
+            )
+
+
+def _device(id, site_id=1):
+    device = MagicMock()
+    device.id = id
+    device.site.id = site_id
+    return device
+
+
+@pytest.mark.unit
+class TestRemoteState:
+    """SyncBase._get_remote_state."""
+
+    def _sync(self, backend):
+        client = MagicMock()
+        client.read_backend = backend
+        client.get_site_device_ids.return_value = [1, 2]
+        client.get_interfaces_bulk.return_value = {1: ["a"], 2: ["b"]}
+        return SyncBase(client, context=MagicMock())
+
+    def test_rest_by_default(self):
+        sync = self._sync("rest")
+
+        assert sync._get_remote_state("interfaces", _device(1), lambda: iter(["rest"])) == ["rest"]
+        sync.client.get_interfaces_bulk.assert_not_called()
+
+    def test_graphql_loads_site_once(self):
+        sync = self._sync("graphql")
+        rest = MagicMock(return_value=["rest"])
+
+        assert sync._get_remote_state("interfaces", _device(1), rest) == ["a"]
+        assert sync._get_remote_state("interfaces", _device(2), rest) == ["b"]
+        sync.client.get_interfaces_bulk.assert_called_once_with([1, 2])
+        rest.assert_not_called()
+
+        # Повторное чтение того же устройства — свежие данные через REST
+        assert sync._get_remote_state("interfaces", _device(1), rest) == ["rest"]
+
+    def test_fallback_on_error(self):
+        sync = self._sync("graphql")
+        sync.client.get_interfaces_bulk.side_effect = NetBoxAPIError("boom")
+
+        assert sync._get_remote_state("interfaces", _device(1), lambda: ["rest"]) == ["rest"]
@@ -8,6 +8,7 @@ from unittest.mock import patch, MagicMock, PropertyMock
 import pytest
 import requests
 
+from network_collector.config import ConfigSection
 from network_collector.netbox.client.base import (
     NetBoxSession,
     MAX_RETRIES_429,
@@ -190,8 +191,8 @@ class TestNetBoxClientBaseTimeout:
 
         with patch("network_collector.netbox.client.base.os.environ", {"NETBOX_URL": "http://test"}):
             with patch("network_collector.config.config") as mock_config:
-                mock_config.netbox = MagicMock()
-                mock_config.netbox.timeout = 45
+                mock_config.netbox = ConfigSection({"timeout": 45})
+                mock_config.connection = ConfigSection({"max_workers": 5})
 
                 from network_collector.netbox.client.base import NetBoxClientBase
                 client = NetBoxClientBase(url="http://test", token="test-token")
@@ -214,3 +215,81 @@ class TestNetBoxClientBaseTimeout:
         session = mock_api.http_session
         assert isinstance(session, NetBoxSession)
         assert session.timeout == 90
+
+
+class TestNetBoxSessionTuning:
+    """Пул соединений, размер страницы, счётчики."""
+
+    def _ok_response(self, content=b"{}", headers=None):
+        response = MagicMock()
+        response.status_code = 200
+        response.content = content
+        response.headers = headers or {}
+        return response
+
+    def test_pool_and_headers(self):
+        session = NetBoxSession(pool_size=32, keep_alive=False)
+        adapter = session.get_adapter("https://netbox.local/api/")
+
+        assert adapter._pool_maxsize == 32
+        assert adapter._pool_block is True
+        assert session.headers["Connection"] == "close"
+
+    @pytest.mark.parametrize("method,url,params,expected", [
+        ("GET", "http://nb/api/dcim/interfaces/", None, {"limit": 500}),
+        ("GET", "http://nb/api/dcim/interfaces/", {"device_id": 1}, {"device_id": 1, "limit": 500}),
+        ("GET", "http://nb/api/dcim/interfaces/", {"limit": 1}, {"limit": 1}),
+        ("GET", "http://nb/api/dcim/interfaces/?limit=50&offset=50", None, None),
+        ("POST", "http://nb/api/dcim/interfaces/", None, None),
+    ])
+    def test_page_size(self, method, url, params, expected):
+        session = NetBoxSession(page_size=500)
+        with patch.object(requests.Session, "request", return_value=self._ok_response()) as mock_req:
+            kwargs = {"params": params} if params is not None else {}
+            session.request(method, url, **kwargs)
+
+        assert mock_req.call_args.kwargs.get("params") == expected
+
+    def test_default_page_size(self):
+        """Без page_size limit не добавляется — размер страницы NetBox."""
+        session = NetBoxSession()
+        with patch.object(requests.Session, "request", return_value=self._ok_response()) as mock_req:
+            session.request("GET", "http://nb/api/dcim/interfaces/")
+
+        assert mock_req.call_args.kwargs.get("params") is None
+
+    def test_stats(self):
+        session = NetBoxSession()
+        responses = [
+            self._ok_response(b"x" * 1000, {"Content-Length": "200"}),
+            self._ok_response(b"y" * 10),
+        ]
+        with patch.object(requests.Session, "request", side_effect=responses):
+            session.request("GET", "http://nb/api/a/")
+            session.request("GET", "http://nb/api/b/")
+
+        assert session.stats["requests"] == 2
+        assert session.stats["bytes"] == 1010
+        assert session.stats["wire_bytes"] == 210
+        assert "2 запросов" in session.stats_summary()
+
+        session.reset_stats()
+        assert session.stats["requests"] == 0
+
+
+class TestNetBoxClientPoolSize:
+    """Размер пула по числу потоков sync."""
+
+    def test_explicit_pool_size(self):
+        from network_collector.netbox.client.base import NetBoxClientBase
+
+        assert NetBoxClientBase._pool_size(ConfigSection({"pool_size": 64})) == 64
+
+    def test_auto_pool_size(self):
+        from network_collector.netbox.client.base import NetBoxClientBase
+
+        with patch("network_collector.config.config") as mock_config:
+            mock_config.connection = ConfigSection({"max_workers": 20})
+            assert NetBoxClientBase._pool_size(ConfigSection({"pool_size": 0})) == 40
+            mock_config.connection = ConfigSection({"max_workers": 2})
+            assert NetBoxClientBase._pool_size(ConfigSection({"pool_size": 0})) == 10
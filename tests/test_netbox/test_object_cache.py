@@ -0,0 +1,137 @@
+"""
+Тесты кэша объектов NetBox на диске (netbox/client/cache.py).
+
+Проверяет:
+- Первая загрузка — полный запрос, повторная — дельта по last_updated__gte
+- Изменённые объекты обновляются в кэше
+- Удаление (count не совпал) — полная перезагрузка
+- Объекты восстанавливаются как pynetbox Record
+- Клиент без кэша работает как раньше
+"""
+
+import pytest
+from unittest.mock import MagicMock
+
+pynetbox = pytest.importorskip("pynetbox")
+
+from network_collector.netbox.client.cache import NetBoxObjectCache
+from network_collector.netbox.client.base import NetBoxClientBase
+
+
+def _record(endpoint, id, name, last_updated="2025-01-01T00:00:00Z"):
+    return endpoint.return_obj(
+        {"id": id, "name": name, "device": {"id": 1, "name": "sw1"},
+         "last_updated": last_updated},
+        endpoint.api, endpoint,
+    )
+
+
+@pytest.fixture
+def endpoint():
+    """Настоящий pynetbox endpoint с подменёнными filter/count."""
+    api = pynetbox.api("http://netbox.local", token="x")
+    ep = api.dcim.interfaces
+    ep.filter = MagicMock()
+    ep.count = MagicMock()
+    return ep
+
+
+@pytest.fixture
+def cache(tmp_path):
+    return NetBoxObjectCache(str(tmp_path / "nb" / "cache.sqlite"))
+
+
+class TestObjectCache:
+    """Дельта-ревалидация."""
+
+    def test_first_fetch_full(self, cache, endpoint):
+        endpoint.filter.return_value = [_record(endpoint, 1, "Gi0/1"), _record(endpoint, 2, "Gi0/2")]
+
+        result = cache.fetch(endpoint, {"device_id": 1})
+
+        assert [r.name for r in result] == ["Gi0/1", "Gi0/2"]
+        endpoint.filter.assert_called_once_with(device_id=1)
+        endpoint.count.assert_not_called()
+        assert cache.stats["full"] == 1
+
+    def test_second_fetch_delta(self, tmp_path, endpoint):
+        path = str(tmp_path / "cache.sqlite")
+        endpoint.filter.return_value = [_record(endpoint, 1, "Gi0/1"), _record(endpoint, 2, "Gi0/2")]
+        NetBoxObjectCache(path).fetch(endpoint, {"device_id": 1})
+
+        # Новый запуск: изменился только Gi0/2
+        endpoint.filter.reset_mock()
+        endpoint.filter.return_value = [_record(endpoint, 2, "Gi0/2-renamed")]
+        endpoint.count.return_value = 2
+        cache = NetBoxObjectCache(path)
+
+        result = cache.fetch(endpoint, {"device_id": 1})
+
+        assert [r.name for r in result] == ["Gi0/1", "Gi0/2-renamed"]
+        kwargs = endpoint.filter.call_args.kwargs
+        assert kwargs["device_id"] == 1
+        assert "last_updated__gte" in kwargs
+        assert cache.stats == {"full": 0, "delta": 1, "reloaded": 0}
+
+    def test_deleted_object_triggers_reload(self, cache, endpoint):
+        endpoint.filter.return_value = [_record(endpoint, 1, "Gi0/1"), _record(endpoint, 2, "Gi0/2")]
+        cache.fetch(endpoint, {"device_id": 1})
+
+        endpoint.filter.side_effect = [[], [_record(endpoint, 1, "Gi0/1")]]
+        endpoint.count.return_value = 1
+
+        result = cache.fetch(endpoint, {"device_id": 1})
+
+        assert [r.id for r in result] == [1]
+        assert cache.stats["reloaded"] == 1
+
+    def test_records_rehydrated(self, cache, endpoint):
+        endpoint.filter.return_value = [_record(endpoint, 1, "Gi0/1")]
+        cache.fetch(endpoint, {})
+        endpoint.filter.return_value = []
+        endpoint.count.return_value = 1
+
+        record = cache.fetch(endpoint, {})[0]
+
+        assert isinstance(record, pynetbox.core.response.Record)
+        assert record.device.name == "sw1"
+        assert record.endpoint is endpoint
+
+    def test_keys_separate_filters(self, cache, endpoint):
+        endpoint.filter.return_value = [_record(endpoint, 1, "Gi0/1")]
+        cache.fetch(endpoint, {"device_id": 1})
+        cache.fetch(endpoint, {"device_id": 2})
+
+        assert cache.stats["full"] == 2
+
+
+class TestClientFilter:
+    """NetBoxClientBase._filter."""
+
+    def test_without_cache(self):
+        client = NetBoxClientBase.__new__(NetBoxClientBase)
+        client.object_cache = None
+        endpoint = MagicMock()
+        endpoint.filter.return_value = iter(["a", "b"])
+
+        assert client._filter(endpoint, {"site": "x"}) == ["a", "b"]
+        endpoint.filter.assert_called_once_with(site="x")
+
+    def test_path_object_cache(self, tmp_path):
+        """object_cache принимает pathlib.Path, не только str."""
+        client = NetBoxClientBase(
+            url="http://netbox.local", token="x",
+            object_cache=tmp_path / "nb" / "cache.sqlite",
+        )
+
+        assert isinstance(client.object_cache, NetBoxObjectCache)
+        assert client.object_cache.path == tmp_path / "nb" / "cache.sqlite"
+
+    def test_with_cache(self):
+        client = NetBoxClientBase.__new__(NetBoxClientBase)
+        client.object_cache = MagicMock()
+        client.object_cache.fetch.return_value = ["cached"]
+        endpoint = MagicMock()
+
+        assert client._filter(endpoint, {"site": "x"}) == ["cached"]
+        endpoint.filter.assert_not_called()
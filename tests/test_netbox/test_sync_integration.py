@@ -480,9 +480,8 @@ class TestVLANSyncDuplicates:
     def test_sync_vlans_skips_existing(self):
         """Существующие VLAN пропускаются."""
         mock_client = Mock()
-        mock_vlan = Mock()
-        mock_vlan.vid = 30
-        mock_client.get_vlan_by_vid.return_value = mock_vlan  # VLAN уже есть
+        mock_vlan = Mock(id=300, vid=30)
+        mock_client.get_vlans.return_value = [mock_vlan]  # VLAN уже есть
 
         sync = NetBoxSync(mock_client, dry_run=True)
 
@@ -14,6 +14,8 @@ from unittest.mock import MagicMock, patch
 from dataclasses import dataclass
 from typing import Optional
 
+from network_collector.core.domain.vlan import VlanIndex
+
 
 @dataclass
 class MockInterface:
@@ -504,6 +506,9 @@ class TestTaggedVlansSync:
             return MockVLAN(id=vid * 10, vid=vid)
 
         sync._get_vlan_by_vid = MagicMock(side_effect=get_vlan)
+        sync._get_vlan_index = MagicMock(return_value=VlanIndex.from_vlans(
+            [get_vlan(vid, "Office") for vid in (1, 10, 20, 30)]
+        ))
         sync._parse_vlan_range = MagicMock(return_value=[10, 20, 30])
 
         # Trunk интерфейс с tagged_vlans
@@ -883,6 +888,7 @@ class TestVlanOnCreate:
 
         mock_vlan = MockVLAN(id=10, vid=1, name="Default")
         sync._get_vlan_by_vid = MagicMock(return_value=mock_vlan)
+        sync._get_vlan_index = MagicMock(return_value=VlanIndex.from_vlans([mock_vlan]))
 
         intf = MockInterface(
             name="Gi0/24",
@@ -909,6 +915,9 @@ class TestVlanOnCreate:
             return MockVLAN(id=vid * 10, vid=vid)
 
         sync._get_vlan_by_vid = MagicMock(side_effect=get_vlan)
+        sync._get_vlan_index = MagicMock(return_value=VlanIndex.from_vlans(
+            [get_vlan(vid, "Office") for vid in (1, 10, 20, 30)]
+        ))
 
         intf = MockInterface(
             name="Gi0/24",
@@ -74,9 +74,8 @@ class TestVlansSyncExisting:
 
     def test_skips_existing_vlan(self, mock_client):
         """Существующий VLAN пропускается."""
-        mock_vlan = Mock()
-        mock_vlan.vid = 30
-        mock_client.get_vlan_by_vid.return_value = mock_vlan
+        mock_vlan = Mock(id=300, vid=30)
+        mock_client.get_vlans.return_value = [mock_vlan]
 
         sync = NetBoxSync(mock_client, dry_run=True)
 
@@ -91,14 +90,7 @@ class TestVlansSyncExisting:
 
     def test_mixed_existing_and_new(self, mock_client):
         """Смешанный случай: часть существует, часть нет."""
-        def get_vlan_side_effect(vid=None, **kwargs):
-            if vid == 30:
-                mock_vlan = Mock()
-                mock_vlan.vid = 30
-                return mock_vlan
-            return None
-
-        mock_client.get_vlan_by_vid.side_effect = get_vlan_side_effect
+        mock_client.get_vlans.return_value = [Mock(id=300, vid=30)]
 
         sync = NetBoxSync(mock_client, dry_run=True)
 
@@ -177,9 +169,10 @@ class TestVlanVidExtraction:
 
     def test_extracts_vid_from_vlan_name(self, mock_client):
         """Извлекает VID из имени Vlan*."""
-        mock_client.get_vlan_by_vid.return_value = None
+        mock_client.get_vlans.return_value = []
+        mock_client.bulk_create_vlans.return_value = []
 
-        sync = NetBoxSync(mock_client, dry_run=True)
+        sync = NetBoxSync(mock_client)
 
         interfaces = [
             Interface(name="Vlan30", status="up"),
@@ -189,7 +182,62 @@ class TestVlanVidExtraction:
 
         sync.sync_vlans_from_interfaces("switch-01", interfaces)
 
-        # Проверяем что get_vlan_by_vid вызывался с правильными VID
-        calls = mock_client.get_vlan_by_vid.call_args_list
-        vids = [call.kwargs.get("vid") or call.args[0] for call in calls if call.args or call.kwargs]
-        # VID должны быть числами или переданы как kwargs
+        vids = [data["vid"] for data in mock_client.bulk_create_vlans.call_args.args[0]]
+        assert vids == [1, 30, 100]
+
+
+class TestVlansSyncBulk:
+    """Пакетное создание и общий индекс VLAN сайта."""
+
+    @pytest.fixture
+    def mock_client(self):
+        """Мокированный NetBox клиент."""
+        client = Mock()
+        client.get_vlans.return_value = [Mock(id=300, vid=30)]
+        return client
+
+    def test_single_bulk_request(self, mock_client):
+        """Новые VLAN создаются одним запросом, существующие не запрашиваются по VID."""
+        mock_client.bulk_create_vlans.return_value = [Mock(id=1000, vid=100)]
+        sync = NetBoxSync(mock_client)
+
+        interfaces = [
+            Interface(name="Vlan30", status="up"),
+            Interface(name="Vlan100", status="up", description="Users"),
+        ]
+        result = sync.sync_vlans_from_interfaces("switch-01", interfaces, site="Office")
+
+        assert result["created"] == 1
+        assert result["skipped"] == 1
+        mock_client.bulk_create_vlans.assert_called_once_with(
+            [{"vid": 100, "name": "Users", "status": "active"}], site="Office",
+        )
+        mock_client.get_vlans.assert_called_once_with(site="Office")
+        mock_client.get_vlan_by_vid.assert_not_called()
+
+    def test_created_vlans_shared_with_interface_sync(self, mock_client):
+        """Созданный VLAN сразу виден sync интерфейсов без новых запросов."""
+        created = Mock(id=1000, vid=100)
+        mock_client.bulk_create_vlans.return_value = [created]
+        sync = NetBoxSync(mock_client)
+
+        sync.sync_vlans_from_interfaces(
+            "switch-01", [Interface(name="Vlan100", status="up")], site="Office",
+        )
+
+        assert sync._get_vlan_by_vid(100, "Office") is created
+        assert mock_client.get_vlans.call_count == 1
+
+    def test_bulk_failure_falls_back(self, mock_client):
+        """Ошибка bulk — VLAN создаются поштучно."""
+        mock_client.bulk_create_vlans.side_effect = Exception("bad request")
+        mock_client.create_vlan.side_effect = [Mock(id=1000, vid=100), Exception("dup")]
+        sync = NetBoxSync(mock_client)
+
+        result = sync.sync_vlans_from_interfaces(
+            "switch-01",
+            [Interface(name="Vlan100", status="up"), Interface(name="Vlan200", status="up")],
+        )
+
+        assert result["created"] == 1
+        assert result["failed"] == 1
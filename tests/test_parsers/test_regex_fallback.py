@@ -0,0 +1,154 @@
+"""
+Тесты regex fallback-парсеров (parsers/regex_fallback.py).
+
+Проверяет:
+- Разбор выводов Cisco IOS / NX-OS из fixtures без TextFSM
+- Границы секций и блоков (trunk, LLDP без "Local Intf:", CDP)
+- Первая строка вывода тоже разбирается (привязка через ведущий \\n)
+"""
+
+import pytest
+from pathlib import Path
+
+from network_collector.parsers.regex_fallback import (
+    parse_cdp_detail,
+    parse_interface_status,
+    parse_lag_membership,
+    parse_lldp_detail,
+    parse_mac_table,
+    parse_switchport_modes,
+    parse_trunk_ports,
+)
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+
+def _fixture(platform: str, name: str) -> str:
+    return (FIXTURES_DIR / platform / name).read_text(encoding="utf-8")
+
+
+class TestLineParsers:
+    """MAC, статус портов, LAG."""
+
+    def test_mac_table(self):
+        rows = parse_mac_table(_fixture("cisco_ios", "show_mac_address_table.txt"))
+        assert len(rows) == 43
+        assert rows[0] == {"vlan": "1", "mac": "2c4f.52fb.b71f", "type": "dynamic", "interface": "Po1"}
+
+    def test_mac_first_line(self):
+        assert parse_mac_table("10    0011.2233.4455    DYNAMIC     Gi0/1") == [
+            {"vlan": "10", "mac": "0011.2233.4455", "type": "dynamic", "interface": "Gi0/1"}
+        ]
+
+    @pytest.mark.parametrize("line, expected", [
+        ("Gi0/1     Uplink to core     connected    trunk", [("Gi0/1", "connected")]),
+        ("Gi0/2                        notconnect   1", [("Gi0/2", "notconnect")]),
+        ("Eth1/1    SU-829             notconnec    trunk", []),  # NX-OS обрезает статус
+        ("Gi0/3 connected 1", []),  # один пробел — не колонки
+    ])
+    def test_interface_status_line(self, line, expected):
+        assert parse_interface_status(line + "\n") == expected
+
+    def test_interface_status_fixture(self):
+        rows = parse_interface_status(_fixture("cisco_ios", "show_interface_status.txt"))
+        assert len(rows) == 53
+        assert rows[0] == ("Gi1/0/1", "connected")
+
+    def test_status_at_end_of_line(self):
+        """Статус последним в строке не съедает перевод строки следующей."""
+        output = "Gi0/1    a   connected \nGi0/2    b   disabled \n"
+        assert parse_interface_status(output) == [("Gi0/1", "connected"), ("Gi0/2", "disabled")]
+
+    def test_lag_membership(self):
+        rows = parse_lag_membership(_fixture("cisco_ios", "show_etherchannel_summary.txt"))
+        assert rows == [("Te1/1/1", "Po1"), ("Te1/1/2", "Po1")]
+
+
+class TestTrunkPorts:
+    """show interfaces trunk: только первая секция."""
+
+    OUTPUT = (
+        "\n"
+        "Port        Mode             Encapsulation  Status        Native vlan\n"
+        "Gi0/1       on               802.1q         trunking      1\n"
+        "Po1         on               802.1q         trunking      1\n"
+        "\n"
+        "Port        Vlans allowed on trunk\n"
+        "Gi0/1       1-4094\n"
+        "Gi0/9       1-4094\n"
+    )
+
+    def test_first_section_only(self):
+        assert parse_trunk_ports(self.OUTPUT) == ["Gi0/1", "Po1"]
+
+    def test_no_header(self):
+        assert parse_trunk_ports("Gi0/1  on  802.1q  trunking  1\n") == []
+
+
+class TestSwitchportModes:
+    """show interfaces switchport."""
+
+    def test_fixture(self):
+        modes = parse_switchport_modes(_fixture("cisco_ios", "show_interfaces_switchport.txt"))
+        assert modes["Gi1/0/1"] == {"mode": "access", "native_vlan": "1", "access_vlan": "47"}
+
+    def test_trunk_with_vlan_list(self):
+        output = (
+            "Name: Gi0/1\n"
+            "Administrative Mode: trunk\n"
+            "Access Mode VLAN: 1 (default)\n"
+            "Trunking Native Mode VLAN: 99 (Native)\n"
+            "Trunking VLANs Enabled: 10,20\n"
+            "Name: Gi0/2\n"
+            "Administrative Mode: dynamic auto\n"
+            "Trunking VLANs Enabled: ALL\n"
+        )
+        assert parse_switchport_modes(output) == {
+            "Gi0/1": {"mode": "tagged", "native_vlan": "99", "access_vlan": "1"},
+            "Gi0/2": {"mode": "tagged-all", "native_vlan": "", "access_vlan": ""},
+        }
+
+
+class TestNeighborBlocks:
+    """LLDP/CDP detail: блоки и значения в пределах блока."""
+
+    def test_lldp_fixture(self):
+        neighbors = parse_lldp_detail(_fixture("cisco_ios", "show_lldp_neighbors_detail.txt"))
+        assert len(neighbors) == 11
+        first = neighbors[0]
+        assert first["local_interface"] == "Gi1/0/38"
+        assert first["remote_hostname"] == "SU-2802-717-HALL"
+        assert first["remote_ip"] == "10.195.227.175"
+        assert first["remote_description"].startswith("Cisco AP Software")
+
+    def test_lldp_without_local_intf(self):
+        """Старый формат: блоки по строке из дефисов, not advertised пропускается."""
+        output = (
+            "------------------------------------------------\n"
+            "Chassis id: 0011.2233.4455\n"
+            "Port id: Gi0/1\n"
+            "Port Description: - not advertised\n"
+            "System Name: sw-a\n"
+            "------------------------------------------------\n"
+            "Chassis id: 0011.2233.6677\n"
+            "Port id: Gi0/2\n"
+        )
+        assert parse_lldp_detail(output) == [
+            {"chassis_id": "0011.2233.4455", "port_id": "Gi0/1", "remote_hostname": "sw-a"},
+            {"chassis_id": "0011.2233.6677", "port_id": "Gi0/2"},
+        ]
+
+    def test_cdp_fixture(self):
+        neighbors = parse_cdp_detail(_fixture("cisco_ios", "show_cdp_neighbors_detail.txt"))
+        assert len(neighbors) == 4
+        assert neighbors[0] == {
+            "remote_hostname": "SU-C9500-48Y4C-01.corp.ogk4.ru",
+            "local_interface": "TenGigabitEthernet1/1/1",
+            "remote_port": "TwentyFiveGigE1/0/17",
+            "remote_platform": "cisco C9500-48Y4C",
+            "remote_ip": "10.195.227.1",
+        }
+
+    def test_cdp_block_without_interface_skipped(self):
+        output = "Device ID: sw-a\n  IP address: 10.0.0.1\n"
+        assert parse_cdp_detail(output) == []
@@ -0,0 +1,197 @@
+"""
+Тесты разбора JSON-вывода (parsers/structured_parser.py).
+
+Проверяет:
+- JSON NX-OS/EOS/Junos раскладывается в сырые строки формата TextFSM
+- Нормализаторы Domain Layer дают тот же результат, что для текста
+- Коллектор выполняет JSON-команду и возвращается к тексту, если JSON нет
+"""
+
+import json
+
+import pytest
+from pathlib import Path
+from unittest.mock import MagicMock
+
+from network_collector.collectors.interfaces import InterfaceCollector
+from network_collector.collectors.mac import MACCollector
+from network_collector.core.device import Device
+from network_collector.core.domain import InterfaceNormalizer, LLDPNormalizer
+from network_collector.parsers.structured_parser import parse_structured
+
+FIXTURES_DIR = Path(__file__).parent.parent / "fixtures"
+
+
+def _fixture(platform: str, name: str) -> str:
+    return (FIXTURES_DIR / platform / name).read_text(encoding="utf-8")
+
+
+class TestNxosStructured:
+    """NX-OS: show interface | json, show lldp neighbors detail | json."""
+
+    @pytest.fixture
+    def interfaces(self):
+        rows = parse_structured(
+            _fixture("cisco_nxos", "show_interface_json.txt"), "cisco_nxos", "interfaces"
+        )
+        return {row["interface"]: row for row in InterfaceNormalizer().normalize_dicts(rows)}
+
+    def test_ethernet_fields(self, interfaces):
+        eth = interfaces["Ethernet1/1"]
+        assert eth["status"] == "up"
+        assert eth["mode"] == "trunk"
+        assert eth["mtu"] == "1500"
+        assert eth["description"] == "SU-829-C2960S-48-2"
+        assert eth["port_type"] == "25g-sfp28"
+
+    def test_admin_down_is_disabled(self, interfaces):
+        assert interfaces["Ethernet1/5"]["status"] == "disabled"
+
+    def test_svi_ip(self, interfaces):
+        svi = interfaces["Vlan10"]
+        assert (svi["ip_address"], svi["prefix_length"]) == ("10.10.0.1", "24")
+
+    def test_lag_speed_from_bandwidth(self, interfaces):
+        assert interfaces["port-channel1"]["speed"] == "20000000 Kbit"
+
+    def test_same_keys_as_textfsm(self):
+        """Ключи JSON-строк — подмножество ключей TextFSM (тот же нормализатор)."""
+        device = Device(host="10.0.0.1", device_type="cisco_nxos")
+        text_rows = InterfaceCollector(credentials=None)._parse_output(
+            _fixture("cisco_nxos", "show_interface.txt"), device
+        )
+        json_rows = parse_structured(
+            _fixture("cisco_nxos", "show_interface_json.txt"), "cisco_nxos", "interfaces"
+        )
+        text_keys = set(text_rows[0])
+        for row in json_rows:
+            assert set(row) - {"prefix_length"} <= text_keys
+
+    def test_lldp_single_row(self):
+        """ROW_nbor_detail с одной записью — dict, а не список."""
+        rows = parse_structured(
+            _fixture("cisco_nxos", "show_lldp_neighbors_detail_json.txt"), "cisco_nxos", "lldp"
+        )
+        neighbor = LLDPNormalizer().normalize_dicts(rows)[0]
+        assert neighbor["local_interface"] == "Eth1/2"
+        assert neighbor["remote_hostname"] == "SU-820-C9200L-48P-4X.corp.ogk4.ru"
+        assert neighbor["remote_port"] == "Te1/1/1"
+        assert neighbor["remote_ip"] == "10.177.30.225"
+
+
+class TestEosStructured:
+    """Arista EOS: | json."""
+
+    def test_interfaces(self):
+        output = json.dumps({"interfaces": {"Ethernet1": {
+            "name": "Ethernet1",
+            "interfaceStatus": "notconnect",
+            "lineProtocolStatus": "down",
+            "hardware": "ethernet",
+            "physicalAddress": "001c.7300.0001",
+            "interfaceAddress": [{"primaryIp": {"address": "10.0.0.1", "maskLen": 30}}],
+            "mtu": 9214,
+            "bandwidth": 10000000000,
+        }}})
+        row = InterfaceNormalizer().normalize_dicts(
+            parse_structured(output, "arista_eos", "interfaces")
+        )[0]
+        assert row["status"] == "down"
+        assert row["ip_address"] == "10.0.0.1"
+        assert row["bandwidth"] == "10000000 Kbit"
+
+    def test_mac(self):
+        output = json.dumps({"unicastTable": {"tableEntries": [
+            {"vlanId": 10, "macAddress": "00:1c:73:00:00:01", "entryType": "dynamic",
+             "interface": "Ethernet1"},
+        ]}})
+        assert parse_structured(output, "arista_eos", "mac") == [
+            {"vlan": "10", "mac": "00:1c:73:00:00:01", "type": "dynamic", "interface": "Ethernet1"}
+        ]
+
+    def test_lldp_quoted_interface_id(self):
+        output = json.dumps({"lldpNeighbors": {"Ethernet1": {"lldpNeighborInfo": [{
+            "systemName": "spine1",
+            "chassisId": "001c.7300.0002",
+            "neighborInterfaceInfo": {"interfaceId": '"Ethernet49/1"'},
+            "systemCapabilities": {"bridge": True, "router": False},
+        }]}}})
+        row = parse_structured(output, "arista_eos", "lldp")[0]
+        assert row["neighbor_port_id"] == "Ethernet49/1"
+        assert row["capabilities"] == "bridge"
+
+
+class TestJunosStructured:
+    """Junos: | display json ({"key": [{"data": value}]})."""
+
+    def test_interfaces(self):
+        output = json.dumps({"interface-information": [{"physical-interface": [{
+            "name": [{"data": "ge-0/0/0"}],
+            "admin-status": [{"data": "up"}],
+            "oper-status": [{"data": "down"}],
+            "mtu": [{"data": "1514"}],
+            "logical-interface": [{"address-family": [{
+                "address-family-name": [{"data": "inet"}],
+                "interface-address": [{
+                    "ifa-local": [{"data": "192.0.2.1"}],
+                    "ifa-destination": [{"data": "192.0.2.0/30"}],
+                }],
+            }]}],
+        }]}]})
+        row = parse_structured(output, "juniper_junos", "interfaces")[0]
+        assert row["interface"] == "ge-0/0/0"
+        assert row["link_status"] == "down"
+        assert (row["ip_address"], row["prefix_length"]) == ("192.0.2.1", "30")
+
+
+class TestParseStructuredFallback:
+    """Не JSON / нет парсера — None (коллектор разбирает текст)."""
+
+    @pytest.mark.parametrize("output, platform", [
+        ("% Invalid command at '^' marker.", "cisco_nxos"),
+        ("{broken", "cisco_nxos"),
+        ('{"interfaces": {}}', "cisco_ios"),
+    ])
+    def test_returns_none(self, output, platform):
+        assert parse_structured(output, platform, "interfaces") is None
+
+
+class TestCollectorStructured:
+    """Коллектор: JSON-команда при structured_output, текст — иначе."""
+
+    @staticmethod
+    def _conn(outputs):
+        conn = MagicMock()
+        conn.send_command.side_effect = lambda cmd: MagicMock(result=outputs[cmd])
+        return conn
+
+    def test_json_command_used(self):
+        collector = MACCollector(credentials=None, structured_output=True)
+        collector._skip_normalize = True
+        conn = self._conn({"show mac address-table | json": '{"TABLE_mac_address": {}}'})
+        device = Device(host="10.0.0.1", device_type="cisco_nxos")
+
+        outputs = collector._fetch_outputs(conn, device)
+
+        assert collector._process_outputs(outputs, device, "sw") == []
+        conn.send_command.assert_called_once_with("show mac address-table | json")
+
+    def test_text_fallback_when_json_rejected(self):
+        collector = InterfaceCollector(credentials=None, structured_output=True)
+        collector._skip_normalize = True
+        text = _fixture("cisco_nxos", "show_interface.txt")
+        conn = self._conn({
+            "show interface | json": "% Invalid command at '^' marker.",
+            "show interface": text,
+        })
+        device = Device(host="10.0.0.1", device_type="cisco_nxos")
+
+        outputs = collector._fetch_outputs(conn, device)
+
+        assert outputs["main"] == text
+
+    def test_disabled_by_default(self):
+        collector = InterfaceCollector(credentials=None)
+        device = Device(host="10.0.0.1", device_type="cisco_nxos")
+
+        assert collector._main_command(device) == "show interface"